@@ -10,55 +10,176 @@ import javax.imageio.ImageIO;
 import boofcv.struct.image.GrayU8;
 
 import java.awt.image.BufferedImage;
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.EOFException;
 import java.io.File;
 import java.io.IOException;
+import java.io.InputStream;
 import java.io.DataInputStream;
 import java.io.DataOutputStream;
 import java.io.OutputStreamWriter;
+import java.io.PrintStream;
+import java.nio.ByteBuffer;
 import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
 import java.util.List;
 
 public class Main {
-    public static void main(String[] args) {
-        DataInputStream in = new DataInputStream(System.in);
+    static final int STATUS_OK = 0;
+    static final int STATUS_INVALID_IMAGE = 1;
+    static final int STATUS_DECODE_FAILED = 2;
+    static final int STATUS_ERROR = 3;
+    static final int REQUEST_ENCODED = 0;
+    static final int REQUEST_GREYSCALE = 1;
+
+    static class DecodeException extends Exception {
+        final int status;
+
+        DecodeException(int status) {
+            this.status = status;
+        }
+    }
+
+    public static void main(String[] args) throws IOException {
+        if (args.length > 0 && args[0].equals("--server")) {
+            serve();
+            return;
+        }
+
+        AztecCodePreciseDetector<GrayU8> detector = FactoryFiducial.aztec(new ConfigAztecCode(), GrayU8.class);
+        PackedBits8 bits;
+        try {
+            bits = decode(detector, readImage(new DataInputStream(System.in))).get(0);
+        } catch (DecodeException e) {
+            System.exit(e.status == STATUS_INVALID_IMAGE ? -1 : -2);
+            return;
+        }
+
+        System.out.println(bits.length());
+        System.out.print(bitString(bits));
+    }
+
+    // Requests are a 4 byte big endian length followed by the request body, a zero length request is a health check.
+    // The body is a kind byte followed by either an encoded image or a 4 byte width, 4 byte height and 8-bit
+    // greyscale pixels. Responses are a status byte, a 4 byte big endian length and the payload, which on success is
+    // a 4 byte count of decoded codes followed by each code's packed bits.
+    static void serve() throws IOException {
+        DataInputStream in = new DataInputStream(new BufferedInputStream(System.in));
+        DataOutputStream out = new DataOutputStream(new BufferedOutputStream(System.out));
+        // Keep anything the libraries print away from the protocol stream
+        System.setOut(System.err);
+
+        AztecCodePreciseDetector<GrayU8> detector = FactoryFiducial.aztec(new ConfigAztecCode(), GrayU8.class);
+
+        while (true) {
+            int length;
+            try {
+                length = in.readInt();
+            } catch (EOFException e) {
+                return;
+            }
+            byte[] request = new byte[length];
+            in.readFully(request);
+
+            int status = STATUS_OK;
+            byte[] payload = new byte[0];
+            if (length > 0) {
+                try {
+                    payload = packCodes(decode(detector, parseRequest(request)));
+                } catch (DecodeException e) {
+                    status = e.status;
+                } catch (Exception e) {
+                    status = STATUS_ERROR;
+                    payload = e.toString().getBytes(StandardCharsets.UTF_8);
+                }
+            }
+
+            out.writeByte(status);
+            out.writeInt(payload.length);
+            out.write(payload);
+            out.flush();
+        }
+    }
+
+    static GrayU8 parseRequest(byte[] request) throws DecodeException {
+        if (request[0] == REQUEST_ENCODED) {
+            return readImage(new ByteArrayInputStream(request, 1, request.length - 1));
+        } else if (request[0] == REQUEST_GREYSCALE && request.length >= 9) {
+            ByteBuffer header = ByteBuffer.wrap(request, 1, 8);
+            int width = header.getInt();
+            int height = header.getInt();
+            if (width <= 0 || height <= 0 || (long) width * height != request.length - 9) {
+                throw new DecodeException(STATUS_INVALID_IMAGE);
+            }
+            GrayU8 gray = new GrayU8(width, height);
+            System.arraycopy(request, 9, gray.data, 0, width * height);
+            return gray;
+        }
+        throw new DecodeException(STATUS_INVALID_IMAGE);
+    }
+
+    static GrayU8 readImage(InputStream in) throws DecodeException {
         BufferedImage input;
         try {
            input = ImageIO.read(in);
         } catch (IOException e) {
-            System.exit(-1);
-            return;
+            throw new DecodeException(STATUS_INVALID_IMAGE);
         }
-        GrayU8 gray = ConvertBufferedImage.convertFrom(input, (GrayU8) null);
-
-        ConfigAztecCode config = new ConfigAztecCode();
-        AztecCodePreciseDetector<GrayU8> detector = FactoryFiducial.aztec(config, GrayU8.class);
+        if (input == null) {
+            throw new DecodeException(STATUS_INVALID_IMAGE);
+        }
+        return ConvertBufferedImage.convertFrom(input, (GrayU8) null);
+    }
 
+    static List<PackedBits8> decode(AztecCodePreciseDetector<GrayU8> detector, GrayU8 gray) throws DecodeException {
         detector.process(gray);
 
-        List<AztecCode> detections = detector.getDetections();
+        List<PackedBits8> codes = new ArrayList<>();
+        for (AztecCode marker : detector.getDetections()) {
+            PackedBits8 paddedBits = PackedBits8.wrap(marker.corrected, marker.messageWordCount*marker.getWordBitCount());
+            PackedBits8 bits = new PackedBits8();
+            if (removeExtraBits(marker.getWordBitCount(), marker.messageWordCount, paddedBits, bits)) {
+                codes.add(bits);
+            }
+        }
+
+        if (codes.isEmpty()) {
+            throw new DecodeException(STATUS_DECODE_FAILED);
+        }
+        return codes;
+    }
 
-        if (detections.size() == 0) {
-            System.exit(-2);
-            return;
+    static byte[] packCodes(List<PackedBits8> codes) throws IOException {
+        ByteArrayOutputStream out = new ByteArrayOutputStream();
+        out.write(intToByteArray(codes.size()));
+        for (PackedBits8 bits : codes) {
+            out.write(packBits(bits));
         }
+        return out.toByteArray();
+    }
 
-        AztecCode marker = detections.get(0);
-        PackedBits8 paddedBits = PackedBits8.wrap(marker.corrected, marker.messageWordCount*marker.getWordBitCount());
-        PackedBits8 bits = new PackedBits8();
-        if (!removeExtraBits(marker.getWordBitCount(), marker.messageWordCount, paddedBits, bits)) {
-            System.exit(-2);
-            return;
+    // A 4 byte big endian bit count followed by the bits, most significant bit first
+    static byte[] packBits(PackedBits8 bits) {
+        int length = bits.length();
+        byte[] out = new byte[4 + (length + 7) / 8];
+        System.arraycopy(intToByteArray(length), 0, out, 0, 4);
+        for (int i = 0; i < length; i++) {
+            if (bits.get(i) != 0) {
+                out[4 + (i >> 3)] |= (byte) (0x80 >>> (i & 7));
+            }
         }
+        return out;
+    }
 
-        System.out.println(bits.length());
+    static String bitString(PackedBits8 bits) {
+        StringBuilder out = new StringBuilder(bits.length());
         for (int i = 0; i < bits.length(); i++) {
-            int v = bits.get(i);
-            if (v == 0) {
-                System.out.print("0");
-            } else {
-                System.out.print("1");
-            }
+            out.append(bits.get(i) == 0 ? '0' : '1');
         }
+        return out.toString();
     }
 
     static boolean removeExtraBits(int wordBitCount, int messageWordCount, PackedBits8 bitsExtras, PackedBits8 bits ) {
@@ -85,4 +206,4 @@ public class Main {
                 (byte)(value >>> 8),
                 (byte)value};
     }
-}
\ No newline at end of file
+}
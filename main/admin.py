@@ -46,6 +46,45 @@ class TicketAdmin(admin.ModelAdmin):
     search_fields = ["id"]
 
 
+class DecodeJobImageInline(admin.TabularInline):
+    extra = 0
+    model = models.DecodeJobImage
+    exclude = [
+        "image",
+    ]
+    readonly_fields = [
+        "position",
+        "name",
+    ]
+
+
+@admin.register(models.DecodeJob)
+class DecodeJobAdmin(admin.ModelAdmin):
+    readonly_fields = [
+        "id",
+        "created",
+        "updated",
+        "ticket",
+    ]
+    exclude = [
+        "image",
+    ]
+    inlines = [
+        DecodeJobImageInline,
+    ]
+    list_display = [
+        "id",
+        "state",
+        "attempts",
+        "created",
+    ]
+    date_hierarchy = "created"
+    list_filter = [
+        "state",
+        "batch",
+    ]
+
+
 @admin.register(models.AppleDevice)
 class AppleDeviceAdmin(admin.ModelAdmin):
     readonly_fields = [
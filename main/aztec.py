@@ -1,5 +1,21 @@
+import atexit
+import fcntl
+import hashlib
+import io
+import logging
+import os
+import queue
+import select
+import struct
 import subprocess
+import threading
+import time
+import typing
 import enum
+import PIL.Image
+import PIL.ImageFilter
+import PIL.ImageOps
+import django.core.cache
 from django.conf import settings
 
 
@@ -7,6 +23,10 @@ class AztecError(Exception):
     pass
 
 
+class AztecBusy(AztecError):
+    pass
+
+
 class Table(enum.Enum):
     UPPER = 0
     LOWER = 1
@@ -40,40 +60,422 @@ DIGIT_TABLE = [
     'CTRL_PS', ' ', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9', ',', '.', 'CTRL_UL', 'CTRL_US'
 ]
 
-def decode(data: bytes) -> bytes:
+STATUS_OK = 0
+STATUS_INVALID_IMAGE = 1
+STATUS_DECODE_FAILED = 2
+STATUS_ERROR = 3
+REQUEST_ENCODED = 0
+REQUEST_GREYSCALE = 1
+CANDIDATE_SEARCH_SIZE = 512
+SLOT_POLL_INTERVAL = 0.1
+CACHE_VERSION = 2
+
+POOL = None
+
+logger = logging.getLogger(__name__)
+
+
+class Slot:
+    fd: int
+
+    # One of AZTEC_MAX_CONCURRENT lock files shared by every process in the pod, the kernel drops the lock if the
+    # holder dies so a crashed process can't leak a slot
+    def __init__(self, deadline: float):
+        os.makedirs(settings.AZTEC_LOCK_DIR, exist_ok=True)
+        while True:
+            for i in range(settings.AZTEC_MAX_CONCURRENT):
+                fd = os.open(os.path.join(settings.AZTEC_LOCK_DIR, f"slot-{i}.lock"), os.O_RDWR | os.O_CREAT, 0o600)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    os.close(fd)
+                    continue
+                self.fd = fd
+                return
+            if time.monotonic() + SLOT_POLL_INTERVAL >= deadline:
+                raise AztecBusy("The Aztec decoder is too busy, please try again later")
+            time.sleep(SLOT_POLL_INTERVAL)
+
+    def release(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class Worker:
+    process: subprocess.Popen
+    slot: Slot
+    last_used: float
+
+    # Each JVM holds a slot for as long as it runs, which bounds the decoder memory across the whole pod
+    def __init__(self, deadline: float):
+        self.slot = Slot(deadline)
+        try:
+            self.process = subprocess.Popen(
+                [
+                    "java", f"-Xmx{settings.AZTEC_JAVA_MAX_HEAP}", "-XX:+ExitOnOutOfMemoryError",
+                    "-jar", str(settings.AZTEC_JAR_PATH), "--server"
+                ],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=None, bufsize=0
+            )
+        except OSError as e:
+            self.slot.release()
+            raise AztecError("Could not execute Java binary") from e
+        self.last_used = time.monotonic()
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def read_exact(self, length: int, deadline: float) -> bytes:
+        out = bytearray()
+        fd = self.process.stdout.fileno()
+        while len(out) < length:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise AztecError("Timed out waiting for the Aztec decoder")
+            chunk = os.read(fd, length - len(out))
+            if not chunk:
+                raise AztecError("Aztec decoder exited unexpectedly")
+            out += chunk
+        return bytes(out)
+
+    def request(self, data: bytes, deadline: float) -> typing.Tuple[int, bytes]:
+        request = memoryview(struct.pack(">I", len(data)) + data)
+        try:
+            while request:
+                request = request[self.process.stdin.write(request):]
+        except OSError as e:
+            raise AztecError("Aztec decoder exited unexpectedly") from e
+        status, length = struct.unpack(">BI", self.read_exact(5, deadline))
+        payload = self.read_exact(length, deadline)
+        self.last_used = time.monotonic()
+        return status, payload
+
+    def healthy(self) -> bool:
+        if not self.alive():
+            return False
+        if time.monotonic() - self.last_used < settings.AZTEC_HEALTH_CHECK_INTERVAL:
+            return True
+        try:
+            return self.request(b"", time.monotonic() + settings.AZTEC_HEALTH_CHECK_TIMEOUT) == (STATUS_OK, b"")
+        except AztecError:
+            return False
+
+    def close(self):
+        if self.alive():
+            self.process.kill()
+        self.process.wait()
+        self.slot.release()
+
+
+class Pool:
+    pid: int
+    idle: "queue.LifoQueue[Worker]"
+    size: int
+    started: int
+    waiting: int
+    lock: threading.Lock
+
+    def __init__(self, size: int):
+        self.pid = os.getpid()
+        self.idle = queue.LifoQueue()
+        self.size = size
+        self.started = 0
+        self.waiting = 0
+        self.lock = threading.Lock()
+
+    def acquire(self, deadline: float) -> Worker:
+        with self.lock:
+            if self.idle.empty() and self.started < self.size:
+                self.started += 1
+                spawn = True
+            elif self.waiting >= settings.AZTEC_MAX_QUEUE:
+                raise AztecBusy("The Aztec decoder is too busy, please try again later")
+            else:
+                self.waiting += 1
+                spawn = False
+
+        if spawn:
+            try:
+                return Worker(deadline)
+            except AztecError:
+                self.discard()
+                raise
+
+        try:
+            worker = self.idle.get(timeout=max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            raise AztecBusy("The Aztec decoder is too busy, please try again later")
+        finally:
+            with self.lock:
+                self.waiting -= 1
+
+        if not worker.healthy():
+            worker.close()
+            try:
+                worker = Worker(deadline)
+            except AztecError:
+                self.discard()
+                raise
+        return worker
+
+    def release(self, worker: Worker):
+        self.idle.put(worker)
+
+    def discard(self, worker: typing.Optional[Worker] = None):
+        if worker:
+            worker.close()
+        with self.lock:
+            self.started -= 1
+
+    def close(self):
+        while not self.idle.empty():
+            self.discard(self.idle.get_nowait())
+
+
+class Session:
+    worker: typing.Optional[Worker]
+    deadline: float
+
+    # Holds on to one decoder for a run of requests, it's only taken from the pool once something isn't cached
+    def __init__(self, deadline: float):
+        self.worker = None
+        self.deadline = deadline
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def request(self, data: bytes) -> typing.Tuple[int, bytes]:
+        if self.worker is None:
+            self.worker = get_pool().acquire(self.deadline)
+        try:
+            return self.worker.request(data, self.deadline)
+        except BaseException:
+            # The worker may be half way through a response, so it can't be reused
+            get_pool().discard(self.worker)
+            self.worker = None
+            raise
+
+    def close(self):
+        if self.worker is not None:
+            get_pool().release(self.worker)
+            self.worker = None
+
+
+def get_pool() -> Pool:
+    global POOL
+
+    if POOL is None or POOL.pid != os.getpid():
+        POOL = Pool(settings.AZTEC_WORKERS)
+        atexit.register(POOL.close)
+
+    return POOL
+
+
+def load_image(data: bytes) -> PIL.Image.Image:
     try:
-        p = subprocess.Popen(
-            ["java", "-jar", settings.AZTEC_JAR_PATH],
-            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-            universal_newlines=False, text=False
+        image = PIL.Image.open(io.BytesIO(data))
+        # Lets JPEG decode at a reduced scale, leaving enough resolution to crop to the barcode afterwards
+        image.draft("L", (2 * settings.AZTEC_MAX_IMAGE_SIZE, 2 * settings.AZTEC_MAX_IMAGE_SIZE))
+        image = PIL.ImageOps.exif_transpose(image)
+        if image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info):
+            # Transparent pixels are often black underneath, put them on white so a dark code stays visible
+            image = image.convert("RGBA")
+            image = PIL.Image.alpha_composite(PIL.Image.new("RGBA", image.size, "white"), image)
+        return image.convert("L")
+    except (PIL.UnidentifiedImageError, PIL.Image.DecompressionBombError, OSError, ValueError, SyntaxError) as e:
+        # PIL reports some corrupt PNG chunks as a SyntaxError
+        raise AztecError("Invalid image data") from e
+
+
+def find_candidate_region(image: PIL.Image.Image) -> typing.Optional[typing.Tuple[int, int, int, int]]:
+    thumbnail = image.copy()
+    thumbnail.thumbnail((CANDIDATE_SEARCH_SIZE, CANDIDATE_SEARCH_SIZE))
+    # An Aztec code is the densest patch of edges, text and photo backgrounds are sparser
+    edges = thumbnail.filter(PIL.ImageFilter.FIND_EDGES)
+    # The filter leaves garbage in the outermost pixels
+    edges = edges.crop((1, 1, edges.width - 1, edges.height - 1)).filter(PIL.ImageFilter.BoxBlur(8))
+    _, high = edges.getextrema()
+    if not high:
+        return None
+    box = edges.point(lambda v: 255 if 2 * v >= high else 0).getbbox()
+    if not box:
+        return None
+
+    scale = image.width / thumbnail.width
+    margin = 0.15 * max(box[2] - box[0], box[3] - box[1])
+    left = max(0, int((box[0] + 1 - margin) * scale))
+    top = max(0, int((box[1] + 1 - margin) * scale))
+    right = min(image.width, int((box[2] + 1 + margin) * scale))
+    bottom = min(image.height, int((box[3] + 1 + margin) * scale))
+    if (right - left) * (bottom - top) > 0.8 * image.width * image.height:
+        return None
+    return left, top, right, bottom
+
+
+def greyscale_request(image: PIL.Image.Image) -> bytes:
+    if max(image.size) > settings.AZTEC_MAX_IMAGE_SIZE:
+        image = image.copy()
+        image.thumbnail(
+            (settings.AZTEC_MAX_IMAGE_SIZE, settings.AZTEC_MAX_IMAGE_SIZE),
+            PIL.Image.Resampling.LANCZOS, reducing_gap=2.0
         )
-    except OSError as e:
-        raise AztecError("Could not execute Java binary") from e
-
-    stdout, _ = p.communicate(data)
-    if p.returncode == 255:
-        raise AztecError("Invalid image data")
-    elif p.returncode == 254:
-        raise AztecError("Failed to decode Aztec")
-    elif p.returncode != 0:
-        raise AztecError(f"Java process exited with code {p.returncode}")
-    elif len(stdout) == 0:
-        raise AztecError("No barcode was found in the image")
-
-    out_lines = stdout.splitlines()
-    num_bits = int(out_lines[0], 10)
-    bits_str = out_lines[1]
-    bits = []
-    for bit in bits_str:
-        if bit == 0x31:
-            bits.append(True)
-        elif bit == 0x30:
-            bits.append(False)
-
-    return get_encoded_data_from_bits(bits, num_bits)
-
-
-def get_encoded_data_from_bits(corrected_bits, end_index):
+    return struct.pack(">BII", REQUEST_GREYSCALE, image.width, image.height) + image.tobytes()
+
+
+def unpack_codes(payload: bytes) -> typing.List[bytes]:
+    if len(payload) < 4:
+        return []
+    count = struct.unpack_from(">I", payload)[0]
+    offset = 4
+    codes = []
+    for _ in range(count):
+        if len(payload) - offset < 4:
+            break
+        num_bits = struct.unpack_from(">I", payload, offset)[0]
+        length = (num_bits + 7) // 8
+        codes.append(bytes(get_encoded_data_from_bits(payload[offset + 4:offset + 4 + length], num_bits)))
+        offset += 4 + length
+    return codes
+
+
+def decode_image(
+        image: PIL.Image.Image, session: Session, all_codes: bool = False
+) -> typing.Tuple[bool, typing.Union[typing.List[bytes], str]]:
+    candidates = [image]
+    if box := find_candidate_region(image):
+        candidates.insert(0, image.crop(box))
+
+    # The crop finds small codes the full image misses, when every code is wanted the full image is decoded too so
+    # codes outside the densest region aren't dropped
+    codes = []
+    status = STATUS_DECODE_FAILED
+    for candidate in candidates:
+        candidate_status, payload = session.request(greyscale_request(candidate))
+        if candidate_status == STATUS_OK:
+            status = STATUS_OK
+            codes.extend(code for code in unpack_codes(payload) if code not in codes)
+            if not all_codes:
+                break
+        elif candidate_status == STATUS_INVALID_IMAGE and status == STATUS_DECODE_FAILED:
+            status = STATUS_INVALID_IMAGE
+        elif candidate_status not in (STATUS_DECODE_FAILED, STATUS_INVALID_IMAGE):
+            raise AztecError(f"Aztec decoder failed: {payload.decode('utf-8', 'replace')}")
+
+    if status == STATUS_INVALID_IMAGE:
+        return False, "Invalid image data"
+    elif status == STATUS_DECODE_FAILED:
+        return False, "Failed to decode Aztec"
+    elif not codes:
+        return False, "No barcode was found in the image"
+
+    return True, codes
+
+
+def decode_upload(
+        data: bytes, cache, session: Session, all_codes: bool
+) -> typing.Tuple[bool, typing.Union[typing.List[bytes], str]]:
+    try:
+        image = load_image(data)
+    except AztecError as e:
+        return False, str(e)
+
+    # The same picture often comes back re-encoded or with different metadata
+    hd = hashlib.sha256(struct.pack(">II", image.width, image.height))
+    hd.update(image.tobytes())
+    image_key = f"image:{hd.hexdigest()}:{int(all_codes)}"
+    if (result := cache.get(image_key, version=CACHE_VERSION)) is not None:
+        return result
+
+    result = decode_image(image, session, all_codes)
+    cache.set(image_key, result, version=CACHE_VERSION)
+    return result
+
+
+def decode_cached(
+        data: bytes, session: Session, all_codes: bool = False
+) -> typing.Tuple[bool, typing.Union[typing.List[bytes], str]]:
+    # Only results that depend on the image alone are cached, a busy or crashed decoder raises instead
+    cache = django.core.cache.caches["aztec"]
+    upload_key = f"upload:{hashlib.sha256(data).hexdigest()}:{int(all_codes)}"
+    if (result := cache.get(upload_key, version=CACHE_VERSION)) is None:
+        result = decode_upload(data, cache, session, all_codes)
+        cache.set(upload_key, result, version=CACHE_VERSION)
+    return result
+
+
+def decode(data: bytes) -> bytes:
+    # One wall clock budget covers waiting for a decoder and every attempt on the image
+    with Session(time.monotonic() + settings.AZTEC_TIMEOUT) as session:
+        success, value = decode_cached(data, session)
+    if not success:
+        raise AztecError(value)
+    return value[0]
+
+
+def decode_batch(
+        images: typing.List[bytes], progress: typing.Optional[typing.Callable[[], None]] = None
+) -> typing.List[typing.Union[typing.List[bytes], AztecError]]:
+    # Every image goes through the same decoder, each one gets its own wall clock budget and one bad image only
+    # fails itself
+    out = []
+    with Session(time.monotonic() + settings.AZTEC_TIMEOUT) as session:
+        for data in images:
+            if progress:
+                progress()
+            session.deadline = time.monotonic() + settings.AZTEC_TIMEOUT
+            try:
+                success, value = decode_cached(data, session, all_codes=True)
+            except AztecBusy:
+                raise
+            except AztecError as e:
+                out.append(e)
+                continue
+            except Exception as e:
+                logger.exception("Unexpected error decoding a batch image")
+                out.append(AztecError(f"Unexpected error decoding the image: {type(e).__name__}"))
+                continue
+            out.append(value if success else AztecError(value))
+    return out
+
+
+def build_decode_table(table: typing.List[str]) -> typing.List[typing.Tuple[bytes, typing.Optional[Table], bool]]:
+    out = []
+    for c in table:
+        if c.startswith("CTRL_"):
+            out.append((b"", TABLE_BY_CODE[c[5]], c[6] == "L"))
+        else:
+            out.append((c.encode("latin-1"), None, False))
+    return out
+
+
+TABLE_BY_CODE = {
+    "U": Table.UPPER,
+    "L": Table.LOWER,
+    "M": Table.MIXED,
+    "D": Table.DIGIT,
+    "P": Table.PUNCT,
+    "B": Table.BINARY,
+}
+
+# Per table: the bit size of a code and for each code the bytes it outputs, the table it switches to and whether
+# that switch is a latch
+DECODE_TABLES = {
+    Table.UPPER: (5, build_decode_table(UPPER_TABLE)),
+    Table.LOWER: (5, build_decode_table(LOWER_TABLE)),
+    Table.MIXED: (5, build_decode_table(MIXED_TABLE)),
+    Table.DIGIT: (4, build_decode_table(DIGIT_TABLE)),
+    Table.PUNCT: (5, build_decode_table(PUNCT_TABLE)),
+}
+
+
+def get_encoded_data_from_bits(data: bytes, end_index: int) -> bytearray:
+    value = int.from_bytes(data, 'big')
+    total_bits = 8 * len(data)
+    end_index = min(end_index, total_bits)
     latch_table = Table.UPPER
     shift_table = Table.UPPER
     output = bytearray()
@@ -83,69 +485,32 @@ def get_encoded_data_from_bits(corrected_bits, end_index):
         if shift_table == Table.BINARY:
             if end_index - index < 5:
                 break
-            length = read_code(corrected_bits, index, 5)
+            length = (value >> (total_bits - index - 5)) & 0x1F
             index += 5
             if length == 0:
                 if end_index - index < 11:
                     break
-                length = read_code(corrected_bits, index, 11) + 31
+                length = ((value >> (total_bits - index - 11)) & 0x7FF) + 31
                 index += 11
-            for _ in range(length):
-                if end_index - index < 8:
-                    index = end_index
-                    break
-                code = read_code(corrected_bits, index, 8)
-                output.append(code)
-                index += 8
+            count = min(length, (end_index - index) // 8)
+            if count:
+                chunk = (value >> (total_bits - index - 8 * count)) & ((1 << (8 * count)) - 1)
+                output += chunk.to_bytes(count, 'big')
+            index = index + 8 * length if count == length else end_index
             shift_table = latch_table
         else:
-            size = 4 if shift_table == Table.DIGIT else 5
+            size, table = DECODE_TABLES[shift_table]
             if end_index - index < size:
                 break
-            code = read_code(corrected_bits, index, size)
+            out, next_table, latch = table[(value >> (total_bits - index - size)) & ((1 << size) - 1)]
             index += size
-            c = get_character(shift_table, code)
-            if c.startswith("CTRL_"):
-                latch_table = shift_table
-                shift_table = get_table(c[5])
-                if c[6] == "L":
-                    latch_table = shift_table
-            else:
-                output.append(ord(c[0]))
+            if next_table is None:
+                output += out
                 shift_table = latch_table
+            else:
+                latch_table = shift_table
+                shift_table = next_table
+                if latch:
+                    latch_table = next_table
 
     return output
-
-def read_code(bits, offset, length):
-    res = 0
-    for i in range(length):
-        res <<= 1
-        if bits[offset + i]:
-            res |= 1
-    return res
-
-def get_table(code):
-    if code == "L":
-        return Table.LOWER
-    elif code == "P":
-        return Table.PUNCT
-    elif code == "M":
-        return Table.MIXED
-    elif code == "D":
-        return Table.DIGIT
-    elif code == "B":
-        return Table.BINARY
-    else:
-        return Table.UPPER
-
-def get_character(table, code):
-    if table == Table.UPPER:
-        return UPPER_TABLE[code]
-    elif table == Table.LOWER:
-        return LOWER_TABLE[code]
-    elif table == Table.MIXED:
-        return MIXED_TABLE[code]
-    elif table == Table.DIGIT:
-        return DIGIT_TABLE[code]
-    elif table == Table.PUNCT:
-        return PUNCT_TABLE[code]
\ No newline at end of file
@@ -18,6 +18,36 @@ class TicketImageForm(forms.Form):
         self.helper.add_input(Submit("submit", "Upload"))
 
 
+class MultipleFileInput(forms.ClearableFileInput):
+    allow_multiple_selected = True
+
+
+class MultipleImageField(forms.ImageField):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("widget", MultipleFileInput())
+        super().__init__(*args, **kwargs)
+
+    def clean(self, data, initial=None):
+        if isinstance(data, (list, tuple)):
+            return [super(MultipleImageField, self).clean(d, initial) for d in data]
+        return [super().clean(data, initial)]
+
+
+class TicketBatchForm(forms.Form):
+    tickets = MultipleImageField(
+        label="Your tickets",
+        help_text="Select up to 20 pictures, each picture may contain more than one ticket",
+        error_messages={
+            "required": "Please upload at least one ticket image",
+        }
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = FormHelper()
+        self.helper.add_input(Submit("submit", "Upload"))
+
+
 class SaarVVLoginForm(forms.Form):
     username = forms.CharField(label="Email/Username", required=True)
     password = forms.CharField(label="Password", widget=forms.PasswordInput)
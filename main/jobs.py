@@ -0,0 +1,261 @@
+import base64
+import dataclasses
+import datetime
+import traceback
+import typing
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from . import models, ticket, aztec, apn
+
+JOB_TIMEOUT = datetime.timedelta(minutes=5)
+JOB_MAX_ATTEMPTS = 3
+JOB_RETENTION = datetime.timedelta(days=1)
+
+
+def to_dict_json(elements: typing.List[typing.Tuple[str, typing.Any]]) -> dict:
+    def encode_value(v):
+        if isinstance(v, bytes) or isinstance(v, bytearray):
+            return base64.b64encode(v).decode("ascii")
+        else:
+            return v
+
+    return {k: encode_value(v) for k, v in elements}
+
+
+def ticket_error(e: ticket.TicketError, ticket_bytes: bytes) -> dict:
+    return {
+        "title": e.title,
+        "message": e.message,
+        "exception": e.exception,
+        "ticket_contents": ticket_bytes.hex()
+    }
+
+
+def ticket_rows(
+        ticket_bytes: bytes, ticket_data: typing.Union[ticket.VDVTicket, ticket.UICTicket],
+        account: typing.Optional[models.Account]
+) -> typing.Tuple[models.Ticket, typing.Union[models.VDVTicketInstance, models.UICTicketInstance]]:
+    ticket_obj = models.Ticket(id=ticket_data.pk(), ticket_type=ticket_data.type(), account=account)
+    if isinstance(ticket_data, ticket.VDVTicket):
+        return ticket_obj, models.VDVTicketInstance(
+            ticket=ticket_obj,
+            ticket_number=ticket_data.ticket.ticket_id,
+            ticket_org_id=ticket_data.ticket.ticket_org_id,
+            validity_start=ticket_data.ticket.validity_start.as_datetime(),
+            validity_end=ticket_data.ticket.validity_end.as_datetime(),
+            barcode_data=ticket_bytes,
+            decoded_data={
+                "root_ca": dataclasses.asdict(ticket_data.root_ca, dict_factory=to_dict_json),
+                "issuing_ca": dataclasses.asdict(ticket_data.issuing_ca, dict_factory=to_dict_json),
+                "envelope_certificate": dataclasses.asdict(ticket_data.envelope_certificate,
+                                                           dict_factory=to_dict_json),
+                "ticket": base64.b64encode(ticket_data.raw_ticket).decode("ascii"),
+            }
+        )
+    else:
+        return ticket_obj, models.UICTicketInstance(
+            ticket=ticket_obj,
+            reference=ticket_data.ticket_id(),
+            distributor_rics=ticket_data.issuing_rics(),
+            issuing_time=ticket_data.issuing_time(),
+            barcode_data=ticket_bytes,
+            decoded_data={
+                "envelope": dataclasses.asdict(ticket_data.envelope, dict_factory=to_dict_json),
+            }
+        )
+
+
+def save_tickets(
+        rows: typing.List[typing.Tuple[
+            models.Ticket, typing.Union[models.VDVTicketInstance, models.UICTicketInstance]
+        ]],
+        account: typing.Optional[models.Account]
+) -> typing.List[typing.Tuple[models.Ticket, bool]]:
+    # Upserts keyed on each table's natural key, later copies of the same ticket in a batch win
+    ticket_objs = {}
+    vdv_instances = {}
+    uic_instances = {}
+    for ticket_obj, instance in rows:
+        ticket_objs[ticket_obj.id] = ticket_obj
+        if isinstance(instance, models.VDVTicketInstance):
+            vdv_instances[(instance.ticket_number, instance.ticket_org_id)] = instance
+        else:
+            uic_instances[(instance.reference, instance.distributor_rics)] = instance
+
+    with transaction.atomic():
+        existing = set(models.Ticket.objects.filter(id__in=ticket_objs.keys()).values_list("id", flat=True))
+        models.Ticket.objects.bulk_create(
+            ticket_objs.values(), update_conflicts=True, unique_fields=["id"],
+            update_fields=["ticket_type", "last_updated", "account"] if account else ["ticket_type", "last_updated"]
+        )
+        if vdv_instances:
+            models.VDVTicketInstance.objects.bulk_create(
+                vdv_instances.values(), update_conflicts=True, unique_fields=["ticket_number", "ticket_org_id"],
+                update_fields=["ticket", "validity_start", "validity_end", "barcode_data", "decoded_data"]
+            )
+        if uic_instances:
+            models.UICTicketInstance.objects.bulk_create(
+                uic_instances.values(), update_conflicts=True, unique_fields=["reference", "distributor_rics"],
+                update_fields=["ticket", "issuing_time", "barcode_data", "decoded_data"]
+            )
+
+    for ticket_obj in ticket_objs.values():
+        apn.notify_ticket(ticket_obj)
+
+    out = []
+    for ticket_obj, _ in rows:
+        out.append((ticket_objs[ticket_obj.id], ticket_obj.id not in existing))
+        existing.add(ticket_obj.id)
+    return out
+
+
+def save_ticket(
+        ticket_bytes: bytes, account: typing.Optional[models.Account]
+) -> typing.Tuple[models.Ticket, bool]:
+    return save_tickets([ticket_rows(ticket_bytes, ticket.parse_ticket(ticket_bytes), account)], account)[0]
+
+
+def fail_job(job: models.DecodeJob, error: dict):
+    job.state = models.DecodeJob.STATE_FAILED
+    job.error = error
+    job.image = b""
+    job.save()
+    job.images.all().delete()
+
+
+def claim_job(batch: bool) -> typing.Optional[models.DecodeJob]:
+    now = timezone.now()
+    candidates = models.DecodeJob.objects.filter(
+        Q(state=models.DecodeJob.STATE_PENDING) |
+        Q(state=models.DecodeJob.STATE_RUNNING, updated__lt=now - JOB_TIMEOUT),
+        batch=batch,
+    ).order_by("created").only("id", "state", "updated")[:10]
+
+    for candidate in candidates:
+        # Another worker may have claimed the job since it was listed, only one update can match
+        claimed = models.DecodeJob.objects.filter(
+            id=candidate.id, state=candidate.state, updated=candidate.updated
+        ).update(state=models.DecodeJob.STATE_RUNNING, attempts=F("attempts") + 1, updated=now)
+        if claimed:
+            job = models.DecodeJob.objects.get(id=candidate.id)
+            if job.attempts > JOB_MAX_ATTEMPTS:
+                fail_job(job, {
+                    "title": "We couldn't process your ticket",
+                    "message": "Decoding your image failed repeatedly, please try again with a different picture.",
+                })
+                continue
+            return job
+
+    return None
+
+
+def run_job(job: models.DecodeJob):
+    try:
+        ticket_bytes = aztec.decode(bytes(job.image))
+    except aztec.AztecBusy:
+        # Not the image's fault, give it back to the queue without using up an attempt
+        job.state = models.DecodeJob.STATE_PENDING
+        job.attempts -= 1
+        job.save()
+        return
+    except aztec.AztecError as e:
+        fail_job(job, {
+            "title": "We couldn't read the barcode in your image",
+            "message": str(e),
+        })
+        return
+
+    try:
+        ticket_obj, ticket_created = save_ticket(ticket_bytes, job.account)
+    except ticket.TicketError as e:
+        fail_job(job, ticket_error(e, ticket_bytes))
+        return
+
+    job.state = models.DecodeJob.STATE_DONE
+    job.ticket = ticket_obj
+    job.ticket_created = ticket_created
+    job.image = b""
+    job.save()
+
+
+def touch_job(job: models.DecodeJob):
+    # Keeps a long running job from looking abandoned to claim_job
+    models.DecodeJob.objects.filter(id=job.id).update(updated=timezone.now())
+
+
+def run_batch_job(job: models.DecodeJob):
+    images = list(job.images.all())
+    try:
+        decoded = aztec.decode_batch([bytes(image.image) for image in images], lambda: touch_job(job))
+    except aztec.AztecBusy:
+        job.state = models.DecodeJob.STATE_PENDING
+        job.attempts -= 1
+        job.save()
+        return
+
+    results = []
+    rows = []
+    for image, codes in zip(images, decoded):
+        result = {
+            "name": image.name,
+            "tickets": [],
+            "errors": [],
+        }
+        results.append(result)
+        if isinstance(codes, aztec.AztecError):
+            result["errors"].append({
+                "title": "We couldn't read the barcode in this image",
+                "message": str(codes),
+            })
+            continue
+
+        # One bad ticket only fails itself, not the rest of the batch
+        for ticket_bytes in codes:
+            try:
+                rows.append((result, ticket_rows(ticket_bytes, ticket.parse_ticket(ticket_bytes), job.account)))
+            except ticket.TicketError as e:
+                result["errors"].append(ticket_error(e, ticket_bytes))
+            except Exception:
+                result["errors"].append({
+                    "title": "Something went wrong processing this ticket",
+                    "message": "This is a bug in this program.",
+                    "exception": traceback.format_exc(),
+                    "ticket_contents": ticket_bytes.hex(),
+                })
+
+    if rows:
+        saved = save_tickets([row for _, row in rows], job.account)
+        for (result, _), (ticket_obj, ticket_created) in zip(rows, saved):
+            result["tickets"].append({
+                "id": ticket_obj.id,
+                "type": ticket_obj.get_ticket_type_display(),
+                "created": ticket_created,
+            })
+
+    job.state = models.DecodeJob.STATE_DONE
+    job.results = results
+    job.image = b""
+    job.save()
+    job.images.all().delete()
+
+
+def run_job_safely(job: models.DecodeJob):
+    try:
+        if job.batch:
+            run_batch_job(job)
+        else:
+            run_job(job)
+    except Exception:
+        fail_job(job, {
+            "title": "Something went wrong processing your ticket",
+            "message": "This is a bug in this program, please try again later.",
+            "exception": traceback.format_exc(),
+        })
+
+
+def delete_old_jobs():
+    models.DecodeJob.objects.filter(
+        state__in=(models.DecodeJob.STATE_DONE, models.DecodeJob.STATE_FAILED),
+        updated__lt=timezone.now() - JOB_RETENTION
+    ).delete()
@@ -0,0 +1,79 @@
+from django.core.management.base import BaseCommand, CommandError
+import random
+import time
+from main import ticket
+from main.uic import codegen, flex
+
+
+class Command(BaseCommand):
+    help = "Compare the generated UIC FCB decoders against asn1tools and benchmark them"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "corpus", nargs="?",
+            help="File with one hex encoded UIC barcode per line"
+        )
+        parser.add_argument(
+            "--random", type=int, default=1000,
+            help="Number of random FCB records to generate per version"
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0,
+            help="Seed for the random FCB records"
+        )
+
+    def handle(self, *args, **options):
+        samples = []
+        rng = random.Random(options["seed"])
+
+        for version in flex.ASN1_SPEC_FILES:
+            spec = flex.get_spec(version)
+            for _ in range(options["random"]):
+                value = codegen.random_value(spec.types["UicRailTicketData"]._type, rng)
+                samples.append((version, bytes(spec.encode("UicRailTicketData", value))))
+
+        if options["corpus"]:
+            with open(options["corpus"], "r") as f:
+                for line in f:
+                    if not (line := line.strip()):
+                        continue
+                    try:
+                        ticket_data = ticket.parse_ticket(bytes.fromhex(line))
+                    except (ValueError, ticket.TicketError):
+                        continue
+                    if isinstance(ticket_data, ticket.UICTicket) and ticket_data.flex:
+                        samples.append((ticket_data.flex.version, ticket_data.flex.raw))
+
+        failures = 0
+        asn1tools_time = 0
+        generated_time = 0
+        for version, data in samples:
+            decoder = flex.get_decoder(version)
+            if not decoder:
+                raise CommandError(f"No up to date generated decoder for FCB version {version}")
+            spec = flex.get_spec(version)
+
+            start = time.perf_counter()
+            expected = spec.decode("UicRailTicketData", data)
+            asn1tools_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            actual = decoder.decode(data)
+            generated_time += time.perf_counter() - start
+
+            summary = flex.decode_summary(spec, data)
+            if not codegen.identical(expected, actual) or not codegen.identical(summary, decoder.decode_summary(data)):
+                failures += 1
+                self.stderr.write(f"Mismatch for FCB version {version}: {data.hex()}")
+
+        if not samples:
+            raise CommandError("No samples to check")
+
+        self.stdout.write(
+            f"Checked {len(samples)} FCB records, {failures} mismatches\n"
+            f"asn1tools: {asn1tools_time / len(samples) * 1e6:.1f}us per record\n"
+            f"generated: {generated_time / len(samples) * 1e6:.1f}us per record "
+            f"({asn1tools_time / generated_time if generated_time else 0:.1f}x)"
+        )
+        if failures:
+            raise CommandError("Generated decoders don't match asn1tools")
@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+import threading
+import time
+from main import jobs, models, ticket
+
+POLL_INTERVAL = 1
+CLEANUP_INTERVAL = 3600
+STATS_INTERVAL = 600
+
+
+class Command(BaseCommand):
+    help = "Decode uploaded ticket images from the job queue"
+
+    def work(self, batch: bool):
+        # Single uploads and batches are claimed by separate threads so a long batch doesn't hold up single uploads
+        while True:
+            close_old_connections()
+
+            job = jobs.claim_job(batch)
+            if not job:
+                time.sleep(POLL_INTERVAL)
+                continue
+
+            self.stdout.write(f"Decoding job {job.id} (attempt {job.attempts})")
+            jobs.run_job_safely(job)
+            self.stdout.write(f"Job {job.id} finished: {job.state}")
+            if job.state == models.DecodeJob.STATE_PENDING:
+                # Every decoder slot in the pod is taken, back off before trying again
+                time.sleep(POLL_INTERVAL)
+
+    def log_cache_stats(self):
+        # For sizing VDV_ENVELOPE_CERTIFICATE_CACHE_SIZE, the counters cover the life of the process
+        info = ticket.ENVELOPE_CERTIFICATES.info()
+        lookups = info["hits"] + info["misses"]
+        self.stdout.write(
+            f"Envelope certificate cache: {info['hits']}/{lookups} hits "
+            f"({info['hits'] / lookups if lookups else 0:.1%}), {info['size']}/{info['max_size']} entries"
+        )
+
+    def handle(self, *args, **options):
+        threads = [
+            threading.Thread(target=self.work, args=(batch,), daemon=True, name="batch" if batch else "single")
+            for batch in (False, True)
+        ]
+        for thread in threads:
+            thread.start()
+
+        last_cleanup = 0
+        last_stats = time.monotonic()
+        while all(thread.is_alive() for thread in threads):
+            if time.monotonic() - last_cleanup > CLEANUP_INTERVAL:
+                close_old_connections()
+                jobs.delete_old_jobs()
+                last_cleanup = time.monotonic()
+            if time.monotonic() - last_stats > STATS_INTERVAL:
+                self.log_cache_stats()
+                last_stats = time.monotonic()
+            time.sleep(POLL_INTERVAL)
+
+        raise CommandError("A decode worker thread exited unexpectedly")
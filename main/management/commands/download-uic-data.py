@@ -4,6 +4,7 @@ import niquests
 import csv
 import datetime
 import json
+from main import uic
 
 
 class Command(BaseCommand):
@@ -39,7 +40,7 @@ class Command(BaseCommand):
                 "url": row["URL"] if row["URL"] else None,
             }
 
-        with uic_storage.open("rics_codes.json", "w") as f:
+        with uic_storage.open(uic.rics.RICS_FILE, "w") as f:
             json.dump(out, f)
 
         stations_r = niquests.get("https://github.com/trainline-eu/stations/raw/refs/heads/master/stations.csv", headers={
@@ -65,5 +66,8 @@ class Command(BaseCommand):
             if row["uic"]:
                 out["uic_codes"][row["uic"]] = len(out["stations"]) - 1
 
-        with uic_storage.open("stations.json", "w") as f:
+        with uic_storage.open(uic.stations.STATIONS_FILE, "w") as f:
             json.dump(out, f)
+
+        with uic_storage.open(uic.stations.STATION_INDEX_FILE, "wb") as f:
+            f.write(uic.stations.build_station_index(out["stations"]))
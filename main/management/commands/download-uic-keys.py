@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+import django.core.files.storage
+import niquests
+import base64
+import binascii
+import json
+import xml.etree.ElementTree
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from main.uic import signature
+
+
+def public_key_der(data: bytes) -> bytes:
+    try:
+        public_key = x509.load_der_x509_certificate(data).public_key()
+    except ValueError:
+        public_key = serialization.load_der_public_key(data)
+    return public_key.public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+
+
+class Command(BaseCommand):
+    help = "Download the UIC barcode public key list"
+
+    def handle(self, *args, **options):
+        uic_storage = django.core.files.storage.storages["uic-data"]
+
+        keys_r = niquests.get("https://railpublickey.uic.org/download.php", headers={
+            "User-Agent": "VDV PKPass Generator (magicalcodewit.ch)",
+        })
+        keys_r.raise_for_status()
+        root = xml.etree.ElementTree.fromstring(keys_r.content)
+
+        out = {
+            "keys": [],
+        }
+        for key in root.iter("key"):
+            try:
+                issuer_rics = int(key.findtext("issuerCode", ""), 10)
+                public_key = public_key_der(base64.b64decode(key.findtext("publicKey", "")))
+            except (ValueError, binascii.Error):
+                self.stderr.write(f"Skipping unreadable key {key.findtext('issuerCode')}/{key.findtext('id')}")
+                continue
+
+            out["keys"].append({
+                "issuer_rics": issuer_rics,
+                "issuer_name": key.findtext("issuerName", "").strip(),
+                "key_id": signature.key_id_index(key.findtext("id", "")),
+                "algorithm": key.findtext("signatureAlgorithm", "").strip(),
+                "barcode_version": key.findtext("barcodeVersion", "").strip(),
+                "public_key": base64.b64encode(public_key).decode("ascii"),
+            })
+
+        with uic_storage.open(signature.KEYS_FILE, "w") as f:
+            json.dump(out, f)
+
+        self.stdout.write(f"Saved {len(out['keys'])} UIC public keys")
@@ -1,6 +1,10 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 import django.core.files.storage
+import datetime
+import hashlib
+import json
 import ldap
+from main import ticket, vdv
 
 
 class Command(BaseCommand):
@@ -23,4 +27,47 @@ class Command(BaseCommand):
 
             with certificate_storage.open(f"{common_name}.der", "wb") as f:
                 f.write(cert_data)
-            print(f"Downloaded {common_name}")
\ No newline at end of file
+            print(f"Downloaded {common_name}")
+
+        pki_store = vdv.CertificateStore()
+        pki_store.load_certificates(use_generation=False)
+
+        try:
+            root_ca_data = ticket.verify_root_ca(pki_store)
+        except ticket.TicketError as e:
+            raise CommandError(f"Unable to verify the root CA: {e.message}")
+
+        entries = []
+        for raw_certificate in pki_store.certificates.values():
+            if raw_certificate.ca_reference == vdv.CAReference.root():
+                certificate_data = root_ca_data
+            else:
+                try:
+                    certificate_data = ticket.verify_issuing_ca(pki_store, root_ca_data, raw_certificate.ca_reference)
+                except ticket.TicketError as e:
+                    print(f"Not pre-verifying {raw_certificate.filename}: {e.title}")
+                    certificate_data = None
+
+            entries.append(vdv.bundle.BundleEntry(
+                ca_reference=raw_certificate.ca_reference.to_bytes(),
+                data=raw_certificate.data,
+                certificate_data=certificate_data,
+            ))
+
+        bundle_data = vdv.bundle.build_bundle(entries)
+        with certificate_storage.open(vdv.bundle.BUNDLE_FILE, "wb") as f:
+            f.write(bundle_data)
+        print(f"Wrote bundle of {len(entries)} certificates")
+
+        generation = {
+            "generation": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "bundle": hashlib.sha256(bundle_data).hexdigest(),
+            "certificates": {
+                raw_certificate.filename: hashlib.sha256(raw_certificate.data).hexdigest()
+                for raw_certificate in pki_store.certificates.values()
+            },
+        }
+
+        with certificate_storage.open(vdv.CertificateStore.GENERATION_FILE, "w") as f:
+            json.dump(generation, f)
+        print(f"Wrote certificate store generation {generation['generation']}")
@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 import django.core.files.storage
 import niquests
 import json
+from main import vdv
 
 
 class Command(BaseCommand):
@@ -21,17 +22,8 @@ class Command(BaseCommand):
         data = r.json()
 
         out = {
-            "orgs": [],
-            "vdv_ids": {},
-            "vdv_test_ids": {},
+            "orgs": vdv.org_id.build_org_ids(data["data"]),
         }
 
-        for org in data["data"]:
-            org_pos = len(out["orgs"])
-            out["orgs"].append(org)
-            if org.get("org_type") == "VDV":
-                out["vdv_ids"][org["id"]] = org_pos
-                out["vdv_test_ids"][org["test_id"]] = org_pos
-
-        with storage.open("orgs.json", "w") as f:
-            json.dump(out, f)
+        with storage.open(vdv.org_id.ORG_IDS_FILE, "w") as f:
+            json.dump(out, f, separators=(",", ":"))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from main.uic import flex, codegen
+
+
+class Command(BaseCommand):
+    help = "Generate specialised UPER decoders for the UIC FCB ASN.1 specs"
+
+    def handle(self, *args, **options):
+        for version, spec_file in flex.ASN1_SPEC_FILES.items():
+            out_file = flex.ROOT / "fcb" / f"{flex.DECODER_MODULES[version]}.py"
+            with open(out_file, "w") as f:
+                f.write(codegen.generate(version, spec_file))
+            self.stdout.write(f"Generated {out_file.name} from {spec_file.name}")
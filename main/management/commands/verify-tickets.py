@@ -0,0 +1,123 @@
+from django.core.management.base import BaseCommand
+import base64
+import binascii
+import json
+import multiprocessing
+import os
+import sys
+import time
+from main import ticket
+from main.uic import flex
+
+
+def init_worker():
+    try:
+        ticket.get_root_ca()
+    except ticket.TicketError:
+        pass
+    for version in (13, 2, 3):
+        flex.get_spec(version)
+
+
+def decode_line(line: str) -> bytes:
+    try:
+        return bytes.fromhex(line)
+    except ValueError:
+        pass
+    try:
+        return base64.b64decode(line, validate=True)
+    except binascii.Error:
+        raise ValueError("Barcode is neither hex nor base64")
+
+
+def verify_line(item):
+    line_number, line = item
+    result = {
+        "line": line_number,
+        "valid": False,
+    }
+
+    try:
+        ticket_bytes = decode_line(line)
+    except ValueError as e:
+        result["error"] = str(e)
+        return result
+
+    details = {}
+    try:
+        ticket_data = ticket.parse_ticket(ticket_bytes)
+        details["ticket_type"] = ticket_data.ticket_type
+        details["type"] = ticket_data.type()
+        details["pk"] = ticket_data.pk()
+        if isinstance(ticket_data, ticket.VDVTicket):
+            details["validity_start"] = ticket_data.ticket.validity_start.as_datetime().isoformat()
+            details["validity_end"] = ticket_data.ticket.validity_end.as_datetime().isoformat()
+        elif isinstance(ticket_data, ticket.UICTicket):
+            if issuing_time := ticket_data.issuing_time():
+                details["issuing_time"] = issuing_time.isoformat()
+    except ticket.TicketError as e:
+        result["error"] = e.title
+        return result
+    except Exception as e:
+        result["error"] = f"Internal error: {type(e).__name__}"
+        return result
+
+    result["valid"] = True
+    result.update(details)
+    return result
+
+
+class Command(BaseCommand):
+    help = "Verify VDV and UIC ticket barcodes in bulk"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "input", nargs="?", default="-",
+            help="File with one hex or base64 encoded barcode per line, - for stdin"
+        )
+        parser.add_argument(
+            "-o", "--output", default="-",
+            help="File to write JSONL results to, - for stdout"
+        )
+        parser.add_argument(
+            "-w", "--workers", type=int, default=os.cpu_count(),
+            help="Number of worker processes"
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=32,
+            help="Number of barcodes handed to a worker at once"
+        )
+
+    def handle(self, *args, **options):
+        input_file = sys.stdin if options["input"] == "-" else open(options["input"], "r")
+        output_file = sys.stdout if options["output"] == "-" else open(options["output"], "w")
+
+        def lines():
+            for i, line in enumerate(input_file, start=1):
+                line = line.strip()
+                if line:
+                    yield i, line
+
+        total = 0
+        valid = 0
+        start = time.monotonic()
+
+        context = multiprocessing.get_context("fork")
+        with context.Pool(options["workers"], initializer=init_worker) as pool:
+            for result in pool.imap(verify_line, lines(), chunksize=options["chunk_size"]):
+                total += 1
+                if result["valid"]:
+                    valid += 1
+                output_file.write(json.dumps(result) + "\n")
+
+        elapsed = time.monotonic() - start
+        output_file.flush()
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+        self.stderr.write(
+            f"Verified {total} barcodes in {elapsed:.2f}s ({total / elapsed if elapsed else 0:.1f}/s): "
+            f"{valid} valid, {total - valid} invalid"
+        )
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.14 on 2026-10-17 20:43
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_ticket_account'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DecodeJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('state', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='pending', max_length=255)),
+                ('created', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('image', models.BinaryField(blank=True)),
+                ('ticket_created', models.BooleanField(default=False)),
+                ('error', models.JSONField(blank=True, null=True)),
+                ('account', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='decode_jobs', to='main.account')),
+                ('ticket', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='decode_jobs', to='main.ticket')),
+            ],
+            options={
+                'verbose_name': 'Decode job',
+                'ordering': ['-created'],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.0.14 on 2026-10-17 20:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0015_decodejob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='decodejob',
+            name='batch',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddField(
+            model_name='decodejob',
+            name='results',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='DecodeJobImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('image', models.BinaryField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='main.decodejob')),
+            ],
+            options={
+                'verbose_name': 'Decode job image',
+                'ordering': ['position'],
+            },
+        ),
+    ]
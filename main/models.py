@@ -1,5 +1,6 @@
 import base64
 import secrets
+import uuid
 import dacite
 from django.utils import timezone
 from django.shortcuts import reverse
@@ -131,16 +132,69 @@ class UICTicketInstance(models.Model):
     def as_ticket(self) -> t.UICTicket:
         config = dacite.Config(type_hooks={bytes: base64.b64decode})
         ticket_envelope = dacite.from_dict(data_class=uic.Envelope, data=self.decoded_data["envelope"], config=config)
+        barcode_data = bytes(self.barcode_data)
         return t.UICTicket(
-            raw_bytes=self.barcode_data,
+            raw_bytes=barcode_data,
             envelope=ticket_envelope,
             head=t.parse_ticket_uic_head(ticket_envelope),
             layout=t.parse_ticket_uic_layout(ticket_envelope),
             flex=t.parse_ticket_uic_flex(ticket_envelope),
-            other_records=[r for r in ticket_envelope.records if not r.id.startswith("U_")]
+            other_records=[r for r in ticket_envelope.records if not r.id.startswith("U_")],
+            signature_status=uic.signature.verify(ticket_envelope, barcode_data)
         )
 
 
+class DecodeJob(models.Model):
+    STATE_PENDING = "pending"
+    STATE_RUNNING = "running"
+    STATE_DONE = "done"
+    STATE_FAILED = "failed"
+
+    STATES = (
+        (STATE_PENDING, "Pending"),
+        (STATE_RUNNING, "Running"),
+        (STATE_DONE, "Done"),
+        (STATE_FAILED, "Failed"),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, verbose_name="ID")
+    state = models.CharField(max_length=255, choices=STATES, default=STATE_PENDING, db_index=True)
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated = models.DateTimeField(auto_now=True)
+    attempts = models.PositiveIntegerField(default=0)
+    batch = models.BooleanField(default=False, db_index=True)
+    image = models.BinaryField(blank=True)
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, null=True, blank=True, related_name="decode_jobs")
+    ticket = models.ForeignKey(Ticket, on_delete=models.SET_NULL, null=True, blank=True, related_name="decode_jobs")
+    ticket_created = models.BooleanField(default=False)
+    error = models.JSONField(null=True, blank=True)
+    results = models.JSONField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created"]
+        verbose_name = "Decode job"
+
+    def __str__(self):
+        return str(self.id)
+
+    def get_absolute_url(self):
+        return reverse("decode_job", kwargs={"pk": self.id})
+
+
+class DecodeJobImage(models.Model):
+    job = models.ForeignKey(DecodeJob, on_delete=models.CASCADE, related_name="images")
+    position = models.PositiveIntegerField()
+    name = models.CharField(max_length=255, blank=True)
+    image = models.BinaryField()
+
+    class Meta:
+        ordering = ["position"]
+        verbose_name = "Decode job image"
+
+    def __str__(self):
+        return f"{self.job_id} - {self.name}"
+
+
 class AppleDevice(models.Model):
     device_id = models.CharField(max_length=255, primary_key=True, verbose_name="Device ID")
     push_token = models.CharField(max_length=255, verbose_name="Push token")
@@ -0,0 +1,63 @@
+import threading
+import time
+import typing
+import django.core.files.storage
+
+REFRESH_INTERVAL = 60
+
+T = typing.TypeVar("T")
+
+
+class StorageFile(typing.Generic[T]):
+    # A value loaded from a file in one of the configured storages, reloaded when the file's modification time
+    # changes. Storage lookups are rate limited to one every refresh_interval seconds. The first of file_names that
+    # exists is used, and missing is returned while none of them do.
+    def __init__(
+            self, storage_name: str, file_names: typing.Sequence[str],
+            load: typing.Callable[[typing.Any, str, typing.Any], T], missing: T = None,
+            refresh_interval: float = REFRESH_INTERVAL
+    ):
+        self.storage_name = storage_name
+        self.file_names = file_names
+        self.load = load
+        self.missing = missing
+        self.refresh_interval = refresh_interval
+        self.value = missing
+        self.loaded = False
+        self.modified = None
+        self.checked = 0
+        self.lock = threading.Lock()
+
+    def get(self) -> T:
+        if self.loaded and time.monotonic() - self.checked < self.refresh_interval:
+            return self.value
+
+        with self.lock:
+            now = time.monotonic()
+            if self.loaded and now - self.checked < self.refresh_interval:
+                return self.value
+            self.checked = now
+
+            storage = django.core.files.storage.storages[self.storage_name]
+            file_name = next((file_name for file_name in self.file_names if storage.exists(file_name)), None)
+            if file_name is None:
+                self.value = self.missing
+                self.modified = None
+                self.loaded = True
+                return self.value
+
+            modified = storage.get_modified_time(file_name)
+            if not self.loaded or (file_name, modified) != self.modified:
+                # A failed load leaves the old value in place and is retried on the next check
+                self.value = self.load(storage, file_name, modified)
+                self.modified = (file_name, modified)
+                self.loaded = True
+
+            return self.value
+
+    def reset(self):
+        with self.lock:
+            self.value = self.missing
+            self.loaded = False
+            self.modified = None
+            self.checked = 0
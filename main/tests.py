@@ -1,3 +1,380 @@
-from django.test import TestCase
+import json
+import os
+import random
+import tempfile
+import unittest.mock
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from . import aztec, storage_file, ticket, uic
+from .uic import codegen, flex, stations, uper
+from .vdv import bundle, org_id, pki, tlv, util
 
-# Create your tests here.
+
+class StorageFileTestCase(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        storages = dict(settings.STORAGES)
+        storages["vdv-certs"] = {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": self.directory.name},
+        }
+        override = override_settings(STORAGES=storages)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def write(self, file_name: str, data: str, modified: int):
+        path = os.path.join(self.directory.name, file_name)
+        with open(path, "w") as f:
+            f.write(data)
+        os.utime(path, (modified, modified))
+
+    def test_reload(self):
+        loads = []
+
+        def load(storage, file_name, _modified):
+            loads.append(file_name)
+            with storage.open(file_name, "r") as f:
+                return f.read()
+
+        value = storage_file.StorageFile("vdv-certs", ("new.txt", "old.txt"), load, "missing")
+        self.assertEqual(value.get(), "missing")
+
+        self.write("old.txt", "old", 1000)
+        self.assertEqual(value.get(), "missing", "Rechecked before the refresh interval")
+        value.checked = 0
+        self.assertEqual(value.get(), "old")
+
+        value.checked = 0
+        self.assertEqual(value.get(), "old")
+        self.assertEqual(loads, ["old.txt"], "Reloaded an unchanged file")
+
+        self.write("new.txt", "new", 1000)
+        value.checked = 0
+        self.assertEqual(value.get(), "new")
+
+        self.write("new.txt", "newer", 2000)
+        value.checked = 0
+        self.assertEqual(value.get(), "newer")
+        self.assertEqual(loads, ["old.txt", "new.txt", "new.txt"])
+
+    def test_failed_load(self):
+        def load(storage, file_name, _modified):
+            raise ValueError("Half written")
+
+        value = storage_file.StorageFile("vdv-certs", ("data.txt",), load)
+        self.write("data.txt", "data", 1000)
+        with self.assertRaises(ValueError):
+            value.get()
+        self.assertFalse(value.loaded)
+
+    def test_org_ids(self):
+        self.addCleanup(org_id.ORG_IDS.reset)
+        org_id.ORG_IDS.reset()
+        self.assertEqual(org_id.get_org(1), (None, False))
+
+        self.write("orgs.json", json.dumps({"orgs": [
+            {"org_type": "VDV", "id": "1", "test_id": "5001", "name": "Test Verkehrsbetriebe"},
+            {"org_type": "UIC", "id": "2", "name": "Not VDV"},
+        ]}), 1000)
+        org_id.ORG_IDS.checked = 0
+        self.assertEqual(org_id.get_org(1), ("Test Verkehrsbetriebe", False))
+        self.assertEqual(org_id.get_org(5001), ("Test Verkehrsbetriebe", True))
+        self.assertEqual(org_id.get_org(2), (None, False))
+
+        self.write("org_ids.json", json.dumps({"orgs": [[1, "Renamed", False]]}), 2000)
+        org_id.ORG_IDS.checked = 0
+        self.assertEqual(org_id.get_org(1), ("Renamed", False))
+        self.assertEqual(org_id.get_org(5001), (None, False))
+
+
+class TLVReaderTestCase(SimpleTestCase):
+    def test_elements(self):
+        data = bytes.fromhex("0000DA0101" "DC820003010203" "5F2C0142" "DB00")
+        self.assertEqual(tlv.Reader(data).elements(), [
+            (0xDA, b"\x01"),
+            (0xDC, b"\x01\x02\x03"),
+            (0x5F2C, b"B"),
+            (0xDB, b""),
+        ])
+
+    def test_children(self):
+        data = bytes.fromhex("85" "08" "DA0101" "DB03010203")
+        reader = tlv.Reader(data)
+        tag, offset, length = reader.next()
+        self.assertEqual(tag, 0x85)
+        self.assertEqual(reader.children(offset, length).elements(), [(0xDA, b"\x01"), (0xDB, b"\x01\x02\x03")])
+        self.assertIsNone(reader.next())
+
+    def test_bounds(self):
+        # The reader must never see past the end it was given, even if the buffer carries on
+        data = bytes.fromhex("DA0101" "DB0101")
+        self.assertEqual(tlv.Reader(data, 0, 3).elements(), [(0xDA, b"\x01")])
+        self.assertEqual(tlv.Reader(memoryview(data), 3).elements(), [(0xDB, b"\x01")])
+
+    def test_invalid(self):
+        for data in ("DA", "DA02FF", "5F", "5F8080808001", "DA85FFFFFFFFFF", "DA80", "DA82FF"):
+            with self.subTest(data=data), self.assertRaises(util.VDVException):
+                tlv.Reader(bytes.fromhex(data)).elements()
+
+
+class CertificateBundleTestCase(SimpleTestCase):
+    def certificate_data(self) -> pki.CertificateData:
+        return pki.CertificateData(
+            certificate_profile_identifier=4,
+            ca_reference=pki.CAReference.root(),
+            certificate_holder_reference=pki.CAReference(b"DEVDV", 16, 1, 2019),
+            certificate_holder_authorization=pki.CertificateHolderAuthorization(name="VDVKA\x00", service_indicator=0),
+            expiry_date=util.Date(year=2030, month=12, day=31),
+            public_key=pki.RSAPublicKey(modulus=(1 << 1023) | 12345, modulus_len=128, exponent=65537),
+        )
+
+    def test_round_trip(self):
+        entries = [
+            bundle.BundleEntry(ca_reference=b"DEVDV\x10\x01\x1d", data=b"\x7f\x21" + bytes(range(200)),
+                               certificate_data=self.certificate_data()),
+            bundle.BundleEntry(ca_reference=b"DEVDV\x10\x01\x1e", data=b"\x7f\x21\x00", certificate_data=None),
+        ]
+        data = bundle.build_bundle(entries)
+        self.assertEqual(bundle.read_bundle(data), entries)
+
+        raw_cert = pki.RawCertificate.from_bundle_entry(bundle.read_bundle(data)[0])
+        self.assertEqual(raw_cert.filename, "444556445610011d.der")
+        self.assertEqual(raw_cert.ca_reference, pki.CAReference(b"DEVDV", 16, 1, 2019))
+        self.assertEqual(raw_cert.certificate_data, self.certificate_data())
+
+    def test_empty(self):
+        self.assertEqual(bundle.read_bundle(bundle.build_bundle([])), [])
+
+    def test_invalid(self):
+        data = bundle.build_bundle([
+            bundle.BundleEntry(ca_reference=b"DEVDV\x10\x01\x1d", data=b"\x7f\x21\x00",
+                               certificate_data=self.certificate_data()),
+        ])
+        for invalid in (data[:5], b"XXXX" + data[4:], data[:4] + b"\x02" + data[5:], data[:20], data[:-1]):
+            with self.assertRaises(util.VDVException):
+                bundle.read_bundle(invalid)
+
+
+class StationIndexTestCase(SimpleTestCase):
+    STATIONS = [
+        {"name": "Berlin Hbf", "uic": "8011160", "country": "DE", "latitude": "52.525592", "longitude": "13.369545",
+         "time_zone": "Europe/Berlin"},
+        {"name": "Berlin Friedrichstraße", "uic": "8011306", "country": "DE", "latitude": "52.520331",
+         "longitude": "13.386934", "time_zone": "Europe/Berlin"},
+        {"name": "Potsdam Hbf", "uic": "8012666", "country": "DE", "latitude": "52.391659",
+         "longitude": "13.066940"},
+        {"name": "Paris Nord", "uic": "8727100", "country": "FR", "latitude": "48.880185", "longitude": "2.354726",
+         "time_zone": "Europe/Paris"},
+        {"name": "Unknown", "uic": "8099999", "country": "DE"},
+        {"name": "No code", "country": "DE", "latitude": "52.5", "longitude": "13.4"},
+        {"name": "Bad code", "uic": "abc", "country": "DE"},
+    ]
+
+    def setUp(self):
+        self.index = stations.StationIndex(stations.build_station_index(self.STATIONS))
+        patcher = unittest.mock.patch.object(stations, "get_station_index", return_value=self.index)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lookup(self):
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.station(self.index.find(8011306)), {
+            "name": "Berlin Friedrichstraße", "uic": "8011306", "country": "DE",
+            "latitude": 52.520331, "longitude": 13.386934, "time_zone": "Europe/Berlin",
+        })
+        self.assertEqual(self.index.station(self.index.find(8012666)), {
+            "name": "Potsdam Hbf", "uic": "8012666", "country": "DE", "latitude": 52.391659, "longitude": 13.06694,
+        })
+        self.assertEqual(self.index.station(self.index.find(8099999)), {
+            "name": "Unknown", "uic": "8099999", "country": "DE",
+        })
+        self.assertIsNone(self.index.find(8000000))
+        self.assertEqual(stations.get_station_by_uic(8727100)["name"], "Paris Nord")
+        self.assertIsNone(stations.get_station_by_uic(1))
+
+    def test_near(self):
+        self.assertEqual([s["uic"] for s in stations.get_stations_near(52.52, 13.38, 2)], ["8011306", "8011160"])
+        self.assertEqual([s["uic"] for s in stations.get_stations_near(52.52, 13.38, 30)],
+                         ["8011306", "8011160", "8012666"])
+        self.assertEqual([s["uic"] for s in stations.get_stations_near(52.52, 13.38, 30, 1)], ["8011306"])
+        self.assertEqual(stations.get_stations_near(0, 0, 100), [])
+
+    def test_near_matches_brute_force(self):
+        rng = random.Random(1)
+        rows = [{
+            "name": f"Station {i}", "uic": str(8000000 + i), "country": "DE",
+            "latitude": f"{rng.uniform(47, 55):.6f}", "longitude": f"{rng.uniform(5, 15):.6f}",
+        } for i in range(500)]
+        with unittest.mock.patch.object(
+                stations, "get_station_index",
+                return_value=stations.StationIndex(stations.build_station_index(rows))
+        ):
+            for _ in range(20):
+                latitude, longitude, radius = rng.uniform(47, 55), rng.uniform(5, 15), rng.uniform(5, 80)
+                expected = sorted(
+                    (stations.distance_km(latitude, longitude, float(row["latitude"]), float(row["longitude"])),
+                     row["uic"]) for row in rows
+                )
+                expected = [uic_code for distance, uic_code in expected if distance <= radius]
+                self.assertEqual([s["uic"] for s in stations.get_stations_near(latitude, longitude, radius)],
+                                 expected)
+
+    def test_box(self):
+        self.assertEqual(sorted(s["uic"] for s in stations.get_stations_in_box(52, 13, 53, 14)),
+                         ["8011160", "8011306", "8012666"])
+        self.assertEqual(stations.get_stations_in_box(40, -10, 45, 0), [])
+
+    def test_along_route(self):
+        route = (52.525592, 13.369545, 52.391659, 13.066940)
+        self.assertEqual([s["uic"] for s in stations.get_stations_along_route(*route, 2)],
+                         ["8011160", "8011306", "8012666"])
+        self.assertEqual([s["uic"] for s in stations.get_stations_along_route(
+            *route, 2, exclude={"8011160", "8012666"}
+        )], ["8011306"])
+        self.assertEqual([s["uic"] for s in stations.get_stations_along_route(*route, 0.5)], ["8011160", "8012666"])
+
+    def test_along_route_limit(self):
+        rng = random.Random(1)
+        rows = [{
+            "name": f"Station {i}", "uic": str(8000000 + i), "country": "DE",
+            "latitude": f"{rng.uniform(50, 52):.6f}", "longitude": f"{rng.uniform(8, 12):.6f}",
+        } for i in range(2000)]
+        with unittest.mock.patch.object(
+                stations, "get_station_index",
+                return_value=stations.StationIndex(stations.build_station_index(rows))
+        ):
+            every_station = stations.get_stations_along_route(50.5, 8.5, 51.5, 11.5, 3)
+            self.assertGreater(len(every_station), 8)
+            picked = stations.get_stations_along_route(50.5, 8.5, 51.5, 11.5, 3, 8)
+            self.assertEqual(len(picked), 8)
+            # Spread over the whole route in order, not just the first few
+            positions = [every_station.index(station) for station in picked]
+            self.assertEqual(positions, sorted(positions))
+            self.assertLess(positions[0], len(every_station) / 8)
+            self.assertGreater(positions[-1], len(every_station) * 7 / 8)
+
+    def test_truncated(self):
+        data = stations.build_station_index(self.STATIONS)
+        for length in (0, 10, len(data) // 2, len(data) - 1):
+            with self.subTest(length=length), self.assertRaises(ValueError):
+                stations.StationIndex(data[:length])
+
+
+class AztecBitsTestCase(SimpleTestCase):
+    @staticmethod
+    def pack(codes):
+        bits = "".join(format(code, f"0{size}b") for size, code in codes)
+        return int(bits, 2).to_bytes((len(bits) + 7) // 8, "big") if bits else b"", len(bits)
+
+    def decode(self, codes, end_index=None, padding=0):
+        data, num_bits = self.pack(codes + [(8, 0xFF)] * padding)
+        if end_index is None:
+            end_index = sum(size for size, _ in codes)
+        data = (int.from_bytes(data, "big") << (-num_bits % 8)).to_bytes(len(data), "big")
+        return bytes(aztec.get_encoded_data_from_bits(data, end_index))
+
+    def test_text(self):
+        # A, B, D/L, 1, 2, U/S, C, 3
+        self.assertEqual(self.decode([(5, 2), (5, 3), (5, 30), (4, 3), (4, 4), (4, 15), (5, 4), (4, 5)]),
+                         b"AB12C3")
+        # L/L, a, U/S, A, b
+        self.assertEqual(self.decode([(5, 28), (5, 2), (5, 28), (5, 2), (5, 3)]), b"aAb")
+
+    def test_binary(self):
+        payload = bytes(range(3))
+        self.assertEqual(
+            self.decode([(5, 2), (5, 31), (5, 3)] + [(8, b) for b in payload] + [(5, 3)]), b"A" + payload + b"B"
+        )
+
+        payload = bytes(random.Random(1).randrange(256) for _ in range(300))
+        self.assertEqual(self.decode([(5, 31), (5, 0), (11, len(payload) - 31)] + [(8, b) for b in payload]),
+                         payload)
+
+    def test_truncated(self):
+        codes = [(5, 2), (5, 31), (5, 4)] + [(8, b) for b in b"WXYZ"]
+        self.assertEqual(self.decode(codes, end_index=10 + 5 + 8 * 2 + 3, padding=1), b"AWX")
+        self.assertEqual(self.decode([(5, 2), (5, 3)], end_index=8, padding=1), b"A")
+        self.assertEqual(self.decode([(5, 2)], end_index=1000), b"A")
+        self.assertEqual(aztec.get_encoded_data_from_bits(b"", 0), b"")
+
+
+class FlexDecoderTestCase(SimpleTestCase):
+    # Seeded so a failure can be reproduced, small enough to keep the suite quick
+    SEED = 1
+    SAMPLES = 40
+    MUTATIONS = 5
+
+    @staticmethod
+    def outcome(decode, data: bytes):
+        # Malformed input has to fail the same way too, asn1tools doesn't always raise a DecodeError and raises
+        # NotImplementedError where the generated decoders raise a DecodeError
+        try:
+            return decode(data)
+        except NotImplementedError:
+            return uper.DecodeError
+        except Exception as e:
+            return type(e)
+
+    def inputs(self, rng: random.Random, spec):
+        for _ in range(self.SAMPLES):
+            data = bytes(spec.encode(
+                "UicRailTicketData", codegen.random_value(spec.types["UicRailTicketData"]._type, rng)
+            ))
+            yield data
+            for _ in range(self.MUTATIONS):
+                mutated = bytearray(data)
+                if rng.random() < 0.5 and len(mutated) > 1:
+                    del mutated[rng.randrange(1, len(mutated)):]
+                else:
+                    mutated[rng.randrange(len(mutated))] ^= 1 << rng.randrange(8)
+                yield bytes(mutated)
+
+    def test_matches_asn1tools(self):
+        for version in flex.ASN1_SPEC_FILES:
+            decoder = flex.get_decoder(version)
+            if decoder is None:
+                self.skipTest(f"No generated decoder for version {version}")
+
+            spec = flex.get_spec(version)
+            rng = random.Random(self.SEED)
+            for i, data in enumerate(self.inputs(rng, spec)):
+                with self.subTest(version=version, sample=i, data=data.hex()):
+                    expected = self.outcome(lambda d: spec.decode("UicRailTicketData", d), data)
+                    actual = self.outcome(decoder.decode, data)
+                    self.assertTrue(codegen.identical(expected, actual), f"{expected!r} != {actual!r}")
+
+                    expected = self.outcome(lambda d: flex.decode_summary(spec, d), data)
+                    actual = self.outcome(decoder.decode_summary, data)
+                    self.assertTrue(codegen.identical(expected, actual), f"{expected!r} != {actual!r}")
+
+    def test_parse(self):
+        spec = flex.get_spec(3)
+        data = bytes(spec.encode(
+            "UicRailTicketData", codegen.random_value(spec.types["UicRailTicketData"]._type, random.Random(self.SEED))
+        ))
+        # The summary stops after the first transport document
+        parsed = uic.Flex.parse(3, data)
+        self.assertEqual(parsed.data["issuingDetail"], parsed.summary["issuingDetail"])
+        self.assertEqual(parsed.data.get("transportDocument", [])[:1], parsed.summary.get("transportDocument", [])[:1])
+
+    def test_invalid(self):
+        cases = (
+            (3, ""),
+            (13, "60800936bf54228028000032560db3930b7400"),
+            # Normally small length above 64, unsupported by asn1tools
+            (3, "608012474823c053200a0004054572696b61008050040000000030300e466ad680"),
+        )
+        for generated in (True, False):
+            with unittest.mock.patch.object(flex, "DECODERS", {} if generated else {13: None, 2: None, 3: None}):
+                for version, data in cases:
+                    with self.subTest(generated=generated, version=version, data=data), \
+                            self.assertRaises(uic.util.UICException):
+                        uic.Flex.parse(version, bytes.fromhex(data))
+
+                # Only the tail is corrupt, so this only fails once the whole record is decoded
+                parsed = uic.Flex.parse(3, bytes.fromhex(
+                    "2080000ce4636b6a8182100000200002148000f72d1bb762e583366c18b16cdd878820428000000330715cfb013c9570"
+                ))
+                with self.subTest(generated=generated), self.assertRaises(ticket.TicketError):
+                    ticket.decode_ticket_uic_flex(parsed)
@@ -4,6 +4,7 @@ import traceback
 import typing
 import datetime
 import Crypto.Hash.TupleHash128
+from django.conf import settings
 
 from . import models, vdv, uic
 
@@ -45,7 +46,7 @@ class VDVTicket:
 
         ticket_type = self.type()
         if ticket_type == models.Ticket.TYPE_DEUTCHLANDTICKET:
-            passenger_data = next(filter(lambda d: isinstance(d, vdv.ticket.PassengerData), self.ticket.product_data), None)
+            passenger_data = self.ticket.passenger_data
             if passenger_data:
                 hd.update(b"deutschlandticket")
                 hd.update(self.ticket.product_org_id.to_bytes(8, "big"))
@@ -68,6 +69,7 @@ class UICTicket:
     layout: typing.Optional[uic.LayoutV1]
     flex: typing.Optional[uic.Flex]
     other_records: typing.List[uic.envelope.Record]
+    signature_status: uic.SignatureStatus
 
     @property
     def ticket_type(self) -> str:
@@ -75,11 +77,11 @@ class UICTicket:
 
     def type(self) -> str:
         if self.flex:
-            issuer_num = self.flex.data["issuingDetail"].get("issuerNum")
-            if len(self.flex.data.get("transportDocument", [])) >= 1:
-                ticket_type, ticket = self.flex.data["transportDocument"][0]["ticket"]
+            issuer_num = self.flex.summary["issuingDetail"].get("issuerNum")
+            if len(self.flex.summary.get("transportDocument", [])) >= 1:
+                ticket_type, ticket = self.flex.summary["transportDocument"][0]["ticket"]
                 if ticket_type == "openTicket":
-                    if len(self.flex.data.get("travelerDetail", {}).get("traveler", [])) >= 1 and \
+                    if len(self.flex.summary.get("travelerDetail", {}).get("traveler", [])) >= 1 and \
                         issuer_num == 1080: # Deutsche Bahn
                         if ticket.get("productIdNum") in (
                                 9999, # Deutschlandticket subscription
@@ -109,21 +111,21 @@ class UICTicket:
         ticket_type = self.type()
 
         if ticket_type == models.Ticket.TYPE_DEUTCHLANDTICKET:
-            passenger = self.flex.data.get("travelerDetail", {}).get("traveler", [{}])[0]
+            passenger = self.flex.summary.get("travelerDetail", {}).get("traveler", [{}])[0]
             dob_year = passenger.get("yearOfBirth", 0)
             dob_month = passenger.get("monthOfBirth", 0)
             dob_day = passenger.get("dayOfBirthInMonth", 0)
             hd.update(b"deutschlandticket")
-            hd.update(self.flex.data["issuingDetail"]["issuerNum"].to_bytes(8, "big"))
+            hd.update(self.flex.summary["issuingDetail"]["issuerNum"].to_bytes(8, "big"))
             hd.update(passenger.get("firstName").encode("utf-8"))
             hd.update(passenger.get("lastName").encode("utf-8"))
             hd.update(f"{dob_year:04d}-{dob_month:02d}-{dob_day:02d}".encode("utf-8"))
             return base64.b32hexencode(hd.digest()).decode("utf-8")
 
         elif ticket_type == models.Ticket.TYPE_BAHNCARD:
-            card = self.flex.data["transportDocument"][0]["ticket"][1]
+            card = self.flex.summary["transportDocument"][0]["ticket"][1]
             hd.update(b"bahncard")
-            hd.update(self.flex.data["issuingDetail"].get("issuerNum", 0).to_bytes(8, "big"))
+            hd.update(self.flex.summary["issuingDetail"].get("issuerNum", 0).to_bytes(8, "big"))
             if "cardIdIA5" in card:
                 hd.update(card["cardIdIA5"].encode("utf-8"))
             else:
@@ -131,9 +133,9 @@ class UICTicket:
             return base64.b32hexencode(hd.digest()).decode("utf-8")
 
         elif ticket_type == models.Ticket.TYPE_FAHRKARTE:
-            ticket = self.flex.data["transportDocument"][0]["ticket"][1]
+            ticket = self.flex.summary["transportDocument"][0]["ticket"][1]
             hd.update(b"fahrkarte")
-            hd.update(self.flex.data["issuingDetail"].get("issuerNum", 0).to_bytes(8, "big"))
+            hd.update(self.flex.summary["issuingDetail"].get("issuerNum", 0).to_bytes(8, "big"))
             if "referenceIA5" in ticket:
                 hd.update(ticket["referenceIA5"].encode("utf-8"))
             else:
@@ -141,9 +143,9 @@ class UICTicket:
             return base64.b32hexencode(hd.digest()).decode("utf-8")
 
         elif ticket_type == models.Ticket.TYPE_RESERVIERUNG:
-            ticket = self.flex.data["transportDocument"][0]["ticket"][1]
+            ticket = self.flex.summary["transportDocument"][0]["ticket"][1]
             hd.update(b"reservierung")
-            hd.update(self.flex.data["issuingDetail"].get("issuerNum", 0).to_bytes(8, "big"))
+            hd.update(self.flex.summary["issuingDetail"].get("issuerNum", 0).to_bytes(8, "big"))
             if "referenceIA5" in ticket:
                 hd.update(ticket["referenceIA5"].encode("utf-8"))
             else:
@@ -151,7 +153,7 @@ class UICTicket:
             return base64.b32hexencode(hd.digest()).decode("utf-8")
 
         elif ticket_type == models.Ticket.TYPE_INTERRAIL:
-            interrail_pass = self.flex.data["transportDocument"][0]["ticket"][1]
+            interrail_pass = self.flex.summary["transportDocument"][0]["ticket"][1]
             hd.update(b"interrail")
             if "referenceIA5" in interrail_pass:
                 hd.update(interrail_pass["referenceIA5"].encode("utf-8"))
@@ -201,7 +203,36 @@ class UICTicket:
             return False
 
 
-def parse_ticket_vdv(ticket_bytes: bytes) -> VDVTicket:
+PKI_STORE = None
+ROOT_CA = None
+ISSUING_CAS = {}
+ENVELOPE_CERTIFICATES = vdv.pki.CertificateCache(settings.VDV_ENVELOPE_CERTIFICATE_CACHE_SIZE)
+
+
+def get_pki_store() -> vdv.CertificateStore:
+    global PKI_STORE, ROOT_CA
+
+    if PKI_STORE:
+        try:
+            changed = PKI_STORE.refresh()
+        except vdv.util.VDVException:
+            raise TicketError(
+                title="Internal error",
+                message="The PKI certificates could not be reloaded. This is almost certainly a bug.",
+                exception=traceback.format_exc()
+            )
+
+        if changed:
+            ENVELOPE_CERTIFICATES.clear()
+        if vdv.CAReference.root().to_bytes() in changed:
+            # Every issuing CA was verified against the old root
+            ROOT_CA = None
+            ISSUING_CAS.clear()
+        for ca_reference in changed:
+            ISSUING_CAS.pop(ca_reference, None)
+
+        return PKI_STORE
+
     pki_store = vdv.CertificateStore()
     try:
         pki_store.load_certificates()
@@ -212,6 +243,34 @@ def parse_ticket_vdv(ticket_bytes: bytes) -> VDVTicket:
             exception=traceback.format_exc()
         )
 
+    PKI_STORE = pki_store
+    return PKI_STORE
+
+
+def get_root_ca() -> vdv.CertificateData:
+    global ROOT_CA
+
+    pki_store = get_pki_store()
+    if ROOT_CA:
+        return ROOT_CA
+
+    ROOT_CA = verify_root_ca(pki_store)
+    return ROOT_CA
+
+
+def get_issuing_ca(ca_reference: vdv.CAReference) -> vdv.CertificateData:
+    root_ca_data = get_root_ca()
+
+    car_bytes = ca_reference.to_bytes()
+    if issuing_ca_data := ISSUING_CAS.get(car_bytes):
+        return issuing_ca_data
+
+    issuing_ca_data = verify_issuing_ca(get_pki_store(), root_ca_data, ca_reference)
+    ISSUING_CAS[car_bytes] = issuing_ca_data
+    return issuing_ca_data
+
+
+def verify_root_ca(pki_store: vdv.CertificateStore) -> vdv.CertificateData:
     raw_root_ca = pki_store.find_certificate(vdv.CAReference.root())
     if not raw_root_ca:
         raise TicketError(
@@ -219,6 +278,9 @@ def parse_ticket_vdv(ticket_bytes: bytes) -> VDVTicket:
             message="The root CA couldn't be found. This is almost certainly a bug.",
         )
 
+    if raw_root_ca.certificate_data:
+        return raw_root_ca.certificate_data
+
     try:
         root_ca = vdv.Certificate.parse(raw_root_ca)
     except vdv.util.VDVException:
@@ -259,23 +321,40 @@ def parse_ticket_vdv(ticket_bytes: bytes) -> VDVTicket:
             exception=traceback.format_exc()
         )
 
-    try:
-        envelope = vdv.EnvelopeV2.parse(ticket_bytes)
-    except vdv.util.VDVException:
-        raise TicketError(
-            title="This doesn't look like a valid VDV ticket",
-            message="You may have scanned something that is not a VDV ticket, the ticket is corrupted, or there "
-                    "is a bug in this program.",
-            exception=traceback.format_exc()
-        )
+    return root_ca_data
+
 
-    raw_issuing_ca = pki_store.find_certificate(envelope.ca_reference)
+def verify_issuing_ca(
+        pki_store: vdv.CertificateStore, root_ca_data: vdv.CertificateData, ca_reference: vdv.CAReference
+) -> vdv.CertificateData:
+    raw_issuing_ca = pki_store.find_certificate(ca_reference)
     if not raw_issuing_ca:
         raise TicketError(
             title="Unknown issuing certificate",
             message="The certificate that issued this ticket is not known - the ticket is likely invalid."
         )
 
+    if raw_issuing_ca.certificate_data:
+        issuing_ca_data = raw_issuing_ca.certificate_data
+    else:
+        issuing_ca_data = decode_issuing_ca(raw_issuing_ca, root_ca_data)
+
+    if issuing_ca_data.ca_reference != root_ca_data.certificate_holder_reference:
+        raise TicketError(
+            title="Broken certificate chain",
+            message="The issuing CA isn't issued by the root CA - the ticket is likely invalid."
+        )
+
+    if ca_reference != issuing_ca_data.certificate_holder_reference:
+        raise TicketError(
+            title="Broken certificate chain",
+            message="The ticket certificate isn't issued by the issuing CA - the ticket is likely invalid."
+        )
+
+    return issuing_ca_data
+
+
+def decode_issuing_ca(raw_issuing_ca: vdv.pki.RawCertificate, root_ca_data: vdv.CertificateData) -> vdv.CertificateData:
     try:
         issuing_ca = vdv.Certificate.parse(raw_issuing_ca)
     except vdv.util.VDVException:
@@ -313,18 +392,10 @@ def parse_ticket_vdv(ticket_bytes: bytes) -> VDVTicket:
             exception=traceback.format_exc()
         )
 
-    if issuing_ca_data.ca_reference != root_ca_data.certificate_holder_reference:
-        raise TicketError(
-            title="Broken certificate chain",
-            message="The issuing CA isn't issued by the root CA - the ticket is likely invalid."
-        )
+    return issuing_ca_data
 
-    if envelope.ca_reference != issuing_ca_data.certificate_holder_reference:
-        raise TicketError(
-            title="Broken certificate chain",
-            message="The ticket certificate isn't issued by the issuing CA - the ticket is likely invalid."
-        )
 
+def decode_envelope_certificate(envelope: vdv.EnvelopeV2, issuing_ca_data: vdv.CertificateData) -> vdv.CertificateData:
     if envelope.certificate.needs_ca_key():
         try:
             envelope.certificate.decrypt_with_ca_key(issuing_ca_data)
@@ -353,6 +424,30 @@ def parse_ticket_vdv(ticket_bytes: bytes) -> VDVTicket:
             exception=traceback.format_exc()
         )
 
+    return envelope_certificate_data
+
+
+def parse_ticket_vdv(ticket_bytes: bytes) -> VDVTicket:
+    root_ca_data = get_root_ca()
+
+    try:
+        envelope = vdv.EnvelopeV2.parse(ticket_bytes)
+    except vdv.util.VDVException:
+        raise TicketError(
+            title="This doesn't look like a valid VDV ticket",
+            message="You may have scanned something that is not a VDV ticket, the ticket is corrupted, or there "
+                    "is a bug in this program.",
+            exception=traceback.format_exc()
+        )
+
+    issuing_ca_data = get_issuing_ca(envelope.ca_reference)
+
+    cache_key = ENVELOPE_CERTIFICATES.key(envelope.certificate, envelope.ca_reference)
+    envelope_certificate_data = ENVELOPE_CERTIFICATES.get(cache_key)
+    if not envelope_certificate_data:
+        envelope_certificate_data = decode_envelope_certificate(envelope, issuing_ca_data)
+        ENVELOPE_CERTIFICATES.put(cache_key, envelope_certificate_data)
+
     try:
         ticket_data = envelope.decrypt_with_cert(envelope_certificate_data)
     except vdv.util.VDVException:
@@ -381,7 +476,7 @@ def parse_ticket_vdv(ticket_bytes: bytes) -> VDVTicket:
 
 
 def parse_ticket_uic_head(ticket_envelope: uic.Envelope) -> typing.Optional[uic.HeadV1]:
-    head_record = next(filter(lambda r: r.id == "U_HEAD", ticket_envelope.records), None)
+    head_record = ticket_envelope.record("U_HEAD")
     if not head_record:
         return None
 
@@ -402,7 +497,7 @@ def parse_ticket_uic_head(ticket_envelope: uic.Envelope) -> typing.Optional[uic.
 
 
 def parse_ticket_uic_layout(ticket_envelope: uic.Envelope) -> typing.Optional[uic.LayoutV1]:
-    layout_record = next(filter(lambda r: r.id == "U_TLAY", ticket_envelope.records), None)
+    layout_record = ticket_envelope.record("U_TLAY")
     if not layout_record:
         return None
 
@@ -423,7 +518,7 @@ def parse_ticket_uic_layout(ticket_envelope: uic.Envelope) -> typing.Optional[ui
 
 
 def parse_ticket_uic_flex(ticket_envelope: uic.Envelope) -> typing.Optional[uic.Flex]:
-    flex_record = next(filter(lambda r: r.id == "U_FLEX", ticket_envelope.records), None)
+    flex_record = ticket_envelope.record("U_FLEX")
     if not flex_record:
         return None
 
@@ -437,6 +532,18 @@ def parse_ticket_uic_flex(ticket_envelope: uic.Envelope) -> typing.Optional[uic.
         )
 
 
+def decode_ticket_uic_flex(flex: uic.Flex) -> typing.Dict[str, typing.Any]:
+    # Parsing only checks the summary, a corrupt tail only shows up once the full record is needed
+    try:
+        return flex.data
+    except uic.util.UICException:
+        raise TicketError(
+            title="Invalid flexible data record",
+            message="The flexible record is invalid - the ticket is likely invalid.",
+            exception=traceback.format_exc()
+        )
+
+
 def parse_ticket_uic(ticket_bytes: bytes) -> UICTicket:
     try:
         ticket_envelope = uic.Envelope.parse(ticket_bytes)
@@ -454,7 +561,8 @@ def parse_ticket_uic(ticket_bytes: bytes) -> UICTicket:
         head=parse_ticket_uic_head(ticket_envelope),
         layout=parse_ticket_uic_layout(ticket_envelope),
         flex=parse_ticket_uic_flex(ticket_envelope),
-        other_records=[r for r in ticket_envelope.records if not r.id.startswith("U_")]
+        other_records=[r for r in ticket_envelope.records if not r.id.startswith("U_")],
+        signature_status=uic.signature.verify(ticket_envelope, ticket_bytes)
     )
 
 def parse_ticket(ticket_bytes: bytes) -> typing.Union[VDVTicket, UICTicket]:
@@ -3,4 +3,5 @@ from .envelope import Envelope
 from .head import HeadV1
 from .layout import LayoutV1
 from .flex import Flex
-from . import rics, stations
\ No newline at end of file
+from .signature import SignatureStatus
+from . import rics, stations, signature, countries
\ No newline at end of file
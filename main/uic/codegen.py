@@ -0,0 +1,473 @@
+import hashlib
+import pathlib
+import random
+import string
+import typing
+import asn1tools
+import asn1tools.codecs.per
+import asn1tools.codecs.uper
+
+GLUE_TYPES = ("UicRailTicketData", "DocumentData")
+GENERATED_TYPES = (
+    "IssuingData", "TravelerData", "OpenTicketData", "CustomerCardData", "PassData", "ReservationData"
+)
+SUMMARY_MEMBER = ("UicRailTicketData", "transportDocument")
+
+HEADER = '''# Generated by "manage.py generate-uic-decoders" from {spec_file}, do not edit.
+from .. import uper
+from ..uper import OutOfDataError, DecodeError
+
+VERSION = {version!r}
+SPEC_SHA256 = {spec_hash!r}
+FALLBACK_PATHS = {fallback_paths!r}
+FALLBACK_TYPES = {{}}
+
+
+def fallback(index, v, n, p):
+    type_ = FALLBACK_TYPES.get(index)
+    if type_ is None:
+        from .. import flex
+        type_ = uper.resolve(flex.get_spec(VERSION), FALLBACK_PATHS[index])
+        FALLBACK_TYPES[index] = type_
+    return uper.fallback(type_, v, n, p)
+
+
+def decode(data):
+    v, n = uper.load(data)
+    return decode_UicRailTicketData(v, n, 0)[0]
+
+
+def decode_summary(data):
+    v, n = uper.load(data)
+    return decode_UicRailTicketData(v, n, 0, True)[0]
+'''
+
+
+class Unsupported(Exception):
+    pass
+
+
+class Generator:
+    def __init__(self, spec, module: dict):
+        self.spec = spec
+        self.module_types = module["types"]
+        self.functions = {}
+        self.queue = []
+        self.constants = []
+        self.fallback_paths = []
+        self.counter = 0
+
+    def var(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def constant(self, value) -> str:
+        definition = repr(value)
+        if definition not in self.constants:
+            self.constants.append(definition)
+        return f"_C{self.constants.index(definition)}"
+
+    def fallback(self, path: typing.Sequence[str]) -> int:
+        path = tuple(path)
+        if path not in self.fallback_paths:
+            self.fallback_paths.append(path)
+        return self.fallback_paths.index(path)
+
+    def generate(self) -> str:
+        for name in GLUE_TYPES:
+            self.request(name, glue=True)
+        while self.queue:
+            self.generate_function(*self.queue.pop(0))
+
+        constants = "".join(f"_C{i} = {definition}\n" for i, definition in enumerate(self.constants))
+        return "\n\n".join([constants, *self.functions.values()])
+
+    def request(self, name: str, glue: bool = False) -> str:
+        function_name = f"decode_{name}"
+        if function_name not in self.functions:
+            self.functions[function_name] = None
+            self.queue.append((function_name, self.spec.types[name]._type, self.module_types[name], [name], glue))
+        return function_name
+
+    def generate_function(self, function_name, ctype, ptype, path, glue):
+        signature = f"def {function_name}(v, n, p{', summary=False' if tuple(path) == SUMMARY_MEMBER[:1] else ''}):"
+        lines = [signature]
+        target = self.var("r")
+        try:
+            if isinstance(ctype, asn1tools.codecs.per.Sequence):
+                self.emit_sequence(ctype, ptype, target, lines, 1, path, glue)
+            elif isinstance(ctype, asn1tools.codecs.uper.Choice):
+                self.emit_choice(ctype, ptype, target, lines, 1, path, glue)
+            elif isinstance(ctype, asn1tools.codecs.uper.SequenceOf):
+                self.emit_sequence_of(ctype, ptype, target, lines, 1, path, glue)
+            else:
+                raise Unsupported()
+        except Unsupported:
+            lines = [signature]
+            self.emit_fallback(target, lines, 1, path)
+        lines.append(f"    return {target}, p")
+        self.functions[function_name] = "\n".join(lines) + "\n"
+
+    @staticmethod
+    def emit_read(target, bits, lines, indent):
+        pad = "    " * indent
+        if bits == 0:
+            lines.append(f"{pad}{target} = 0")
+            return
+        lines.append(f"{pad}if p + {bits} > n:")
+        lines.append(f"{pad}    raise OutOfDataError(p)")
+        lines.append(f"{pad}{target} = (v >> (n - p - {bits})) & {hex((1 << bits) - 1)}")
+        lines.append(f"{pad}p += {bits}")
+
+    def emit_fallback(self, target, lines, indent, path):
+        index = self.fallback(path)
+        lines.append(f"{'    ' * indent}{target}, p = fallback({index}, v, n, p)")
+
+    def emit_value(self, ctype, ptype, target, lines, indent, path, glue):
+        pad = "    " * indent
+        type_name = ptype.get("type") if ptype else None
+
+        if type_name in self.module_types and self.module_types[type_name]["type"] in (
+                "SEQUENCE", "CHOICE", "SEQUENCE OF"
+        ):
+            if glue and type_name not in GLUE_TYPES and type_name not in GENERATED_TYPES:
+                self.emit_fallback(target, lines, indent, path)
+            else:
+                function_name = self.request(type_name, glue=type_name in GLUE_TYPES)
+                lines.append(f"{pad}{target}, p = {function_name}(v, n, p)")
+            return
+        elif type_name in self.module_types:
+            ptype = self.module_types[type_name]
+
+        if isinstance(ctype, asn1tools.codecs.per.Recursive):
+            self.emit_fallback(target, lines, indent, path)
+            return
+
+        start = len(lines)
+        try:
+            if isinstance(ctype, (asn1tools.codecs.per.Sequence, asn1tools.codecs.uper.Choice)):
+                function_name = self.var(f"decode_{'_'.join(p for p in path if p != '[]')}_")
+                self.functions[function_name] = None
+                self.queue_anonymous(function_name, ctype, ptype, path, glue)
+                lines.append(f"{pad}{target}, p = {function_name}(v, n, p)")
+            elif isinstance(ctype, asn1tools.codecs.uper.SequenceOf):
+                self.emit_sequence_of(ctype, ptype, target, lines, indent, path, glue)
+            elif isinstance(ctype, asn1tools.codecs.per.Boolean):
+                self.emit_read(target, 1, lines, indent)
+                lines.append(f"{pad}{target} = bool({target})")
+            elif isinstance(ctype, asn1tools.codecs.uper.Integer):
+                self.emit_integer(ctype, target, lines, indent)
+            elif isinstance(ctype, asn1tools.codecs.per.Enumerated):
+                self.emit_enumerated(ctype, target, lines, indent)
+            elif isinstance(ctype, asn1tools.codecs.uper.KnownMultiplierStringType):
+                self.emit_string(ctype, target, lines, indent)
+            elif isinstance(ctype, asn1tools.codecs.per.UTF8String):
+                lines.append(f"{pad}{target}, p = uper.read_utf8(v, n, p)")
+            elif isinstance(ctype, asn1tools.codecs.uper.OctetString):
+                self.emit_octet_string(ctype, target, lines, indent)
+            else:
+                raise Unsupported()
+        except Unsupported:
+            del lines[start:]
+            self.emit_fallback(target, lines, indent, path)
+
+    def queue_anonymous(self, function_name, ctype, ptype, path, glue):
+        self.queue.append((function_name, ctype, ptype, list(path), glue))
+
+    def emit_sequence(self, ctype, ptype, target, lines, indent, path, glue):
+        if ctype.additions:
+            raise Unsupported()
+
+        pad = "    " * indent
+        members = [m for m in ptype["members"] if m is not None]
+        if [m["name"] for m in members] != [m.name for m in ctype.root_members]:
+            raise Unsupported()
+
+        lines.append(f"{pad}{target} = {{}}")
+        extended = None
+        if ctype.additions is not None:
+            extended = self.var("e")
+            self.emit_read(extended, 1, lines, indent)
+
+        present = None
+        if ctype.optionals:
+            present = self.var("o")
+            self.emit_read(present, len(ctype.optionals), lines, indent)
+
+        for cmember, pmember in zip(ctype.root_members, members):
+            member_path = path + [cmember.name]
+            value = self.var("x")
+            if cmember in ctype.optionals:
+                bit = len(ctype.optionals) - 1 - ctype.optionals.index(cmember)
+                lines.append(f"{pad}if {present} & {hex(1 << bit)}:")
+                self.emit_value(cmember, pmember, value, lines, indent + 1, member_path, glue)
+                lines.append(f"{pad}    {target}[{cmember.name!r}] = {value}")
+                if cmember.has_default():
+                    lines.append(f"{pad}else:")
+                    lines.append(f"{pad}    {target}[{cmember.name!r}] = {self.default(cmember.default)}")
+            else:
+                self.emit_value(cmember, pmember, value, lines, indent, member_path, glue)
+                lines.append(f"{pad}{target}[{cmember.name!r}] = {value}")
+
+            if tuple(path) == SUMMARY_MEMBER[:1] and cmember.name == SUMMARY_MEMBER[1]:
+                lines.append(f"{pad}if summary:")
+                lines.append(f"{pad}    return {target}, p")
+
+        if extended:
+            lines.append(f"{pad}if {extended}:")
+            lines.append(f"{pad}    p = uper.skip_additions(v, n, p)")
+
+    def default(self, value) -> str:
+        if isinstance(value, (bool, int, str, bytes)) or value is None:
+            return repr(value)
+        raise Unsupported()
+
+    def emit_choice(self, ctype, ptype, target, lines, indent, path, glue):
+        pad = "    " * indent
+        members = [m for m in ptype["members"] if m is not None]
+        root = [ctype.root_index_to_member[i] for i in range(len(ctype.root_index_to_member))]
+        if [m["name"] for m in members] != [m.name for m in root]:
+            raise Unsupported()
+        if ctype.additions_index_to_member:
+            raise Unsupported()
+
+        inner_indent = indent
+        if ctype.additions_index_to_member is not None:
+            extended = self.var("e")
+            self.emit_read(extended, 1, lines, indent)
+            lines.append(f"{pad}if {extended}:")
+            lines.append(f"{pad}    _, p = uper.read_normally_small_number(v, n, p)")
+            length = self.var("l")
+            lines.append(f"{pad}    {length}, p = uper.read_length(v, n, p)")
+            lines.append(f"{pad}    p = uper.skip_bits(n, p, 8 * {length})")
+            lines.append(f"{pad}    {target} = (None, None)")
+            lines.append(f"{pad}else:")
+            inner_indent += 1
+
+        inner_pad = "    " * inner_indent
+        index = self.var("i")
+        if len(root) > 1:
+            self.emit_read(index, ctype.root_number_of_bits, lines, inner_indent)
+        else:
+            lines.append(f"{inner_pad}{index} = 0")
+
+        for i, (cmember, pmember) in enumerate(zip(root, members)):
+            value = self.var("x")
+            lines.append(f"{inner_pad}{'if' if i == 0 else 'elif'} {index} == {i}:")
+            self.emit_value(cmember, pmember, value, lines, inner_indent + 1, path + [cmember.name], glue)
+            lines.append(f"{inner_pad}    {target} = ({cmember.name!r}, {value})")
+        lines.append(f"{inner_pad}else:")
+        lines.append(f"{inner_pad}    raise DecodeError(f\"Expected choice index {{{index}}} to be in range.\")")
+
+    def emit_sequence_of(self, ctype, ptype, target, lines, indent, path, glue):
+        pad = "    " * indent
+        count = self.var("c")
+        lines.append(f"{pad}{target} = []")
+
+        if ctype.has_extension_marker or ctype.number_of_bits is not None:
+            if ctype.has_extension_marker:
+                extended = self.var("e")
+                self.emit_read(extended, 1, lines, indent)
+                lines.append(f"{pad}if {extended}:")
+                lines.append(f"{pad}    {count}, p = uper.read_length(v, n, p)")
+                lines.append(f"{pad}else:")
+                count_indent = indent + 1
+            else:
+                count_indent = indent
+
+            if ctype.number_of_bits is None:
+                raise Unsupported()
+            elif ctype.minimum != ctype.maximum:
+                self.emit_read(count, ctype.number_of_bits, lines, count_indent)
+                lines.append(f"{'    ' * count_indent}{count} += {ctype.minimum}")
+            else:
+                lines.append(f"{'    ' * count_indent}{count} = {ctype.minimum}")
+
+            lines.append(f"{pad}for _ in range({count}):")
+            self.emit_element(ctype, ptype, target, lines, indent + 1, path, glue, False)
+        else:
+            lines.append(f"{pad}while True:")
+            lines.append(f"{pad}    {count}, p = uper.read_length(v, n, p)")
+            lines.append(f"{pad}    for _ in range({count}):")
+            is_summary = tuple(path) == SUMMARY_MEMBER
+            self.emit_element(ctype, ptype, target, lines, indent + 2, path, glue, is_summary)
+            if is_summary:
+                lines.append(f"{pad}    if summary or {count} < 16384:")
+            else:
+                lines.append(f"{pad}    if {count} < 16384:")
+            lines.append(f"{pad}        break")
+
+    def emit_element(self, ctype, ptype, target, lines, indent, path, glue, is_summary):
+        pad = "    " * indent
+        element = self.var("x")
+        self.emit_value(ctype.element_type, ptype.get("element"), element, lines, indent, path + ["[]"], glue)
+        lines.append(f"{pad}{target}.append({element})")
+        if is_summary:
+            lines.append(f"{pad}if summary:")
+            lines.append(f"{pad}    break")
+
+    def emit_integer(self, ctype, target, lines, indent):
+        pad = "    " * indent
+        inner_indent = indent
+        if ctype.has_extension_marker:
+            extended = self.var("e")
+            self.emit_read(extended, 1, lines, indent)
+            lines.append(f"{pad}if {extended}:")
+            lines.append(f"{pad}    {target}, p = uper.read_unconstrained(v, n, p)")
+            lines.append(f"{pad}else:")
+            inner_indent += 1
+
+        if ctype.number_of_bits is None:
+            lines.append(f"{'    ' * inner_indent}{target}, p = uper.read_unconstrained(v, n, p)")
+        else:
+            self.emit_read(target, ctype.number_of_bits, lines, inner_indent)
+            if ctype.minimum:
+                lines.append(f"{'    ' * inner_indent}{target} += {ctype.minimum}")
+
+    def emit_enumerated(self, ctype, target, lines, indent):
+        pad = "    " * indent
+        inner_indent = indent
+        if ctype.additions_index_to_data is not None:
+            additions = self.constant(dict(ctype.additions_index_to_data))
+            extended = self.var("e")
+            self.emit_read(extended, 1, lines, indent)
+            lines.append(f"{pad}if {extended}:")
+            lines.append(f"{pad}    {target}, p = uper.read_normally_small_number(v, n, p)")
+            lines.append(f"{pad}    {target} = {additions}.get({target})")
+            lines.append(f"{pad}else:")
+            inner_indent += 1
+
+        inner_pad = "    " * inner_indent
+        values = [ctype.root_index_to_data[i] for i in range(len(ctype.root_index_to_data))]
+        table = self.constant(tuple(values))
+        index = self.var("i")
+        self.emit_read(index, ctype.root_number_of_bits, lines, inner_indent)
+        lines.append(f"{inner_pad}if {index} >= {len(values)}:")
+        lines.append(
+            f"{inner_pad}    raise DecodeError(f\"Expected enumeration index to be in range, but got {{{index}}}.\")"
+        )
+        lines.append(f"{inner_pad}{target} = {table}[{index}]")
+
+    def emit_string(self, ctype, target, lines, indent):
+        pad = "    " * indent
+        bits = ctype.bits_per_character
+        if not 0 < bits <= 8:
+            raise Unsupported()
+        decode_map = ctype.permitted_alphabet.decode_map
+        if any(value > 0xFF for value in decode_map.values()):
+            raise Unsupported()
+        if len(decode_map) == 1 << bits and all(decode_map[i] == i for i in range(1 << bits)):
+            table = "None"
+        else:
+            table = self.constant(tuple(decode_map.get(i) for i in range(1 << bits)))
+
+        if ctype.has_extension_marker:
+            extended = self.var("e")
+            self.emit_read(extended, 1, lines, indent)
+            lines.append(f"{pad}if {extended}:")
+            lines.append(f"{pad}    raise DecodeError(\"String size extension is not supported.\")")
+
+        if ctype.number_of_bits is None:
+            alphabet_bits = asn1tools.codecs.per.integer_as_number_of_bits_power_of_two(len(ctype.ALPHABET) - 1)
+            if not 0 < alphabet_bits <= 8:
+                raise Unsupported()
+            lines.append(f"{pad}{target}, p = uper.read_chars_unbound(v, n, p, {bits}, {table})")
+        else:
+            length = self.var("l")
+            if ctype.minimum != ctype.maximum:
+                self.emit_read(length, ctype.number_of_bits, lines, indent)
+                lines.append(f"{pad}{length} += {ctype.minimum}")
+            else:
+                lines.append(f"{pad}{length} = {ctype.minimum}")
+            lines.append(f"{pad}{target}, p = uper.read_chars(v, n, p, {length}, {bits}, {table})")
+
+    def emit_octet_string(self, ctype, target, lines, indent):
+        pad = "    " * indent
+        inner_indent = indent
+        if ctype.has_extension_marker:
+            extended = self.var("e")
+            self.emit_read(extended, 1, lines, indent)
+            lines.append(f"{pad}if {extended}:")
+            length = self.var("l")
+            lines.append(f"{pad}    {length}, p = uper.read_length(v, n, p)")
+            lines.append(f"{pad}    {target}, p = uper.read_octets(v, n, p, {length})")
+            lines.append(f"{pad}else:")
+            inner_indent += 1
+
+        inner_pad = "    " * inner_indent
+        if ctype.number_of_bits is None:
+            lines.append(f"{inner_pad}{target}, p = uper.read_octets_unbound(v, n, p)")
+        else:
+            length = self.var("l")
+            if ctype.minimum != ctype.maximum:
+                self.emit_read(length, ctype.number_of_bits, lines, inner_indent)
+                lines.append(f"{inner_pad}{length} += {ctype.minimum}")
+            else:
+                lines.append(f"{inner_pad}{length} = {ctype.minimum}")
+            lines.append(f"{inner_pad}{target}, p = uper.read_octets(v, n, p, {length})")
+
+
+def generate(version: int, spec_file: pathlib.Path) -> str:
+    spec_data = spec_file.read_bytes()
+    spec = asn1tools.compile_string(spec_data.decode("utf-8"), codec="uper")
+    module = next(iter(asn1tools.parse_string(spec_data.decode("utf-8")).values()))
+
+    generator = Generator(spec, module)
+    body = generator.generate()
+    return HEADER.format(
+        spec_file=spec_file.name,
+        version=version,
+        spec_hash=hashlib.sha256(spec_data).hexdigest(),
+        fallback_paths=generator.fallback_paths,
+    ) + "\n\n" + body
+
+
+def random_value(type_, rng: random.Random, depth: int = 0):
+    if isinstance(type_, asn1tools.codecs.per.Recursive):
+        return random_value(type_._inner, rng, depth)
+    elif isinstance(type_, asn1tools.codecs.per.Sequence):
+        value = {}
+        for member in type_.root_members:
+            if (member.optional or member.has_default()) and (depth > 4 or rng.random() < 0.5):
+                continue
+            value[member.name] = random_value(member, rng, depth + 1)
+        return value
+    elif isinstance(type_, asn1tools.codecs.uper.Choice):
+        member = rng.choice(list(type_.root_index_to_member.values()))
+        return member.name, random_value(member, rng, depth + 1)
+    elif isinstance(type_, asn1tools.codecs.uper.SequenceOf):
+        minimum = type_.minimum or 0
+        maximum = minimum + (0 if depth > 4 else 3) if type_.maximum is None else min(type_.maximum, minimum + 3)
+        return [random_value(type_.element_type, rng, depth + 1) for _ in range(rng.randint(minimum, maximum))]
+    elif isinstance(type_, asn1tools.codecs.per.Boolean):
+        return rng.random() < 0.5
+    elif isinstance(type_, asn1tools.codecs.uper.Integer):
+        if type_.number_of_bits is None:
+            return rng.choice([0, 1, -1, 127, 128, -129, 65536, rng.randint(-2 ** 40, 2 ** 40)])
+        return rng.randint(type_.minimum, type_.maximum)
+    elif isinstance(type_, asn1tools.codecs.per.Enumerated):
+        return rng.choice(list(type_.root_index_to_data.values()))
+    elif isinstance(type_, asn1tools.codecs.uper.KnownMultiplierStringType):
+        alphabet = [chr(c) for c in type_.permitted_alphabet.encode_map]
+        minimum = type_.minimum or 0
+        maximum = minimum + 20 if type_.maximum is None else min(type_.maximum, minimum + 20)
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(minimum, maximum)))
+    elif isinstance(type_, asn1tools.codecs.per.UTF8String):
+        alphabet = string.ascii_letters + "äöüßÄÖÜéłø€ 0123456789"
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+    elif isinstance(type_, asn1tools.codecs.uper.OctetString):
+        minimum = type_.minimum or 0
+        maximum = minimum + 40 if type_.maximum is None else min(type_.maximum, minimum + 40)
+        return rng.randbytes(rng.randint(minimum, maximum))
+    else:
+        raise Unsupported(f"Can't generate random values for {type_!r}")
+
+
+def identical(a, b) -> bool:
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return list(a.keys()) == list(b.keys()) and all(identical(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(identical(x, y) for x, y in zip(a, b))
+    return a == b
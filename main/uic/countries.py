@@ -0,0 +1,91 @@
+import typing
+import iso3166
+
+UIC_COUNTRIES = {
+    10: "FR",
+    20: "RU",
+    21: "BY",
+    22: "UA",
+    23: "MD",
+    24: "LT",
+    25: "LV",
+    26: "EE",
+    27: "KZ",
+    28: "GE",
+    29: "UZ",
+    30: "KP",
+    31: "MN",
+    32: "VN",
+    33: "CN",
+    34: "LA",
+    40: "CU",
+    41: "AL",
+    42: "JP",
+    44: "BA",
+    49: "BA",
+    50: "BA",
+    51: "PL",
+    52: "BG",
+    53: "RO",
+    54: "CZ",
+    55: "HU",
+    56: "SK",
+    57: "AZ",
+    58: "AM",
+    59: "KG",
+    60: "IE",
+    61: "KR",
+    62: "ME",
+    63: "MK",
+    64: "TJ",
+    65: "TM",
+    66: "AF",
+    70: "GB",
+    71: "ES",
+    72: "RS",
+    73: "GR",
+    74: "SE",
+    75: "TR",
+    76: "NO",
+    78: "HR",
+    79: "SI",
+    80: "DE",
+    81: "AT",
+    82: "LU",
+    83: "IT",
+    84: "NL",
+    85: "CH",
+    86: "DK",
+    87: "FR",
+    88: "BE",
+    89: "TZ",
+    90: "EG",
+    91: "TN",
+    92: "DZ",
+    93: "MA",
+    94: "PT",
+    95: "IL",
+    96: "IR",
+    97: "SY",
+    98: "LB",
+    99: "IQ",
+    383: "XK",
+}
+
+COUNTRY_NAMES = {}
+for _country in iso3166.countries:
+    COUNTRY_NAMES[_country.alpha2] = _country.name
+    COUNTRY_NAMES[_country.alpha3] = _country.name
+    COUNTRY_NAMES[_country.numeric] = _country.name
+    COUNTRY_NAMES[int(_country.numeric)] = _country.name
+del _country
+
+
+def get_iso_country(code: int) -> typing.Optional[str]:
+    return UIC_COUNTRIES.get(code)
+
+
+def get_country_name(value: typing.Union[str, int]) -> str:
+    if name := COUNTRY_NAMES.get(value):
+        return name
+    return iso3166.countries.get(value).name
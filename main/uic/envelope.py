@@ -1,6 +1,8 @@
 import dataclasses
+import functools
 import typing
 import zlib
+from django.conf import settings
 
 from . import util, rics
 
@@ -15,34 +17,36 @@ class Record:
         return ":".join(f"{b:02x}" for b in self.data)
 
     @classmethod
-    def parse(cls, data: bytes) -> "Record":
-        if len(data) < 12:
+    def parse(cls, data: typing.Union[bytes, memoryview], offset: int = 0) -> "Record":
+        if len(data) - offset < 12:
             raise util.UICException("UIC ticket record too short")
 
+        header = bytes(data[offset:offset + 12])
+
         try:
-            record_id = data[0:6].decode("ascii")
+            record_id = header[0:6].decode("ascii")
         except UnicodeDecodeError as e:
             raise util.UICException("Invalid UIC ticket record ID") from e
 
         try:
-            version_str = data[6:8].decode("ascii")
+            version_str = header[6:8].decode("ascii")
             version = int(version_str, 10)
         except (UnicodeDecodeError, ValueError) as e:
             raise util.UICException("Invalid UIC ticket record version") from e
 
         try:
-            data_length_str = data[8:12].decode("ascii")
+            data_length_str = header[8:12].decode("ascii")
             data_length = int(data_length_str, 10)
         except (UnicodeDecodeError, ValueError) as e:
             raise util.UICException("Invalid UIC ticket record data length") from e
 
-        if len(data) < data_length:
+        if len(data) - offset < data_length:
             raise util.UICException("UIC ticket record data too short")
 
         return cls(
             id=record_id,
             version=version,
-            data=data[12:data_length]
+            data=bytes(data[offset + 12:offset + data_length])
         )
 
 
@@ -57,6 +61,22 @@ class Envelope:
     def issuer(self):
         return rics.get_rics(self.issuer_rics)
 
+    @functools.cached_property
+    def records_by_id(self) -> typing.Dict[str, Record]:
+        records = {}
+        for record in self.records:
+            records.setdefault(record.id, record)
+        return records
+
+    def record(self, record_id: str) -> typing.Optional[Record]:
+        return self.records_by_id.get(record_id)
+
+    def signed_data(self, data: bytes) -> bytes:
+        offset = 64 if self.version == 1 else 78
+        # Stored barcodes come back from the database as a memoryview
+        data_length = int(bytes(data[offset:offset + 4]).decode("ascii"), 10)
+        return bytes(data[offset + 4:offset + 4 + data_length])
+
     @classmethod
     def parse(cls, data: bytes) -> "Envelope":
         if data[:3] != b"#UT":
@@ -87,32 +107,40 @@ class Envelope:
             signature_key_id = signature_key_id_str
 
         if version == 1:
-            signature, data = data[14:64], data[64:]
+            signature, offset = data[14:64], 64
         elif version == 2:
-            signature, data = data[14:78], data[78:]
+            signature, offset = data[14:78], 78
         else:
             raise util.UICException("Unsupported UIC ticket version")
 
         try:
-            data_length_str = data[0:4].decode("ascii")
+            data_length_str = data[offset:offset + 4].decode("ascii")
             data_length = int(data_length_str, 10)
         except (UnicodeDecodeError, ValueError) as e:
             raise util.UICException("Invalid UIC ticket data length") from e
 
-        if len(data) < 4 + data_length:
+        if len(data) - offset < 4 + data_length:
             raise util.UICException("UIC ticket data too short")
 
+        max_size = settings.UIC_MAX_DECOMPRESSED_SIZE
+        decompressor = zlib.decompressobj()
         try:
-            raw_ticket = zlib.decompress(data[4:4+data_length])
+            raw_ticket = decompressor.decompress(memoryview(data)[offset + 4:offset + 4 + data_length], max_size + 1)
         except zlib.error as e:
             raise util.UICException("Failed to decompress UIC ticket data") from e
 
+        if len(raw_ticket) > max_size:
+            raise util.UICException(f"UIC ticket data decompresses to more than {max_size} bytes")
+        if not decompressor.eof:
+            raise util.UICException("Failed to decompress UIC ticket data")
+
         offset = 0
         records = []
-        while raw_ticket[offset:]:
-            record = Record.parse(raw_ticket[offset:])
-            offset += 12 + len(record.data)
-            records.append(record)
+        with memoryview(raw_ticket) as buffer:
+            while offset < len(buffer):
+                record = Record.parse(buffer, offset)
+                offset += 12 + len(record.data)
+                records.append(record)
 
         return cls(
             version=version,
@@ -0,0 +1,2657 @@
+# Generated by "manage.py generate-uic-decoders" from uicRailTicketData_v1.3.4.asn, do not edit.
+from .. import uper
+from ..uper import OutOfDataError, DecodeError
+
+VERSION = 13
+SPEC_SHA256 = '29e6e031e7d9a58332b7b58bff27c0c75284c7e4baa1c444e7c4b0b46fa93f46'
+FALLBACK_PATHS = [('UicRailTicketData', 'controlDetail'), ('UicRailTicketData', 'extension', '[]'), ('DocumentData', 'token'), ('DocumentData', 'ticket', 'carCarriageReservation'), ('DocumentData', 'ticket', 'voucher'), ('DocumentData', 'ticket', 'counterMark'), ('DocumentData', 'ticket', 'parkingGround'), ('DocumentData', 'ticket', 'fipTicket'), ('DocumentData', 'ticket', 'stationPassage'), ('DocumentData', 'ticket', 'extension'), ('DocumentData', 'ticket', 'delayConfirmation')]
+FALLBACK_TYPES = {}
+
+
+def fallback(index, v, n, p):
+    type_ = FALLBACK_TYPES.get(index)
+    if type_ is None:
+        from .. import flex
+        type_ = uper.resolve(flex.get_spec(VERSION), FALLBACK_PATHS[index])
+        FALLBACK_TYPES[index] = type_
+    return uper.fallback(type_, v, n, p)
+
+
+def decode(data):
+    v, n = uper.load(data)
+    return decode_UicRailTicketData(v, n, 0)[0]
+
+
+def decode_summary(data):
+    v, n = uper.load(data)
+    return decode_UicRailTicketData(v, n, 0, True)[0]
+
+
+_C0 = ('microDegree', 'tenthmilliDegree', 'milliDegree', 'centiDegree', 'deciDegree')
+_C1 = ('wgs84', 'grs80')
+_C2 = ('north', 'south')
+_C3 = ('east', 'west')
+_C4 = {}
+_C5 = ('unspecified', 'female', 'male', 'other')
+_C6 = ('adult', 'senior', 'child', 'youth', 'dog', 'bicycle', 'freeAddonPassenger', 'freeAddonChild')
+_C7 = ('seat', 'couchette', 'berth', 'carcarriage')
+_C8 = ('stationUIC', 'stationUICReservation', 'stationERA', 'localCarrierStationCodeTable', 'proprietaryIssuerStationCodeTable')
+_C9 = ('notApplicable', 'first', 'second', 'tourist', 'comfort', 'premium', 'business', 'all')
+_C10 = ('noPrice', 'reservationFee', 'supplement', 'travelPrice')
+_C11 = ('unspecified', 'upperLevel', 'lowerLevel')
+_C12 = ('single', 'special', 'double', 't2', 't3', 't4')
+_C13 = ('unspecified', 'family', 'female', 'male', 'mixed')
+
+
+def decode_UicRailTicketData(v, n, p, summary=False):
+    r1 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e2 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 4 > n:
+        raise OutOfDataError(p)
+    o3 = (v >> (n - p - 4)) & 0xf
+    p += 4
+    x4, p = decode_IssuingData(v, n, p)
+    r1['issuingDetail'] = x4
+    if o3 & 0x8:
+        x5, p = decode_TravelerData(v, n, p)
+        r1['travelerDetail'] = x5
+    if o3 & 0x4:
+        x6 = []
+        while True:
+            c7, p = uper.read_length(v, n, p)
+            for _ in range(c7):
+                x8, p = decode_DocumentData(v, n, p)
+                x6.append(x8)
+                if summary:
+                    break
+            if summary or c7 < 16384:
+                break
+        r1['transportDocument'] = x6
+    if summary:
+        return r1, p
+    if o3 & 0x2:
+        x9, p = fallback(0, v, n, p)
+        r1['controlDetail'] = x9
+    if o3 & 0x1:
+        x10 = []
+        while True:
+            c11, p = uper.read_length(v, n, p)
+            for _ in range(c11):
+                x12, p = fallback(1, v, n, p)
+                x10.append(x12)
+            if c11 < 16384:
+                break
+        r1['extension'] = x10
+    if e2:
+        p = uper.skip_additions(v, n, p)
+    return r1, p
+
+
+def decode_DocumentData(v, n, p):
+    r13 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e14 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    o15 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if o15 & 0x1:
+        x16, p = fallback(2, v, n, p)
+        r13['token'] = x16
+    x17, p = decode_DocumentData_ticket_18(v, n, p)
+    r13['ticket'] = x17
+    if e14:
+        p = uper.skip_additions(v, n, p)
+    return r13, p
+
+
+def decode_IssuingData(v, n, p):
+    r19 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e20 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 14 > n:
+        raise OutOfDataError(p)
+    o21 = (v >> (n - p - 14)) & 0x3fff
+    p += 14
+    if o21 & 0x2000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x22 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x22 += 1
+        r19['securityProviderNum'] = x22
+    if o21 & 0x1000:
+        x23, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['securityProviderIA5'] = x23
+    if o21 & 0x800:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x24 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x24 += 1
+        r19['issuerNum'] = x24
+    if o21 & 0x400:
+        x25, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['issuerIA5'] = x25
+    if p + 8 > n:
+        raise OutOfDataError(p)
+    x26 = (v >> (n - p - 8)) & 0xff
+    p += 8
+    x26 += 2016
+    r19['issuingYear'] = x26
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    x27 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    x27 += 1
+    r19['issuingDay'] = x27
+    if o21 & 0x200:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x28 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r19['issuingTime'] = x28
+    if o21 & 0x100:
+        x29, p = uper.read_utf8(v, n, p)
+        r19['issuerName'] = x29
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x30 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x30 = bool(x30)
+    r19['specimen'] = x30
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x31 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x31 = bool(x31)
+    r19['securePaperTicket'] = x31
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x32 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x32 = bool(x32)
+    r19['activated'] = x32
+    if o21 & 0x80:
+        l34 = 3
+        x33, p = uper.read_chars(v, n, p, l34, 7, None)
+        r19['currency'] = x33
+    else:
+        r19['currency'] = 'EUR'
+    if o21 & 0x40:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        x35 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        x35 += 1
+        r19['currencyFract'] = x35
+    else:
+        r19['currencyFract'] = 2
+    if o21 & 0x20:
+        x36, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['issuerPNR'] = x36
+    if o21 & 0x10:
+        x37, p = decode_ExtensionData(v, n, p)
+        r19['extension'] = x37
+    if o21 & 0x8:
+        x38, p = uper.read_unconstrained(v, n, p)
+        r19['issuedOnTrainNum'] = x38
+    if o21 & 0x4:
+        x39, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['issuedOnTrainIA5'] = x39
+    if o21 & 0x2:
+        x40, p = uper.read_unconstrained(v, n, p)
+        r19['issuedOnLine'] = x40
+    if o21 & 0x1:
+        x41, p = decode_GeoCoordinateType(v, n, p)
+        r19['pointOfSale'] = x41
+    if e20:
+        p = uper.skip_additions(v, n, p)
+    return r19, p
+
+
+def decode_TravelerData(v, n, p):
+    r42 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e43 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o44 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o44 & 0x4:
+        x45 = []
+        while True:
+            c46, p = uper.read_length(v, n, p)
+            for _ in range(c46):
+                x47, p = decode_TravelerType(v, n, p)
+                x45.append(x47)
+            if c46 < 16384:
+                break
+        r42['traveler'] = x45
+    if o44 & 0x2:
+        l49 = 2
+        x48, p = uper.read_chars(v, n, p, l49, 7, None)
+        r42['preferredLanguage'] = x48
+    if o44 & 0x1:
+        x50, p = uper.read_utf8(v, n, p)
+        r42['groupName'] = x50
+    if e43:
+        p = uper.skip_additions(v, n, p)
+    return r42, p
+
+
+def decode_DocumentData_ticket_18(v, n, p):
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e52 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if e52:
+        _, p = uper.read_normally_small_number(v, n, p)
+        l53, p = uper.read_length(v, n, p)
+        p = uper.skip_bits(n, p, 8 * l53)
+        r51 = (None, None)
+    else:
+        if p + 4 > n:
+            raise OutOfDataError(p)
+        i54 = (v >> (n - p - 4)) & 0xf
+        p += 4
+        if i54 == 0:
+            x55, p = decode_ReservationData(v, n, p)
+            r51 = ('reservation', x55)
+        elif i54 == 1:
+            x56, p = fallback(3, v, n, p)
+            r51 = ('carCarriageReservation', x56)
+        elif i54 == 2:
+            x57, p = decode_OpenTicketData(v, n, p)
+            r51 = ('openTicket', x57)
+        elif i54 == 3:
+            x58, p = decode_PassData(v, n, p)
+            r51 = ('pass', x58)
+        elif i54 == 4:
+            x59, p = fallback(4, v, n, p)
+            r51 = ('voucher', x59)
+        elif i54 == 5:
+            x60, p = decode_CustomerCardData(v, n, p)
+            r51 = ('customerCard', x60)
+        elif i54 == 6:
+            x61, p = fallback(5, v, n, p)
+            r51 = ('counterMark', x61)
+        elif i54 == 7:
+            x62, p = fallback(6, v, n, p)
+            r51 = ('parkingGround', x62)
+        elif i54 == 8:
+            x63, p = fallback(7, v, n, p)
+            r51 = ('fipTicket', x63)
+        elif i54 == 9:
+            x64, p = fallback(8, v, n, p)
+            r51 = ('stationPassage', x64)
+        elif i54 == 10:
+            x65, p = fallback(9, v, n, p)
+            r51 = ('extension', x65)
+        elif i54 == 11:
+            x66, p = fallback(10, v, n, p)
+            r51 = ('delayConfirmation', x66)
+        else:
+            raise DecodeError(f"Expected choice index {i54} to be in range.")
+    return r51, p
+
+
+def decode_ExtensionData(v, n, p):
+    r67 = {}
+    x68, p = uper.read_chars_unbound(v, n, p, 7, None)
+    r67['extensionId'] = x68
+    x69, p = uper.read_octets_unbound(v, n, p)
+    r67['extensionData'] = x69
+    return r67, p
+
+
+def decode_GeoCoordinateType(v, n, p):
+    r70 = {}
+    if p + 5 > n:
+        raise OutOfDataError(p)
+    o71 = (v >> (n - p - 5)) & 0x1f
+    p += 5
+    if o71 & 0x10:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i73 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i73 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i73}.")
+        x72 = _C0[i73]
+        r70['geoUnit'] = x72
+    else:
+        r70['geoUnit'] = 'milliDegree'
+    if o71 & 0x8:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        i75 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if i75 >= 2:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i75}.")
+        x74 = _C1[i75]
+        r70['coordinateSystem'] = x74
+    else:
+        r70['coordinateSystem'] = 'wgs84'
+    if o71 & 0x4:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        i77 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if i77 >= 2:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i77}.")
+        x76 = _C2[i77]
+        r70['hemisphereLongitude'] = x76
+    else:
+        r70['hemisphereLongitude'] = 'north'
+    if o71 & 0x2:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        i79 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if i79 >= 2:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i79}.")
+        x78 = _C3[i79]
+        r70['hemisphereLatitude'] = x78
+    else:
+        r70['hemisphereLatitude'] = 'east'
+    x80, p = uper.read_unconstrained(v, n, p)
+    r70['longitude'] = x80
+    x81, p = uper.read_unconstrained(v, n, p)
+    r70['latitude'] = x81
+    if o71 & 0x1:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i83 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i83 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i83}.")
+        x82 = _C0[i83]
+        r70['accuracy'] = x82
+    return r70, p
+
+
+def decode_TravelerType(v, n, p):
+    r84 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e85 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 17 > n:
+        raise OutOfDataError(p)
+    o86 = (v >> (n - p - 17)) & 0x1ffff
+    p += 17
+    if o86 & 0x10000:
+        x87, p = uper.read_utf8(v, n, p)
+        r84['firstName'] = x87
+    if o86 & 0x8000:
+        x88, p = uper.read_utf8(v, n, p)
+        r84['secondName'] = x88
+    if o86 & 0x4000:
+        x89, p = uper.read_utf8(v, n, p)
+        r84['lastName'] = x89
+    if o86 & 0x2000:
+        x90, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r84['idCard'] = x90
+    if o86 & 0x1000:
+        x91, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r84['passportId'] = x91
+    if o86 & 0x800:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        l93 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        l93 += 1
+        x92, p = uper.read_chars(v, n, p, l93, 7, None)
+        r84['title'] = x92
+    if o86 & 0x400:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e95 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e95:
+            x94, p = uper.read_normally_small_number(v, n, p)
+            x94 = _C4.get(x94)
+        else:
+            if p + 2 > n:
+                raise OutOfDataError(p)
+            i96 = (v >> (n - p - 2)) & 0x3
+            p += 2
+            if i96 >= 4:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i96}.")
+            x94 = _C5[i96]
+        r84['gender'] = x94
+    if o86 & 0x200:
+        x97, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r84['customerIdIA5'] = x97
+    if o86 & 0x100:
+        x98, p = uper.read_unconstrained(v, n, p)
+        r84['customerIdNum'] = x98
+    if o86 & 0x80:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x99 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x99 += 1901
+        r84['yearOfBirth'] = x99
+    if o86 & 0x40:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x100 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r84['dayOfBirth'] = x100
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x101 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x101 = bool(x101)
+    r84['ticketHolder'] = x101
+    if o86 & 0x20:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e103 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e103:
+            x102, p = uper.read_normally_small_number(v, n, p)
+            x102 = _C4.get(x102)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i104 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i104 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i104}.")
+            x102 = _C6[i104]
+        r84['passengerType'] = x102
+    if o86 & 0x10:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        x105 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        x105 = bool(x105)
+        r84['passengerWithReducedMobility'] = x105
+    if o86 & 0x8:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x106 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x106 += 1
+        r84['countryOfResidence'] = x106
+    if o86 & 0x4:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x107 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x107 += 1
+        r84['countryOfPassport'] = x107
+    if o86 & 0x2:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x108 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x108 += 1
+        r84['countryOfIdCard'] = x108
+    if o86 & 0x1:
+        x109 = []
+        while True:
+            c110, p = uper.read_length(v, n, p)
+            for _ in range(c110):
+                x111, p = decode_CustomerStatusType(v, n, p)
+                x109.append(x111)
+            if c110 < 16384:
+                break
+        r84['status'] = x109
+    if e85:
+        p = uper.skip_additions(v, n, p)
+    return r84, p
+
+
+def decode_ReservationData(v, n, p):
+    r112 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e113 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 43 > n:
+        raise OutOfDataError(p)
+    o114 = (v >> (n - p - 43)) & 0x7ffffffffff
+    p += 43
+    if o114 & 0x40000000000:
+        x115, p = uper.read_unconstrained(v, n, p)
+        r112['trainNum'] = x115
+    if o114 & 0x20000000000:
+        x116, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r112['trainIA5'] = x116
+    if o114 & 0x10000000000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x117 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x117 += -1
+        r112['departureDate'] = x117
+    else:
+        r112['departureDate'] = 0
+    if o114 & 0x8000000000:
+        x118, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r112['referenceIA5'] = x118
+    if o114 & 0x4000000000:
+        x119, p = uper.read_unconstrained(v, n, p)
+        r112['referenceNum'] = x119
+    if o114 & 0x2000000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x120 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x120 += 1
+        r112['productOwnerNum'] = x120
+    if o114 & 0x1000000000:
+        x121, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r112['productOwnerIA5'] = x121
+    if o114 & 0x800000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x122 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        r112['productIdNum'] = x122
+    if o114 & 0x400000000:
+        x123, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r112['productIdIA5'] = x123
+    if o114 & 0x200000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x124 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        r112['serviceBrand'] = x124
+    if o114 & 0x100000000:
+        x125, p = uper.read_utf8(v, n, p)
+        r112['serviceBrandAbrUTF8'] = x125
+    if o114 & 0x80000000:
+        x126, p = uper.read_utf8(v, n, p)
+        r112['serviceBrandNameUTF8'] = x126
+    if o114 & 0x40000000:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        i128 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        if i128 >= 4:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i128}.")
+        x127 = _C7[i128]
+        r112['service'] = x127
+    else:
+        r112['service'] = 'seat'
+    if o114 & 0x20000000:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i130 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i130 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i130}.")
+        x129 = _C8[i130]
+        r112['stationCodeTable'] = x129
+    else:
+        r112['stationCodeTable'] = 'stationUICReservation'
+    if o114 & 0x10000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x131 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x131 += 1
+        r112['fromStationNum'] = x131
+    if o114 & 0x8000000:
+        x132, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r112['fromStationIA5'] = x132
+    if o114 & 0x4000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x133 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x133 += 1
+        r112['toStationNum'] = x133
+    if o114 & 0x2000000:
+        x134, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r112['toStationIA5'] = x134
+    if o114 & 0x1000000:
+        x135, p = uper.read_utf8(v, n, p)
+        r112['fromStationNameUTF8'] = x135
+    if o114 & 0x800000:
+        x136, p = uper.read_utf8(v, n, p)
+        r112['toStationNameUTF8'] = x136
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x137 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r112['departureTime'] = x137
+    if o114 & 0x400000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x138 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x138 += -60
+        r112['departureUTCOffset'] = x138
+    if o114 & 0x200000:
+        if p + 5 > n:
+            raise OutOfDataError(p)
+        x139 = (v >> (n - p - 5)) & 0x1f
+        p += 5
+        r112['arrivalDate'] = x139
+    else:
+        r112['arrivalDate'] = 0
+    if o114 & 0x100000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x140 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r112['arrivalTime'] = x140
+    if o114 & 0x80000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x141 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x141 += -60
+        r112['arrivalUTCOffset'] = x141
+    if o114 & 0x40000:
+        x142 = []
+        while True:
+            c143, p = uper.read_length(v, n, p)
+            for _ in range(c143):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x144 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x144 += 1
+                x142.append(x144)
+            if c143 < 16384:
+                break
+        r112['carrierNum'] = x142
+    if o114 & 0x20000:
+        x145 = []
+        while True:
+            c146, p = uper.read_length(v, n, p)
+            for _ in range(c146):
+                x147, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x145.append(x147)
+            if c146 < 16384:
+                break
+        r112['carrierIA5'] = x145
+    if o114 & 0x10000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e149 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e149:
+            x148, p = uper.read_normally_small_number(v, n, p)
+            x148 = _C4.get(x148)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i150 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i150 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i150}.")
+            x148 = _C9[i150]
+        r112['classCode'] = x148
+    else:
+        r112['classCode'] = 'second'
+    if o114 & 0x8000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        l152 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        l152 += 1
+        x151, p = uper.read_chars(v, n, p, l152, 7, None)
+        r112['serviceLevel'] = x151
+    if o114 & 0x4000:
+        x153, p = decode_PlacesType(v, n, p)
+        r112['places'] = x153
+    if o114 & 0x2000:
+        x154, p = decode_PlacesType(v, n, p)
+        r112['additionalPlaces'] = x154
+    if o114 & 0x1000:
+        x155, p = decode_PlacesType(v, n, p)
+        r112['bicyclePlaces'] = x155
+    if o114 & 0x800:
+        x156, p = decode_CompartmentDetailsType(v, n, p)
+        r112['compartmentDetails'] = x156
+    if o114 & 0x400:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x157 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        r112['numberOfOverbooked'] = x157
+    else:
+        r112['numberOfOverbooked'] = 0
+    if o114 & 0x200:
+        x158 = []
+        while True:
+            c159, p = uper.read_length(v, n, p)
+            for _ in range(c159):
+                x160, p = decode_BerthDetailData(v, n, p)
+                x158.append(x160)
+            if c159 < 16384:
+                break
+        r112['berth'] = x158
+    if o114 & 0x100:
+        x161 = []
+        while True:
+            c162, p = uper.read_length(v, n, p)
+            for _ in range(c162):
+                x163, p = decode_TariffType(v, n, p)
+                x161.append(x163)
+            if c162 < 16384:
+                break
+        r112['tariff'] = x161
+    if o114 & 0x80:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        i165 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        if i165 >= 4:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i165}.")
+        x164 = _C10[i165]
+        r112['priceType'] = x164
+    else:
+        r112['priceType'] = 'travelPrice'
+    if o114 & 0x40:
+        x166, p = uper.read_unconstrained(v, n, p)
+        r112['price'] = x166
+    if o114 & 0x20:
+        x167 = []
+        while True:
+            c168, p = uper.read_length(v, n, p)
+            for _ in range(c168):
+                x169, p = decode_VatDetailType(v, n, p)
+                x167.append(x169)
+            if c168 < 16384:
+                break
+        r112['vatDetail'] = x167
+    if o114 & 0x10:
+        if p + 4 > n:
+            raise OutOfDataError(p)
+        x170 = (v >> (n - p - 4)) & 0xf
+        p += 4
+        r112['typeOfSupplement'] = x170
+    else:
+        r112['typeOfSupplement'] = 0
+    if o114 & 0x8:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x171 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        r112['numberOfSupplements'] = x171
+    else:
+        r112['numberOfSupplements'] = 0
+    if o114 & 0x4:
+        x172, p = decode_LuggageRestrictionType(v, n, p)
+        r112['luggage'] = x172
+    if o114 & 0x2:
+        x173, p = uper.read_utf8(v, n, p)
+        r112['infoText'] = x173
+    if o114 & 0x1:
+        x174, p = decode_ExtensionData(v, n, p)
+        r112['extension'] = x174
+    if e113:
+        p = uper.skip_additions(v, n, p)
+    return r112, p
+
+
+def decode_OpenTicketData(v, n, p):
+    r175 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e176 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 38 > n:
+        raise OutOfDataError(p)
+    o177 = (v >> (n - p - 38)) & 0x3fffffffff
+    p += 38
+    if o177 & 0x2000000000:
+        x178, p = uper.read_unconstrained(v, n, p)
+        r175['referenceNum'] = x178
+    if o177 & 0x1000000000:
+        x179, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r175['referenceIA5'] = x179
+    if o177 & 0x800000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x180 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x180 += 1
+        r175['productOwnerNum'] = x180
+    if o177 & 0x400000000:
+        x181, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r175['productOwnerIA5'] = x181
+    if o177 & 0x200000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x182 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        r175['productIdNum'] = x182
+    if o177 & 0x100000000:
+        x183, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r175['productIdIA5'] = x183
+    if o177 & 0x80000000:
+        x184, p = uper.read_unconstrained(v, n, p)
+        r175['extIssuerId'] = x184
+    if o177 & 0x40000000:
+        x185, p = uper.read_unconstrained(v, n, p)
+        r175['issuerAutorizationId'] = x185
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x186 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x186 = bool(x186)
+    r175['returnIncluded'] = x186
+    if o177 & 0x20000000:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i188 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i188 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i188}.")
+        x187 = _C8[i188]
+        r175['stationCodeTable'] = x187
+    else:
+        r175['stationCodeTable'] = 'stationUIC'
+    if o177 & 0x10000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x189 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x189 += 1
+        r175['fromStationNum'] = x189
+    if o177 & 0x8000000:
+        x190, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r175['fromStationIA5'] = x190
+    if o177 & 0x4000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x191 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x191 += 1
+        r175['toStationNum'] = x191
+    if o177 & 0x2000000:
+        x192, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r175['toStationIA5'] = x192
+    if o177 & 0x1000000:
+        x193, p = uper.read_utf8(v, n, p)
+        r175['fromStationNameUTF8'] = x193
+    if o177 & 0x800000:
+        x194, p = uper.read_utf8(v, n, p)
+        r175['toStationNameUTF8'] = x194
+    if o177 & 0x400000:
+        x195, p = uper.read_utf8(v, n, p)
+        r175['validRegionDesc'] = x195
+    if o177 & 0x200000:
+        x196 = []
+        while True:
+            c197, p = uper.read_length(v, n, p)
+            for _ in range(c197):
+                x198, p = decode_RegionalValidityType(v, n, p)
+                x196.append(x198)
+            if c197 < 16384:
+                break
+        r175['validRegion'] = x196
+    if o177 & 0x100000:
+        x199, p = decode_ReturnRouteDescriptionType(v, n, p)
+        r175['returnDescription'] = x199
+    if o177 & 0x80000:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x200 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x200 += -1
+        r175['validFromDay'] = x200
+    else:
+        r175['validFromDay'] = 0
+    if o177 & 0x40000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x201 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r175['validFromTime'] = x201
+    if o177 & 0x20000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x202 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x202 += -60
+        r175['validFromUTCOffset'] = x202
+    if o177 & 0x10000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x203 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r175['validUntilDay'] = x203
+    else:
+        r175['validUntilDay'] = 0
+    if o177 & 0x8000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x204 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r175['validUntilTime'] = x204
+    if o177 & 0x4000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x205 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x205 += -60
+        r175['validUntilUTCOffset'] = x205
+    if o177 & 0x2000:
+        x206 = []
+        while True:
+            c207, p = uper.read_length(v, n, p)
+            for _ in range(c207):
+                if p + 9 > n:
+                    raise OutOfDataError(p)
+                x208 = (v >> (n - p - 9)) & 0x1ff
+                p += 9
+                x206.append(x208)
+            if c207 < 16384:
+                break
+        r175['activatedDay'] = x206
+    if o177 & 0x1000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e210 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e210:
+            x209, p = uper.read_normally_small_number(v, n, p)
+            x209 = _C4.get(x209)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i211 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i211 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i211}.")
+            x209 = _C9[i211]
+        r175['classCode'] = x209
+    else:
+        r175['classCode'] = 'second'
+    if o177 & 0x800:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        l213 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        l213 += 1
+        x212, p = uper.read_chars(v, n, p, l213, 7, None)
+        r175['serviceLevel'] = x212
+    if o177 & 0x400:
+        x214 = []
+        while True:
+            c215, p = uper.read_length(v, n, p)
+            for _ in range(c215):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x216 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x216 += 1
+                x214.append(x216)
+            if c215 < 16384:
+                break
+        r175['carrierNum'] = x214
+    if o177 & 0x200:
+        x217 = []
+        while True:
+            c218, p = uper.read_length(v, n, p)
+            for _ in range(c218):
+                x219, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x217.append(x219)
+            if c218 < 16384:
+                break
+        r175['carrierIA5'] = x217
+    if o177 & 0x100:
+        x220 = []
+        while True:
+            c221, p = uper.read_length(v, n, p)
+            for _ in range(c221):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x222 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x222 += 1
+                x220.append(x222)
+            if c221 < 16384:
+                break
+        r175['includedServiceBrands'] = x220
+    if o177 & 0x80:
+        x223 = []
+        while True:
+            c224, p = uper.read_length(v, n, p)
+            for _ in range(c224):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x225 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x225 += 1
+                x223.append(x225)
+            if c224 < 16384:
+                break
+        r175['excludedServiceBrands'] = x223
+    if o177 & 0x40:
+        x226 = []
+        while True:
+            c227, p = uper.read_length(v, n, p)
+            for _ in range(c227):
+                x228, p = decode_TariffType(v, n, p)
+                x226.append(x228)
+            if c227 < 16384:
+                break
+        r175['tariffs'] = x226
+    if o177 & 0x20:
+        x229, p = uper.read_unconstrained(v, n, p)
+        r175['price'] = x229
+    if o177 & 0x10:
+        x230 = []
+        while True:
+            c231, p = uper.read_length(v, n, p)
+            for _ in range(c231):
+                x232, p = decode_VatDetailType(v, n, p)
+                x230.append(x232)
+            if c231 < 16384:
+                break
+        r175['vatDetail'] = x230
+    if o177 & 0x8:
+        x233, p = uper.read_utf8(v, n, p)
+        r175['infoText'] = x233
+    if o177 & 0x4:
+        x234 = []
+        while True:
+            c235, p = uper.read_length(v, n, p)
+            for _ in range(c235):
+                x236, p = decode_IncludedOpenTicketType(v, n, p)
+                x234.append(x236)
+            if c235 < 16384:
+                break
+        r175['includedAddOns'] = x234
+    if o177 & 0x2:
+        x237, p = decode_LuggageRestrictionType(v, n, p)
+        r175['luggage'] = x237
+    if o177 & 0x1:
+        x238, p = decode_ExtensionData(v, n, p)
+        r175['extension'] = x238
+    if e176:
+        p = uper.skip_additions(v, n, p)
+    return r175, p
+
+
+def decode_PassData(v, n, p):
+    r239 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e240 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 33 > n:
+        raise OutOfDataError(p)
+    o241 = (v >> (n - p - 33)) & 0x1ffffffff
+    p += 33
+    if o241 & 0x100000000:
+        x242, p = uper.read_unconstrained(v, n, p)
+        r239['referenceNum'] = x242
+    if o241 & 0x80000000:
+        x243, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r239['referenceIA5'] = x243
+    if o241 & 0x40000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x244 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x244 += 1
+        r239['productOwnerNum'] = x244
+    if o241 & 0x20000000:
+        x245, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r239['productOwnerIA5'] = x245
+    if o241 & 0x10000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x246 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        r239['productIdNum'] = x246
+    if o241 & 0x8000000:
+        x247, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r239['productIdIA5'] = x247
+    if o241 & 0x4000000:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x248 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x248 += 1
+        r239['passType'] = x248
+    if o241 & 0x2000000:
+        x249, p = uper.read_utf8(v, n, p)
+        r239['passDescription'] = x249
+    if o241 & 0x1000000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e251 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e251:
+            x250, p = uper.read_normally_small_number(v, n, p)
+            x250 = _C4.get(x250)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i252 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i252 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i252}.")
+            x250 = _C9[i252]
+        r239['classCode'] = x250
+    else:
+        r239['classCode'] = 'second'
+    if o241 & 0x800000:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x253 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x253 += -1
+        r239['validFromDay'] = x253
+    else:
+        r239['validFromDay'] = 0
+    if o241 & 0x400000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x254 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r239['validFromTime'] = x254
+    if o241 & 0x200000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x255 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x255 += -60
+        r239['validFromUTCOffset'] = x255
+    if o241 & 0x100000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x256 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r239['validUntilDay'] = x256
+    else:
+        r239['validUntilDay'] = 0
+    if o241 & 0x80000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x257 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r239['validUntilTime'] = x257
+    if o241 & 0x40000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x258 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x258 += -60
+        r239['validUntilUTCOffset'] = x258
+    if o241 & 0x20000:
+        x259, p = decode_ValidityPeriodDetailType(v, n, p)
+        r239['validityPeriodDetails'] = x259
+    if o241 & 0x10000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x260 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r239['numberOfValidityDays'] = x260
+    if o241 & 0x8000:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x261 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x261 += 1
+        r239['numberOfPossibleTrips'] = x261
+    if o241 & 0x4000:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x262 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x262 += 1
+        r239['numberOfDaysOfTravel'] = x262
+    if o241 & 0x2000:
+        x263 = []
+        while True:
+            c264, p = uper.read_length(v, n, p)
+            for _ in range(c264):
+                if p + 9 > n:
+                    raise OutOfDataError(p)
+                x265 = (v >> (n - p - 9)) & 0x1ff
+                p += 9
+                x263.append(x265)
+            if c264 < 16384:
+                break
+        r239['activatedDay'] = x263
+    if o241 & 0x1000:
+        x266 = []
+        while True:
+            c267, p = uper.read_length(v, n, p)
+            for _ in range(c267):
+                if p + 8 > n:
+                    raise OutOfDataError(p)
+                x268 = (v >> (n - p - 8)) & 0xff
+                p += 8
+                x268 += 1
+                x266.append(x268)
+            if c267 < 16384:
+                break
+        r239['countries'] = x266
+    if o241 & 0x800:
+        x269 = []
+        while True:
+            c270, p = uper.read_length(v, n, p)
+            for _ in range(c270):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x271 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x271 += 1
+                x269.append(x271)
+            if c270 < 16384:
+                break
+        r239['includedCarrierNum'] = x269
+    if o241 & 0x400:
+        x272 = []
+        while True:
+            c273, p = uper.read_length(v, n, p)
+            for _ in range(c273):
+                x274, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x272.append(x274)
+            if c273 < 16384:
+                break
+        r239['includedCarrierIA5'] = x272
+    if o241 & 0x200:
+        x275 = []
+        while True:
+            c276, p = uper.read_length(v, n, p)
+            for _ in range(c276):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x277 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x277 += 1
+                x275.append(x277)
+            if c276 < 16384:
+                break
+        r239['excludedCarrierNum'] = x275
+    if o241 & 0x100:
+        x278 = []
+        while True:
+            c279, p = uper.read_length(v, n, p)
+            for _ in range(c279):
+                x280, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x278.append(x280)
+            if c279 < 16384:
+                break
+        r239['excludedCarrierIA5'] = x278
+    if o241 & 0x80:
+        x281 = []
+        while True:
+            c282, p = uper.read_length(v, n, p)
+            for _ in range(c282):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x283 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x283 += 1
+                x281.append(x283)
+            if c282 < 16384:
+                break
+        r239['includedServiceBrands'] = x281
+    if o241 & 0x40:
+        x284 = []
+        while True:
+            c285, p = uper.read_length(v, n, p)
+            for _ in range(c285):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x286 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x286 += 1
+                x284.append(x286)
+            if c285 < 16384:
+                break
+        r239['excludedServiceBrands'] = x284
+    if o241 & 0x20:
+        x287 = []
+        while True:
+            c288, p = uper.read_length(v, n, p)
+            for _ in range(c288):
+                x289, p = decode_RegionalValidityType(v, n, p)
+                x287.append(x289)
+            if c288 < 16384:
+                break
+        r239['validRegion'] = x287
+    if o241 & 0x10:
+        x290 = []
+        while True:
+            c291, p = uper.read_length(v, n, p)
+            for _ in range(c291):
+                x292, p = decode_TariffType(v, n, p)
+                x290.append(x292)
+            if c291 < 16384:
+                break
+        r239['tariffs'] = x290
+    if o241 & 0x8:
+        x293, p = uper.read_unconstrained(v, n, p)
+        r239['price'] = x293
+    if o241 & 0x4:
+        x294 = []
+        while True:
+            c295, p = uper.read_length(v, n, p)
+            for _ in range(c295):
+                x296, p = decode_VatDetailType(v, n, p)
+                x294.append(x296)
+            if c295 < 16384:
+                break
+        r239['vatDetail'] = x294
+    if o241 & 0x2:
+        x297, p = uper.read_utf8(v, n, p)
+        r239['infoText'] = x297
+    if o241 & 0x1:
+        x298, p = decode_ExtensionData(v, n, p)
+        r239['extension'] = x298
+    if e240:
+        p = uper.skip_additions(v, n, p)
+    return r239, p
+
+
+def decode_CustomerCardData(v, n, p):
+    r299 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e300 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 13 > n:
+        raise OutOfDataError(p)
+    o301 = (v >> (n - p - 13)) & 0x1fff
+    p += 13
+    if o301 & 0x1000:
+        x302, p = decode_TravelerType(v, n, p)
+        r299['customer'] = x302
+    if o301 & 0x800:
+        x303, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r299['cardIdIA5'] = x303
+    if o301 & 0x400:
+        x304, p = uper.read_unconstrained(v, n, p)
+        r299['cardIdNum'] = x304
+    if p + 8 > n:
+        raise OutOfDataError(p)
+    x305 = (v >> (n - p - 8)) & 0xff
+    p += 8
+    x305 += 2016
+    r299['validFromYear'] = x305
+    if o301 & 0x200:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x306 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r299['validFromDay'] = x306
+    if o301 & 0x100:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x307 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        r299['validUntilYear'] = x307
+    else:
+        r299['validUntilYear'] = 0
+    if o301 & 0x80:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x308 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r299['validUntilDay'] = x308
+    if o301 & 0x40:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e310 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e310:
+            x309, p = uper.read_normally_small_number(v, n, p)
+            x309 = _C4.get(x309)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i311 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i311 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i311}.")
+            x309 = _C9[i311]
+        r299['classCode'] = x309
+    if o301 & 0x20:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x312 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x312 += 1
+        r299['cardType'] = x312
+    if o301 & 0x10:
+        x313, p = uper.read_utf8(v, n, p)
+        r299['cardTypeDescr'] = x313
+    if o301 & 0x8:
+        x314, p = uper.read_unconstrained(v, n, p)
+        r299['customerStatus'] = x314
+    if o301 & 0x4:
+        x315, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r299['customerStatusDescr'] = x315
+    if o301 & 0x2:
+        x316 = []
+        while True:
+            c317, p = uper.read_length(v, n, p)
+            for _ in range(c317):
+                x318, p = uper.read_unconstrained(v, n, p)
+                x316.append(x318)
+            if c317 < 16384:
+                break
+        r299['includedServices'] = x316
+    if o301 & 0x1:
+        x319, p = decode_ExtensionData(v, n, p)
+        r299['extension'] = x319
+    if e300:
+        p = uper.skip_additions(v, n, p)
+    return r299, p
+
+
+def decode_CustomerStatusType(v, n, p):
+    r320 = {}
+    if p + 4 > n:
+        raise OutOfDataError(p)
+    o321 = (v >> (n - p - 4)) & 0xf
+    p += 4
+    if o321 & 0x8:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x322 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x322 += 1
+        r320['statusProviderNum'] = x322
+    if o321 & 0x4:
+        x323, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r320['statusProviderIA5'] = x323
+    if o321 & 0x2:
+        x324, p = uper.read_unconstrained(v, n, p)
+        r320['customerStatus'] = x324
+    if o321 & 0x1:
+        x325, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r320['customerStatusDescr'] = x325
+    return r320, p
+
+
+def decode_PlacesType(v, n, p):
+    r326 = {}
+    if p + 5 > n:
+        raise OutOfDataError(p)
+    o327 = (v >> (n - p - 5)) & 0x1f
+    p += 5
+    if o327 & 0x10:
+        x328, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r326['coach'] = x328
+    if o327 & 0x8:
+        x329, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r326['placeString'] = x329
+    if o327 & 0x4:
+        x330, p = uper.read_utf8(v, n, p)
+        r326['placeDescription'] = x330
+    if o327 & 0x2:
+        x331 = []
+        while True:
+            c332, p = uper.read_length(v, n, p)
+            for _ in range(c332):
+                x333, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x331.append(x333)
+            if c332 < 16384:
+                break
+        r326['placeIA5'] = x331
+    if o327 & 0x1:
+        x334 = []
+        while True:
+            c335, p = uper.read_length(v, n, p)
+            for _ in range(c335):
+                if p + 8 > n:
+                    raise OutOfDataError(p)
+                x336 = (v >> (n - p - 8)) & 0xff
+                p += 8
+                x336 += 1
+                x334.append(x336)
+            if c335 < 16384:
+                break
+        r326['placeNum'] = x334
+    return r326, p
+
+
+def decode_CompartmentDetailsType(v, n, p):
+    r337 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e338 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 7 > n:
+        raise OutOfDataError(p)
+    o339 = (v >> (n - p - 7)) & 0x7f
+    p += 7
+    if o339 & 0x40:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x340 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x340 += 1
+        r337['coachType'] = x340
+    if o339 & 0x20:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x341 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x341 += 1
+        r337['compartmentType'] = x341
+    if o339 & 0x10:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x342 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x342 += 1
+        r337['specialAllocation'] = x342
+    if o339 & 0x8:
+        x343, p = uper.read_utf8(v, n, p)
+        r337['coachTypeDescr'] = x343
+    if o339 & 0x4:
+        x344, p = uper.read_utf8(v, n, p)
+        r337['compartmentTypeDescr'] = x344
+    if o339 & 0x2:
+        x345, p = uper.read_utf8(v, n, p)
+        r337['specialAllocationDescr'] = x345
+    if o339 & 0x1:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        i347 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        if i347 >= 3:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i347}.")
+        x346 = _C11[i347]
+        r337['position'] = x346
+    else:
+        r337['position'] = 'unspecified'
+    if e338:
+        p = uper.skip_additions(v, n, p)
+    return r337, p
+
+
+def decode_BerthDetailData(v, n, p):
+    r348 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e349 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    o350 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    i352 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if i352 >= 6:
+        raise DecodeError(f"Expected enumeration index to be in range, but got {i352}.")
+    x351 = _C12[i352]
+    r348['berthType'] = x351
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    x353 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    x353 += 1
+    r348['numberOfBerths'] = x353
+    if o350 & 0x1:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e355 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e355:
+            x354, p = uper.read_normally_small_number(v, n, p)
+            x354 = _C4.get(x354)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i356 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i356 >= 5:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i356}.")
+            x354 = _C13[i356]
+        r348['gender'] = x354
+    else:
+        r348['gender'] = 'family'
+    if e349:
+        p = uper.skip_additions(v, n, p)
+    return r348, p
+
+
+def decode_TariffType(v, n, p):
+    r357 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e358 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    o359 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    if o359 & 0x400:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x360 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x360 += 1
+        r357['numberOfPassengers'] = x360
+    else:
+        r357['numberOfPassengers'] = 1
+    if o359 & 0x200:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e362 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e362:
+            x361, p = uper.read_normally_small_number(v, n, p)
+            x361 = _C4.get(x361)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i363 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i363 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i363}.")
+            x361 = _C6[i363]
+        r357['passengerType'] = x361
+    if o359 & 0x100:
+        if p + 6 > n:
+            raise OutOfDataError(p)
+        x364 = (v >> (n - p - 6)) & 0x3f
+        p += 6
+        x364 += 1
+        r357['ageBelow'] = x364
+    if o359 & 0x80:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x365 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x365 += 1
+        r357['ageAbove'] = x365
+    if o359 & 0x40:
+        x366 = []
+        while True:
+            c367, p = uper.read_length(v, n, p)
+            for _ in range(c367):
+                if p + 8 > n:
+                    raise OutOfDataError(p)
+                x368 = (v >> (n - p - 8)) & 0xff
+                p += 8
+                x366.append(x368)
+            if c367 < 16384:
+                break
+        r357['travelerid'] = x366
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x369 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x369 = bool(x369)
+    r357['restrictedToCountryOfResidence'] = x369
+    if o359 & 0x20:
+        x370, p = decode_RouteSectionType(v, n, p)
+        r357['restrictedToRouteSection'] = x370
+    if o359 & 0x10:
+        x371, p = decode_SeriesDetailType(v, n, p)
+        r357['seriesDataDetails'] = x371
+    if o359 & 0x8:
+        x372, p = uper.read_unconstrained(v, n, p)
+        r357['tariffIdNum'] = x372
+    if o359 & 0x4:
+        x373, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r357['tariffIdIA5'] = x373
+    if o359 & 0x2:
+        x374, p = uper.read_utf8(v, n, p)
+        r357['tariffDesc'] = x374
+    if o359 & 0x1:
+        x375 = []
+        while True:
+            c376, p = uper.read_length(v, n, p)
+            for _ in range(c376):
+                x377, p = decode_CardReferenceType(v, n, p)
+                x375.append(x377)
+            if c376 < 16384:
+                break
+        r357['reductionCard'] = x375
+    if e358:
+        p = uper.skip_additions(v, n, p)
+    return r357, p
+
+
+def decode_VatDetailType(v, n, p):
+    r378 = {}
+    if p + 2 > n:
+        raise OutOfDataError(p)
+    o379 = (v >> (n - p - 2)) & 0x3
+    p += 2
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    x380 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    x380 += 1
+    r378['country'] = x380
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    x381 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    r378['percentage'] = x381
+    if o379 & 0x2:
+        x382, p = uper.read_unconstrained(v, n, p)
+        r378['amount'] = x382
+    if o379 & 0x1:
+        x383, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r378['vatId'] = x383
+    return r378, p
+
+
+def decode_LuggageRestrictionType(v, n, p):
+    r384 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e385 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o386 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o386 & 0x4:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x387 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        r384['maxHandLuggagePieces'] = x387
+    else:
+        r384['maxHandLuggagePieces'] = 3
+    if o386 & 0x2:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x388 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        r384['maxNonHandLuggagePieces'] = x388
+    else:
+        r384['maxNonHandLuggagePieces'] = 1
+    if o386 & 0x1:
+        x389 = []
+        while True:
+            c390, p = uper.read_length(v, n, p)
+            for _ in range(c390):
+                x391, p = decode_RegisteredLuggageType(v, n, p)
+                x389.append(x391)
+            if c390 < 16384:
+                break
+        r384['registeredLuggage'] = x389
+    if e385:
+        p = uper.skip_additions(v, n, p)
+    return r384, p
+
+
+def decode_RegionalValidityType(v, n, p):
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e393 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if e393:
+        _, p = uper.read_normally_small_number(v, n, p)
+        l394, p = uper.read_length(v, n, p)
+        p = uper.skip_bits(n, p, 8 * l394)
+        r392 = (None, None)
+    else:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i395 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i395 == 0:
+            x396, p = decode_TrainLinkType(v, n, p)
+            r392 = ('trainLink', x396)
+        elif i395 == 1:
+            x397, p = decode_ViaStationType(v, n, p)
+            r392 = ('viaStations', x397)
+        elif i395 == 2:
+            x398, p = decode_ZoneType(v, n, p)
+            r392 = ('zones', x398)
+        elif i395 == 3:
+            x399, p = decode_LineType(v, n, p)
+            r392 = ('lines', x399)
+        elif i395 == 4:
+            x400, p = decode_PolygoneType(v, n, p)
+            r392 = ('polygone', x400)
+        else:
+            raise DecodeError(f"Expected choice index {i395} to be in range.")
+    return r392, p
+
+
+def decode_ReturnRouteDescriptionType(v, n, p):
+    r401 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e402 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 8 > n:
+        raise OutOfDataError(p)
+    o403 = (v >> (n - p - 8)) & 0xff
+    p += 8
+    if o403 & 0x80:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x404 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x404 += 1
+        r401['fromStationNum'] = x404
+    if o403 & 0x40:
+        x405, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r401['fromStationIA5'] = x405
+    if o403 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x406 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x406 += 1
+        r401['toStationNum'] = x406
+    if o403 & 0x10:
+        x407, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r401['toStationIA5'] = x407
+    if o403 & 0x8:
+        x408, p = uper.read_utf8(v, n, p)
+        r401['fromStationNameUTF8'] = x408
+    if o403 & 0x4:
+        x409, p = uper.read_utf8(v, n, p)
+        r401['toStationNameUTF8'] = x409
+    if o403 & 0x2:
+        x410, p = uper.read_utf8(v, n, p)
+        r401['validReturnRegionDesc'] = x410
+    if o403 & 0x1:
+        x411 = []
+        while True:
+            c412, p = uper.read_length(v, n, p)
+            for _ in range(c412):
+                x413, p = decode_RegionalValidityType(v, n, p)
+                x411.append(x413)
+            if c412 < 16384:
+                break
+        r401['validReturnRegion'] = x411
+    if e402:
+        p = uper.skip_additions(v, n, p)
+    return r401, p
+
+
+def decode_IncludedOpenTicketType(v, n, p):
+    r414 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e415 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 23 > n:
+        raise OutOfDataError(p)
+    o416 = (v >> (n - p - 23)) & 0x7fffff
+    p += 23
+    if o416 & 0x400000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x417 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x417 += 1
+        r414['productOwnerNum'] = x417
+    if o416 & 0x200000:
+        x418, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r414['productOwnerIA5'] = x418
+    if o416 & 0x100000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x419 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        r414['productIdNum'] = x419
+    if o416 & 0x80000:
+        x420, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r414['productIdIA5'] = x420
+    if o416 & 0x40000:
+        x421, p = uper.read_unconstrained(v, n, p)
+        r414['externalIssuerId'] = x421
+    if o416 & 0x20000:
+        x422, p = uper.read_unconstrained(v, n, p)
+        r414['issuerAutorizationId'] = x422
+    if o416 & 0x10000:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i424 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i424 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i424}.")
+        x423 = _C8[i424]
+        r414['stationCodeTable'] = x423
+    else:
+        r414['stationCodeTable'] = 'stationUIC'
+    if o416 & 0x8000:
+        x425 = []
+        while True:
+            c426, p = uper.read_length(v, n, p)
+            for _ in range(c426):
+                x427, p = decode_RegionalValidityType(v, n, p)
+                x425.append(x427)
+            if c426 < 16384:
+                break
+        r414['validRegion'] = x425
+    if o416 & 0x4000:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x428 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x428 += -1
+        r414['validFromDay'] = x428
+    else:
+        r414['validFromDay'] = 0
+    if o416 & 0x2000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x429 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r414['validFromTime'] = x429
+    if o416 & 0x1000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x430 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x430 += -60
+        r414['validFromUTCOffset'] = x430
+    if o416 & 0x800:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x431 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r414['validUntilDay'] = x431
+    else:
+        r414['validUntilDay'] = 0
+    if o416 & 0x400:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x432 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r414['validUntilTime'] = x432
+    if o416 & 0x200:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x433 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x433 += -60
+        r414['validUntilUTCOffset'] = x433
+    if o416 & 0x100:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e435 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e435:
+            x434, p = uper.read_normally_small_number(v, n, p)
+            x434 = _C4.get(x434)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i436 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i436 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i436}.")
+            x434 = _C9[i436]
+        r414['classCode'] = x434
+    if o416 & 0x80:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        l438 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        l438 += 1
+        x437, p = uper.read_chars(v, n, p, l438, 7, None)
+        r414['serviceLevel'] = x437
+    if o416 & 0x40:
+        x439 = []
+        while True:
+            c440, p = uper.read_length(v, n, p)
+            for _ in range(c440):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x441 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x441 += 1
+                x439.append(x441)
+            if c440 < 16384:
+                break
+        r414['carrierNum'] = x439
+    if o416 & 0x20:
+        x442 = []
+        while True:
+            c443, p = uper.read_length(v, n, p)
+            for _ in range(c443):
+                x444, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x442.append(x444)
+            if c443 < 16384:
+                break
+        r414['carrierIA5'] = x442
+    if o416 & 0x10:
+        x445 = []
+        while True:
+            c446, p = uper.read_length(v, n, p)
+            for _ in range(c446):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x447 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x447 += 1
+                x445.append(x447)
+            if c446 < 16384:
+                break
+        r414['includedServiceBrands'] = x445
+    if o416 & 0x8:
+        x448 = []
+        while True:
+            c449, p = uper.read_length(v, n, p)
+            for _ in range(c449):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x450 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x450 += 1
+                x448.append(x450)
+            if c449 < 16384:
+                break
+        r414['excludedServiceBrands'] = x448
+    if o416 & 0x4:
+        x451 = []
+        while True:
+            c452, p = uper.read_length(v, n, p)
+            for _ in range(c452):
+                x453, p = decode_TariffType(v, n, p)
+                x451.append(x453)
+            if c452 < 16384:
+                break
+        r414['tariffs'] = x451
+    if o416 & 0x2:
+        x454, p = uper.read_utf8(v, n, p)
+        r414['infoText'] = x454
+    if o416 & 0x1:
+        x455, p = decode_ExtensionData(v, n, p)
+        r414['extension'] = x455
+    if e415:
+        p = uper.skip_additions(v, n, p)
+    return r414, p
+
+
+def decode_ValidityPeriodDetailType(v, n, p):
+    r456 = {}
+    if p + 2 > n:
+        raise OutOfDataError(p)
+    o457 = (v >> (n - p - 2)) & 0x3
+    p += 2
+    if o457 & 0x2:
+        x458 = []
+        while True:
+            c459, p = uper.read_length(v, n, p)
+            for _ in range(c459):
+                x460, p = decode_ValidityPeriodType(v, n, p)
+                x458.append(x460)
+            if c459 < 16384:
+                break
+        r456['validityPeriod'] = x458
+    if o457 & 0x1:
+        x461 = []
+        while True:
+            c462, p = uper.read_length(v, n, p)
+            for _ in range(c462):
+                x463, p = decode_TimeRangeType(v, n, p)
+                x461.append(x463)
+            if c462 < 16384:
+                break
+        r456['excludedTimeRange'] = x461
+    return r456, p
+
+
+def decode_RouteSectionType(v, n, p):
+    r464 = {}
+    if p + 7 > n:
+        raise OutOfDataError(p)
+    o465 = (v >> (n - p - 7)) & 0x7f
+    p += 7
+    if o465 & 0x40:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i467 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i467 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i467}.")
+        x466 = _C8[i467]
+        r464['stationCodeTable'] = x466
+    else:
+        r464['stationCodeTable'] = 'stationUIC'
+    if o465 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x468 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x468 += 1
+        r464['fromStationNum'] = x468
+    if o465 & 0x10:
+        x469, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r464['fromStationIA5'] = x469
+    if o465 & 0x8:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x470 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x470 += 1
+        r464['toStationNum'] = x470
+    if o465 & 0x4:
+        x471, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r464['toStationIA5'] = x471
+    if o465 & 0x2:
+        x472, p = uper.read_utf8(v, n, p)
+        r464['fromStationNameUTF8'] = x472
+    if o465 & 0x1:
+        x473, p = uper.read_utf8(v, n, p)
+        r464['toStationNameUTF8'] = x473
+    return r464, p
+
+
+def decode_SeriesDetailType(v, n, p):
+    r474 = {}
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o475 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o475 & 0x4:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x476 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x476 += 1
+        r474['supplyingCarrier'] = x476
+    if o475 & 0x2:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x477 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x477 += 1
+        r474['offerIdentification'] = x477
+    if o475 & 0x1:
+        x478, p = uper.read_unconstrained(v, n, p)
+        r474['series'] = x478
+    return r474, p
+
+
+def decode_CardReferenceType(v, n, p):
+    r479 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e480 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    o481 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    if o481 & 0x200:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x482 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x482 += 1
+        r479['cardIssuerNum'] = x482
+    if o481 & 0x100:
+        x483, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r479['cardIssuerIA5'] = x483
+    if o481 & 0x80:
+        x484, p = uper.read_unconstrained(v, n, p)
+        r479['cardIdNum'] = x484
+    if o481 & 0x40:
+        x485, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r479['cardIdIA5'] = x485
+    if o481 & 0x20:
+        x486, p = uper.read_utf8(v, n, p)
+        r479['cardName'] = x486
+    if o481 & 0x10:
+        x487, p = uper.read_unconstrained(v, n, p)
+        r479['cardType'] = x487
+    if o481 & 0x8:
+        x488, p = uper.read_unconstrained(v, n, p)
+        r479['leadingCardIdNum'] = x488
+    if o481 & 0x4:
+        x489, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r479['leadingCardIdIA5'] = x489
+    if o481 & 0x2:
+        x490, p = uper.read_unconstrained(v, n, p)
+        r479['trailingCardIdNum'] = x490
+    if o481 & 0x1:
+        x491, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r479['trailingCardIdIA5'] = x491
+    if e480:
+        p = uper.skip_additions(v, n, p)
+    return r479, p
+
+
+def decode_RegisteredLuggageType(v, n, p):
+    r492 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e493 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o494 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o494 & 0x4:
+        x495, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r492['registrationId'] = x495
+    if o494 & 0x2:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x496 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x496 += 1
+        r492['maxWeight'] = x496
+    if o494 & 0x1:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x497 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x497 += 1
+        r492['maxSize'] = x497
+    if e493:
+        p = uper.skip_additions(v, n, p)
+    return r492, p
+
+
+def decode_TrainLinkType(v, n, p):
+    r498 = {}
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    o499 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    if o499 & 0x100:
+        x500, p = uper.read_unconstrained(v, n, p)
+        r498['trainNum'] = x500
+    if o499 & 0x80:
+        x501, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r498['trainIA5'] = x501
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    x502 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    x502 += -1
+    r498['travelDate'] = x502
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x503 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r498['departureTime'] = x503
+    if o499 & 0x40:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x504 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x504 += -60
+        r498['departureUTCOffset'] = x504
+    if o499 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x505 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x505 += 1
+        r498['fromStationNum'] = x505
+    if o499 & 0x10:
+        x506, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r498['fromStationIA5'] = x506
+    if o499 & 0x8:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x507 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x507 += 1
+        r498['toStationNum'] = x507
+    if o499 & 0x4:
+        x508, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r498['toStationIA5'] = x508
+    if o499 & 0x2:
+        x509, p = uper.read_utf8(v, n, p)
+        r498['fromStationNameUTF8'] = x509
+    if o499 & 0x1:
+        x510, p = uper.read_utf8(v, n, p)
+        r498['toStationNameUTF8'] = x510
+    return r498, p
+
+
+def decode_ViaStationType(v, n, p):
+    r511 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e512 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    o513 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    if o513 & 0x100:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i515 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i515 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i515}.")
+        x514 = _C8[i515]
+        r511['stationCodeTable'] = x514
+    else:
+        r511['stationCodeTable'] = 'stationUIC'
+    if o513 & 0x80:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x516 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x516 += 1
+        r511['stationNum'] = x516
+    if o513 & 0x40:
+        x517, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r511['stationIA5'] = x517
+    if o513 & 0x20:
+        x518 = []
+        while True:
+            c519, p = uper.read_length(v, n, p)
+            for _ in range(c519):
+                x520, p = decode_ViaStationType(v, n, p)
+                x518.append(x520)
+            if c519 < 16384:
+                break
+        r511['alternativeRoutes'] = x518
+    if o513 & 0x10:
+        x521 = []
+        while True:
+            c522, p = uper.read_length(v, n, p)
+            for _ in range(c522):
+                x523, p = decode_ViaStationType(v, n, p)
+                x521.append(x523)
+            if c522 < 16384:
+                break
+        r511['route'] = x521
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x524 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x524 = bool(x524)
+    r511['border'] = x524
+    if o513 & 0x8:
+        x525 = []
+        while True:
+            c526, p = uper.read_length(v, n, p)
+            for _ in range(c526):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x527 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x527 += 1
+                x525.append(x527)
+            if c526 < 16384:
+                break
+        r511['carrierNum'] = x525
+    if o513 & 0x4:
+        x528 = []
+        while True:
+            c529, p = uper.read_length(v, n, p)
+            for _ in range(c529):
+                x530, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x528.append(x530)
+            if c529 < 16384:
+                break
+        r511['carrierIA5'] = x528
+    if o513 & 0x2:
+        x531, p = uper.read_unconstrained(v, n, p)
+        r511['seriesId'] = x531
+    if o513 & 0x1:
+        x532, p = uper.read_unconstrained(v, n, p)
+        r511['routeId'] = x532
+    if e512:
+        p = uper.skip_additions(v, n, p)
+    return r511, p
+
+
+def decode_ZoneType(v, n, p):
+    r533 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e534 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    o535 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    if o535 & 0x400:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x536 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x536 += 1
+        r533['carrierNum'] = x536
+    if o535 & 0x200:
+        x537, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r533['carrierIA5'] = x537
+    if o535 & 0x100:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i539 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i539 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i539}.")
+        x538 = _C8[i539]
+        r533['stationCodeTable'] = x538
+    else:
+        r533['stationCodeTable'] = 'stationUIC'
+    if o535 & 0x80:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x540 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x540 += 1
+        r533['entryStationNum'] = x540
+    if o535 & 0x40:
+        x541, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r533['entryStationIA5'] = x541
+    if o535 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x542 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x542 += 1
+        r533['terminatingStationNum'] = x542
+    if o535 & 0x10:
+        x543, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r533['terminatingStationIA5'] = x543
+    if o535 & 0x8:
+        x544, p = uper.read_unconstrained(v, n, p)
+        r533['city'] = x544
+    if o535 & 0x4:
+        x545 = []
+        while True:
+            c546, p = uper.read_length(v, n, p)
+            for _ in range(c546):
+                x547, p = uper.read_unconstrained(v, n, p)
+                x545.append(x547)
+            if c546 < 16384:
+                break
+        r533['zoneId'] = x545
+    if o535 & 0x2:
+        x548, p = uper.read_octets_unbound(v, n, p)
+        r533['binaryZoneId'] = x548
+    if o535 & 0x1:
+        x549, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r533['nutsCode'] = x549
+    if e534:
+        p = uper.skip_additions(v, n, p)
+    return r533, p
+
+
+def decode_LineType(v, n, p):
+    r550 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e551 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    o552 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    if o552 & 0x200:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x553 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x553 += 1
+        r550['carrierNum'] = x553
+    if o552 & 0x100:
+        x554, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r550['carrierIA5'] = x554
+    if o552 & 0x80:
+        x555 = []
+        while True:
+            c556, p = uper.read_length(v, n, p)
+            for _ in range(c556):
+                x557, p = uper.read_unconstrained(v, n, p)
+                x555.append(x557)
+            if c556 < 16384:
+                break
+        r550['lineId'] = x555
+    if o552 & 0x40:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i559 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i559 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i559}.")
+        x558 = _C8[i559]
+        r550['stationCodeTable'] = x558
+    else:
+        r550['stationCodeTable'] = 'stationUIC'
+    if o552 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x560 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x560 += 1
+        r550['entryStationNum'] = x560
+    if o552 & 0x10:
+        x561, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r550['entryStationIA5'] = x561
+    if o552 & 0x8:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x562 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x562 += 1
+        r550['terminatingStationNum'] = x562
+    if o552 & 0x4:
+        x563, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r550['terminatingStationIA5'] = x563
+    if o552 & 0x2:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x564 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x564 += 1
+        r550['city'] = x564
+    if o552 & 0x1:
+        x565, p = uper.read_octets_unbound(v, n, p)
+        r550['binaryZoneId'] = x565
+    if e551:
+        p = uper.skip_additions(v, n, p)
+    return r550, p
+
+
+def decode_PolygoneType(v, n, p):
+    r566 = {}
+    x567, p = decode_GeoCoordinateType(v, n, p)
+    r566['firstEdge'] = x567
+    x568 = []
+    while True:
+        c569, p = uper.read_length(v, n, p)
+        for _ in range(c569):
+            x570, p = decode_DeltaCoordinates(v, n, p)
+            x568.append(x570)
+        if c569 < 16384:
+            break
+    r566['edges'] = x568
+    return r566, p
+
+
+def decode_ValidityPeriodType(v, n, p):
+    r571 = {}
+    if p + 6 > n:
+        raise OutOfDataError(p)
+    o572 = (v >> (n - p - 6)) & 0x3f
+    p += 6
+    if o572 & 0x20:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x573 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x573 += -1
+        r571['validFromDay'] = x573
+    else:
+        r571['validFromDay'] = 0
+    if o572 & 0x10:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x574 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r571['validFromTime'] = x574
+    if o572 & 0x8:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x575 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x575 += -60
+        r571['validFromUTCOffset'] = x575
+    if o572 & 0x4:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x576 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r571['validUntilDay'] = x576
+    else:
+        r571['validUntilDay'] = 0
+    if o572 & 0x2:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x577 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r571['validUntilTime'] = x577
+    if o572 & 0x1:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x578 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x578 += -60
+        r571['validUntilUTCOffset'] = x578
+    return r571, p
+
+
+def decode_TimeRangeType(v, n, p):
+    r579 = {}
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x580 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r579['fromTime'] = x580
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x581 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r579['untilTime'] = x581
+    return r579, p
+
+
+def decode_DeltaCoordinates(v, n, p):
+    r582 = {}
+    x583, p = uper.read_unconstrained(v, n, p)
+    r582['longitude'] = x583
+    x584, p = uper.read_unconstrained(v, n, p)
+    r582['latitude'] = x584
+    return r582, p
@@ -0,0 +1,2716 @@
+# Generated by "manage.py generate-uic-decoders" from uicRailTicketData_v2.0.2.asn, do not edit.
+from .. import uper
+from ..uper import OutOfDataError, DecodeError
+
+VERSION = 2
+SPEC_SHA256 = 'd191f71ab5b55dc0d156e278255e145688eb54e852ffe35d181addd5ca947ed1'
+FALLBACK_PATHS = [('UicRailTicketData', 'controlDetail'), ('UicRailTicketData', 'extension', '[]'), ('DocumentData', 'token'), ('DocumentData', 'ticket', 'carCarriageReservation'), ('DocumentData', 'ticket', 'voucher'), ('DocumentData', 'ticket', 'counterMark'), ('DocumentData', 'ticket', 'parkingGround'), ('DocumentData', 'ticket', 'fipTicket'), ('DocumentData', 'ticket', 'stationPassage'), ('DocumentData', 'ticket', 'extension'), ('DocumentData', 'ticket', 'delayConfirmation')]
+FALLBACK_TYPES = {}
+
+
+def fallback(index, v, n, p):
+    type_ = FALLBACK_TYPES.get(index)
+    if type_ is None:
+        from .. import flex
+        type_ = uper.resolve(flex.get_spec(VERSION), FALLBACK_PATHS[index])
+        FALLBACK_TYPES[index] = type_
+    return uper.fallback(type_, v, n, p)
+
+
+def decode(data):
+    v, n = uper.load(data)
+    return decode_UicRailTicketData(v, n, 0)[0]
+
+
+def decode_summary(data):
+    v, n = uper.load(data)
+    return decode_UicRailTicketData(v, n, 0, True)[0]
+
+
+_C0 = ('microDegree', 'tenthmilliDegree', 'milliDegree', 'centiDegree', 'deciDegree')
+_C1 = ('wgs84', 'grs80')
+_C2 = ('north', 'south')
+_C3 = ('east', 'west')
+_C4 = {}
+_C5 = ('unspecified', 'female', 'male', 'other')
+_C6 = ('adult', 'senior', 'child', 'youth', 'dog', 'bicycle', 'freeAddonPassenger', 'freeAddonChild')
+_C7 = ('seat', 'couchette', 'berth', 'carcarriage')
+_C8 = ('stationUIC', 'stationUICReservation', 'stationERA', 'localCarrierStationCodeTable', 'proprietaryIssuerStationCodeTable')
+_C9 = ('notApplicable', 'first', 'second', 'tourist', 'comfort', 'premium', 'business', 'all', 'premiumFirst', 'standardFirst', 'premiumSecond', 'standardSecond')
+_C10 = ('noPrice', 'reservationFee', 'supplement', 'travelPrice')
+_C11 = ('unspecified', 'upperLevel', 'lowerLevel')
+_C12 = ('single', 'special', 'double', 't2', 't3', 't4')
+_C13 = ('unspecified', 'family', 'female', 'male', 'mixed')
+
+
+def decode_UicRailTicketData(v, n, p, summary=False):
+    r1 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e2 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 4 > n:
+        raise OutOfDataError(p)
+    o3 = (v >> (n - p - 4)) & 0xf
+    p += 4
+    x4, p = decode_IssuingData(v, n, p)
+    r1['issuingDetail'] = x4
+    if o3 & 0x8:
+        x5, p = decode_TravelerData(v, n, p)
+        r1['travelerDetail'] = x5
+    if o3 & 0x4:
+        x6 = []
+        while True:
+            c7, p = uper.read_length(v, n, p)
+            for _ in range(c7):
+                x8, p = decode_DocumentData(v, n, p)
+                x6.append(x8)
+                if summary:
+                    break
+            if summary or c7 < 16384:
+                break
+        r1['transportDocument'] = x6
+    if summary:
+        return r1, p
+    if o3 & 0x2:
+        x9, p = fallback(0, v, n, p)
+        r1['controlDetail'] = x9
+    if o3 & 0x1:
+        x10 = []
+        while True:
+            c11, p = uper.read_length(v, n, p)
+            for _ in range(c11):
+                x12, p = fallback(1, v, n, p)
+                x10.append(x12)
+            if c11 < 16384:
+                break
+        r1['extension'] = x10
+    if e2:
+        p = uper.skip_additions(v, n, p)
+    return r1, p
+
+
+def decode_DocumentData(v, n, p):
+    r13 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e14 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    o15 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if o15 & 0x1:
+        x16, p = fallback(2, v, n, p)
+        r13['token'] = x16
+    x17, p = decode_DocumentData_ticket_18(v, n, p)
+    r13['ticket'] = x17
+    if e14:
+        p = uper.skip_additions(v, n, p)
+    return r13, p
+
+
+def decode_IssuingData(v, n, p):
+    r19 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e20 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 14 > n:
+        raise OutOfDataError(p)
+    o21 = (v >> (n - p - 14)) & 0x3fff
+    p += 14
+    if o21 & 0x2000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x22 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x22 += 1
+        r19['securityProviderNum'] = x22
+    if o21 & 0x1000:
+        x23, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['securityProviderIA5'] = x23
+    if o21 & 0x800:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x24 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x24 += 1
+        r19['issuerNum'] = x24
+    if o21 & 0x400:
+        x25, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['issuerIA5'] = x25
+    if p + 8 > n:
+        raise OutOfDataError(p)
+    x26 = (v >> (n - p - 8)) & 0xff
+    p += 8
+    x26 += 2016
+    r19['issuingYear'] = x26
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    x27 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    x27 += 1
+    r19['issuingDay'] = x27
+    if o21 & 0x200:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x28 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r19['issuingTime'] = x28
+    if o21 & 0x100:
+        x29, p = uper.read_utf8(v, n, p)
+        r19['issuerName'] = x29
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x30 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x30 = bool(x30)
+    r19['specimen'] = x30
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x31 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x31 = bool(x31)
+    r19['securePaperTicket'] = x31
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x32 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x32 = bool(x32)
+    r19['activated'] = x32
+    if o21 & 0x80:
+        l34 = 3
+        x33, p = uper.read_chars(v, n, p, l34, 7, None)
+        r19['currency'] = x33
+    else:
+        r19['currency'] = 'EUR'
+    if o21 & 0x40:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        x35 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        x35 += 1
+        r19['currencyFract'] = x35
+    else:
+        r19['currencyFract'] = 2
+    if o21 & 0x20:
+        x36, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['issuerPNR'] = x36
+    if o21 & 0x10:
+        x37, p = decode_ExtensionData(v, n, p)
+        r19['extension'] = x37
+    if o21 & 0x8:
+        x38, p = uper.read_unconstrained(v, n, p)
+        r19['issuedOnTrainNum'] = x38
+    if o21 & 0x4:
+        x39, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['issuedOnTrainIA5'] = x39
+    if o21 & 0x2:
+        x40, p = uper.read_unconstrained(v, n, p)
+        r19['issuedOnLine'] = x40
+    if o21 & 0x1:
+        x41, p = decode_GeoCoordinateType(v, n, p)
+        r19['pointOfSale'] = x41
+    if e20:
+        p = uper.skip_additions(v, n, p)
+    return r19, p
+
+
+def decode_TravelerData(v, n, p):
+    r42 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e43 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o44 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o44 & 0x4:
+        x45 = []
+        while True:
+            c46, p = uper.read_length(v, n, p)
+            for _ in range(c46):
+                x47, p = decode_TravelerType(v, n, p)
+                x45.append(x47)
+            if c46 < 16384:
+                break
+        r42['traveler'] = x45
+    if o44 & 0x2:
+        l49 = 2
+        x48, p = uper.read_chars(v, n, p, l49, 7, None)
+        r42['preferredLanguage'] = x48
+    if o44 & 0x1:
+        x50, p = uper.read_utf8(v, n, p)
+        r42['groupName'] = x50
+    if e43:
+        p = uper.skip_additions(v, n, p)
+    return r42, p
+
+
+def decode_DocumentData_ticket_18(v, n, p):
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e52 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if e52:
+        _, p = uper.read_normally_small_number(v, n, p)
+        l53, p = uper.read_length(v, n, p)
+        p = uper.skip_bits(n, p, 8 * l53)
+        r51 = (None, None)
+    else:
+        if p + 4 > n:
+            raise OutOfDataError(p)
+        i54 = (v >> (n - p - 4)) & 0xf
+        p += 4
+        if i54 == 0:
+            x55, p = decode_ReservationData(v, n, p)
+            r51 = ('reservation', x55)
+        elif i54 == 1:
+            x56, p = fallback(3, v, n, p)
+            r51 = ('carCarriageReservation', x56)
+        elif i54 == 2:
+            x57, p = decode_OpenTicketData(v, n, p)
+            r51 = ('openTicket', x57)
+        elif i54 == 3:
+            x58, p = decode_PassData(v, n, p)
+            r51 = ('pass', x58)
+        elif i54 == 4:
+            x59, p = fallback(4, v, n, p)
+            r51 = ('voucher', x59)
+        elif i54 == 5:
+            x60, p = decode_CustomerCardData(v, n, p)
+            r51 = ('customerCard', x60)
+        elif i54 == 6:
+            x61, p = fallback(5, v, n, p)
+            r51 = ('counterMark', x61)
+        elif i54 == 7:
+            x62, p = fallback(6, v, n, p)
+            r51 = ('parkingGround', x62)
+        elif i54 == 8:
+            x63, p = fallback(7, v, n, p)
+            r51 = ('fipTicket', x63)
+        elif i54 == 9:
+            x64, p = fallback(8, v, n, p)
+            r51 = ('stationPassage', x64)
+        elif i54 == 10:
+            x65, p = fallback(9, v, n, p)
+            r51 = ('extension', x65)
+        elif i54 == 11:
+            x66, p = fallback(10, v, n, p)
+            r51 = ('delayConfirmation', x66)
+        else:
+            raise DecodeError(f"Expected choice index {i54} to be in range.")
+    return r51, p
+
+
+def decode_ExtensionData(v, n, p):
+    r67 = {}
+    x68, p = uper.read_chars_unbound(v, n, p, 7, None)
+    r67['extensionId'] = x68
+    x69, p = uper.read_octets_unbound(v, n, p)
+    r67['extensionData'] = x69
+    return r67, p
+
+
+def decode_GeoCoordinateType(v, n, p):
+    r70 = {}
+    if p + 5 > n:
+        raise OutOfDataError(p)
+    o71 = (v >> (n - p - 5)) & 0x1f
+    p += 5
+    if o71 & 0x10:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i73 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i73 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i73}.")
+        x72 = _C0[i73]
+        r70['geoUnit'] = x72
+    else:
+        r70['geoUnit'] = 'milliDegree'
+    if o71 & 0x8:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        i75 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if i75 >= 2:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i75}.")
+        x74 = _C1[i75]
+        r70['coordinateSystem'] = x74
+    else:
+        r70['coordinateSystem'] = 'wgs84'
+    if o71 & 0x4:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        i77 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if i77 >= 2:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i77}.")
+        x76 = _C2[i77]
+        r70['hemisphereLongitude'] = x76
+    else:
+        r70['hemisphereLongitude'] = 'north'
+    if o71 & 0x2:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        i79 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if i79 >= 2:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i79}.")
+        x78 = _C3[i79]
+        r70['hemisphereLatitude'] = x78
+    else:
+        r70['hemisphereLatitude'] = 'east'
+    x80, p = uper.read_unconstrained(v, n, p)
+    r70['longitude'] = x80
+    x81, p = uper.read_unconstrained(v, n, p)
+    r70['latitude'] = x81
+    if o71 & 0x1:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i83 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i83 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i83}.")
+        x82 = _C0[i83]
+        r70['accuracy'] = x82
+    return r70, p
+
+
+def decode_TravelerType(v, n, p):
+    r84 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e85 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 18 > n:
+        raise OutOfDataError(p)
+    o86 = (v >> (n - p - 18)) & 0x3ffff
+    p += 18
+    if o86 & 0x20000:
+        x87, p = uper.read_utf8(v, n, p)
+        r84['firstName'] = x87
+    if o86 & 0x10000:
+        x88, p = uper.read_utf8(v, n, p)
+        r84['secondName'] = x88
+    if o86 & 0x8000:
+        x89, p = uper.read_utf8(v, n, p)
+        r84['lastName'] = x89
+    if o86 & 0x4000:
+        x90, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r84['idCard'] = x90
+    if o86 & 0x2000:
+        x91, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r84['passportId'] = x91
+    if o86 & 0x1000:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        l93 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        l93 += 1
+        x92, p = uper.read_chars(v, n, p, l93, 7, None)
+        r84['title'] = x92
+    if o86 & 0x800:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e95 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e95:
+            x94, p = uper.read_normally_small_number(v, n, p)
+            x94 = _C4.get(x94)
+        else:
+            if p + 2 > n:
+                raise OutOfDataError(p)
+            i96 = (v >> (n - p - 2)) & 0x3
+            p += 2
+            if i96 >= 4:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i96}.")
+            x94 = _C5[i96]
+        r84['gender'] = x94
+    if o86 & 0x400:
+        x97, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r84['customerIdIA5'] = x97
+    if o86 & 0x200:
+        x98, p = uper.read_unconstrained(v, n, p)
+        r84['customerIdNum'] = x98
+    if o86 & 0x100:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x99 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x99 += 1901
+        r84['yearOfBirth'] = x99
+    if o86 & 0x80:
+        if p + 4 > n:
+            raise OutOfDataError(p)
+        x100 = (v >> (n - p - 4)) & 0xf
+        p += 4
+        x100 += 1
+        r84['monthOfBirth'] = x100
+    if o86 & 0x40:
+        if p + 5 > n:
+            raise OutOfDataError(p)
+        x101 = (v >> (n - p - 5)) & 0x1f
+        p += 5
+        x101 += 1
+        r84['dayOfBirthInMonth'] = x101
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x102 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x102 = bool(x102)
+    r84['ticketHolder'] = x102
+    if o86 & 0x20:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e104 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e104:
+            x103, p = uper.read_normally_small_number(v, n, p)
+            x103 = _C4.get(x103)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i105 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i105 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i105}.")
+            x103 = _C6[i105]
+        r84['passengerType'] = x103
+    if o86 & 0x10:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        x106 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        x106 = bool(x106)
+        r84['passengerWithReducedMobility'] = x106
+    if o86 & 0x8:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x107 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x107 += 1
+        r84['countryOfResidence'] = x107
+    if o86 & 0x4:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x108 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x108 += 1
+        r84['countryOfPassport'] = x108
+    if o86 & 0x2:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x109 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x109 += 1
+        r84['countryOfIdCard'] = x109
+    if o86 & 0x1:
+        x110 = []
+        while True:
+            c111, p = uper.read_length(v, n, p)
+            for _ in range(c111):
+                x112, p = decode_CustomerStatusType(v, n, p)
+                x110.append(x112)
+            if c111 < 16384:
+                break
+        r84['status'] = x110
+    if e85:
+        p = uper.skip_additions(v, n, p)
+    return r84, p
+
+
+def decode_ReservationData(v, n, p):
+    r113 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e114 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 43 > n:
+        raise OutOfDataError(p)
+    o115 = (v >> (n - p - 43)) & 0x7ffffffffff
+    p += 43
+    if o115 & 0x40000000000:
+        x116, p = uper.read_unconstrained(v, n, p)
+        r113['trainNum'] = x116
+    if o115 & 0x20000000000:
+        x117, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['trainIA5'] = x117
+    if o115 & 0x10000000000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x118 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x118 += -1
+        r113['departureDate'] = x118
+    else:
+        r113['departureDate'] = 0
+    if o115 & 0x8000000000:
+        x119, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['referenceIA5'] = x119
+    if o115 & 0x4000000000:
+        x120, p = uper.read_unconstrained(v, n, p)
+        r113['referenceNum'] = x120
+    if o115 & 0x2000000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x121 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x121 += 1
+        r113['productOwnerNum'] = x121
+    if o115 & 0x1000000000:
+        x122, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['productOwnerIA5'] = x122
+    if o115 & 0x800000000:
+        if p + 16 > n:
+            raise OutOfDataError(p)
+        x123 = (v >> (n - p - 16)) & 0xffff
+        p += 16
+        r113['productIdNum'] = x123
+    if o115 & 0x400000000:
+        x124, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['productIdIA5'] = x124
+    if o115 & 0x200000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x125 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        r113['serviceBrand'] = x125
+    if o115 & 0x100000000:
+        x126, p = uper.read_utf8(v, n, p)
+        r113['serviceBrandAbrUTF8'] = x126
+    if o115 & 0x80000000:
+        x127, p = uper.read_utf8(v, n, p)
+        r113['serviceBrandNameUTF8'] = x127
+    if o115 & 0x40000000:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        i129 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        if i129 >= 4:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i129}.")
+        x128 = _C7[i129]
+        r113['service'] = x128
+    else:
+        r113['service'] = 'seat'
+    if o115 & 0x20000000:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i131 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i131 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i131}.")
+        x130 = _C8[i131]
+        r113['stationCodeTable'] = x130
+    else:
+        r113['stationCodeTable'] = 'stationUICReservation'
+    if o115 & 0x10000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x132 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x132 += 1
+        r113['fromStationNum'] = x132
+    if o115 & 0x8000000:
+        x133, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['fromStationIA5'] = x133
+    if o115 & 0x4000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x134 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x134 += 1
+        r113['toStationNum'] = x134
+    if o115 & 0x2000000:
+        x135, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['toStationIA5'] = x135
+    if o115 & 0x1000000:
+        x136, p = uper.read_utf8(v, n, p)
+        r113['fromStationNameUTF8'] = x136
+    if o115 & 0x800000:
+        x137, p = uper.read_utf8(v, n, p)
+        r113['toStationNameUTF8'] = x137
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x138 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r113['departureTime'] = x138
+    if o115 & 0x400000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x139 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x139 += -60
+        r113['departureUTCOffset'] = x139
+    if o115 & 0x200000:
+        if p + 5 > n:
+            raise OutOfDataError(p)
+        x140 = (v >> (n - p - 5)) & 0x1f
+        p += 5
+        x140 += -1
+        r113['arrivalDate'] = x140
+    else:
+        r113['arrivalDate'] = 0
+    if o115 & 0x100000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x141 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r113['arrivalTime'] = x141
+    if o115 & 0x80000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x142 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x142 += -60
+        r113['arrivalUTCOffset'] = x142
+    if o115 & 0x40000:
+        x143 = []
+        while True:
+            c144, p = uper.read_length(v, n, p)
+            for _ in range(c144):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x145 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x145 += 1
+                x143.append(x145)
+            if c144 < 16384:
+                break
+        r113['carrierNum'] = x143
+    if o115 & 0x20000:
+        x146 = []
+        while True:
+            c147, p = uper.read_length(v, n, p)
+            for _ in range(c147):
+                x148, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x146.append(x148)
+            if c147 < 16384:
+                break
+        r113['carrierIA5'] = x146
+    if o115 & 0x10000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e150 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e150:
+            x149, p = uper.read_normally_small_number(v, n, p)
+            x149 = _C4.get(x149)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i151 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i151 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i151}.")
+            x149 = _C9[i151]
+        r113['classCode'] = x149
+    else:
+        r113['classCode'] = 'second'
+    if o115 & 0x8000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        l153 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        l153 += 1
+        x152, p = uper.read_chars(v, n, p, l153, 7, None)
+        r113['serviceLevel'] = x152
+    if o115 & 0x4000:
+        x154, p = decode_PlacesType(v, n, p)
+        r113['places'] = x154
+    if o115 & 0x2000:
+        x155, p = decode_PlacesType(v, n, p)
+        r113['additionalPlaces'] = x155
+    if o115 & 0x1000:
+        x156, p = decode_PlacesType(v, n, p)
+        r113['bicyclePlaces'] = x156
+    if o115 & 0x800:
+        x157, p = decode_CompartmentDetailsType(v, n, p)
+        r113['compartmentDetails'] = x157
+    if o115 & 0x400:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x158 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        r113['numberOfOverbooked'] = x158
+    else:
+        r113['numberOfOverbooked'] = 0
+    if o115 & 0x200:
+        x159 = []
+        while True:
+            c160, p = uper.read_length(v, n, p)
+            for _ in range(c160):
+                x161, p = decode_BerthDetailData(v, n, p)
+                x159.append(x161)
+            if c160 < 16384:
+                break
+        r113['berth'] = x159
+    if o115 & 0x100:
+        x162 = []
+        while True:
+            c163, p = uper.read_length(v, n, p)
+            for _ in range(c163):
+                x164, p = decode_TariffType(v, n, p)
+                x162.append(x164)
+            if c163 < 16384:
+                break
+        r113['tariff'] = x162
+    if o115 & 0x80:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        i166 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        if i166 >= 4:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i166}.")
+        x165 = _C10[i166]
+        r113['priceType'] = x165
+    else:
+        r113['priceType'] = 'travelPrice'
+    if o115 & 0x40:
+        x167, p = uper.read_unconstrained(v, n, p)
+        r113['price'] = x167
+    if o115 & 0x20:
+        x168 = []
+        while True:
+            c169, p = uper.read_length(v, n, p)
+            for _ in range(c169):
+                x170, p = decode_VatDetailType(v, n, p)
+                x168.append(x170)
+            if c169 < 16384:
+                break
+        r113['vatDetail'] = x168
+    if o115 & 0x10:
+        if p + 4 > n:
+            raise OutOfDataError(p)
+        x171 = (v >> (n - p - 4)) & 0xf
+        p += 4
+        r113['typeOfSupplement'] = x171
+    else:
+        r113['typeOfSupplement'] = 0
+    if o115 & 0x8:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x172 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        r113['numberOfSupplements'] = x172
+    else:
+        r113['numberOfSupplements'] = 0
+    if o115 & 0x4:
+        x173, p = decode_LuggageRestrictionType(v, n, p)
+        r113['luggage'] = x173
+    if o115 & 0x2:
+        x174, p = uper.read_utf8(v, n, p)
+        r113['infoText'] = x174
+    if o115 & 0x1:
+        x175, p = decode_ExtensionData(v, n, p)
+        r113['extension'] = x175
+    if e114:
+        p = uper.skip_additions(v, n, p)
+    return r113, p
+
+
+def decode_OpenTicketData(v, n, p):
+    r176 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e177 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 40 > n:
+        raise OutOfDataError(p)
+    o178 = (v >> (n - p - 40)) & 0xffffffffff
+    p += 40
+    if o178 & 0x8000000000:
+        x179, p = uper.read_unconstrained(v, n, p)
+        r176['referenceNum'] = x179
+    if o178 & 0x4000000000:
+        x180, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['referenceIA5'] = x180
+    if o178 & 0x2000000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x181 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x181 += 1
+        r176['productOwnerNum'] = x181
+    if o178 & 0x1000000000:
+        x182, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['productOwnerIA5'] = x182
+    if o178 & 0x800000000:
+        if p + 16 > n:
+            raise OutOfDataError(p)
+        x183 = (v >> (n - p - 16)) & 0xffff
+        p += 16
+        r176['productIdNum'] = x183
+    if o178 & 0x400000000:
+        x184, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['productIdIA5'] = x184
+    if o178 & 0x200000000:
+        x185, p = uper.read_unconstrained(v, n, p)
+        r176['extIssuerId'] = x185
+    if o178 & 0x100000000:
+        x186, p = uper.read_unconstrained(v, n, p)
+        r176['issuerAutorizationId'] = x186
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x187 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x187 = bool(x187)
+    r176['returnIncluded'] = x187
+    if o178 & 0x80000000:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i189 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i189 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i189}.")
+        x188 = _C8[i189]
+        r176['stationCodeTable'] = x188
+    else:
+        r176['stationCodeTable'] = 'stationUIC'
+    if o178 & 0x40000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x190 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x190 += 1
+        r176['fromStationNum'] = x190
+    if o178 & 0x20000000:
+        x191, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['fromStationIA5'] = x191
+    if o178 & 0x10000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x192 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x192 += 1
+        r176['toStationNum'] = x192
+    if o178 & 0x8000000:
+        x193, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['toStationIA5'] = x193
+    if o178 & 0x4000000:
+        x194, p = uper.read_utf8(v, n, p)
+        r176['fromStationNameUTF8'] = x194
+    if o178 & 0x2000000:
+        x195, p = uper.read_utf8(v, n, p)
+        r176['toStationNameUTF8'] = x195
+    if o178 & 0x1000000:
+        x196, p = uper.read_utf8(v, n, p)
+        r176['validRegionDesc'] = x196
+    if o178 & 0x800000:
+        x197 = []
+        while True:
+            c198, p = uper.read_length(v, n, p)
+            for _ in range(c198):
+                x199, p = decode_RegionalValidityType(v, n, p)
+                x197.append(x199)
+            if c198 < 16384:
+                break
+        r176['validRegion'] = x197
+    if o178 & 0x400000:
+        x200, p = decode_ReturnRouteDescriptionType(v, n, p)
+        r176['returnDescription'] = x200
+    if o178 & 0x200000:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x201 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x201 += -1
+        r176['validFromDay'] = x201
+    else:
+        r176['validFromDay'] = 0
+    if o178 & 0x100000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x202 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r176['validFromTime'] = x202
+    if o178 & 0x80000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x203 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x203 += -60
+        r176['validFromUTCOffset'] = x203
+    if o178 & 0x40000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x204 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x204 += -1
+        r176['validUntilDay'] = x204
+    else:
+        r176['validUntilDay'] = 0
+    if o178 & 0x20000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x205 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r176['validUntilTime'] = x205
+    if o178 & 0x10000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x206 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x206 += -60
+        r176['validUntilUTCOffset'] = x206
+    if o178 & 0x8000:
+        x207 = []
+        while True:
+            c208, p = uper.read_length(v, n, p)
+            for _ in range(c208):
+                if p + 9 > n:
+                    raise OutOfDataError(p)
+                x209 = (v >> (n - p - 9)) & 0x1ff
+                p += 9
+                x207.append(x209)
+            if c208 < 16384:
+                break
+        r176['activatedDay'] = x207
+    if o178 & 0x4000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e211 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e211:
+            x210, p = uper.read_normally_small_number(v, n, p)
+            x210 = _C4.get(x210)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i212 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i212 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i212}.")
+            x210 = _C9[i212]
+        r176['classCode'] = x210
+    else:
+        r176['classCode'] = 'second'
+    if o178 & 0x2000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        l214 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        l214 += 1
+        x213, p = uper.read_chars(v, n, p, l214, 7, None)
+        r176['serviceLevel'] = x213
+    if o178 & 0x1000:
+        x215 = []
+        while True:
+            c216, p = uper.read_length(v, n, p)
+            for _ in range(c216):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x217 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x217 += 1
+                x215.append(x217)
+            if c216 < 16384:
+                break
+        r176['carrierNum'] = x215
+    if o178 & 0x800:
+        x218 = []
+        while True:
+            c219, p = uper.read_length(v, n, p)
+            for _ in range(c219):
+                x220, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x218.append(x220)
+            if c219 < 16384:
+                break
+        r176['carrierIA5'] = x218
+    if o178 & 0x400:
+        x221 = []
+        while True:
+            c222, p = uper.read_length(v, n, p)
+            for _ in range(c222):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x223 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x223 += 1
+                x221.append(x223)
+            if c222 < 16384:
+                break
+        r176['includedServiceBrands'] = x221
+    if o178 & 0x200:
+        x224 = []
+        while True:
+            c225, p = uper.read_length(v, n, p)
+            for _ in range(c225):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x226 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x226 += 1
+                x224.append(x226)
+            if c225 < 16384:
+                break
+        r176['excludedServiceBrands'] = x224
+    if o178 & 0x100:
+        x227 = []
+        while True:
+            c228, p = uper.read_length(v, n, p)
+            for _ in range(c228):
+                x229, p = decode_TariffType(v, n, p)
+                x227.append(x229)
+            if c228 < 16384:
+                break
+        r176['tariffs'] = x227
+    if o178 & 0x80:
+        x230, p = uper.read_unconstrained(v, n, p)
+        r176['price'] = x230
+    if o178 & 0x40:
+        x231 = []
+        while True:
+            c232, p = uper.read_length(v, n, p)
+            for _ in range(c232):
+                x233, p = decode_VatDetailType(v, n, p)
+                x231.append(x233)
+            if c232 < 16384:
+                break
+        r176['vatDetail'] = x231
+    if o178 & 0x20:
+        x234, p = uper.read_utf8(v, n, p)
+        r176['infoText'] = x234
+    if o178 & 0x10:
+        x235 = []
+        while True:
+            c236, p = uper.read_length(v, n, p)
+            for _ in range(c236):
+                x237, p = decode_IncludedOpenTicketType(v, n, p)
+                x235.append(x237)
+            if c236 < 16384:
+                break
+        r176['includedAddOns'] = x235
+    if o178 & 0x8:
+        x238, p = decode_LuggageRestrictionType(v, n, p)
+        r176['luggage'] = x238
+    if o178 & 0x4:
+        x239 = []
+        while True:
+            c240, p = uper.read_length(v, n, p)
+            for _ in range(c240):
+                if p + 5 > n:
+                    raise OutOfDataError(p)
+                x241 = (v >> (n - p - 5)) & 0x1f
+                p += 5
+                x239.append(x241)
+            if c240 < 16384:
+                break
+        r176['includedTransportType'] = x239
+    if o178 & 0x2:
+        x242 = []
+        while True:
+            c243, p = uper.read_length(v, n, p)
+            for _ in range(c243):
+                if p + 5 > n:
+                    raise OutOfDataError(p)
+                x244 = (v >> (n - p - 5)) & 0x1f
+                p += 5
+                x242.append(x244)
+            if c243 < 16384:
+                break
+        r176['excludedTransportType'] = x242
+    if o178 & 0x1:
+        x245, p = decode_ExtensionData(v, n, p)
+        r176['extension'] = x245
+    if e177:
+        p = uper.skip_additions(v, n, p)
+    return r176, p
+
+
+def decode_PassData(v, n, p):
+    r246 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e247 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 33 > n:
+        raise OutOfDataError(p)
+    o248 = (v >> (n - p - 33)) & 0x1ffffffff
+    p += 33
+    if o248 & 0x100000000:
+        x249, p = uper.read_unconstrained(v, n, p)
+        r246['referenceNum'] = x249
+    if o248 & 0x80000000:
+        x250, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r246['referenceIA5'] = x250
+    if o248 & 0x40000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x251 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x251 += 1
+        r246['productOwnerNum'] = x251
+    if o248 & 0x20000000:
+        x252, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r246['productOwnerIA5'] = x252
+    if o248 & 0x10000000:
+        if p + 16 > n:
+            raise OutOfDataError(p)
+        x253 = (v >> (n - p - 16)) & 0xffff
+        p += 16
+        r246['productIdNum'] = x253
+    if o248 & 0x8000000:
+        x254, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r246['productIdIA5'] = x254
+    if o248 & 0x4000000:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x255 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x255 += 1
+        r246['passType'] = x255
+    if o248 & 0x2000000:
+        x256, p = uper.read_utf8(v, n, p)
+        r246['passDescription'] = x256
+    if o248 & 0x1000000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e258 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e258:
+            x257, p = uper.read_normally_small_number(v, n, p)
+            x257 = _C4.get(x257)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i259 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i259 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i259}.")
+            x257 = _C9[i259]
+        r246['classCode'] = x257
+    else:
+        r246['classCode'] = 'second'
+    if o248 & 0x800000:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x260 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x260 += -1
+        r246['validFromDay'] = x260
+    else:
+        r246['validFromDay'] = 0
+    if o248 & 0x400000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x261 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r246['validFromTime'] = x261
+    if o248 & 0x200000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x262 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x262 += -60
+        r246['validFromUTCOffset'] = x262
+    if o248 & 0x100000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x263 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x263 += -1
+        r246['validUntilDay'] = x263
+    else:
+        r246['validUntilDay'] = 0
+    if o248 & 0x80000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x264 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r246['validUntilTime'] = x264
+    if o248 & 0x40000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x265 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x265 += -60
+        r246['validUntilUTCOffset'] = x265
+    if o248 & 0x20000:
+        x266, p = decode_ValidityPeriodDetailType(v, n, p)
+        r246['validityPeriodDetails'] = x266
+    if o248 & 0x10000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x267 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r246['numberOfValidityDays'] = x267
+    if o248 & 0x8000:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x268 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x268 += 1
+        r246['numberOfPossibleTrips'] = x268
+    if o248 & 0x4000:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x269 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x269 += 1
+        r246['numberOfDaysOfTravel'] = x269
+    if o248 & 0x2000:
+        x270 = []
+        while True:
+            c271, p = uper.read_length(v, n, p)
+            for _ in range(c271):
+                if p + 9 > n:
+                    raise OutOfDataError(p)
+                x272 = (v >> (n - p - 9)) & 0x1ff
+                p += 9
+                x270.append(x272)
+            if c271 < 16384:
+                break
+        r246['activatedDay'] = x270
+    if o248 & 0x1000:
+        x273 = []
+        while True:
+            c274, p = uper.read_length(v, n, p)
+            for _ in range(c274):
+                if p + 8 > n:
+                    raise OutOfDataError(p)
+                x275 = (v >> (n - p - 8)) & 0xff
+                p += 8
+                x275 += 1
+                x273.append(x275)
+            if c274 < 16384:
+                break
+        r246['countries'] = x273
+    if o248 & 0x800:
+        x276 = []
+        while True:
+            c277, p = uper.read_length(v, n, p)
+            for _ in range(c277):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x278 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x278 += 1
+                x276.append(x278)
+            if c277 < 16384:
+                break
+        r246['includedCarrierNum'] = x276
+    if o248 & 0x400:
+        x279 = []
+        while True:
+            c280, p = uper.read_length(v, n, p)
+            for _ in range(c280):
+                x281, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x279.append(x281)
+            if c280 < 16384:
+                break
+        r246['includedCarrierIA5'] = x279
+    if o248 & 0x200:
+        x282 = []
+        while True:
+            c283, p = uper.read_length(v, n, p)
+            for _ in range(c283):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x284 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x284 += 1
+                x282.append(x284)
+            if c283 < 16384:
+                break
+        r246['excludedCarrierNum'] = x282
+    if o248 & 0x100:
+        x285 = []
+        while True:
+            c286, p = uper.read_length(v, n, p)
+            for _ in range(c286):
+                x287, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x285.append(x287)
+            if c286 < 16384:
+                break
+        r246['excludedCarrierIA5'] = x285
+    if o248 & 0x80:
+        x288 = []
+        while True:
+            c289, p = uper.read_length(v, n, p)
+            for _ in range(c289):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x290 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x290 += 1
+                x288.append(x290)
+            if c289 < 16384:
+                break
+        r246['includedServiceBrands'] = x288
+    if o248 & 0x40:
+        x291 = []
+        while True:
+            c292, p = uper.read_length(v, n, p)
+            for _ in range(c292):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x293 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x293 += 1
+                x291.append(x293)
+            if c292 < 16384:
+                break
+        r246['excludedServiceBrands'] = x291
+    if o248 & 0x20:
+        x294 = []
+        while True:
+            c295, p = uper.read_length(v, n, p)
+            for _ in range(c295):
+                x296, p = decode_RegionalValidityType(v, n, p)
+                x294.append(x296)
+            if c295 < 16384:
+                break
+        r246['validRegion'] = x294
+    if o248 & 0x10:
+        x297 = []
+        while True:
+            c298, p = uper.read_length(v, n, p)
+            for _ in range(c298):
+                x299, p = decode_TariffType(v, n, p)
+                x297.append(x299)
+            if c298 < 16384:
+                break
+        r246['tariffs'] = x297
+    if o248 & 0x8:
+        x300, p = uper.read_unconstrained(v, n, p)
+        r246['price'] = x300
+    if o248 & 0x4:
+        x301 = []
+        while True:
+            c302, p = uper.read_length(v, n, p)
+            for _ in range(c302):
+                x303, p = decode_VatDetailType(v, n, p)
+                x301.append(x303)
+            if c302 < 16384:
+                break
+        r246['vatDetail'] = x301
+    if o248 & 0x2:
+        x304, p = uper.read_utf8(v, n, p)
+        r246['infoText'] = x304
+    if o248 & 0x1:
+        x305, p = decode_ExtensionData(v, n, p)
+        r246['extension'] = x305
+    if e247:
+        p = uper.skip_additions(v, n, p)
+    return r246, p
+
+
+def decode_CustomerCardData(v, n, p):
+    r306 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e307 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 13 > n:
+        raise OutOfDataError(p)
+    o308 = (v >> (n - p - 13)) & 0x1fff
+    p += 13
+    if o308 & 0x1000:
+        x309, p = decode_TravelerType(v, n, p)
+        r306['customer'] = x309
+    if o308 & 0x800:
+        x310, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r306['cardIdIA5'] = x310
+    if o308 & 0x400:
+        x311, p = uper.read_unconstrained(v, n, p)
+        r306['cardIdNum'] = x311
+    if p + 8 > n:
+        raise OutOfDataError(p)
+    x312 = (v >> (n - p - 8)) & 0xff
+    p += 8
+    x312 += 2016
+    r306['validFromYear'] = x312
+    if o308 & 0x200:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x313 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r306['validFromDay'] = x313
+    if o308 & 0x100:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x314 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        r306['validUntilYear'] = x314
+    else:
+        r306['validUntilYear'] = 0
+    if o308 & 0x80:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x315 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r306['validUntilDay'] = x315
+    if o308 & 0x40:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e317 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e317:
+            x316, p = uper.read_normally_small_number(v, n, p)
+            x316 = _C4.get(x316)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i318 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i318 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i318}.")
+            x316 = _C9[i318]
+        r306['classCode'] = x316
+    if o308 & 0x20:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x319 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x319 += 1
+        r306['cardType'] = x319
+    if o308 & 0x10:
+        x320, p = uper.read_utf8(v, n, p)
+        r306['cardTypeDescr'] = x320
+    if o308 & 0x8:
+        x321, p = uper.read_unconstrained(v, n, p)
+        r306['customerStatus'] = x321
+    if o308 & 0x4:
+        x322, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r306['customerStatusDescr'] = x322
+    if o308 & 0x2:
+        x323 = []
+        while True:
+            c324, p = uper.read_length(v, n, p)
+            for _ in range(c324):
+                x325, p = uper.read_unconstrained(v, n, p)
+                x323.append(x325)
+            if c324 < 16384:
+                break
+        r306['includedServices'] = x323
+    if o308 & 0x1:
+        x326, p = decode_ExtensionData(v, n, p)
+        r306['extension'] = x326
+    if e307:
+        p = uper.skip_additions(v, n, p)
+    return r306, p
+
+
+def decode_CustomerStatusType(v, n, p):
+    r327 = {}
+    if p + 4 > n:
+        raise OutOfDataError(p)
+    o328 = (v >> (n - p - 4)) & 0xf
+    p += 4
+    if o328 & 0x8:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x329 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x329 += 1
+        r327['statusProviderNum'] = x329
+    if o328 & 0x4:
+        x330, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r327['statusProviderIA5'] = x330
+    if o328 & 0x2:
+        x331, p = uper.read_unconstrained(v, n, p)
+        r327['customerStatus'] = x331
+    if o328 & 0x1:
+        x332, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r327['customerStatusDescr'] = x332
+    return r327, p
+
+
+def decode_PlacesType(v, n, p):
+    r333 = {}
+    if p + 5 > n:
+        raise OutOfDataError(p)
+    o334 = (v >> (n - p - 5)) & 0x1f
+    p += 5
+    if o334 & 0x10:
+        x335, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r333['coach'] = x335
+    if o334 & 0x8:
+        x336, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r333['placeString'] = x336
+    if o334 & 0x4:
+        x337, p = uper.read_utf8(v, n, p)
+        r333['placeDescription'] = x337
+    if o334 & 0x2:
+        x338 = []
+        while True:
+            c339, p = uper.read_length(v, n, p)
+            for _ in range(c339):
+                x340, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x338.append(x340)
+            if c339 < 16384:
+                break
+        r333['placeIA5'] = x338
+    if o334 & 0x1:
+        x341 = []
+        while True:
+            c342, p = uper.read_length(v, n, p)
+            for _ in range(c342):
+                if p + 8 > n:
+                    raise OutOfDataError(p)
+                x343 = (v >> (n - p - 8)) & 0xff
+                p += 8
+                x343 += 1
+                x341.append(x343)
+            if c342 < 16384:
+                break
+        r333['placeNum'] = x341
+    return r333, p
+
+
+def decode_CompartmentDetailsType(v, n, p):
+    r344 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e345 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 7 > n:
+        raise OutOfDataError(p)
+    o346 = (v >> (n - p - 7)) & 0x7f
+    p += 7
+    if o346 & 0x40:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x347 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x347 += 1
+        r344['coachType'] = x347
+    if o346 & 0x20:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x348 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x348 += 1
+        r344['compartmentType'] = x348
+    if o346 & 0x10:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x349 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x349 += 1
+        r344['specialAllocation'] = x349
+    if o346 & 0x8:
+        x350, p = uper.read_utf8(v, n, p)
+        r344['coachTypeDescr'] = x350
+    if o346 & 0x4:
+        x351, p = uper.read_utf8(v, n, p)
+        r344['compartmentTypeDescr'] = x351
+    if o346 & 0x2:
+        x352, p = uper.read_utf8(v, n, p)
+        r344['specialAllocationDescr'] = x352
+    if o346 & 0x1:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        i354 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        if i354 >= 3:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i354}.")
+        x353 = _C11[i354]
+        r344['position'] = x353
+    else:
+        r344['position'] = 'unspecified'
+    if e345:
+        p = uper.skip_additions(v, n, p)
+    return r344, p
+
+
+def decode_BerthDetailData(v, n, p):
+    r355 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e356 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    o357 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    i359 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if i359 >= 6:
+        raise DecodeError(f"Expected enumeration index to be in range, but got {i359}.")
+    x358 = _C12[i359]
+    r355['berthType'] = x358
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    x360 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    x360 += 1
+    r355['numberOfBerths'] = x360
+    if o357 & 0x1:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e362 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e362:
+            x361, p = uper.read_normally_small_number(v, n, p)
+            x361 = _C4.get(x361)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i363 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i363 >= 5:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i363}.")
+            x361 = _C13[i363]
+        r355['gender'] = x361
+    else:
+        r355['gender'] = 'family'
+    if e356:
+        p = uper.skip_additions(v, n, p)
+    return r355, p
+
+
+def decode_TariffType(v, n, p):
+    r364 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e365 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    o366 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    if o366 & 0x400:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x367 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x367 += 1
+        r364['numberOfPassengers'] = x367
+    else:
+        r364['numberOfPassengers'] = 1
+    if o366 & 0x200:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e369 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e369:
+            x368, p = uper.read_normally_small_number(v, n, p)
+            x368 = _C4.get(x368)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i370 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i370 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i370}.")
+            x368 = _C6[i370]
+        r364['passengerType'] = x368
+    if o366 & 0x100:
+        if p + 6 > n:
+            raise OutOfDataError(p)
+        x371 = (v >> (n - p - 6)) & 0x3f
+        p += 6
+        x371 += 1
+        r364['ageBelow'] = x371
+    if o366 & 0x80:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x372 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x372 += 1
+        r364['ageAbove'] = x372
+    if o366 & 0x40:
+        x373 = []
+        while True:
+            c374, p = uper.read_length(v, n, p)
+            for _ in range(c374):
+                if p + 8 > n:
+                    raise OutOfDataError(p)
+                x375 = (v >> (n - p - 8)) & 0xff
+                p += 8
+                x375 += 1
+                x373.append(x375)
+            if c374 < 16384:
+                break
+        r364['travelerid'] = x373
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x376 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x376 = bool(x376)
+    r364['restrictedToCountryOfResidence'] = x376
+    if o366 & 0x20:
+        x377, p = decode_RouteSectionType(v, n, p)
+        r364['restrictedToRouteSection'] = x377
+    if o366 & 0x10:
+        x378, p = decode_SeriesDetailType(v, n, p)
+        r364['seriesDataDetails'] = x378
+    if o366 & 0x8:
+        x379, p = uper.read_unconstrained(v, n, p)
+        r364['tariffIdNum'] = x379
+    if o366 & 0x4:
+        x380, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r364['tariffIdIA5'] = x380
+    if o366 & 0x2:
+        x381, p = uper.read_utf8(v, n, p)
+        r364['tariffDesc'] = x381
+    if o366 & 0x1:
+        x382 = []
+        while True:
+            c383, p = uper.read_length(v, n, p)
+            for _ in range(c383):
+                x384, p = decode_CardReferenceType(v, n, p)
+                x382.append(x384)
+            if c383 < 16384:
+                break
+        r364['reductionCard'] = x382
+    if e365:
+        p = uper.skip_additions(v, n, p)
+    return r364, p
+
+
+def decode_VatDetailType(v, n, p):
+    r385 = {}
+    if p + 2 > n:
+        raise OutOfDataError(p)
+    o386 = (v >> (n - p - 2)) & 0x3
+    p += 2
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    x387 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    x387 += 1
+    r385['country'] = x387
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    x388 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    r385['percentage'] = x388
+    if o386 & 0x2:
+        x389, p = uper.read_unconstrained(v, n, p)
+        r385['amount'] = x389
+    if o386 & 0x1:
+        x390, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r385['vatId'] = x390
+    return r385, p
+
+
+def decode_LuggageRestrictionType(v, n, p):
+    r391 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e392 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o393 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o393 & 0x4:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x394 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        r391['maxHandLuggagePieces'] = x394
+    else:
+        r391['maxHandLuggagePieces'] = 3
+    if o393 & 0x2:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x395 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        r391['maxNonHandLuggagePieces'] = x395
+    else:
+        r391['maxNonHandLuggagePieces'] = 1
+    if o393 & 0x1:
+        x396 = []
+        while True:
+            c397, p = uper.read_length(v, n, p)
+            for _ in range(c397):
+                x398, p = decode_RegisteredLuggageType(v, n, p)
+                x396.append(x398)
+            if c397 < 16384:
+                break
+        r391['registeredLuggage'] = x396
+    if e392:
+        p = uper.skip_additions(v, n, p)
+    return r391, p
+
+
+def decode_RegionalValidityType(v, n, p):
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e400 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if e400:
+        _, p = uper.read_normally_small_number(v, n, p)
+        l401, p = uper.read_length(v, n, p)
+        p = uper.skip_bits(n, p, 8 * l401)
+        r399 = (None, None)
+    else:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i402 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i402 == 0:
+            x403, p = decode_TrainLinkType(v, n, p)
+            r399 = ('trainLink', x403)
+        elif i402 == 1:
+            x404, p = decode_ViaStationType(v, n, p)
+            r399 = ('viaStations', x404)
+        elif i402 == 2:
+            x405, p = decode_ZoneType(v, n, p)
+            r399 = ('zones', x405)
+        elif i402 == 3:
+            x406, p = decode_LineType(v, n, p)
+            r399 = ('lines', x406)
+        elif i402 == 4:
+            x407, p = decode_PolygoneType(v, n, p)
+            r399 = ('polygone', x407)
+        else:
+            raise DecodeError(f"Expected choice index {i402} to be in range.")
+    return r399, p
+
+
+def decode_ReturnRouteDescriptionType(v, n, p):
+    r408 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e409 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 8 > n:
+        raise OutOfDataError(p)
+    o410 = (v >> (n - p - 8)) & 0xff
+    p += 8
+    if o410 & 0x80:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x411 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x411 += 1
+        r408['fromStationNum'] = x411
+    if o410 & 0x40:
+        x412, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r408['fromStationIA5'] = x412
+    if o410 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x413 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x413 += 1
+        r408['toStationNum'] = x413
+    if o410 & 0x10:
+        x414, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r408['toStationIA5'] = x414
+    if o410 & 0x8:
+        x415, p = uper.read_utf8(v, n, p)
+        r408['fromStationNameUTF8'] = x415
+    if o410 & 0x4:
+        x416, p = uper.read_utf8(v, n, p)
+        r408['toStationNameUTF8'] = x416
+    if o410 & 0x2:
+        x417, p = uper.read_utf8(v, n, p)
+        r408['validReturnRegionDesc'] = x417
+    if o410 & 0x1:
+        x418 = []
+        while True:
+            c419, p = uper.read_length(v, n, p)
+            for _ in range(c419):
+                x420, p = decode_RegionalValidityType(v, n, p)
+                x418.append(x420)
+            if c419 < 16384:
+                break
+        r408['validReturnRegion'] = x418
+    if e409:
+        p = uper.skip_additions(v, n, p)
+    return r408, p
+
+
+def decode_IncludedOpenTicketType(v, n, p):
+    r421 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e422 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 25 > n:
+        raise OutOfDataError(p)
+    o423 = (v >> (n - p - 25)) & 0x1ffffff
+    p += 25
+    if o423 & 0x1000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x424 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x424 += 1
+        r421['productOwnerNum'] = x424
+    if o423 & 0x800000:
+        x425, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r421['productOwnerIA5'] = x425
+    if o423 & 0x400000:
+        if p + 16 > n:
+            raise OutOfDataError(p)
+        x426 = (v >> (n - p - 16)) & 0xffff
+        p += 16
+        r421['productIdNum'] = x426
+    if o423 & 0x200000:
+        x427, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r421['productIdIA5'] = x427
+    if o423 & 0x100000:
+        x428, p = uper.read_unconstrained(v, n, p)
+        r421['externalIssuerId'] = x428
+    if o423 & 0x80000:
+        x429, p = uper.read_unconstrained(v, n, p)
+        r421['issuerAutorizationId'] = x429
+    if o423 & 0x40000:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i431 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i431 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i431}.")
+        x430 = _C8[i431]
+        r421['stationCodeTable'] = x430
+    else:
+        r421['stationCodeTable'] = 'stationUIC'
+    if o423 & 0x20000:
+        x432 = []
+        while True:
+            c433, p = uper.read_length(v, n, p)
+            for _ in range(c433):
+                x434, p = decode_RegionalValidityType(v, n, p)
+                x432.append(x434)
+            if c433 < 16384:
+                break
+        r421['validRegion'] = x432
+    if o423 & 0x10000:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x435 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x435 += -1
+        r421['validFromDay'] = x435
+    else:
+        r421['validFromDay'] = 0
+    if o423 & 0x8000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x436 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r421['validFromTime'] = x436
+    if o423 & 0x4000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x437 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x437 += -60
+        r421['validFromUTCOffset'] = x437
+    if o423 & 0x2000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x438 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x438 += -1
+        r421['validUntilDay'] = x438
+    else:
+        r421['validUntilDay'] = 0
+    if o423 & 0x1000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x439 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r421['validUntilTime'] = x439
+    if o423 & 0x800:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x440 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x440 += -60
+        r421['validUntilUTCOffset'] = x440
+    if o423 & 0x400:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e442 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e442:
+            x441, p = uper.read_normally_small_number(v, n, p)
+            x441 = _C4.get(x441)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i443 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i443 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i443}.")
+            x441 = _C9[i443]
+        r421['classCode'] = x441
+    if o423 & 0x200:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        l445 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        l445 += 1
+        x444, p = uper.read_chars(v, n, p, l445, 7, None)
+        r421['serviceLevel'] = x444
+    if o423 & 0x100:
+        x446 = []
+        while True:
+            c447, p = uper.read_length(v, n, p)
+            for _ in range(c447):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x448 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x448 += 1
+                x446.append(x448)
+            if c447 < 16384:
+                break
+        r421['carrierNum'] = x446
+    if o423 & 0x80:
+        x449 = []
+        while True:
+            c450, p = uper.read_length(v, n, p)
+            for _ in range(c450):
+                x451, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x449.append(x451)
+            if c450 < 16384:
+                break
+        r421['carrierIA5'] = x449
+    if o423 & 0x40:
+        x452 = []
+        while True:
+            c453, p = uper.read_length(v, n, p)
+            for _ in range(c453):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x454 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x454 += 1
+                x452.append(x454)
+            if c453 < 16384:
+                break
+        r421['includedServiceBrands'] = x452
+    if o423 & 0x20:
+        x455 = []
+        while True:
+            c456, p = uper.read_length(v, n, p)
+            for _ in range(c456):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x457 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x457 += 1
+                x455.append(x457)
+            if c456 < 16384:
+                break
+        r421['excludedServiceBrands'] = x455
+    if o423 & 0x10:
+        x458 = []
+        while True:
+            c459, p = uper.read_length(v, n, p)
+            for _ in range(c459):
+                x460, p = decode_TariffType(v, n, p)
+                x458.append(x460)
+            if c459 < 16384:
+                break
+        r421['tariffs'] = x458
+    if o423 & 0x8:
+        x461, p = uper.read_utf8(v, n, p)
+        r421['infoText'] = x461
+    if o423 & 0x4:
+        x462 = []
+        while True:
+            c463, p = uper.read_length(v, n, p)
+            for _ in range(c463):
+                if p + 5 > n:
+                    raise OutOfDataError(p)
+                x464 = (v >> (n - p - 5)) & 0x1f
+                p += 5
+                x462.append(x464)
+            if c463 < 16384:
+                break
+        r421['includedTransportType'] = x462
+    if o423 & 0x2:
+        x465 = []
+        while True:
+            c466, p = uper.read_length(v, n, p)
+            for _ in range(c466):
+                if p + 5 > n:
+                    raise OutOfDataError(p)
+                x467 = (v >> (n - p - 5)) & 0x1f
+                p += 5
+                x465.append(x467)
+            if c466 < 16384:
+                break
+        r421['excludedTransportType'] = x465
+    if o423 & 0x1:
+        x468, p = decode_ExtensionData(v, n, p)
+        r421['extension'] = x468
+    if e422:
+        p = uper.skip_additions(v, n, p)
+    return r421, p
+
+
+def decode_ValidityPeriodDetailType(v, n, p):
+    r469 = {}
+    if p + 2 > n:
+        raise OutOfDataError(p)
+    o470 = (v >> (n - p - 2)) & 0x3
+    p += 2
+    if o470 & 0x2:
+        x471 = []
+        while True:
+            c472, p = uper.read_length(v, n, p)
+            for _ in range(c472):
+                x473, p = decode_ValidityPeriodType(v, n, p)
+                x471.append(x473)
+            if c472 < 16384:
+                break
+        r469['validityPeriod'] = x471
+    if o470 & 0x1:
+        x474 = []
+        while True:
+            c475, p = uper.read_length(v, n, p)
+            for _ in range(c475):
+                x476, p = decode_TimeRangeType(v, n, p)
+                x474.append(x476)
+            if c475 < 16384:
+                break
+        r469['excludedTimeRange'] = x474
+    return r469, p
+
+
+def decode_RouteSectionType(v, n, p):
+    r477 = {}
+    if p + 7 > n:
+        raise OutOfDataError(p)
+    o478 = (v >> (n - p - 7)) & 0x7f
+    p += 7
+    if o478 & 0x40:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i480 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i480 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i480}.")
+        x479 = _C8[i480]
+        r477['stationCodeTable'] = x479
+    else:
+        r477['stationCodeTable'] = 'stationUIC'
+    if o478 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x481 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x481 += 1
+        r477['fromStationNum'] = x481
+    if o478 & 0x10:
+        x482, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r477['fromStationIA5'] = x482
+    if o478 & 0x8:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x483 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x483 += 1
+        r477['toStationNum'] = x483
+    if o478 & 0x4:
+        x484, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r477['toStationIA5'] = x484
+    if o478 & 0x2:
+        x485, p = uper.read_utf8(v, n, p)
+        r477['fromStationNameUTF8'] = x485
+    if o478 & 0x1:
+        x486, p = uper.read_utf8(v, n, p)
+        r477['toStationNameUTF8'] = x486
+    return r477, p
+
+
+def decode_SeriesDetailType(v, n, p):
+    r487 = {}
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o488 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o488 & 0x4:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x489 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x489 += 1
+        r487['supplyingCarrier'] = x489
+    if o488 & 0x2:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x490 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x490 += 1
+        r487['offerIdentification'] = x490
+    if o488 & 0x1:
+        x491, p = uper.read_unconstrained(v, n, p)
+        r487['series'] = x491
+    return r487, p
+
+
+def decode_CardReferenceType(v, n, p):
+    r492 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e493 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    o494 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    if o494 & 0x200:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x495 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x495 += 1
+        r492['cardIssuerNum'] = x495
+    if o494 & 0x100:
+        x496, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r492['cardIssuerIA5'] = x496
+    if o494 & 0x80:
+        x497, p = uper.read_unconstrained(v, n, p)
+        r492['cardIdNum'] = x497
+    if o494 & 0x40:
+        x498, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r492['cardIdIA5'] = x498
+    if o494 & 0x20:
+        x499, p = uper.read_utf8(v, n, p)
+        r492['cardName'] = x499
+    if o494 & 0x10:
+        x500, p = uper.read_unconstrained(v, n, p)
+        r492['cardType'] = x500
+    if o494 & 0x8:
+        x501, p = uper.read_unconstrained(v, n, p)
+        r492['leadingCardIdNum'] = x501
+    if o494 & 0x4:
+        x502, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r492['leadingCardIdIA5'] = x502
+    if o494 & 0x2:
+        x503, p = uper.read_unconstrained(v, n, p)
+        r492['trailingCardIdNum'] = x503
+    if o494 & 0x1:
+        x504, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r492['trailingCardIdIA5'] = x504
+    if e493:
+        p = uper.skip_additions(v, n, p)
+    return r492, p
+
+
+def decode_RegisteredLuggageType(v, n, p):
+    r505 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e506 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o507 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o507 & 0x4:
+        x508, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r505['registrationId'] = x508
+    if o507 & 0x2:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x509 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x509 += 1
+        r505['maxWeight'] = x509
+    if o507 & 0x1:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x510 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x510 += 1
+        r505['maxSize'] = x510
+    if e506:
+        p = uper.skip_additions(v, n, p)
+    return r505, p
+
+
+def decode_TrainLinkType(v, n, p):
+    r511 = {}
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    o512 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    if o512 & 0x100:
+        x513, p = uper.read_unconstrained(v, n, p)
+        r511['trainNum'] = x513
+    if o512 & 0x80:
+        x514, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r511['trainIA5'] = x514
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    x515 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    x515 += -1
+    r511['travelDate'] = x515
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x516 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r511['departureTime'] = x516
+    if o512 & 0x40:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x517 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x517 += -60
+        r511['departureUTCOffset'] = x517
+    if o512 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x518 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x518 += 1
+        r511['fromStationNum'] = x518
+    if o512 & 0x10:
+        x519, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r511['fromStationIA5'] = x519
+    if o512 & 0x8:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x520 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x520 += 1
+        r511['toStationNum'] = x520
+    if o512 & 0x4:
+        x521, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r511['toStationIA5'] = x521
+    if o512 & 0x2:
+        x522, p = uper.read_utf8(v, n, p)
+        r511['fromStationNameUTF8'] = x522
+    if o512 & 0x1:
+        x523, p = uper.read_utf8(v, n, p)
+        r511['toStationNameUTF8'] = x523
+    return r511, p
+
+
+def decode_ViaStationType(v, n, p):
+    r524 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e525 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    o526 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    if o526 & 0x100:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i528 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i528 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i528}.")
+        x527 = _C8[i528]
+        r524['stationCodeTable'] = x527
+    else:
+        r524['stationCodeTable'] = 'stationUIC'
+    if o526 & 0x80:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x529 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x529 += 1
+        r524['stationNum'] = x529
+    if o526 & 0x40:
+        x530, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r524['stationIA5'] = x530
+    if o526 & 0x20:
+        x531 = []
+        while True:
+            c532, p = uper.read_length(v, n, p)
+            for _ in range(c532):
+                x533, p = decode_ViaStationType(v, n, p)
+                x531.append(x533)
+            if c532 < 16384:
+                break
+        r524['alternativeRoutes'] = x531
+    if o526 & 0x10:
+        x534 = []
+        while True:
+            c535, p = uper.read_length(v, n, p)
+            for _ in range(c535):
+                x536, p = decode_ViaStationType(v, n, p)
+                x534.append(x536)
+            if c535 < 16384:
+                break
+        r524['route'] = x534
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x537 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x537 = bool(x537)
+    r524['border'] = x537
+    if o526 & 0x8:
+        x538 = []
+        while True:
+            c539, p = uper.read_length(v, n, p)
+            for _ in range(c539):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x540 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x540 += 1
+                x538.append(x540)
+            if c539 < 16384:
+                break
+        r524['carrierNum'] = x538
+    if o526 & 0x4:
+        x541 = []
+        while True:
+            c542, p = uper.read_length(v, n, p)
+            for _ in range(c542):
+                x543, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x541.append(x543)
+            if c542 < 16384:
+                break
+        r524['carrierIA5'] = x541
+    if o526 & 0x2:
+        x544, p = uper.read_unconstrained(v, n, p)
+        r524['seriesId'] = x544
+    if o526 & 0x1:
+        x545, p = uper.read_unconstrained(v, n, p)
+        r524['routeId'] = x545
+    if e525:
+        p = uper.skip_additions(v, n, p)
+    return r524, p
+
+
+def decode_ZoneType(v, n, p):
+    r546 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e547 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    o548 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    if o548 & 0x400:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x549 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x549 += 1
+        r546['carrierNum'] = x549
+    if o548 & 0x200:
+        x550, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r546['carrierIA5'] = x550
+    if o548 & 0x100:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i552 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i552 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i552}.")
+        x551 = _C8[i552]
+        r546['stationCodeTable'] = x551
+    else:
+        r546['stationCodeTable'] = 'stationUIC'
+    if o548 & 0x80:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x553 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x553 += 1
+        r546['entryStationNum'] = x553
+    if o548 & 0x40:
+        x554, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r546['entryStationIA5'] = x554
+    if o548 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x555 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x555 += 1
+        r546['terminatingStationNum'] = x555
+    if o548 & 0x10:
+        x556, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r546['terminatingStationIA5'] = x556
+    if o548 & 0x8:
+        x557, p = uper.read_unconstrained(v, n, p)
+        r546['city'] = x557
+    if o548 & 0x4:
+        x558 = []
+        while True:
+            c559, p = uper.read_length(v, n, p)
+            for _ in range(c559):
+                x560, p = uper.read_unconstrained(v, n, p)
+                x558.append(x560)
+            if c559 < 16384:
+                break
+        r546['zoneId'] = x558
+    if o548 & 0x2:
+        x561, p = uper.read_octets_unbound(v, n, p)
+        r546['binaryZoneId'] = x561
+    if o548 & 0x1:
+        x562, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r546['nutsCode'] = x562
+    if e547:
+        p = uper.skip_additions(v, n, p)
+    return r546, p
+
+
+def decode_LineType(v, n, p):
+    r563 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e564 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    o565 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    if o565 & 0x100:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x566 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x566 += 1
+        r563['carrierNum'] = x566
+    if o565 & 0x80:
+        x567, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r563['carrierIA5'] = x567
+    if o565 & 0x40:
+        x568 = []
+        while True:
+            c569, p = uper.read_length(v, n, p)
+            for _ in range(c569):
+                x570, p = uper.read_unconstrained(v, n, p)
+                x568.append(x570)
+            if c569 < 16384:
+                break
+        r563['lineId'] = x568
+    if o565 & 0x20:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i572 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i572 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i572}.")
+        x571 = _C8[i572]
+        r563['stationCodeTable'] = x571
+    else:
+        r563['stationCodeTable'] = 'stationUIC'
+    if o565 & 0x10:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x573 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x573 += 1
+        r563['entryStationNum'] = x573
+    if o565 & 0x8:
+        x574, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r563['entryStationIA5'] = x574
+    if o565 & 0x4:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x575 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x575 += 1
+        r563['terminatingStationNum'] = x575
+    if o565 & 0x2:
+        x576, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r563['terminatingStationIA5'] = x576
+    if o565 & 0x1:
+        x577, p = uper.read_unconstrained(v, n, p)
+        r563['city'] = x577
+    if e564:
+        p = uper.skip_additions(v, n, p)
+    return r563, p
+
+
+def decode_PolygoneType(v, n, p):
+    r578 = {}
+    x579, p = decode_GeoCoordinateType(v, n, p)
+    r578['firstEdge'] = x579
+    x580 = []
+    while True:
+        c581, p = uper.read_length(v, n, p)
+        for _ in range(c581):
+            x582, p = decode_DeltaCoordinates(v, n, p)
+            x580.append(x582)
+        if c581 < 16384:
+            break
+    r578['edges'] = x580
+    return r578, p
+
+
+def decode_ValidityPeriodType(v, n, p):
+    r583 = {}
+    if p + 6 > n:
+        raise OutOfDataError(p)
+    o584 = (v >> (n - p - 6)) & 0x3f
+    p += 6
+    if o584 & 0x20:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x585 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x585 += -1
+        r583['validFromDay'] = x585
+    else:
+        r583['validFromDay'] = 0
+    if o584 & 0x10:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x586 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r583['validFromTime'] = x586
+    if o584 & 0x8:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x587 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x587 += -60
+        r583['validFromUTCOffset'] = x587
+    if o584 & 0x4:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x588 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x588 += -1
+        r583['validUntilDay'] = x588
+    else:
+        r583['validUntilDay'] = 0
+    if o584 & 0x2:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x589 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r583['validUntilTime'] = x589
+    if o584 & 0x1:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x590 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x590 += -60
+        r583['validUntilUTCOffset'] = x590
+    return r583, p
+
+
+def decode_TimeRangeType(v, n, p):
+    r591 = {}
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x592 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r591['fromTime'] = x592
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x593 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r591['untilTime'] = x593
+    return r591, p
+
+
+def decode_DeltaCoordinates(v, n, p):
+    r594 = {}
+    x595, p = uper.read_unconstrained(v, n, p)
+    r594['longitude'] = x595
+    x596, p = uper.read_unconstrained(v, n, p)
+    r594['latitude'] = x596
+    return r594, p
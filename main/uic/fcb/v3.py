@@ -0,0 +1,2901 @@
+# Generated by "manage.py generate-uic-decoders" from uicRailTicketData_v3.0.3.asn, do not edit.
+from .. import uper
+from ..uper import OutOfDataError, DecodeError
+
+VERSION = 3
+SPEC_SHA256 = 'a0d71c9ebaf2779cc2b79226aa79982a606370e5f8ea946605dc4c0ac0e55989'
+FALLBACK_PATHS = [('UicRailTicketData', 'controlDetail'), ('UicRailTicketData', 'extension', '[]'), ('DocumentData', 'token'), ('DocumentData', 'ticket', 'carCarriageReservation'), ('DocumentData', 'ticket', 'voucher'), ('DocumentData', 'ticket', 'counterMark'), ('DocumentData', 'ticket', 'parkingGround'), ('DocumentData', 'ticket', 'fipTicket'), ('DocumentData', 'ticket', 'stationPassage'), ('DocumentData', 'ticket', 'extension'), ('DocumentData', 'ticket', 'delayConfirmation')]
+FALLBACK_TYPES = {}
+
+
+def fallback(index, v, n, p):
+    type_ = FALLBACK_TYPES.get(index)
+    if type_ is None:
+        from .. import flex
+        type_ = uper.resolve(flex.get_spec(VERSION), FALLBACK_PATHS[index])
+        FALLBACK_TYPES[index] = type_
+    return uper.fallback(type_, v, n, p)
+
+
+def decode(data):
+    v, n = uper.load(data)
+    return decode_UicRailTicketData(v, n, 0)[0]
+
+
+def decode_summary(data):
+    v, n = uper.load(data)
+    return decode_UicRailTicketData(v, n, 0, True)[0]
+
+
+_C0 = ('microDegree', 'tenthmilliDegree', 'milliDegree', 'centiDegree', 'deciDegree')
+_C1 = ('wgs84', 'grs80')
+_C2 = ('north', 'south')
+_C3 = ('east', 'west')
+_C4 = {}
+_C5 = ('unspecified', 'female', 'male', 'other')
+_C6 = ('adult', 'senior', 'child', 'youth', 'dog', 'bicycle', 'freeAddonPassenger', 'freeAddonChild')
+_C7 = ('seat', 'couchette', 'berth', 'carcarriage')
+_C8 = ('stationUIC', 'stationUICReservation', 'stationERA', 'localCarrierStationCodeTable', 'proprietaryIssuerStationCodeTable')
+_C9 = ('notApplicable', 'first', 'second', 'tourist', 'comfort', 'premium', 'business', 'all', 'premiumFirst', 'standardFirst', 'premiumSecond', 'standardSecond')
+_C10 = ('noPrice', 'reservationFee', 'supplement', 'travelPrice')
+_C11 = ('unspecified', 'upperLevel', 'lowerLevel')
+_C12 = ('single', 'special', 'double', 't2', 't3', 't4')
+_C13 = ('unspecified', 'family', 'female', 'male', 'mixed')
+_C14 = ('boarding', 'arrival')
+
+
+def decode_UicRailTicketData(v, n, p, summary=False):
+    r1 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e2 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 4 > n:
+        raise OutOfDataError(p)
+    o3 = (v >> (n - p - 4)) & 0xf
+    p += 4
+    x4, p = decode_IssuingData(v, n, p)
+    r1['issuingDetail'] = x4
+    if o3 & 0x8:
+        x5, p = decode_TravelerData(v, n, p)
+        r1['travelerDetail'] = x5
+    if o3 & 0x4:
+        x6 = []
+        while True:
+            c7, p = uper.read_length(v, n, p)
+            for _ in range(c7):
+                x8, p = decode_DocumentData(v, n, p)
+                x6.append(x8)
+                if summary:
+                    break
+            if summary or c7 < 16384:
+                break
+        r1['transportDocument'] = x6
+    if summary:
+        return r1, p
+    if o3 & 0x2:
+        x9, p = fallback(0, v, n, p)
+        r1['controlDetail'] = x9
+    if o3 & 0x1:
+        x10 = []
+        while True:
+            c11, p = uper.read_length(v, n, p)
+            for _ in range(c11):
+                x12, p = fallback(1, v, n, p)
+                x10.append(x12)
+            if c11 < 16384:
+                break
+        r1['extension'] = x10
+    if e2:
+        p = uper.skip_additions(v, n, p)
+    return r1, p
+
+
+def decode_DocumentData(v, n, p):
+    r13 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e14 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    o15 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if o15 & 0x1:
+        x16, p = fallback(2, v, n, p)
+        r13['token'] = x16
+    x17, p = decode_DocumentData_ticket_18(v, n, p)
+    r13['ticket'] = x17
+    if e14:
+        p = uper.skip_additions(v, n, p)
+    return r13, p
+
+
+def decode_IssuingData(v, n, p):
+    r19 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e20 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 13 > n:
+        raise OutOfDataError(p)
+    o21 = (v >> (n - p - 13)) & 0x1fff
+    p += 13
+    if o21 & 0x1000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x22 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x22 += 1
+        r19['securityProviderNum'] = x22
+    if o21 & 0x800:
+        x23, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['securityProviderIA5'] = x23
+    if o21 & 0x400:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x24 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x24 += 1
+        r19['issuerNum'] = x24
+    if o21 & 0x200:
+        x25, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['issuerIA5'] = x25
+    if p + 8 > n:
+        raise OutOfDataError(p)
+    x26 = (v >> (n - p - 8)) & 0xff
+    p += 8
+    x26 += 2016
+    r19['issuingYear'] = x26
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    x27 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    x27 += 1
+    r19['issuingDay'] = x27
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x28 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r19['issuingTime'] = x28
+    if o21 & 0x100:
+        x29, p = uper.read_utf8(v, n, p)
+        r19['issuerName'] = x29
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x30 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x30 = bool(x30)
+    r19['specimen'] = x30
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x31 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x31 = bool(x31)
+    r19['securePaperTicket'] = x31
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x32 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x32 = bool(x32)
+    r19['activated'] = x32
+    if o21 & 0x80:
+        l34 = 3
+        x33, p = uper.read_chars(v, n, p, l34, 7, None)
+        r19['currency'] = x33
+    else:
+        r19['currency'] = 'EUR'
+    if o21 & 0x40:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        x35 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        x35 += 1
+        r19['currencyFract'] = x35
+    else:
+        r19['currencyFract'] = 2
+    if o21 & 0x20:
+        x36, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['issuerPNR'] = x36
+    if o21 & 0x10:
+        x37, p = decode_ExtensionData(v, n, p)
+        r19['extension'] = x37
+    if o21 & 0x8:
+        x38, p = uper.read_unconstrained(v, n, p)
+        r19['issuedOnTrainNum'] = x38
+    if o21 & 0x4:
+        x39, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r19['issuedOnTrainIA5'] = x39
+    if o21 & 0x2:
+        x40, p = uper.read_unconstrained(v, n, p)
+        r19['issuedOnLine'] = x40
+    if o21 & 0x1:
+        x41, p = decode_GeoCoordinateType(v, n, p)
+        r19['pointOfSale'] = x41
+    if e20:
+        p = uper.skip_additions(v, n, p)
+    return r19, p
+
+
+def decode_TravelerData(v, n, p):
+    r42 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e43 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o44 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o44 & 0x4:
+        x45 = []
+        while True:
+            c46, p = uper.read_length(v, n, p)
+            for _ in range(c46):
+                x47, p = decode_TravelerType(v, n, p)
+                x45.append(x47)
+            if c46 < 16384:
+                break
+        r42['traveler'] = x45
+    if o44 & 0x2:
+        l49 = 2
+        x48, p = uper.read_chars(v, n, p, l49, 7, None)
+        r42['preferredLanguage'] = x48
+    if o44 & 0x1:
+        x50, p = uper.read_utf8(v, n, p)
+        r42['groupName'] = x50
+    if e43:
+        p = uper.skip_additions(v, n, p)
+    return r42, p
+
+
+def decode_DocumentData_ticket_18(v, n, p):
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e52 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if e52:
+        _, p = uper.read_normally_small_number(v, n, p)
+        l53, p = uper.read_length(v, n, p)
+        p = uper.skip_bits(n, p, 8 * l53)
+        r51 = (None, None)
+    else:
+        if p + 4 > n:
+            raise OutOfDataError(p)
+        i54 = (v >> (n - p - 4)) & 0xf
+        p += 4
+        if i54 == 0:
+            x55, p = decode_ReservationData(v, n, p)
+            r51 = ('reservation', x55)
+        elif i54 == 1:
+            x56, p = fallback(3, v, n, p)
+            r51 = ('carCarriageReservation', x56)
+        elif i54 == 2:
+            x57, p = decode_OpenTicketData(v, n, p)
+            r51 = ('openTicket', x57)
+        elif i54 == 3:
+            x58, p = decode_PassData(v, n, p)
+            r51 = ('pass', x58)
+        elif i54 == 4:
+            x59, p = fallback(4, v, n, p)
+            r51 = ('voucher', x59)
+        elif i54 == 5:
+            x60, p = decode_CustomerCardData(v, n, p)
+            r51 = ('customerCard', x60)
+        elif i54 == 6:
+            x61, p = fallback(5, v, n, p)
+            r51 = ('counterMark', x61)
+        elif i54 == 7:
+            x62, p = fallback(6, v, n, p)
+            r51 = ('parkingGround', x62)
+        elif i54 == 8:
+            x63, p = fallback(7, v, n, p)
+            r51 = ('fipTicket', x63)
+        elif i54 == 9:
+            x64, p = fallback(8, v, n, p)
+            r51 = ('stationPassage', x64)
+        elif i54 == 10:
+            x65, p = fallback(9, v, n, p)
+            r51 = ('extension', x65)
+        elif i54 == 11:
+            x66, p = fallback(10, v, n, p)
+            r51 = ('delayConfirmation', x66)
+        else:
+            raise DecodeError(f"Expected choice index {i54} to be in range.")
+    return r51, p
+
+
+def decode_ExtensionData(v, n, p):
+    r67 = {}
+    x68, p = uper.read_chars_unbound(v, n, p, 7, None)
+    r67['extensionId'] = x68
+    x69, p = uper.read_octets_unbound(v, n, p)
+    r67['extensionData'] = x69
+    return r67, p
+
+
+def decode_GeoCoordinateType(v, n, p):
+    r70 = {}
+    if p + 5 > n:
+        raise OutOfDataError(p)
+    o71 = (v >> (n - p - 5)) & 0x1f
+    p += 5
+    if o71 & 0x10:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i73 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i73 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i73}.")
+        x72 = _C0[i73]
+        r70['geoUnit'] = x72
+    else:
+        r70['geoUnit'] = 'milliDegree'
+    if o71 & 0x8:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        i75 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if i75 >= 2:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i75}.")
+        x74 = _C1[i75]
+        r70['coordinateSystem'] = x74
+    else:
+        r70['coordinateSystem'] = 'wgs84'
+    if o71 & 0x4:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        i77 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if i77 >= 2:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i77}.")
+        x76 = _C2[i77]
+        r70['hemisphereLongitude'] = x76
+    else:
+        r70['hemisphereLongitude'] = 'north'
+    if o71 & 0x2:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        i79 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if i79 >= 2:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i79}.")
+        x78 = _C3[i79]
+        r70['hemisphereLatitude'] = x78
+    else:
+        r70['hemisphereLatitude'] = 'east'
+    x80, p = uper.read_unconstrained(v, n, p)
+    r70['longitude'] = x80
+    x81, p = uper.read_unconstrained(v, n, p)
+    r70['latitude'] = x81
+    if o71 & 0x1:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i83 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i83 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i83}.")
+        x82 = _C0[i83]
+        r70['accuracy'] = x82
+    return r70, p
+
+
+def decode_TravelerType(v, n, p):
+    r84 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e85 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 18 > n:
+        raise OutOfDataError(p)
+    o86 = (v >> (n - p - 18)) & 0x3ffff
+    p += 18
+    if o86 & 0x20000:
+        x87, p = uper.read_utf8(v, n, p)
+        r84['firstName'] = x87
+    if o86 & 0x10000:
+        x88, p = uper.read_utf8(v, n, p)
+        r84['secondName'] = x88
+    if o86 & 0x8000:
+        x89, p = uper.read_utf8(v, n, p)
+        r84['lastName'] = x89
+    if o86 & 0x4000:
+        x90, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r84['idCard'] = x90
+    if o86 & 0x2000:
+        x91, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r84['passportId'] = x91
+    if o86 & 0x1000:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        l93 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        l93 += 1
+        x92, p = uper.read_chars(v, n, p, l93, 7, None)
+        r84['title'] = x92
+    if o86 & 0x800:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e95 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e95:
+            x94, p = uper.read_normally_small_number(v, n, p)
+            x94 = _C4.get(x94)
+        else:
+            if p + 2 > n:
+                raise OutOfDataError(p)
+            i96 = (v >> (n - p - 2)) & 0x3
+            p += 2
+            if i96 >= 4:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i96}.")
+            x94 = _C5[i96]
+        r84['gender'] = x94
+    if o86 & 0x400:
+        x97, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r84['customerIdIA5'] = x97
+    if o86 & 0x200:
+        x98, p = uper.read_unconstrained(v, n, p)
+        r84['customerIdNum'] = x98
+    if o86 & 0x100:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x99 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x99 += 1901
+        r84['yearOfBirth'] = x99
+    if o86 & 0x80:
+        if p + 4 > n:
+            raise OutOfDataError(p)
+        x100 = (v >> (n - p - 4)) & 0xf
+        p += 4
+        x100 += 1
+        r84['monthOfBirth'] = x100
+    if o86 & 0x40:
+        if p + 5 > n:
+            raise OutOfDataError(p)
+        x101 = (v >> (n - p - 5)) & 0x1f
+        p += 5
+        x101 += 1
+        r84['dayOfBirthInMonth'] = x101
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x102 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x102 = bool(x102)
+    r84['ticketHolder'] = x102
+    if o86 & 0x20:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e104 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e104:
+            x103, p = uper.read_normally_small_number(v, n, p)
+            x103 = _C4.get(x103)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i105 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i105 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i105}.")
+            x103 = _C6[i105]
+        r84['passengerType'] = x103
+    if o86 & 0x10:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        x106 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        x106 = bool(x106)
+        r84['passengerWithReducedMobility'] = x106
+    if o86 & 0x8:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x107 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x107 += 1
+        r84['countryOfResidence'] = x107
+    if o86 & 0x4:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x108 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x108 += 1
+        r84['countryOfPassport'] = x108
+    if o86 & 0x2:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x109 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x109 += 1
+        r84['countryOfIdCard'] = x109
+    if o86 & 0x1:
+        x110 = []
+        while True:
+            c111, p = uper.read_length(v, n, p)
+            for _ in range(c111):
+                x112, p = decode_CustomerStatusType(v, n, p)
+                x110.append(x112)
+            if c111 < 16384:
+                break
+        r84['status'] = x110
+    if e85:
+        p = uper.skip_additions(v, n, p)
+    return r84, p
+
+
+def decode_ReservationData(v, n, p):
+    r113 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e114 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 43 > n:
+        raise OutOfDataError(p)
+    o115 = (v >> (n - p - 43)) & 0x7ffffffffff
+    p += 43
+    if o115 & 0x40000000000:
+        x116, p = uper.read_unconstrained(v, n, p)
+        r113['trainNum'] = x116
+    if o115 & 0x20000000000:
+        x117, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['trainIA5'] = x117
+    if o115 & 0x10000000000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x118 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x118 += -1
+        r113['departureDate'] = x118
+    else:
+        r113['departureDate'] = 0
+    if o115 & 0x8000000000:
+        x119, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['referenceIA5'] = x119
+    if o115 & 0x4000000000:
+        x120, p = uper.read_unconstrained(v, n, p)
+        r113['referenceNum'] = x120
+    if o115 & 0x2000000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x121 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x121 += 1
+        r113['productOwnerNum'] = x121
+    if o115 & 0x1000000000:
+        x122, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['productOwnerIA5'] = x122
+    if o115 & 0x800000000:
+        if p + 16 > n:
+            raise OutOfDataError(p)
+        x123 = (v >> (n - p - 16)) & 0xffff
+        p += 16
+        r113['productIdNum'] = x123
+    if o115 & 0x400000000:
+        x124, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['productIdIA5'] = x124
+    if o115 & 0x200000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x125 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        r113['serviceBrand'] = x125
+    if o115 & 0x100000000:
+        x126, p = uper.read_utf8(v, n, p)
+        r113['serviceBrandAbrUTF8'] = x126
+    if o115 & 0x80000000:
+        x127, p = uper.read_utf8(v, n, p)
+        r113['serviceBrandNameUTF8'] = x127
+    if o115 & 0x40000000:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        i129 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        if i129 >= 4:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i129}.")
+        x128 = _C7[i129]
+        r113['service'] = x128
+    else:
+        r113['service'] = 'seat'
+    if o115 & 0x20000000:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i131 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i131 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i131}.")
+        x130 = _C8[i131]
+        r113['stationCodeTable'] = x130
+    else:
+        r113['stationCodeTable'] = 'stationUICReservation'
+    if o115 & 0x10000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x132 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x132 += 1
+        r113['fromStationNum'] = x132
+    if o115 & 0x8000000:
+        x133, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['fromStationIA5'] = x133
+    if o115 & 0x4000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x134 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x134 += 1
+        r113['toStationNum'] = x134
+    if o115 & 0x2000000:
+        x135, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r113['toStationIA5'] = x135
+    if o115 & 0x1000000:
+        x136, p = uper.read_utf8(v, n, p)
+        r113['fromStationNameUTF8'] = x136
+    if o115 & 0x800000:
+        x137, p = uper.read_utf8(v, n, p)
+        r113['toStationNameUTF8'] = x137
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x138 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r113['departureTime'] = x138
+    if o115 & 0x400000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x139 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x139 += -60
+        r113['departureUTCOffset'] = x139
+    if o115 & 0x200000:
+        if p + 5 > n:
+            raise OutOfDataError(p)
+        x140 = (v >> (n - p - 5)) & 0x1f
+        p += 5
+        x140 += -1
+        r113['arrivalDate'] = x140
+    else:
+        r113['arrivalDate'] = 0
+    if o115 & 0x100000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x141 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r113['arrivalTime'] = x141
+    if o115 & 0x80000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x142 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x142 += -60
+        r113['arrivalUTCOffset'] = x142
+    if o115 & 0x40000:
+        x143 = []
+        while True:
+            c144, p = uper.read_length(v, n, p)
+            for _ in range(c144):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x145 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x145 += 1
+                x143.append(x145)
+            if c144 < 16384:
+                break
+        r113['carrierNum'] = x143
+    if o115 & 0x20000:
+        x146 = []
+        while True:
+            c147, p = uper.read_length(v, n, p)
+            for _ in range(c147):
+                x148, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x146.append(x148)
+            if c147 < 16384:
+                break
+        r113['carrierIA5'] = x146
+    if o115 & 0x10000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e150 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e150:
+            x149, p = uper.read_normally_small_number(v, n, p)
+            x149 = _C4.get(x149)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i151 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i151 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i151}.")
+            x149 = _C9[i151]
+        r113['classCode'] = x149
+    else:
+        r113['classCode'] = 'second'
+    if o115 & 0x8000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        l153 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        l153 += 1
+        x152, p = uper.read_chars(v, n, p, l153, 7, None)
+        r113['serviceLevel'] = x152
+    if o115 & 0x4000:
+        x154, p = decode_PlacesType(v, n, p)
+        r113['places'] = x154
+    if o115 & 0x2000:
+        x155, p = decode_PlacesType(v, n, p)
+        r113['additionalPlaces'] = x155
+    if o115 & 0x1000:
+        x156, p = decode_PlacesType(v, n, p)
+        r113['bicyclePlaces'] = x156
+    if o115 & 0x800:
+        x157, p = decode_CompartmentDetailsType(v, n, p)
+        r113['compartmentDetails'] = x157
+    if o115 & 0x400:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x158 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        r113['numberOfOverbooked'] = x158
+    else:
+        r113['numberOfOverbooked'] = 0
+    if o115 & 0x200:
+        x159 = []
+        while True:
+            c160, p = uper.read_length(v, n, p)
+            for _ in range(c160):
+                x161, p = decode_BerthDetailData(v, n, p)
+                x159.append(x161)
+            if c160 < 16384:
+                break
+        r113['berth'] = x159
+    if o115 & 0x100:
+        x162 = []
+        while True:
+            c163, p = uper.read_length(v, n, p)
+            for _ in range(c163):
+                x164, p = decode_TariffType(v, n, p)
+                x162.append(x164)
+            if c163 < 16384:
+                break
+        r113['tariff'] = x162
+    if o115 & 0x80:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        i166 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        if i166 >= 4:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i166}.")
+        x165 = _C10[i166]
+        r113['priceType'] = x165
+    else:
+        r113['priceType'] = 'travelPrice'
+    if o115 & 0x40:
+        x167, p = uper.read_unconstrained(v, n, p)
+        r113['price'] = x167
+    if o115 & 0x20:
+        x168 = []
+        while True:
+            c169, p = uper.read_length(v, n, p)
+            for _ in range(c169):
+                x170, p = decode_VatDetailType(v, n, p)
+                x168.append(x170)
+            if c169 < 16384:
+                break
+        r113['vatDetail'] = x168
+    if o115 & 0x10:
+        if p + 4 > n:
+            raise OutOfDataError(p)
+        x171 = (v >> (n - p - 4)) & 0xf
+        p += 4
+        r113['typeOfSupplement'] = x171
+    else:
+        r113['typeOfSupplement'] = 0
+    if o115 & 0x8:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x172 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        r113['numberOfSupplements'] = x172
+    else:
+        r113['numberOfSupplements'] = 0
+    if o115 & 0x4:
+        x173, p = decode_LuggageRestrictionType(v, n, p)
+        r113['luggage'] = x173
+    if o115 & 0x2:
+        x174, p = uper.read_utf8(v, n, p)
+        r113['infoText'] = x174
+    if o115 & 0x1:
+        x175, p = decode_ExtensionData(v, n, p)
+        r113['extension'] = x175
+    if e114:
+        p = uper.skip_additions(v, n, p)
+    return r113, p
+
+
+def decode_OpenTicketData(v, n, p):
+    r176 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e177 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 40 > n:
+        raise OutOfDataError(p)
+    o178 = (v >> (n - p - 40)) & 0xffffffffff
+    p += 40
+    if o178 & 0x8000000000:
+        x179, p = uper.read_unconstrained(v, n, p)
+        r176['referenceNum'] = x179
+    if o178 & 0x4000000000:
+        x180, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['referenceIA5'] = x180
+    if o178 & 0x2000000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x181 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x181 += 1
+        r176['productOwnerNum'] = x181
+    if o178 & 0x1000000000:
+        x182, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['productOwnerIA5'] = x182
+    if o178 & 0x800000000:
+        if p + 16 > n:
+            raise OutOfDataError(p)
+        x183 = (v >> (n - p - 16)) & 0xffff
+        p += 16
+        r176['productIdNum'] = x183
+    if o178 & 0x400000000:
+        x184, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['productIdIA5'] = x184
+    if o178 & 0x200000000:
+        x185, p = uper.read_unconstrained(v, n, p)
+        r176['extIssuerId'] = x185
+    if o178 & 0x100000000:
+        x186, p = uper.read_unconstrained(v, n, p)
+        r176['issuerAutorizationId'] = x186
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x187 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x187 = bool(x187)
+    r176['returnIncluded'] = x187
+    if o178 & 0x80000000:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i189 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i189 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i189}.")
+        x188 = _C8[i189]
+        r176['stationCodeTable'] = x188
+    else:
+        r176['stationCodeTable'] = 'stationUIC'
+    if o178 & 0x40000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x190 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x190 += 1
+        r176['fromStationNum'] = x190
+    if o178 & 0x20000000:
+        x191, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['fromStationIA5'] = x191
+    if o178 & 0x10000000:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x192 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x192 += 1
+        r176['toStationNum'] = x192
+    if o178 & 0x8000000:
+        x193, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r176['toStationIA5'] = x193
+    if o178 & 0x4000000:
+        x194, p = uper.read_utf8(v, n, p)
+        r176['fromStationNameUTF8'] = x194
+    if o178 & 0x2000000:
+        x195, p = uper.read_utf8(v, n, p)
+        r176['toStationNameUTF8'] = x195
+    if o178 & 0x1000000:
+        x196, p = uper.read_utf8(v, n, p)
+        r176['validRegionDesc'] = x196
+    if o178 & 0x800000:
+        x197 = []
+        while True:
+            c198, p = uper.read_length(v, n, p)
+            for _ in range(c198):
+                x199, p = decode_RegionalValidityType(v, n, p)
+                x197.append(x199)
+            if c198 < 16384:
+                break
+        r176['validRegion'] = x197
+    if o178 & 0x400000:
+        x200, p = decode_ReturnRouteDescriptionType(v, n, p)
+        r176['returnDescription'] = x200
+    if o178 & 0x200000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x201 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        x201 += -367
+        r176['validFromDay'] = x201
+    else:
+        r176['validFromDay'] = 0
+    if o178 & 0x100000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x202 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r176['validFromTime'] = x202
+    if o178 & 0x80000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x203 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x203 += -60
+        r176['validFromUTCOffset'] = x203
+    if o178 & 0x40000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x204 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x204 += -1
+        r176['validUntilDay'] = x204
+    else:
+        r176['validUntilDay'] = 0
+    if o178 & 0x20000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x205 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r176['validUntilTime'] = x205
+    if o178 & 0x10000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x206 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x206 += -60
+        r176['validUntilUTCOffset'] = x206
+    if o178 & 0x8000:
+        x207 = []
+        while True:
+            c208, p = uper.read_length(v, n, p)
+            for _ in range(c208):
+                if p + 9 > n:
+                    raise OutOfDataError(p)
+                x209 = (v >> (n - p - 9)) & 0x1ff
+                p += 9
+                x207.append(x209)
+            if c208 < 16384:
+                break
+        r176['activatedDay'] = x207
+    if o178 & 0x4000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e211 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e211:
+            x210, p = uper.read_normally_small_number(v, n, p)
+            x210 = _C4.get(x210)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i212 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i212 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i212}.")
+            x210 = _C9[i212]
+        r176['classCode'] = x210
+    else:
+        r176['classCode'] = 'second'
+    if o178 & 0x2000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        l214 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        l214 += 1
+        x213, p = uper.read_chars(v, n, p, l214, 7, None)
+        r176['serviceLevel'] = x213
+    if o178 & 0x1000:
+        x215 = []
+        while True:
+            c216, p = uper.read_length(v, n, p)
+            for _ in range(c216):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x217 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x217 += 1
+                x215.append(x217)
+            if c216 < 16384:
+                break
+        r176['carrierNum'] = x215
+    if o178 & 0x800:
+        x218 = []
+        while True:
+            c219, p = uper.read_length(v, n, p)
+            for _ in range(c219):
+                x220, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x218.append(x220)
+            if c219 < 16384:
+                break
+        r176['carrierIA5'] = x218
+    if o178 & 0x400:
+        x221 = []
+        while True:
+            c222, p = uper.read_length(v, n, p)
+            for _ in range(c222):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x223 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x223 += 1
+                x221.append(x223)
+            if c222 < 16384:
+                break
+        r176['includedServiceBrands'] = x221
+    if o178 & 0x200:
+        x224 = []
+        while True:
+            c225, p = uper.read_length(v, n, p)
+            for _ in range(c225):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x226 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x226 += 1
+                x224.append(x226)
+            if c225 < 16384:
+                break
+        r176['excludedServiceBrands'] = x224
+    if o178 & 0x100:
+        x227 = []
+        while True:
+            c228, p = uper.read_length(v, n, p)
+            for _ in range(c228):
+                x229, p = decode_TariffType(v, n, p)
+                x227.append(x229)
+            if c228 < 16384:
+                break
+        r176['tariffs'] = x227
+    if o178 & 0x80:
+        x230, p = uper.read_unconstrained(v, n, p)
+        r176['price'] = x230
+    if o178 & 0x40:
+        x231 = []
+        while True:
+            c232, p = uper.read_length(v, n, p)
+            for _ in range(c232):
+                x233, p = decode_VatDetailType(v, n, p)
+                x231.append(x233)
+            if c232 < 16384:
+                break
+        r176['vatDetail'] = x231
+    if o178 & 0x20:
+        x234, p = uper.read_utf8(v, n, p)
+        r176['infoText'] = x234
+    if o178 & 0x10:
+        x235 = []
+        while True:
+            c236, p = uper.read_length(v, n, p)
+            for _ in range(c236):
+                x237, p = decode_IncludedOpenTicketType(v, n, p)
+                x235.append(x237)
+            if c236 < 16384:
+                break
+        r176['includedAddOns'] = x235
+    if o178 & 0x8:
+        x238, p = decode_LuggageRestrictionType(v, n, p)
+        r176['luggage'] = x238
+    if o178 & 0x4:
+        x239 = []
+        while True:
+            c240, p = uper.read_length(v, n, p)
+            for _ in range(c240):
+                if p + 5 > n:
+                    raise OutOfDataError(p)
+                x241 = (v >> (n - p - 5)) & 0x1f
+                p += 5
+                x239.append(x241)
+            if c240 < 16384:
+                break
+        r176['includedTransportType'] = x239
+    if o178 & 0x2:
+        x242 = []
+        while True:
+            c243, p = uper.read_length(v, n, p)
+            for _ in range(c243):
+                if p + 5 > n:
+                    raise OutOfDataError(p)
+                x244 = (v >> (n - p - 5)) & 0x1f
+                p += 5
+                x242.append(x244)
+            if c243 < 16384:
+                break
+        r176['excludedTransportType'] = x242
+    if o178 & 0x1:
+        x245, p = decode_ExtensionData(v, n, p)
+        r176['extension'] = x245
+    if e177:
+        p = uper.skip_additions(v, n, p)
+    return r176, p
+
+
+def decode_PassData(v, n, p):
+    r246 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e247 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 34 > n:
+        raise OutOfDataError(p)
+    o248 = (v >> (n - p - 34)) & 0x3ffffffff
+    p += 34
+    if o248 & 0x200000000:
+        x249, p = uper.read_unconstrained(v, n, p)
+        r246['referenceNum'] = x249
+    if o248 & 0x100000000:
+        x250, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r246['referenceIA5'] = x250
+    if o248 & 0x80000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x251 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x251 += 1
+        r246['productOwnerNum'] = x251
+    if o248 & 0x40000000:
+        x252, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r246['productOwnerIA5'] = x252
+    if o248 & 0x20000000:
+        if p + 16 > n:
+            raise OutOfDataError(p)
+        x253 = (v >> (n - p - 16)) & 0xffff
+        p += 16
+        r246['productIdNum'] = x253
+    if o248 & 0x10000000:
+        x254, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r246['productIdIA5'] = x254
+    if o248 & 0x8000000:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x255 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x255 += 1
+        r246['passType'] = x255
+    if o248 & 0x4000000:
+        x256, p = uper.read_utf8(v, n, p)
+        r246['passDescription'] = x256
+    if o248 & 0x2000000:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e258 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e258:
+            x257, p = uper.read_normally_small_number(v, n, p)
+            x257 = _C4.get(x257)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i259 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i259 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i259}.")
+            x257 = _C9[i259]
+        r246['classCode'] = x257
+    else:
+        r246['classCode'] = 'second'
+    if o248 & 0x1000000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x260 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        x260 += -367
+        r246['validFromDay'] = x260
+    else:
+        r246['validFromDay'] = 0
+    if o248 & 0x800000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x261 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r246['validFromTime'] = x261
+    if o248 & 0x400000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x262 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x262 += -60
+        r246['validFromUTCOffset'] = x262
+    if o248 & 0x200000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x263 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x263 += -1
+        r246['validUntilDay'] = x263
+    else:
+        r246['validUntilDay'] = 0
+    if o248 & 0x100000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x264 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r246['validUntilTime'] = x264
+    if o248 & 0x80000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x265 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x265 += -60
+        r246['validUntilUTCOffset'] = x265
+    if o248 & 0x40000:
+        x266, p = decode_ValidityPeriodDetailType(v, n, p)
+        r246['validityPeriodDetails'] = x266
+    if o248 & 0x20000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x267 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r246['numberOfValidityDays'] = x267
+    if o248 & 0x10000:
+        x268, p = decode_TrainValidityType(v, n, p)
+        r246['trainValidity'] = x268
+    if o248 & 0x8000:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x269 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x269 += 1
+        r246['numberOfPossibleTrips'] = x269
+    if o248 & 0x4000:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x270 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x270 += 1
+        r246['numberOfDaysOfTravel'] = x270
+    if o248 & 0x2000:
+        x271 = []
+        while True:
+            c272, p = uper.read_length(v, n, p)
+            for _ in range(c272):
+                if p + 9 > n:
+                    raise OutOfDataError(p)
+                x273 = (v >> (n - p - 9)) & 0x1ff
+                p += 9
+                x271.append(x273)
+            if c272 < 16384:
+                break
+        r246['activatedDay'] = x271
+    if o248 & 0x1000:
+        x274 = []
+        while True:
+            c275, p = uper.read_length(v, n, p)
+            for _ in range(c275):
+                if p + 8 > n:
+                    raise OutOfDataError(p)
+                x276 = (v >> (n - p - 8)) & 0xff
+                p += 8
+                x276 += 1
+                x274.append(x276)
+            if c275 < 16384:
+                break
+        r246['countries'] = x274
+    if o248 & 0x800:
+        x277 = []
+        while True:
+            c278, p = uper.read_length(v, n, p)
+            for _ in range(c278):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x279 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x279 += 1
+                x277.append(x279)
+            if c278 < 16384:
+                break
+        r246['includedCarrierNum'] = x277
+    if o248 & 0x400:
+        x280 = []
+        while True:
+            c281, p = uper.read_length(v, n, p)
+            for _ in range(c281):
+                x282, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x280.append(x282)
+            if c281 < 16384:
+                break
+        r246['includedCarrierIA5'] = x280
+    if o248 & 0x200:
+        x283 = []
+        while True:
+            c284, p = uper.read_length(v, n, p)
+            for _ in range(c284):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x285 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x285 += 1
+                x283.append(x285)
+            if c284 < 16384:
+                break
+        r246['excludedCarrierNum'] = x283
+    if o248 & 0x100:
+        x286 = []
+        while True:
+            c287, p = uper.read_length(v, n, p)
+            for _ in range(c287):
+                x288, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x286.append(x288)
+            if c287 < 16384:
+                break
+        r246['excludedCarrierIA5'] = x286
+    if o248 & 0x80:
+        x289 = []
+        while True:
+            c290, p = uper.read_length(v, n, p)
+            for _ in range(c290):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x291 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x291 += 1
+                x289.append(x291)
+            if c290 < 16384:
+                break
+        r246['includedServiceBrands'] = x289
+    if o248 & 0x40:
+        x292 = []
+        while True:
+            c293, p = uper.read_length(v, n, p)
+            for _ in range(c293):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x294 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x294 += 1
+                x292.append(x294)
+            if c293 < 16384:
+                break
+        r246['excludedServiceBrands'] = x292
+    if o248 & 0x20:
+        x295 = []
+        while True:
+            c296, p = uper.read_length(v, n, p)
+            for _ in range(c296):
+                x297, p = decode_RegionalValidityType(v, n, p)
+                x295.append(x297)
+            if c296 < 16384:
+                break
+        r246['validRegion'] = x295
+    if o248 & 0x10:
+        x298 = []
+        while True:
+            c299, p = uper.read_length(v, n, p)
+            for _ in range(c299):
+                x300, p = decode_TariffType(v, n, p)
+                x298.append(x300)
+            if c299 < 16384:
+                break
+        r246['tariffs'] = x298
+    if o248 & 0x8:
+        x301, p = uper.read_unconstrained(v, n, p)
+        r246['price'] = x301
+    if o248 & 0x4:
+        x302 = []
+        while True:
+            c303, p = uper.read_length(v, n, p)
+            for _ in range(c303):
+                x304, p = decode_VatDetailType(v, n, p)
+                x302.append(x304)
+            if c303 < 16384:
+                break
+        r246['vatDetail'] = x302
+    if o248 & 0x2:
+        x305, p = uper.read_utf8(v, n, p)
+        r246['infoText'] = x305
+    if o248 & 0x1:
+        x306, p = decode_ExtensionData(v, n, p)
+        r246['extension'] = x306
+    if e247:
+        p = uper.skip_additions(v, n, p)
+    return r246, p
+
+
+def decode_CustomerCardData(v, n, p):
+    r307 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e308 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 13 > n:
+        raise OutOfDataError(p)
+    o309 = (v >> (n - p - 13)) & 0x1fff
+    p += 13
+    if o309 & 0x1000:
+        x310, p = decode_TravelerType(v, n, p)
+        r307['customer'] = x310
+    if o309 & 0x800:
+        x311, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r307['cardIdIA5'] = x311
+    if o309 & 0x400:
+        x312, p = uper.read_unconstrained(v, n, p)
+        r307['cardIdNum'] = x312
+    if p + 8 > n:
+        raise OutOfDataError(p)
+    x313 = (v >> (n - p - 8)) & 0xff
+    p += 8
+    x313 += 2016
+    r307['validFromYear'] = x313
+    if o309 & 0x200:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x314 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r307['validFromDay'] = x314
+    if o309 & 0x100:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x315 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        r307['validUntilYear'] = x315
+    else:
+        r307['validUntilYear'] = 0
+    if o309 & 0x80:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x316 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        r307['validUntilDay'] = x316
+    if o309 & 0x40:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e318 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e318:
+            x317, p = uper.read_normally_small_number(v, n, p)
+            x317 = _C4.get(x317)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i319 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i319 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i319}.")
+            x317 = _C9[i319]
+        r307['classCode'] = x317
+    if o309 & 0x20:
+        if p + 10 > n:
+            raise OutOfDataError(p)
+        x320 = (v >> (n - p - 10)) & 0x3ff
+        p += 10
+        x320 += 1
+        r307['cardType'] = x320
+    if o309 & 0x10:
+        x321, p = uper.read_utf8(v, n, p)
+        r307['cardTypeDescr'] = x321
+    if o309 & 0x8:
+        x322, p = uper.read_unconstrained(v, n, p)
+        r307['customerStatus'] = x322
+    if o309 & 0x4:
+        x323, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r307['customerStatusDescr'] = x323
+    if o309 & 0x2:
+        x324 = []
+        while True:
+            c325, p = uper.read_length(v, n, p)
+            for _ in range(c325):
+                x326, p = uper.read_unconstrained(v, n, p)
+                x324.append(x326)
+            if c325 < 16384:
+                break
+        r307['includedServices'] = x324
+    if o309 & 0x1:
+        x327, p = decode_ExtensionData(v, n, p)
+        r307['extension'] = x327
+    if e308:
+        p = uper.skip_additions(v, n, p)
+    return r307, p
+
+
+def decode_CustomerStatusType(v, n, p):
+    r328 = {}
+    if p + 4 > n:
+        raise OutOfDataError(p)
+    o329 = (v >> (n - p - 4)) & 0xf
+    p += 4
+    if o329 & 0x8:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x330 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x330 += 1
+        r328['statusProviderNum'] = x330
+    if o329 & 0x4:
+        x331, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r328['statusProviderIA5'] = x331
+    if o329 & 0x2:
+        x332, p = uper.read_unconstrained(v, n, p)
+        r328['customerStatus'] = x332
+    if o329 & 0x1:
+        x333, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r328['customerStatusDescr'] = x333
+    return r328, p
+
+
+def decode_PlacesType(v, n, p):
+    r334 = {}
+    if p + 5 > n:
+        raise OutOfDataError(p)
+    o335 = (v >> (n - p - 5)) & 0x1f
+    p += 5
+    if o335 & 0x10:
+        x336, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r334['coach'] = x336
+    if o335 & 0x8:
+        x337, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r334['placeString'] = x337
+    if o335 & 0x4:
+        x338, p = uper.read_utf8(v, n, p)
+        r334['placeDescription'] = x338
+    if o335 & 0x2:
+        x339 = []
+        while True:
+            c340, p = uper.read_length(v, n, p)
+            for _ in range(c340):
+                x341, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x339.append(x341)
+            if c340 < 16384:
+                break
+        r334['placeIA5'] = x339
+    if o335 & 0x1:
+        x342 = []
+        while True:
+            c343, p = uper.read_length(v, n, p)
+            for _ in range(c343):
+                if p + 8 > n:
+                    raise OutOfDataError(p)
+                x344 = (v >> (n - p - 8)) & 0xff
+                p += 8
+                x344 += 1
+                x342.append(x344)
+            if c343 < 16384:
+                break
+        r334['placeNum'] = x342
+    return r334, p
+
+
+def decode_CompartmentDetailsType(v, n, p):
+    r345 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e346 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 7 > n:
+        raise OutOfDataError(p)
+    o347 = (v >> (n - p - 7)) & 0x7f
+    p += 7
+    if o347 & 0x40:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x348 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x348 += 1
+        r345['coachType'] = x348
+    if o347 & 0x20:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x349 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x349 += 1
+        r345['compartmentType'] = x349
+    if o347 & 0x10:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x350 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x350 += 1
+        r345['specialAllocation'] = x350
+    if o347 & 0x8:
+        x351, p = uper.read_utf8(v, n, p)
+        r345['coachTypeDescr'] = x351
+    if o347 & 0x4:
+        x352, p = uper.read_utf8(v, n, p)
+        r345['compartmentTypeDescr'] = x352
+    if o347 & 0x2:
+        x353, p = uper.read_utf8(v, n, p)
+        r345['specialAllocationDescr'] = x353
+    if o347 & 0x1:
+        if p + 2 > n:
+            raise OutOfDataError(p)
+        i355 = (v >> (n - p - 2)) & 0x3
+        p += 2
+        if i355 >= 3:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i355}.")
+        x354 = _C11[i355]
+        r345['position'] = x354
+    else:
+        r345['position'] = 'unspecified'
+    if e346:
+        p = uper.skip_additions(v, n, p)
+    return r345, p
+
+
+def decode_BerthDetailData(v, n, p):
+    r356 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e357 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    o358 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    i360 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if i360 >= 6:
+        raise DecodeError(f"Expected enumeration index to be in range, but got {i360}.")
+    x359 = _C12[i360]
+    r356['berthType'] = x359
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    x361 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    x361 += 1
+    r356['numberOfBerths'] = x361
+    if o358 & 0x1:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e363 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e363:
+            x362, p = uper.read_normally_small_number(v, n, p)
+            x362 = _C4.get(x362)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i364 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i364 >= 5:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i364}.")
+            x362 = _C13[i364]
+        r356['gender'] = x362
+    else:
+        r356['gender'] = 'family'
+    if e357:
+        p = uper.skip_additions(v, n, p)
+    return r356, p
+
+
+def decode_TariffType(v, n, p):
+    r365 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e366 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    o367 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    if o367 & 0x400:
+        if p + 8 > n:
+            raise OutOfDataError(p)
+        x368 = (v >> (n - p - 8)) & 0xff
+        p += 8
+        x368 += 1
+        r365['numberOfPassengers'] = x368
+    else:
+        r365['numberOfPassengers'] = 1
+    if o367 & 0x200:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e370 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e370:
+            x369, p = uper.read_normally_small_number(v, n, p)
+            x369 = _C4.get(x369)
+        else:
+            if p + 3 > n:
+                raise OutOfDataError(p)
+            i371 = (v >> (n - p - 3)) & 0x7
+            p += 3
+            if i371 >= 8:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i371}.")
+            x369 = _C6[i371]
+        r365['passengerType'] = x369
+    if o367 & 0x100:
+        if p + 6 > n:
+            raise OutOfDataError(p)
+        x372 = (v >> (n - p - 6)) & 0x3f
+        p += 6
+        x372 += 1
+        r365['ageBelow'] = x372
+    if o367 & 0x80:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x373 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x373 += 1
+        r365['ageAbove'] = x373
+    if o367 & 0x40:
+        x374 = []
+        while True:
+            c375, p = uper.read_length(v, n, p)
+            for _ in range(c375):
+                if p + 8 > n:
+                    raise OutOfDataError(p)
+                x376 = (v >> (n - p - 8)) & 0xff
+                p += 8
+                x376 += 1
+                x374.append(x376)
+            if c375 < 16384:
+                break
+        r365['travelerid'] = x374
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x377 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x377 = bool(x377)
+    r365['restrictedToCountryOfResidence'] = x377
+    if o367 & 0x20:
+        x378, p = decode_RouteSectionType(v, n, p)
+        r365['restrictedToRouteSection'] = x378
+    if o367 & 0x10:
+        x379, p = decode_SeriesDetailType(v, n, p)
+        r365['seriesDataDetails'] = x379
+    if o367 & 0x8:
+        x380, p = uper.read_unconstrained(v, n, p)
+        r365['tariffIdNum'] = x380
+    if o367 & 0x4:
+        x381, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r365['tariffIdIA5'] = x381
+    if o367 & 0x2:
+        x382, p = uper.read_utf8(v, n, p)
+        r365['tariffDesc'] = x382
+    if o367 & 0x1:
+        x383 = []
+        while True:
+            c384, p = uper.read_length(v, n, p)
+            for _ in range(c384):
+                x385, p = decode_CardReferenceType(v, n, p)
+                x383.append(x385)
+            if c384 < 16384:
+                break
+        r365['reductionCard'] = x383
+    if e366:
+        p = uper.skip_additions(v, n, p)
+    return r365, p
+
+
+def decode_VatDetailType(v, n, p):
+    r386 = {}
+    if p + 2 > n:
+        raise OutOfDataError(p)
+    o387 = (v >> (n - p - 2)) & 0x3
+    p += 2
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    x388 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    x388 += 1
+    r386['country'] = x388
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    x389 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    r386['percentage'] = x389
+    if o387 & 0x2:
+        x390, p = uper.read_unconstrained(v, n, p)
+        r386['amount'] = x390
+    if o387 & 0x1:
+        x391, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r386['vatId'] = x391
+    return r386, p
+
+
+def decode_LuggageRestrictionType(v, n, p):
+    r392 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e393 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o394 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o394 & 0x4:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x395 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        r392['maxHandLuggagePieces'] = x395
+    else:
+        r392['maxHandLuggagePieces'] = 3
+    if o394 & 0x2:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x396 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        r392['maxNonHandLuggagePieces'] = x396
+    else:
+        r392['maxNonHandLuggagePieces'] = 1
+    if o394 & 0x1:
+        x397 = []
+        while True:
+            c398, p = uper.read_length(v, n, p)
+            for _ in range(c398):
+                x399, p = decode_RegisteredLuggageType(v, n, p)
+                x397.append(x399)
+            if c398 < 16384:
+                break
+        r392['registeredLuggage'] = x397
+    if e393:
+        p = uper.skip_additions(v, n, p)
+    return r392, p
+
+
+def decode_RegionalValidityType(v, n, p):
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e401 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if e401:
+        _, p = uper.read_normally_small_number(v, n, p)
+        l402, p = uper.read_length(v, n, p)
+        p = uper.skip_bits(n, p, 8 * l402)
+        r400 = (None, None)
+    else:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i403 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i403 == 0:
+            x404, p = decode_TrainLinkType(v, n, p)
+            r400 = ('trainLink', x404)
+        elif i403 == 1:
+            x405, p = decode_ViaStationType(v, n, p)
+            r400 = ('viaStations', x405)
+        elif i403 == 2:
+            x406, p = decode_ZoneType(v, n, p)
+            r400 = ('zones', x406)
+        elif i403 == 3:
+            x407, p = decode_LineType(v, n, p)
+            r400 = ('lines', x407)
+        elif i403 == 4:
+            x408, p = decode_PolygoneType(v, n, p)
+            r400 = ('polygone', x408)
+        else:
+            raise DecodeError(f"Expected choice index {i403} to be in range.")
+    return r400, p
+
+
+def decode_ReturnRouteDescriptionType(v, n, p):
+    r409 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e410 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 8 > n:
+        raise OutOfDataError(p)
+    o411 = (v >> (n - p - 8)) & 0xff
+    p += 8
+    if o411 & 0x80:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x412 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x412 += 1
+        r409['fromStationNum'] = x412
+    if o411 & 0x40:
+        x413, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r409['fromStationIA5'] = x413
+    if o411 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x414 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x414 += 1
+        r409['toStationNum'] = x414
+    if o411 & 0x10:
+        x415, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r409['toStationIA5'] = x415
+    if o411 & 0x8:
+        x416, p = uper.read_utf8(v, n, p)
+        r409['fromStationNameUTF8'] = x416
+    if o411 & 0x4:
+        x417, p = uper.read_utf8(v, n, p)
+        r409['toStationNameUTF8'] = x417
+    if o411 & 0x2:
+        x418, p = uper.read_utf8(v, n, p)
+        r409['validReturnRegionDesc'] = x418
+    if o411 & 0x1:
+        x419 = []
+        while True:
+            c420, p = uper.read_length(v, n, p)
+            for _ in range(c420):
+                x421, p = decode_RegionalValidityType(v, n, p)
+                x419.append(x421)
+            if c420 < 16384:
+                break
+        r409['validReturnRegion'] = x419
+    if e410:
+        p = uper.skip_additions(v, n, p)
+    return r409, p
+
+
+def decode_IncludedOpenTicketType(v, n, p):
+    r422 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e423 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 25 > n:
+        raise OutOfDataError(p)
+    o424 = (v >> (n - p - 25)) & 0x1ffffff
+    p += 25
+    if o424 & 0x1000000:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x425 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x425 += 1
+        r422['productOwnerNum'] = x425
+    if o424 & 0x800000:
+        x426, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r422['productOwnerIA5'] = x426
+    if o424 & 0x400000:
+        if p + 16 > n:
+            raise OutOfDataError(p)
+        x427 = (v >> (n - p - 16)) & 0xffff
+        p += 16
+        r422['productIdNum'] = x427
+    if o424 & 0x200000:
+        x428, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r422['productIdIA5'] = x428
+    if o424 & 0x100000:
+        x429, p = uper.read_unconstrained(v, n, p)
+        r422['externalIssuerId'] = x429
+    if o424 & 0x80000:
+        x430, p = uper.read_unconstrained(v, n, p)
+        r422['issuerAutorizationId'] = x430
+    if o424 & 0x40000:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i432 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i432 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i432}.")
+        x431 = _C8[i432]
+        r422['stationCodeTable'] = x431
+    else:
+        r422['stationCodeTable'] = 'stationUIC'
+    if o424 & 0x20000:
+        x433 = []
+        while True:
+            c434, p = uper.read_length(v, n, p)
+            for _ in range(c434):
+                x435, p = decode_RegionalValidityType(v, n, p)
+                x433.append(x435)
+            if c434 < 16384:
+                break
+        r422['validRegion'] = x433
+    if o424 & 0x10000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x436 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        x436 += -367
+        r422['validFromDay'] = x436
+    else:
+        r422['validFromDay'] = 0
+    if o424 & 0x8000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x437 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r422['validFromTime'] = x437
+    if o424 & 0x4000:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x438 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x438 += -60
+        r422['validFromUTCOffset'] = x438
+    if o424 & 0x2000:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x439 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x439 += -1
+        r422['validUntilDay'] = x439
+    else:
+        r422['validUntilDay'] = 0
+    if o424 & 0x1000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x440 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r422['validUntilTime'] = x440
+    if o424 & 0x800:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x441 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x441 += -60
+        r422['validUntilUTCOffset'] = x441
+    if o424 & 0x400:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e443 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e443:
+            x442, p = uper.read_normally_small_number(v, n, p)
+            x442 = _C4.get(x442)
+        else:
+            if p + 4 > n:
+                raise OutOfDataError(p)
+            i444 = (v >> (n - p - 4)) & 0xf
+            p += 4
+            if i444 >= 12:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i444}.")
+            x442 = _C9[i444]
+        r422['classCode'] = x442
+    if o424 & 0x200:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        l446 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        l446 += 1
+        x445, p = uper.read_chars(v, n, p, l446, 7, None)
+        r422['serviceLevel'] = x445
+    if o424 & 0x100:
+        x447 = []
+        while True:
+            c448, p = uper.read_length(v, n, p)
+            for _ in range(c448):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x449 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x449 += 1
+                x447.append(x449)
+            if c448 < 16384:
+                break
+        r422['carrierNum'] = x447
+    if o424 & 0x80:
+        x450 = []
+        while True:
+            c451, p = uper.read_length(v, n, p)
+            for _ in range(c451):
+                x452, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x450.append(x452)
+            if c451 < 16384:
+                break
+        r422['carrierIA5'] = x450
+    if o424 & 0x40:
+        x453 = []
+        while True:
+            c454, p = uper.read_length(v, n, p)
+            for _ in range(c454):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x455 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x455 += 1
+                x453.append(x455)
+            if c454 < 16384:
+                break
+        r422['includedServiceBrands'] = x453
+    if o424 & 0x20:
+        x456 = []
+        while True:
+            c457, p = uper.read_length(v, n, p)
+            for _ in range(c457):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x458 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x458 += 1
+                x456.append(x458)
+            if c457 < 16384:
+                break
+        r422['excludedServiceBrands'] = x456
+    if o424 & 0x10:
+        x459 = []
+        while True:
+            c460, p = uper.read_length(v, n, p)
+            for _ in range(c460):
+                x461, p = decode_TariffType(v, n, p)
+                x459.append(x461)
+            if c460 < 16384:
+                break
+        r422['tariffs'] = x459
+    if o424 & 0x8:
+        x462, p = uper.read_utf8(v, n, p)
+        r422['infoText'] = x462
+    if o424 & 0x4:
+        x463 = []
+        while True:
+            c464, p = uper.read_length(v, n, p)
+            for _ in range(c464):
+                if p + 5 > n:
+                    raise OutOfDataError(p)
+                x465 = (v >> (n - p - 5)) & 0x1f
+                p += 5
+                x463.append(x465)
+            if c464 < 16384:
+                break
+        r422['includedTransportType'] = x463
+    if o424 & 0x2:
+        x466 = []
+        while True:
+            c467, p = uper.read_length(v, n, p)
+            for _ in range(c467):
+                if p + 5 > n:
+                    raise OutOfDataError(p)
+                x468 = (v >> (n - p - 5)) & 0x1f
+                p += 5
+                x466.append(x468)
+            if c467 < 16384:
+                break
+        r422['excludedTransportType'] = x466
+    if o424 & 0x1:
+        x469, p = decode_ExtensionData(v, n, p)
+        r422['extension'] = x469
+    if e423:
+        p = uper.skip_additions(v, n, p)
+    return r422, p
+
+
+def decode_ValidityPeriodDetailType(v, n, p):
+    r470 = {}
+    if p + 2 > n:
+        raise OutOfDataError(p)
+    o471 = (v >> (n - p - 2)) & 0x3
+    p += 2
+    if o471 & 0x2:
+        x472 = []
+        while True:
+            c473, p = uper.read_length(v, n, p)
+            for _ in range(c473):
+                x474, p = decode_ValidityPeriodType(v, n, p)
+                x472.append(x474)
+            if c473 < 16384:
+                break
+        r470['validityPeriod'] = x472
+    if o471 & 0x1:
+        x475 = []
+        while True:
+            c476, p = uper.read_length(v, n, p)
+            for _ in range(c476):
+                x477, p = decode_TimeRangeType(v, n, p)
+                x475.append(x477)
+            if c476 < 16384:
+                break
+        r470['excludedTimeRange'] = x475
+    return r470, p
+
+
+def decode_TrainValidityType(v, n, p):
+    r478 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e479 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 13 > n:
+        raise OutOfDataError(p)
+    o480 = (v >> (n - p - 13)) & 0x1fff
+    p += 13
+    if o480 & 0x1000:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x481 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        x481 += -367
+        r478['validFromDay'] = x481
+    else:
+        r478['validFromDay'] = 0
+    if o480 & 0x800:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x482 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r478['validFromTime'] = x482
+    if o480 & 0x400:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x483 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x483 += -60
+        r478['validFromUTCOffset'] = x483
+    if o480 & 0x200:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x484 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x484 += -1
+        r478['validUntilDay'] = x484
+    else:
+        r478['validUntilDay'] = 0
+    if o480 & 0x100:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x485 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r478['validUntilTime'] = x485
+    if o480 & 0x80:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x486 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x486 += -60
+        r478['validUntilUTCOffset'] = x486
+    if o480 & 0x40:
+        x487 = []
+        while True:
+            c488, p = uper.read_length(v, n, p)
+            for _ in range(c488):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x489 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x489 += 1
+                x487.append(x489)
+            if c488 < 16384:
+                break
+        r478['includedCarrierNum'] = x487
+    if o480 & 0x20:
+        x490 = []
+        while True:
+            c491, p = uper.read_length(v, n, p)
+            for _ in range(c491):
+                x492, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x490.append(x492)
+            if c491 < 16384:
+                break
+        r478['includedCarrierIA5'] = x490
+    if o480 & 0x10:
+        x493 = []
+        while True:
+            c494, p = uper.read_length(v, n, p)
+            for _ in range(c494):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x495 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x495 += 1
+                x493.append(x495)
+            if c494 < 16384:
+                break
+        r478['excludedCarrierNum'] = x493
+    if o480 & 0x8:
+        x496 = []
+        while True:
+            c497, p = uper.read_length(v, n, p)
+            for _ in range(c497):
+                x498, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x496.append(x498)
+            if c497 < 16384:
+                break
+        r478['excludedCarrierIA5'] = x496
+    if o480 & 0x4:
+        x499 = []
+        while True:
+            c500, p = uper.read_length(v, n, p)
+            for _ in range(c500):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x501 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x501 += 1
+                x499.append(x501)
+            if c500 < 16384:
+                break
+        r478['includedServiceBrands'] = x499
+    if o480 & 0x2:
+        x502 = []
+        while True:
+            c503, p = uper.read_length(v, n, p)
+            for _ in range(c503):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x504 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x504 += 1
+                x502.append(x504)
+            if c503 < 16384:
+                break
+        r478['excludedServiceBrands'] = x502
+    if o480 & 0x1:
+        if p + 1 > n:
+            raise OutOfDataError(p)
+        e506 = (v >> (n - p - 1)) & 0x1
+        p += 1
+        if e506:
+            x505, p = uper.read_normally_small_number(v, n, p)
+            x505 = _C4.get(x505)
+        else:
+            if p + 1 > n:
+                raise OutOfDataError(p)
+            i507 = (v >> (n - p - 1)) & 0x1
+            p += 1
+            if i507 >= 2:
+                raise DecodeError(f"Expected enumeration index to be in range, but got {i507}.")
+            x505 = _C14[i507]
+        r478['boardingOrArrival'] = x505
+    else:
+        r478['boardingOrArrival'] = 'boarding'
+    if e479:
+        p = uper.skip_additions(v, n, p)
+    return r478, p
+
+
+def decode_RouteSectionType(v, n, p):
+    r508 = {}
+    if p + 7 > n:
+        raise OutOfDataError(p)
+    o509 = (v >> (n - p - 7)) & 0x7f
+    p += 7
+    if o509 & 0x40:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i511 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i511 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i511}.")
+        x510 = _C8[i511]
+        r508['stationCodeTable'] = x510
+    else:
+        r508['stationCodeTable'] = 'stationUIC'
+    if o509 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x512 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x512 += 1
+        r508['fromStationNum'] = x512
+    if o509 & 0x10:
+        x513, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r508['fromStationIA5'] = x513
+    if o509 & 0x8:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x514 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x514 += 1
+        r508['toStationNum'] = x514
+    if o509 & 0x4:
+        x515, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r508['toStationIA5'] = x515
+    if o509 & 0x2:
+        x516, p = uper.read_utf8(v, n, p)
+        r508['fromStationNameUTF8'] = x516
+    if o509 & 0x1:
+        x517, p = uper.read_utf8(v, n, p)
+        r508['toStationNameUTF8'] = x517
+    return r508, p
+
+
+def decode_SeriesDetailType(v, n, p):
+    r518 = {}
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o519 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o519 & 0x4:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x520 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x520 += 1
+        r518['supplyingCarrier'] = x520
+    if o519 & 0x2:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x521 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x521 += 1
+        r518['offerIdentification'] = x521
+    if o519 & 0x1:
+        x522, p = uper.read_unconstrained(v, n, p)
+        r518['series'] = x522
+    return r518, p
+
+
+def decode_CardReferenceType(v, n, p):
+    r523 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e524 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 10 > n:
+        raise OutOfDataError(p)
+    o525 = (v >> (n - p - 10)) & 0x3ff
+    p += 10
+    if o525 & 0x200:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x526 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x526 += 1
+        r523['cardIssuerNum'] = x526
+    if o525 & 0x100:
+        x527, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r523['cardIssuerIA5'] = x527
+    if o525 & 0x80:
+        x528, p = uper.read_unconstrained(v, n, p)
+        r523['cardIdNum'] = x528
+    if o525 & 0x40:
+        x529, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r523['cardIdIA5'] = x529
+    if o525 & 0x20:
+        x530, p = uper.read_utf8(v, n, p)
+        r523['cardName'] = x530
+    if o525 & 0x10:
+        x531, p = uper.read_unconstrained(v, n, p)
+        r523['cardType'] = x531
+    if o525 & 0x8:
+        x532, p = uper.read_unconstrained(v, n, p)
+        r523['leadingCardIdNum'] = x532
+    if o525 & 0x4:
+        x533, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r523['leadingCardIdIA5'] = x533
+    if o525 & 0x2:
+        x534, p = uper.read_unconstrained(v, n, p)
+        r523['trailingCardIdNum'] = x534
+    if o525 & 0x1:
+        x535, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r523['trailingCardIdIA5'] = x535
+    if e524:
+        p = uper.skip_additions(v, n, p)
+    return r523, p
+
+
+def decode_RegisteredLuggageType(v, n, p):
+    r536 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e537 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 3 > n:
+        raise OutOfDataError(p)
+    o538 = (v >> (n - p - 3)) & 0x7
+    p += 3
+    if o538 & 0x4:
+        x539, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r536['registrationId'] = x539
+    if o538 & 0x2:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x540 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x540 += 1
+        r536['maxWeight'] = x540
+    if o538 & 0x1:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x541 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x541 += 1
+        r536['maxSize'] = x541
+    if e537:
+        p = uper.skip_additions(v, n, p)
+    return r536, p
+
+
+def decode_TrainLinkType(v, n, p):
+    r542 = {}
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    o543 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    if o543 & 0x100:
+        x544, p = uper.read_unconstrained(v, n, p)
+        r542['trainNum'] = x544
+    if o543 & 0x80:
+        x545, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r542['trainIA5'] = x545
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    x546 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    x546 += -1
+    r542['travelDate'] = x546
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x547 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r542['departureTime'] = x547
+    if o543 & 0x40:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x548 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x548 += -60
+        r542['departureUTCOffset'] = x548
+    if o543 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x549 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x549 += 1
+        r542['fromStationNum'] = x549
+    if o543 & 0x10:
+        x550, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r542['fromStationIA5'] = x550
+    if o543 & 0x8:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x551 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x551 += 1
+        r542['toStationNum'] = x551
+    if o543 & 0x4:
+        x552, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r542['toStationIA5'] = x552
+    if o543 & 0x2:
+        x553, p = uper.read_utf8(v, n, p)
+        r542['fromStationNameUTF8'] = x553
+    if o543 & 0x1:
+        x554, p = uper.read_utf8(v, n, p)
+        r542['toStationNameUTF8'] = x554
+    return r542, p
+
+
+def decode_ViaStationType(v, n, p):
+    r555 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e556 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    o557 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    if o557 & 0x400:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i559 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i559 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i559}.")
+        x558 = _C8[i559]
+        r555['stationCodeTable'] = x558
+    else:
+        r555['stationCodeTable'] = 'stationUIC'
+    if o557 & 0x200:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x560 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x560 += 1
+        r555['stationNum'] = x560
+    if o557 & 0x100:
+        x561, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r555['stationIA5'] = x561
+    if o557 & 0x80:
+        x562 = []
+        while True:
+            c563, p = uper.read_length(v, n, p)
+            for _ in range(c563):
+                x564, p = decode_ViaStationType(v, n, p)
+                x562.append(x564)
+            if c563 < 16384:
+                break
+        r555['alternativeRoutes'] = x562
+    if o557 & 0x40:
+        x565 = []
+        while True:
+            c566, p = uper.read_length(v, n, p)
+            for _ in range(c566):
+                x567, p = decode_ViaStationType(v, n, p)
+                x565.append(x567)
+            if c566 < 16384:
+                break
+        r555['route'] = x565
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    x568 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    x568 = bool(x568)
+    r555['border'] = x568
+    if o557 & 0x20:
+        x569 = []
+        while True:
+            c570, p = uper.read_length(v, n, p)
+            for _ in range(c570):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x571 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x571 += 1
+                x569.append(x571)
+            if c570 < 16384:
+                break
+        r555['carrierNum'] = x569
+    if o557 & 0x10:
+        x572 = []
+        while True:
+            c573, p = uper.read_length(v, n, p)
+            for _ in range(c573):
+                x574, p = uper.read_chars_unbound(v, n, p, 7, None)
+                x572.append(x574)
+            if c573 < 16384:
+                break
+        r555['carrierIA5'] = x572
+    if o557 & 0x8:
+        x575, p = uper.read_unconstrained(v, n, p)
+        r555['seriesId'] = x575
+    if o557 & 0x4:
+        x576, p = uper.read_unconstrained(v, n, p)
+        r555['routeId'] = x576
+    if o557 & 0x2:
+        x577 = []
+        while True:
+            c578, p = uper.read_length(v, n, p)
+            for _ in range(c578):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x579 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x579 += 1
+                x577.append(x579)
+            if c578 < 16384:
+                break
+        r555['includedServiceBrands'] = x577
+    if o557 & 0x1:
+        x580 = []
+        while True:
+            c581, p = uper.read_length(v, n, p)
+            for _ in range(c581):
+                if p + 15 > n:
+                    raise OutOfDataError(p)
+                x582 = (v >> (n - p - 15)) & 0x7fff
+                p += 15
+                x582 += 1
+                x580.append(x582)
+            if c581 < 16384:
+                break
+        r555['excludedServiceBrands'] = x580
+    if e556:
+        p = uper.skip_additions(v, n, p)
+    return r555, p
+
+
+def decode_ZoneType(v, n, p):
+    r583 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e584 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    o585 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    if o585 & 0x400:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x586 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x586 += 1
+        r583['carrierNum'] = x586
+    if o585 & 0x200:
+        x587, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r583['carrierIA5'] = x587
+    if o585 & 0x100:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i589 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i589 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i589}.")
+        x588 = _C8[i589]
+        r583['stationCodeTable'] = x588
+    else:
+        r583['stationCodeTable'] = 'stationUIC'
+    if o585 & 0x80:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x590 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x590 += 1
+        r583['entryStationNum'] = x590
+    if o585 & 0x40:
+        x591, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r583['entryStationIA5'] = x591
+    if o585 & 0x20:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x592 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x592 += 1
+        r583['terminatingStationNum'] = x592
+    if o585 & 0x10:
+        x593, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r583['terminatingStationIA5'] = x593
+    if o585 & 0x8:
+        x594, p = uper.read_unconstrained(v, n, p)
+        r583['city'] = x594
+    if o585 & 0x4:
+        x595 = []
+        while True:
+            c596, p = uper.read_length(v, n, p)
+            for _ in range(c596):
+                x597, p = uper.read_unconstrained(v, n, p)
+                x595.append(x597)
+            if c596 < 16384:
+                break
+        r583['zoneId'] = x595
+    if o585 & 0x2:
+        x598, p = uper.read_octets_unbound(v, n, p)
+        r583['binaryZoneId'] = x598
+    if o585 & 0x1:
+        x599, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r583['nutsCode'] = x599
+    if e584:
+        p = uper.skip_additions(v, n, p)
+    return r583, p
+
+
+def decode_LineType(v, n, p):
+    r600 = {}
+    if p + 1 > n:
+        raise OutOfDataError(p)
+    e601 = (v >> (n - p - 1)) & 0x1
+    p += 1
+    if p + 9 > n:
+        raise OutOfDataError(p)
+    o602 = (v >> (n - p - 9)) & 0x1ff
+    p += 9
+    if o602 & 0x100:
+        if p + 15 > n:
+            raise OutOfDataError(p)
+        x603 = (v >> (n - p - 15)) & 0x7fff
+        p += 15
+        x603 += 1
+        r600['carrierNum'] = x603
+    if o602 & 0x80:
+        x604, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r600['carrierIA5'] = x604
+    if o602 & 0x40:
+        x605 = []
+        while True:
+            c606, p = uper.read_length(v, n, p)
+            for _ in range(c606):
+                x607, p = uper.read_unconstrained(v, n, p)
+                x605.append(x607)
+            if c606 < 16384:
+                break
+        r600['lineId'] = x605
+    if o602 & 0x20:
+        if p + 3 > n:
+            raise OutOfDataError(p)
+        i609 = (v >> (n - p - 3)) & 0x7
+        p += 3
+        if i609 >= 5:
+            raise DecodeError(f"Expected enumeration index to be in range, but got {i609}.")
+        x608 = _C8[i609]
+        r600['stationCodeTable'] = x608
+    else:
+        r600['stationCodeTable'] = 'stationUIC'
+    if o602 & 0x10:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x610 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x610 += 1
+        r600['entryStationNum'] = x610
+    if o602 & 0x8:
+        x611, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r600['entryStationIA5'] = x611
+    if o602 & 0x4:
+        if p + 24 > n:
+            raise OutOfDataError(p)
+        x612 = (v >> (n - p - 24)) & 0xffffff
+        p += 24
+        x612 += 1
+        r600['terminatingStationNum'] = x612
+    if o602 & 0x2:
+        x613, p = uper.read_chars_unbound(v, n, p, 7, None)
+        r600['terminatingStationIA5'] = x613
+    if o602 & 0x1:
+        x614, p = uper.read_unconstrained(v, n, p)
+        r600['city'] = x614
+    if e601:
+        p = uper.skip_additions(v, n, p)
+    return r600, p
+
+
+def decode_PolygoneType(v, n, p):
+    r615 = {}
+    x616, p = decode_GeoCoordinateType(v, n, p)
+    r615['firstEdge'] = x616
+    x617 = []
+    while True:
+        c618, p = uper.read_length(v, n, p)
+        for _ in range(c618):
+            x619, p = decode_DeltaCoordinates(v, n, p)
+            x617.append(x619)
+        if c618 < 16384:
+            break
+    r615['edges'] = x617
+    return r615, p
+
+
+def decode_ValidityPeriodType(v, n, p):
+    r620 = {}
+    if p + 6 > n:
+        raise OutOfDataError(p)
+    o621 = (v >> (n - p - 6)) & 0x3f
+    p += 6
+    if o621 & 0x20:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x622 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        x622 += -367
+        r620['validFromDay'] = x622
+    else:
+        r620['validFromDay'] = 0
+    if o621 & 0x10:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x623 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r620['validFromTime'] = x623
+    if o621 & 0x8:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x624 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x624 += -60
+        r620['validFromUTCOffset'] = x624
+    if o621 & 0x4:
+        if p + 9 > n:
+            raise OutOfDataError(p)
+        x625 = (v >> (n - p - 9)) & 0x1ff
+        p += 9
+        x625 += -1
+        r620['validUntilDay'] = x625
+    else:
+        r620['validUntilDay'] = 0
+    if o621 & 0x2:
+        if p + 11 > n:
+            raise OutOfDataError(p)
+        x626 = (v >> (n - p - 11)) & 0x7ff
+        p += 11
+        r620['validUntilTime'] = x626
+    if o621 & 0x1:
+        if p + 7 > n:
+            raise OutOfDataError(p)
+        x627 = (v >> (n - p - 7)) & 0x7f
+        p += 7
+        x627 += -60
+        r620['validUntilUTCOffset'] = x627
+    return r620, p
+
+
+def decode_TimeRangeType(v, n, p):
+    r628 = {}
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x629 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r628['fromTime'] = x629
+    if p + 11 > n:
+        raise OutOfDataError(p)
+    x630 = (v >> (n - p - 11)) & 0x7ff
+    p += 11
+    r628['untilTime'] = x630
+    return r628, p
+
+
+def decode_DeltaCoordinates(v, n, p):
+    r631 = {}
+    x632, p = uper.read_unconstrained(v, n, p)
+    r631['longitude'] = x632
+    x633, p = uper.read_unconstrained(v, n, p)
+    r631['latitude'] = x633
+    return r631, p
@@ -2,63 +2,171 @@ import typing
 import dataclasses
 import pathlib
 import datetime
+import functools
+import hashlib
+import importlib
+import os
+import pickle
+import tempfile
 import asn1tools
 import pytz
+from django.conf import settings
 from . import util
 
 ROOT = pathlib.Path(__file__).parent
-ASN1_SPEC_V1_3 = asn1tools.compile_files([ROOT / "asn1" / "uicRailTicketData_v1.3.4.asn"], codec="uper")
-ASN1_SPEC_V2 = asn1tools.compile_files([ROOT / "asn1" / "uicRailTicketData_v2.0.2.asn"], codec="uper")
-ASN1_SPEC_V3 = asn1tools.compile_files([ROOT / "asn1" / "uicRailTicketData_v3.0.3.asn"], codec="uper")
+ASN1_SPEC_FILES = {
+    13: ROOT / "asn1" / "uicRailTicketData_v1.3.4.asn",
+    2: ROOT / "asn1" / "uicRailTicketData_v2.0.2.asn",
+    3: ROOT / "asn1" / "uicRailTicketData_v3.0.3.asn",
+}
+ASN1_SPECS = {}
+DECODER_MODULES = {
+    13: "v1_3",
+    2: "v2",
+    3: "v3",
+}
+DECODERS = {}
+
+
+def load_spec(spec_file: pathlib.Path):
+    spec_data = spec_file.read_bytes()
+    cache_dir = settings.UIC_ASN1_CACHE_DIR
+    cache_file = None
+
+    if cache_dir:
+        spec_hash = hashlib.sha256(spec_data).hexdigest()[:16]
+        cache_file = pathlib.Path(cache_dir) / f"{spec_file.stem}-{asn1tools.__version__}-{spec_hash}.pickle"
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            pass
+
+    spec = asn1tools.compile_string(spec_data.decode("utf-8"), codec="uper")
+
+    if cache_file:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=cache_file.parent, delete=False) as f:
+                pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, cache_file)
+        except OSError:
+            pass
+
+    return spec
+
+
+def get_spec(version: int):
+    if spec := ASN1_SPECS.get(version):
+        return spec
+
+    if version not in ASN1_SPEC_FILES:
+        raise util.UICException("Unsupported UIC rail ticket flexible data version")
+
+    spec = load_spec(ASN1_SPEC_FILES[version])
+    ASN1_SPECS[version] = spec
+    return spec
+
+
+def get_decoder(version: int):
+    if version in DECODERS:
+        return DECODERS[version]
+
+    decoder = None
+    if module_name := DECODER_MODULES.get(version):
+        try:
+            decoder = importlib.import_module(f".fcb.{module_name}", __package__)
+        except ImportError:
+            pass
+        else:
+            spec_hash = hashlib.sha256(ASN1_SPEC_FILES[version].read_bytes()).hexdigest()
+            if decoder.SPEC_SHA256 != spec_hash:
+                decoder = None
+
+    DECODERS[version] = decoder
+    return decoder
+
+
+def decode_summary(spec, data: bytes) -> typing.Dict[str, typing.Any]:
+    ticket_type = spec.types["UicRailTicketData"]._type
+    decoder = asn1tools.codecs.uper.Decoder(bytearray(data))
+
+    if ticket_type.additions is not None:
+        decoder.read_bit()
+    optionals = {
+        optional: decoder.read_bit()
+        for optional in ticket_type.optionals
+    }
+
+    values = {}
+    for member in ticket_type.root_members:
+        if member.name == "transportDocument":
+            if optionals.get(member, True):
+                decoder.align()
+                length = decoder.read_length_determinant()
+                values[member.name] = [member.element_type.decode(decoder)] if length else []
+            break
+
+        if optionals.get(member, True):
+            values[member.name] = member.decode(decoder)
+
+    return values
+
 
 @dataclasses.dataclass
 class Flex:
     version: int
-    data: typing.Dict[str, typing.Any]
+    raw: bytes = dataclasses.field(repr=False)
 
     @classmethod
     def parse(cls, version: int, data: bytes) -> "Flex":
+        flex = cls(
+            version=version,
+            raw=bytes(data)
+        )
+        _ = flex.summary
+        return flex
+
+    @functools.cached_property
+    def summary(self) -> typing.Dict[str, typing.Any]:
         try:
-            if version == 13:
-                return cls(
-                    version=version,
-                    data=ASN1_SPEC_V1_3.decode("UicRailTicketData", data)
-                )
-            elif version == 2:
-                return cls(
-                    version=version,
-                    data=ASN1_SPEC_V2.decode("UicRailTicketData", data)
-                )
-            elif version == 3:
-                return cls(
-                    version=version,
-                    data=ASN1_SPEC_V3.decode("UicRailTicketData", data)
-                )
-            else:
-                raise util.UICException("Unsupported UIC rail ticket flexible data version")
-        except asn1tools.DecodeError as e:
+            if decoder := get_decoder(self.version):
+                return decoder.decode_summary(self.raw)
+            return decode_summary(get_spec(self.version), self.raw)
+        except (asn1tools.DecodeError, ValueError, NotImplementedError) as e:
+            # Corrupt strings and lengths surface as plain ValueErrors from the codec, and asn1tools gives up on
+            # some encodings it doesn't support with NotImplementedError
+            raise util.UICException("Failed to decode UIC rail ticket flexible data") from e
+
+    @functools.cached_property
+    def data(self) -> typing.Dict[str, typing.Any]:
+        try:
+            if decoder := get_decoder(self.version):
+                return decoder.decode(self.raw)
+            return get_spec(self.version).decode("UicRailTicketData", self.raw)
+        except (asn1tools.DecodeError, ValueError, NotImplementedError) as e:
             raise util.UICException("Failed to decode UIC rail ticket flexible data") from e
 
     def issuing_rics(self) -> int:
         if self.version in (13, 2, 3):
-            rics = self.data["issuingDetail"].get("issuerNum", 0)
+            rics = self.summary["issuingDetail"].get("issuerNum", 0)
             if rics:
                 return rics
             else:
-                return self.data["issuingDetail"].get("securityProviderNum", 0)
+                return self.summary["issuingDetail"].get("securityProviderNum", 0)
 
     def ticket_id(self) -> str:
         if self.version in (13, 2, 3):
-            return self.data["issuingDetail"].get("issuerPNR", "")
+            return self.summary["issuingDetail"].get("issuerPNR", "")
 
     def issuing_time(self) -> typing.Optional[datetime.datetime]:
         if self.version in (13, 2, 3):
-            date = datetime.datetime(self.data["issuingDetail"]["issuingYear"], 1, 1)
-            date += datetime.timedelta(days=self.data["issuingDetail"]["issuingDay"] - 1)
-            if "issuingTime" in self.data["issuingDetail"]:
-                date += datetime.timedelta(minutes=self.data["issuingDetail"]["issuingTime"])
+            date = datetime.datetime(self.summary["issuingDetail"]["issuingYear"], 1, 1)
+            date += datetime.timedelta(days=self.summary["issuingDetail"]["issuingDay"] - 1)
+            if "issuingTime" in self.summary["issuingDetail"]:
+                date += datetime.timedelta(minutes=self.summary["issuingDetail"]["issuingTime"])
             return pytz.utc.localize(date)
 
     def specimen(self) -> bool:
         if self.version in (13, 2, 3):
-            return self.data["issuingDetail"]["specimen"]
\ No newline at end of file
+            return self.summary["issuingDetail"]["specimen"]
\ No newline at end of file
@@ -2,20 +2,22 @@ import typing
 import django.core.files.storage
 import json
 
+RICS_FILE = "rics_codes.json"
+
 RICS = None
 
-def get_rics_list() -> typing.Dict[str, dict]:
+def get_rics_list() -> typing.Dict[int, dict]:
     global RICS
 
-    if RICS:
+    if RICS is not None:
         return RICS
 
     uic_storage = django.core.files.storage.storages["uic-data"]
-    with uic_storage.open("rics_codes.json", "r") as f:
-        RICS = json.loads(f.read())
+    with uic_storage.open(RICS_FILE, "r") as f:
+        RICS = {int(code): org for code, org in json.loads(f.read()).items()}
 
     return RICS
 
 
 def get_rics(code: int) -> typing.Optional[dict]:
-    return get_rics_list().get(str(code))
\ No newline at end of file
+    return get_rics_list().get(code)
@@ -0,0 +1,149 @@
+import base64
+import collections
+import dataclasses
+import enum
+import json
+import threading
+import typing
+import Crypto.Hash.TupleHash128
+from django.conf import settings
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import dsa, ec
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+
+from . import envelope
+from .. import storage_file
+
+KEYS_FILE = "public_keys.json"
+
+RESULTS: "collections.OrderedDict[bytes, SignatureStatus]" = collections.OrderedDict()
+# The decode worker verifies from more than one thread
+RESULTS_LOCK = threading.Lock()
+
+
+class SignatureStatus(enum.Enum):
+    VALID = "valid"
+    INVALID = "invalid"
+    UNKNOWN_KEY = "unknown-key"
+
+
+@dataclasses.dataclass
+class PublicKey:
+    issuer_rics: int
+    key_id: str
+    issuer_name: str
+    public_key: typing.Union[dsa.DSAPublicKey, ec.EllipticCurvePublicKey]
+    hash_algorithm: hashes.HashAlgorithm
+
+    def verify(self, signature: bytes, data: bytes) -> bool:
+        try:
+            if isinstance(self.public_key, dsa.DSAPublicKey):
+                self.public_key.verify(signature, data, self.hash_algorithm)
+            else:
+                self.public_key.verify(signature, data, ec.ECDSA(self.hash_algorithm))
+        except InvalidSignature:
+            return False
+        return True
+
+
+def key_id_index(key_id: typing.Union[int, str]) -> str:
+    key_id = str(key_id).strip()
+    return str(int(key_id, 10)) if key_id.isdigit() else key_id
+
+
+def hash_for_key(public_key) -> typing.Optional[hashes.HashAlgorithm]:
+    if isinstance(public_key, dsa.DSAPublicKey):
+        size = public_key.parameters().parameter_numbers().q.bit_length()
+    elif isinstance(public_key, ec.EllipticCurvePublicKey):
+        size = public_key.curve.key_size
+    else:
+        return None
+    if size <= 160:
+        return hashes.SHA1()
+    elif size <= 224:
+        return hashes.SHA224()
+    elif size <= 256:
+        return hashes.SHA256()
+    elif size <= 384:
+        return hashes.SHA384()
+    return hashes.SHA512()
+
+
+def load_keys(storage, _file_name: str, _modified) -> typing.Dict[typing.Tuple[int, str], PublicKey]:
+    with storage.open(KEYS_FILE, "r") as f:
+        data = json.loads(f.read())
+
+    keys = {}
+    for key in data["keys"]:
+        try:
+            public_key = serialization.load_der_public_key(base64.b64decode(key["public_key"]))
+        except ValueError:
+            continue
+        if not (hash_algorithm := hash_for_key(public_key)):
+            continue
+        key_id = key_id_index(key["key_id"])
+        keys[(key["issuer_rics"], key_id)] = PublicKey(
+            issuer_rics=key["issuer_rics"],
+            key_id=key_id,
+            issuer_name=key["issuer_name"],
+            public_key=public_key,
+            hash_algorithm=hash_algorithm,
+        )
+
+    # Cached results are keyed by key ID, not the key itself
+    with RESULTS_LOCK:
+        RESULTS.clear()
+    return keys
+
+
+KEYS = storage_file.StorageFile("uic-data", (KEYS_FILE,), load_keys, {})
+
+
+def get_keys() -> typing.Dict[typing.Tuple[int, str], PublicKey]:
+    return KEYS.get()
+
+
+def get_key(issuer_rics: int, key_id: typing.Union[int, str]) -> typing.Optional[PublicKey]:
+    return get_keys().get((issuer_rics, key_id_index(key_id)))
+
+
+def decode_signature(signature: bytes) -> bytes:
+    # Signatures are DER encoded and zero padded to the fixed field size, some issuers put raw r || s instead
+    if len(signature) >= 2 and signature[0] == 0x30 and signature[1] < 0x80 and 2 + signature[1] <= len(signature):
+        return signature[:2 + signature[1]]
+    half = len(signature) // 2
+    return encode_dss_signature(int.from_bytes(signature[:half], "big"), int.from_bytes(signature[half:], "big"))
+
+
+def verify(ticket_envelope: "envelope.Envelope", raw_bytes: bytes) -> SignatureStatus:
+    key = get_key(ticket_envelope.issuer_rics, ticket_envelope.signature_key_id)
+    if not key:
+        return SignatureStatus.UNKNOWN_KEY
+
+    signed_data = ticket_envelope.signed_data(raw_bytes)
+    hd = Crypto.Hash.TupleHash128.new(digest_bytes=16)
+    hd.update(key.issuer_rics.to_bytes(4, "big"))
+    hd.update(key.key_id.encode("utf-8"))
+    hd.update(ticket_envelope.signature)
+    hd.update(signed_data)
+    cache_key = hd.digest()
+
+    with RESULTS_LOCK:
+        if status := RESULTS.get(cache_key):
+            RESULTS.move_to_end(cache_key)
+            return status
+
+    try:
+        signature = decode_signature(ticket_envelope.signature)
+    except ValueError:
+        status = SignatureStatus.INVALID
+    else:
+        status = SignatureStatus.VALID if key.verify(signature, signed_data) else SignatureStatus.INVALID
+
+    with RESULTS_LOCK:
+        RESULTS[cache_key] = status
+        RESULTS.move_to_end(cache_key)
+        while len(RESULTS) > settings.UIC_SIGNATURE_CACHE_SIZE:
+            RESULTS.popitem(last=False)
+    return status
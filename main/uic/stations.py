@@ -1,9 +1,228 @@
+import bisect
+import math
+import mmap
+import os
+import pathlib
+import struct
+import tempfile
 import typing
 import django.core.files.storage
+from django.conf import settings
 import json
+from .. import storage_file
+
+STATIONS_FILE = "stations.json"
+STATION_INDEX_FILE = "stations.idx"
+STATION_INDEX_MAGIC = b"UICSTN02"
+HEADER = struct.Struct("=8sIII")
+RECORD = struct.Struct("=iiIII")
+NO_COORDINATE = -2 ** 31
+GRID_CELLS_PER_DEGREE = 10
+GRID_COLUMNS = 360 * GRID_CELLS_PER_DEGREE
+GRID_ROWS = 180 * GRID_CELLS_PER_DEGREE
+EARTH_RADIUS_KM = 6371.0
 
 STATIONS = None
 
+
+def grid_row(latitude: int) -> int:
+    return min(max((latitude + 90_000_000) * GRID_CELLS_PER_DEGREE // 1_000_000, 0), GRID_ROWS - 1)
+
+
+def grid_column(longitude: int) -> int:
+    return min(max((longitude + 180_000_000) * GRID_CELLS_PER_DEGREE // 1_000_000, 0), GRID_COLUMNS - 1)
+
+
+def distance_km(latitude_a: float, longitude_a: float, latitude_b: float, longitude_b: float) -> float:
+    latitude_a, longitude_a, latitude_b, longitude_b = map(
+        math.radians, (latitude_a, longitude_a, latitude_b, longitude_b)
+    )
+    h = math.sin((latitude_b - latitude_a) / 2) ** 2 + \
+        math.cos(latitude_a) * math.cos(latitude_b) * math.sin((longitude_b - longitude_a) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+class StationIndex:
+    # Layout: header, sorted UIC codes, one record per code, grid cell keys, offsets of each cell into the grid
+    # members, station numbers sorted by grid cell, string offsets, UTF-8 string table
+    def __init__(self, buffer):
+        try:
+            self.parse(buffer)
+        except (struct.error, TypeError, IndexError) as e:
+            raise ValueError("Truncated station index") from e
+
+    def parse(self, buffer):
+        magic, count, string_count, cell_count = HEADER.unpack_from(buffer, 0)
+        if magic != STATION_INDEX_MAGIC:
+            raise ValueError("Not a station index")
+
+        view = memoryview(buffer)
+        offset = HEADER.size
+        self.codes = view[offset:offset + 4 * count].cast("I")
+        offset += 4 * count
+        self.records = view[offset:offset + RECORD.size * count]
+        offset += RECORD.size * count
+        self.cell_keys = view[offset:offset + 4 * cell_count].cast("I")
+        offset += 4 * cell_count
+        self.cell_starts = view[offset:offset + 4 * (cell_count + 1)].cast("I")
+        offset += 4 * (cell_count + 1)
+        member_count = self.cell_starts[cell_count]
+        self.cell_members = view[offset:offset + 4 * member_count].cast("I")
+        offset += 4 * member_count
+        self.string_offsets = view[offset:offset + 4 * (string_count + 1)].cast("I")
+        offset += 4 * (string_count + 1)
+        self.strings = view[offset:]
+        if len(self.strings) != self.string_offsets[string_count]:
+            raise ValueError("Truncated station index")
+
+    def __len__(self):
+        return len(self.codes)
+
+    def string(self, i: int) -> str:
+        return str(self.strings[self.string_offsets[i]:self.string_offsets[i + 1]], "utf-8")
+
+    def find(self, code: int) -> typing.Optional[int]:
+        i = bisect.bisect_left(self.codes, code)
+        if i < len(self.codes) and self.codes[i] == code:
+            return i
+        return None
+
+    def station(self, i: int) -> dict:
+        latitude, longitude, name, country, time_zone = RECORD.unpack_from(self.records, i * RECORD.size)
+        station = {
+            "name": self.string(name),
+            "uic": str(self.codes[i]),
+            "country": self.string(country),
+        }
+        if latitude != NO_COORDINATE:
+            station["latitude"] = latitude / 1e6
+            station["longitude"] = longitude / 1e6
+        if time_zone := self.string(time_zone):
+            station["time_zone"] = time_zone
+        return station
+
+    def in_box(self, min_latitude: int, min_longitude: int, max_latitude: int, max_longitude: int) -> typing.List[int]:
+        column_min = grid_column(min_longitude)
+        column_max = grid_column(max_longitude)
+        out = []
+        for row in range(grid_row(min_latitude), grid_row(max_latitude) + 1):
+            start = bisect.bisect_left(self.cell_keys, row * GRID_COLUMNS + column_min)
+            end = bisect.bisect_right(self.cell_keys, row * GRID_COLUMNS + column_max, lo=start)
+            for i in self.cell_members[self.cell_starts[start]:self.cell_starts[end]]:
+                latitude, longitude = RECORD.unpack_from(self.records, i * RECORD.size)[:2]
+                if min_latitude <= latitude <= max_latitude and min_longitude <= longitude <= max_longitude:
+                    out.append(i)
+        return out
+
+
+def parse_coordinate(value: typing.Optional[str]) -> typing.Optional[int]:
+    try:
+        return round(float(value) * 1e6)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_station_index(stations: typing.Iterable[dict]) -> bytes:
+    by_code = {}
+    for station in stations:
+        try:
+            code = int(station.get("uic"), 10)
+        except (TypeError, ValueError):
+            continue
+        if 0 <= code < 2 ** 32:
+            by_code[code] = station
+
+    strings = {}
+
+    def intern(value: typing.Optional[str]) -> int:
+        return strings.setdefault(value or "", len(strings))
+
+    intern("")
+    codes = sorted(by_code)
+    records = bytearray()
+    for code in codes:
+        station = by_code[code]
+        latitude = parse_coordinate(station.get("latitude"))
+        longitude = parse_coordinate(station.get("longitude"))
+        if latitude is None or longitude is None:
+            latitude = longitude = NO_COORDINATE
+        records += RECORD.pack(
+            latitude, longitude,
+            intern(station.get("name")), intern(station.get("country")), intern(station.get("time_zone"))
+        )
+
+    cells = sorted(
+        (grid_row(latitude) * GRID_COLUMNS + grid_column(longitude), i)
+        for i, (latitude, longitude, *_) in enumerate(RECORD.iter_unpack(records))
+        if latitude != NO_COORDINATE
+    )
+    cell_keys = []
+    cell_starts = []
+    for j, (key, _) in enumerate(cells):
+        if not cell_keys or cell_keys[-1] != key:
+            cell_keys.append(key)
+            cell_starts.append(j)
+    cell_starts.append(len(cells))
+
+    string_offsets = [0]
+    string_data = bytearray()
+    for value in strings:
+        string_data += value.encode("utf-8")
+        string_offsets.append(len(string_data))
+
+    return b"".join((
+        HEADER.pack(STATION_INDEX_MAGIC, len(codes), len(strings), len(cell_keys)),
+        struct.pack(f"={len(codes)}I", *codes),
+        records,
+        struct.pack(f"={len(cell_keys)}I", *cell_keys),
+        struct.pack(f"={len(cell_starts)}I", *cell_starts),
+        struct.pack(f"={len(cells)}I", *(i for _, i in cells)),
+        struct.pack(f"={len(string_offsets)}I", *string_offsets),
+        string_data,
+    ))
+
+
+def local_index_path(storage, modified) -> pathlib.Path:
+    # Always map a private copy, download-uic-data rewrites the stored index in place and truncating a mapped file
+    # kills the process with SIGBUS
+    cache_dir = pathlib.Path(settings.UIC_DATA_CACHE_DIR)
+    local_path = cache_dir / f"stations-{int(modified.timestamp() * 1_000_000)}.idx"
+    if not local_path.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with storage.open(STATION_INDEX_FILE, "rb") as src:
+            with tempfile.NamedTemporaryFile("wb", dir=cache_dir, delete=False) as f:
+                for chunk in src.chunks():
+                    f.write(chunk)
+        os.replace(f.name, local_path)
+
+        # Other processes may still have an old copy mapped, the kernel keeps it around until they drop it
+        for old_path in cache_dir.glob("stations-*.idx"):
+            if old_path != local_path:
+                old_path.unlink(missing_ok=True)
+    return local_path
+
+
+def load_station_index(storage, _file_name: str, modified) -> StationIndex:
+    local_path = local_index_path(storage, modified)
+    try:
+        with open(local_path, "rb") as f:
+            return StationIndex(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except ValueError:
+        local_path.unlink(missing_ok=True)
+        raise
+
+
+STATION_INDEX = storage_file.StorageFile("uic-data", (STATION_INDEX_FILE,), load_station_index)
+
+
+def get_station_index() -> typing.Optional[StationIndex]:
+    try:
+        return STATION_INDEX.get()
+    except ValueError:
+        # Copied while download-uic-data was still writing it, keep what we have and try again on the next check
+        return STATION_INDEX.value
+
+
 def get_stations_list() -> typing.Dict[str, typing.Any]:
     global STATIONS
 
@@ -11,12 +230,97 @@ def get_stations_list() -> typing.Dict[str, typing.Any]:
         return STATIONS
 
     uic_storage = django.core.files.storage.storages["uic-data"]
-    with uic_storage.open("stations.json", "r") as f:
+    with uic_storage.open(STATIONS_FILE, "r") as f:
         STATIONS = json.load(f)
 
     return STATIONS
 
 
 def get_station_by_uic(code) -> typing.Optional[dict]:
-    if i := get_stations_list()["uic_codes"].get(str(code)):
-        return get_stations_list()["stations"][i]
\ No newline at end of file
+    if (index := get_station_index()) is not None:
+        try:
+            i = index.find(int(code))
+        except (TypeError, ValueError):
+            return None
+        return index.station(i) if i is not None else None
+
+    if (i := get_stations_list()["uic_codes"].get(str(code))) is not None:
+        return get_stations_list()["stations"][i]
+
+
+def get_stations_in_box(
+        min_latitude: float, min_longitude: float, max_latitude: float, max_longitude: float
+) -> typing.List[dict]:
+    if (index := get_station_index()) is None:
+        return []
+
+    return [index.station(i) for i in index.in_box(
+        round(min_latitude * 1e6), round(min_longitude * 1e6), round(max_latitude * 1e6), round(max_longitude * 1e6)
+    )]
+
+
+def get_stations_along_route(
+        from_latitude: float, from_longitude: float, to_latitude: float, to_longitude: float, corridor_km: float,
+        limit: typing.Optional[int] = None, exclude: typing.Collection[str] = ()
+) -> typing.List[dict]:
+    if (index := get_station_index()) is None:
+        return []
+
+    # A flat projection is close enough over the few hundred km a ticket covers
+    scale = math.cos(math.radians((from_latitude + to_latitude) / 2))
+
+    def project(latitude: float, longitude: float) -> typing.Tuple[float, float]:
+        return math.radians(longitude) * scale * EARTH_RADIUS_KM, math.radians(latitude) * EARTH_RADIUS_KM
+
+    from_x, from_y = project(from_latitude, from_longitude)
+    to_x, to_y = project(to_latitude, to_longitude)
+    route_x, route_y = to_x - from_x, to_y - from_y
+    route_length = route_x * route_x + route_y * route_y
+
+    latitude_delta = math.degrees(corridor_km / EARTH_RADIUS_KM)
+    longitude_delta = latitude_delta / max(
+        min(math.cos(math.radians(from_latitude)), math.cos(math.radians(to_latitude))), 0.01
+    )
+    candidates = []
+    for i in index.in_box(
+            round((min(from_latitude, to_latitude) - latitude_delta) * 1e6),
+            round(max(min(from_longitude, to_longitude) - longitude_delta, -180) * 1e6),
+            round((max(from_latitude, to_latitude) + latitude_delta) * 1e6),
+            round(min(max(from_longitude, to_longitude) + longitude_delta, 180) * 1e6)
+    ):
+        if str(index.codes[i]) in exclude:
+            continue
+        station_latitude, station_longitude = RECORD.unpack_from(index.records, i * RECORD.size)[:2]
+        x, y = project(station_latitude / 1e6, station_longitude / 1e6)
+        position = ((x - from_x) * route_x + (y - from_y) * route_y) / route_length if route_length else 0
+        position = min(max(position, 0), 1)
+        if math.hypot(from_x + position * route_x - x, from_y + position * route_y - y) <= corridor_km:
+            candidates.append((position, i))
+
+    candidates.sort()
+    if limit is not None and len(candidates) > limit:
+        # Spread out along the route instead of bunching up at the start
+        candidates = [candidates[(2 * k + 1) * len(candidates) // (2 * limit)] for k in range(limit)]
+    return [index.station(i) for _, i in candidates]
+
+
+def get_stations_near(
+        latitude: float, longitude: float, radius_km: float, limit: typing.Optional[int] = None
+) -> typing.List[dict]:
+    if (index := get_station_index()) is None:
+        return []
+
+    latitude_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    longitude_delta = latitude_delta / max(math.cos(math.radians(latitude)), 0.01)
+    candidates = []
+    for i in index.in_box(
+            round((latitude - latitude_delta) * 1e6), round(max(longitude - longitude_delta, -180) * 1e6),
+            round((latitude + latitude_delta) * 1e6), round(min(longitude + longitude_delta, 180) * 1e6)
+    ):
+        station_latitude, station_longitude = RECORD.unpack_from(index.records, i * RECORD.size)[:2]
+        distance = distance_km(latitude, longitude, station_latitude / 1e6, station_longitude / 1e6)
+        if distance <= radius_km:
+            candidates.append((distance, i))
+
+    candidates.sort()
+    return [index.station(i) for _, i in candidates[:limit]]
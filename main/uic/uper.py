@@ -0,0 +1,151 @@
+import typing
+import asn1tools.codecs
+import asn1tools.codecs.uper
+
+DecodeError = asn1tools.codecs.DecodeError
+OutOfDataError = asn1tools.codecs.OutOfDataError
+
+
+def load(data: bytes) -> typing.Tuple[int, int]:
+    return int.from_bytes(data, 'big'), 8 * len(data)
+
+
+def read_bits(v: int, n: int, p: int, k: int) -> typing.Tuple[int, int]:
+    if p + k > n:
+        raise OutOfDataError(p)
+    return (v >> (n - p - k)) & ((1 << k) - 1), p + k
+
+
+def skip_bits(n: int, p: int, k: int) -> int:
+    if p + k > n:
+        raise OutOfDataError(p)
+    return p + k
+
+
+def read_length(v: int, n: int, p: int) -> typing.Tuple[int, int]:
+    value, p = read_bits(v, n, p, 8)
+    if value & 0x80 == 0x00:
+        return value, p
+    elif value & 0xc0 == 0x80:
+        low, p = read_bits(v, n, p, 8)
+        return ((value & 0x7f) << 8) | low, p
+    elif value == 0xc1:
+        return 16384, p
+    elif value == 0xc2:
+        return 32768, p
+    elif value == 0xc3:
+        return 49152, p
+    elif value == 0xc4:
+        return 65536, p
+    else:
+        raise DecodeError(f"Bad length determinant fragmentation value 0x{value:02x}.")
+
+
+def read_normally_small_number(v: int, n: int, p: int) -> typing.Tuple[int, int]:
+    bit, p = read_bits(v, n, p, 1)
+    if not bit:
+        return read_bits(v, n, p, 6)
+    length, p = read_length(v, n, p)
+    return read_bits(v, n, p, 8 * length)
+
+
+def read_normally_small_length(v: int, n: int, p: int) -> typing.Tuple[int, int]:
+    bit, p = read_bits(v, n, p, 1)
+    if not bit:
+        value, p = read_bits(v, n, p, 6)
+        return value + 1, p
+    bit, p = read_bits(v, n, p, 1)
+    if not bit:
+        return read_bits(v, n, p, 7)
+    # asn1tools doesn't support these either, they never show up in a valid FCB record
+    raise DecodeError("Normally small length number >64 is not supported.")
+
+
+def read_unconstrained(v: int, n: int, p: int) -> typing.Tuple[int, int]:
+    length, p = read_length(v, n, p)
+    number_of_bits = 8 * length
+    value, p = read_bits(v, n, p, number_of_bits)
+    if value & (1 << (number_of_bits - 1)):
+        value -= 1 << number_of_bits
+    return value, p
+
+
+def read_octets(v: int, n: int, p: int, length: int) -> typing.Tuple[bytes, int]:
+    value, p = read_bits(v, n, p, 8 * length)
+    return value.to_bytes(length, 'big'), p
+
+
+def read_octets_unbound(v: int, n: int, p: int) -> typing.Tuple[bytes, int]:
+    chunks = []
+    while True:
+        length, p = read_length(v, n, p)
+        chunk, p = read_octets(v, n, p, length)
+        chunks.append(chunk)
+        if length < 16384:
+            break
+    return b"".join(chunks), p
+
+
+def read_utf8(v: int, n: int, p: int) -> typing.Tuple[str, int]:
+    value, p = read_octets_unbound(v, n, p)
+    return value.decode("utf-8"), p
+
+
+def read_chars(
+        v: int, n: int, p: int, length: int, bits: int, table: typing.Optional[typing.Sequence[int]]
+) -> typing.Tuple[str, int]:
+    total, p = read_bits(v, n, p, length * bits)
+    mask = (1 << bits) - 1
+    codes = bytearray(length)
+    for i in range(length):
+        codes[i] = (total >> (bits * (length - 1 - i))) & mask
+    if table is not None:
+        try:
+            codes = bytearray(table[c] for c in codes)
+        except (IndexError, TypeError):
+            raise DecodeError("Invalid character in permitted alphabet.")
+    return codes.decode("ascii"), p
+
+
+def read_chars_unbound(
+        v: int, n: int, p: int, bits: int, table: typing.Optional[typing.Sequence[int]]
+) -> typing.Tuple[str, int]:
+    chunks = []
+    while True:
+        length, p = read_length(v, n, p)
+        chunk, p = read_chars(v, n, p, length, bits, table)
+        chunks.append(chunk)
+        if length < 16384:
+            break
+    return "".join(chunks), p
+
+
+def skip_additions(v: int, n: int, p: int) -> int:
+    length, p = read_normally_small_length(v, n, p)
+    present, p = read_bits(v, n, p, length)
+    for i in range(length):
+        if present & (1 << (length - i - 1)):
+            open_type_length, p = read_length(v, n, p)
+            p = skip_bits(n, p, 8 * open_type_length)
+    return p
+
+
+def fallback(type_, v: int, n: int, p: int) -> typing.Tuple[typing.Any, int]:
+    decoder = asn1tools.codecs.uper.Decoder(bytearray())
+    decoder.value = format(v, f"0{n}b") if n else ""
+    decoder.total_number_of_bits = n
+    decoder.number_of_bits = n - p
+    value = type_.decode(decoder)
+    return value, n - decoder.number_of_bits
+
+
+def resolve(spec, path: typing.Sequence[str]):
+    type_ = spec.types[path[0]]._type
+    for name in path[1:]:
+        if name == "[]":
+            type_ = type_.element_type
+        elif hasattr(type_, "root_members"):
+            type_ = next(m for m in type_.root_members if m.name == name)
+        else:
+            type_ = next(m for m in type_.root_index_to_member.values() if m.name == name)
+    return type_
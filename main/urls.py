@@ -3,6 +3,8 @@ from . import views
 
 urlpatterns = [
     path('', views.passes.index, name='index'),
+    path('batch/', views.passes.batch, name='batch'),
+    path('decode/<uuid:pk>/', views.passes.decode_job, name='decode_job'),
     path('ticket/<str:pk>/', views.passes.view_ticket, name='ticket'),
     path('ticket/<str:pk>/pkpass/', views.passes.ticket_pkpass, name='ticket_pkpass'),
 
@@ -0,0 +1,107 @@
+import base64
+import dataclasses
+import json
+import mmap
+import struct
+import typing
+import dacite
+
+from . import pki, util
+
+BUNDLE_FILE = "certificates.bundle"
+MAGIC = b"VDVB"
+VERSION = 1
+HEADER = struct.Struct(">4sBI")
+ENTRY = struct.Struct(">8sIIII")
+
+
+@dataclasses.dataclass
+class BundleEntry:
+    ca_reference: bytes
+    data: bytes
+    certificate_data: typing.Optional["pki.CertificateData"]
+
+
+def encode_certificate_data(certificate_data: "pki.CertificateData") -> bytes:
+    def dict_factory(elements):
+        return {
+            k: base64.b64encode(v).decode("ascii") if isinstance(v, bytes) else v
+            for k, v in elements
+        }
+
+    return json.dumps(dataclasses.asdict(certificate_data, dict_factory=dict_factory)).encode("utf-8")
+
+
+def decode_certificate_data(data: bytes) -> "pki.CertificateData":
+    config = dacite.Config(type_hooks={bytes: base64.b64decode})
+    return dacite.from_dict(data_class=pki.CertificateData, data=json.loads(data), config=config)
+
+
+def build_bundle(entries: typing.List[BundleEntry]) -> bytes:
+    table = bytearray()
+    payload = bytearray()
+    payload_offset = HEADER.size + ENTRY.size * len(entries)
+
+    for entry in entries:
+        certificate_data = encode_certificate_data(entry.certificate_data) if entry.certificate_data else b""
+        data_offset = payload_offset + len(payload)
+        payload += entry.data
+        certificate_data_offset = payload_offset + len(payload)
+        payload += certificate_data
+        table += ENTRY.pack(
+            entry.ca_reference, data_offset, len(entry.data), certificate_data_offset, len(certificate_data)
+        )
+
+    return HEADER.pack(MAGIC, VERSION, len(entries)) + bytes(table) + bytes(payload)
+
+
+def read_bundle(data: typing.Union[bytes, mmap.mmap]) -> typing.List[BundleEntry]:
+    with memoryview(data) as buffer:
+        if len(buffer) < HEADER.size:
+            raise util.VDVException("Certificate bundle too short")
+
+        magic, version, count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise util.VDVException("Invalid certificate bundle magic")
+        if version != VERSION:
+            raise util.VDVException("Unsupported certificate bundle version")
+        if len(buffer) < HEADER.size + ENTRY.size * count:
+            raise util.VDVException("Certificate bundle offset table too short")
+
+        entries = []
+        for i in range(count):
+            ca_reference, data_offset, data_length, certificate_data_offset, certificate_data_length = \
+                ENTRY.unpack_from(buffer, HEADER.size + ENTRY.size * i)
+            if data_offset + data_length > len(buffer) or \
+                    certificate_data_offset + certificate_data_length > len(buffer):
+                raise util.VDVException("Certificate bundle entry out of range")
+
+            if certificate_data_length:
+                try:
+                    certificate_data = decode_certificate_data(bytes(
+                        buffer[certificate_data_offset:certificate_data_offset + certificate_data_length]
+                    ))
+                except (ValueError, dacite.DaciteError) as e:
+                    raise util.VDVException("Invalid certificate data in bundle") from e
+            else:
+                certificate_data = None
+
+            entries.append(BundleEntry(
+                ca_reference=ca_reference,
+                data=bytes(buffer[data_offset:data_offset + data_length]),
+                certificate_data=certificate_data,
+            ))
+
+    return entries
+
+
+def load_bundle(certificate_storage) -> typing.List[BundleEntry]:
+    try:
+        path = certificate_storage.path(BUNDLE_FILE)
+    except NotImplementedError:
+        with certificate_storage.open(BUNDLE_FILE, "rb") as f:
+            return read_bundle(f.read())
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return read_bundle(data)
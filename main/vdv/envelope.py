@@ -1,7 +1,6 @@
 import dataclasses
-import ber_tlv.tlv
 
-from . import pki, util, iso9796
+from . import pki, util, iso9796, tlv
 
 
 @dataclasses.dataclass
@@ -17,40 +16,37 @@ class EnvelopeV2:
 
     @classmethod
     def parse(cls, data: bytes) -> "EnvelopeV2":
-        try:
-            elms = ber_tlv.tlv.Tlv.Parser.parse(data, True, [], False, 0)
-        except Exception as e:
-            raise util.VDVException("Failed to parse envelope, invalid BER-TLV") from e
+        reader = tlv.Reader(data)
 
         signature = None
         residual_data = None
         certificate = None
         ca_reference = None
 
-        for tag, data in elms:
+        for tag, offset, length in reader:
             if tag == util.TAG_SIGNATURE:
-                if len(data) != 128:
+                if length != 128:
                     raise util.VDVException("Invalid signature length")
                 if signature:
                     raise util.VDVException("Multiple signatures")
-                signature = data
+                signature = reader.value(offset, length)
 
             elif tag == util.REMAINING_DATA:
                 if residual_data:
                     raise util.VDVException("Multiple residual signature data")
-                residual_data = data
+                residual_data = reader.value(offset, length)
 
             elif tag == util.TAG_CERTIFICATE:
-                certificate = pki.Certificate.parse_tags(data)
+                certificate = pki.Certificate.parse_tags(reader.children(offset, length))
 
             elif tag == util.TAG_CA_REFERENCE:
-                if len(data) != 8:
+                if length != 8:
                     raise util.VDVException("Invalid certification authority reference length")
 
                 if ca_reference:
                     raise util.VDVException("Multiple certification authority references")
 
-                ca_reference = pki.CAReference.from_bytes(data)
+                ca_reference = pki.CAReference.from_bytes(reader.value(offset, length))
             else:
                 raise util.VDVException(f"Unknown tag: 0x{tag:02X}")
 
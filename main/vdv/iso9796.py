@@ -1,13 +1,11 @@
 import hashlib
-from . import util, pki
+from . import util, pki, rsa
 
 
 def decrypt_with_cert(signature: bytes, signature_residual: bytes, ca: "pki.CertificateData") -> bytes:
     assert isinstance(ca.public_key, pki.RSAPublicKey)
 
-    h = int.from_bytes(signature, 'big')
-    m = pow(h, ca.public_key.exponent, ca.public_key.modulus)
-    data = m.to_bytes(ca.public_key.modulus_len, 'big')
+    data = rsa.public_operation(signature, ca.public_key)
 
     if data[0] != 0x6A:
         raise util.VDVException("Invalid message header - signature verification failed")
@@ -1,26 +1,51 @@
 import typing
-import django.core.files.storage
 import json
+from .. import storage_file
 
-ORG_IDS = None
+ORG_IDS_FILE = "org_ids.json"
+LEGACY_ORG_IDS_FILE = "orgs.json"
 
-def get_org_ids_list() -> typing.Dict[str, dict]:
-    global ORG_IDS
 
-    if ORG_IDS:
-        return ORG_IDS
+def build_org_ids(orgs: typing.List[dict]) -> typing.List[list]:
+    test_ids = {}
+    ids = {}
+    for org in orgs:
+        if org.get("org_type") != "VDV":
+            continue
+        for org_id, table in ((org.get("id"), ids), (org.get("test_id"), test_ids)):
+            try:
+                table[int(org_id)] = org["name"]
+            except (TypeError, ValueError):
+                pass
 
-    storage = django.core.files.storage.storages["vdv-certs"]
-    with storage.open("orgs.json", "r") as f:
-        ORG_IDS = json.loads(f.read())
+    out = [[org_id, name, True] for org_id, name in test_ids.items() if org_id not in ids]
+    out.extend([org_id, name, False] for org_id, name in ids.items())
+    out.sort()
+    return out
 
-    return ORG_IDS
 
+def load_org_ids(storage, file_name: str, _modified) -> typing.Dict[int, typing.Tuple[str, bool]]:
+    if file_name == ORG_IDS_FILE:
+        with storage.open(ORG_IDS_FILE, "r") as f:
+            data = json.loads(f.read())
+    else:
+        with storage.open(LEGACY_ORG_IDS_FILE, "r") as f:
+            legacy = json.loads(f.read())
+        data = {"orgs": build_org_ids(legacy["orgs"])}
 
-def get_org(code: int) -> typing.Tuple[typing.Optional[dict], bool]:
-    org_list = get_org_ids_list()
-    if org_pos := org_list["vdv_ids"].get(str(code)):
-        return org_list["orgs"][org_pos], False
-    elif org_pos := org_list["vdv_test_ids"].get(str(code)):
-        return org_list["orgs"][org_pos], True
-    return None, False
\ No newline at end of file
+    names = {}
+    return {
+        org_id: (names.setdefault(name, name), is_test)
+        for org_id, name, is_test in data["orgs"]
+    }
+
+
+ORG_IDS = storage_file.StorageFile("vdv-certs", (ORG_IDS_FILE, LEGACY_ORG_IDS_FILE), load_org_ids, {})
+
+
+def get_org_ids_list() -> typing.Dict[int, typing.Tuple[str, bool]]:
+    return ORG_IDS.get()
+
+
+def get_org(code: int) -> typing.Tuple[typing.Optional[str], bool]:
+    return get_org_ids_list().get(code, (None, False))
@@ -1,12 +1,16 @@
+import collections
 import dataclasses
 import typing
 import pathlib
-import ber_tlv.tlv
+import json
+import time
 import hashlib
 import string
+import threading
 import django.core.files.storage
+import Crypto.Hash.TupleHash128
 
-from . import iso9796, util
+from . import iso9796, util, bundle, rsa, tlv
 
 ROOT = pathlib.Path(__file__).parent
 SHA1 = [1, 3, 14, 3, 2, 26]
@@ -47,9 +51,12 @@ class CAReference:
             return None
 
     def hex_name(self):
-        full_name = self.name + bytes([self.service_indicator, self.algorithm_reference, self.year - 1990])
+        full_name = self.to_bytes()
         return ":".join(f"{full_name[i]:02x}" for i in range(len(full_name)))
 
+    def to_bytes(self) -> bytes:
+        return self.name + bytes([self.service_indicator, self.algorithm_reference, self.year - 1990])
+
     @classmethod
     def from_bytes(cls, data: bytes) -> "CAReference":
         if len(data) != 8:
@@ -71,40 +78,143 @@ class RawCertificate:
     filename: str
     ca_reference: CAReference
     data: bytes
+    certificate_data: typing.Optional["CertificateData"] = None
+
+    @classmethod
+    def load(cls, certificate_storage, filename: str) -> typing.Optional["RawCertificate"]:
+        if not filename.endswith(".der"):
+            return None
+        try:
+            car_bytes = bytes.fromhex(filename[:-4])
+            ca_reference = CAReference.from_bytes(car_bytes)
+        except ValueError:
+            return None
+        with certificate_storage.open(filename, "rb") as f:
+            data = f.read()
+        return cls(
+            filename=filename,
+            ca_reference=ca_reference,
+            data=data
+        )
+
+    @classmethod
+    def from_bundle_entry(cls, entry: "bundle.BundleEntry") -> "RawCertificate":
+        return cls(
+            filename=f"{entry.ca_reference.hex()}.der",
+            ca_reference=CAReference.from_bytes(entry.ca_reference),
+            data=entry.data,
+            certificate_data=entry.certificate_data
+        )
+
 
 class CertificateStore:
-    certificates: typing.List[RawCertificate]
+    GENERATION_FILE = "generation.json"
+    REFRESH_INTERVAL = 60
+
+    certificates: typing.Dict[bytes, RawCertificate]
+    generation: typing.Optional[dict]
+    last_refresh: float
 
     def __init__(self):
-        self.certificates = []
-
-    def load_certificates(self):
-        certificates = []
-        certificate_storage = django.core.files.storage.storages["vdv-certs"]
-        for filename in certificate_storage.listdir("")[1]:
-            if not filename.endswith(".der"):
-                continue
-            with certificate_storage.open(filename, "rb") as f:
-                data = f.read()
-            try:
-                car_bytes = bytes.fromhex(filename[:-4])
-            except ValueError:
-                continue
-            certificates.append(RawCertificate(
-                filename=filename,
-                ca_reference=CAReference.from_bytes(car_bytes),
-                data=data
-            ))
+        self.certificates = {}
+        self.generation = None
+        self.last_refresh = 0
+
+    @staticmethod
+    def get_storage():
+        return django.core.files.storage.storages["vdv-certs"]
+
+    def load_generation(self) -> typing.Optional[dict]:
+        certificate_storage = self.get_storage()
+        if not certificate_storage.exists(self.GENERATION_FILE):
+            return None
+        try:
+            with certificate_storage.open(self.GENERATION_FILE, "r") as f:
+                return json.load(f)
+        except ValueError as e:
+            raise util.VDVException("Invalid certificate store generation marker") from e
+
+    def load_bundle(self) -> typing.Dict[bytes, RawCertificate]:
+        certificates = {}
+        for entry in bundle.load_bundle(self.get_storage()):
+            certificates[entry.ca_reference] = RawCertificate.from_bundle_entry(entry)
+        return certificates
+
+    def load_certificates(self, use_generation=True):
+        certificate_storage = self.get_storage()
+        generation = self.load_generation() if use_generation else None
+        if generation and generation.get("bundle"):
+            self.certificates = self.load_bundle()
+            self.generation = generation
+            self.last_refresh = time.monotonic()
+            return
+
+        if generation:
+            filenames = generation["certificates"].keys()
+        else:
+            filenames = certificate_storage.listdir("")[1]
+
+        certificates = {}
+        for filename in filenames:
+            if certificate := RawCertificate.load(certificate_storage, filename):
+                certificates[certificate.ca_reference.to_bytes()] = certificate
+
         self.certificates = certificates
+        self.generation = generation
+        self.last_refresh = time.monotonic()
+
+    def refresh(self) -> typing.Set[bytes]:
+        now = time.monotonic()
+        if now - self.last_refresh < self.REFRESH_INTERVAL:
+            return set()
+        self.last_refresh = now
+
+        certificate_storage = self.get_storage()
+        generation = self.load_generation()
+        known_filenames = {c.filename: k for k, c in self.certificates.items()}
+
+        if generation and generation.get("bundle"):
+            if self.generation and generation["bundle"] == self.generation.get("bundle"):
+                return set()
+            certificates = self.load_bundle()
+            changed = {
+                k for k in certificates.keys() | self.certificates.keys()
+                if k not in certificates or k not in self.certificates or
+                   certificates[k].data != self.certificates[k].data
+            }
+            self.certificates = certificates
+            self.generation = generation
+            return changed
+
+        if generation:
+            if self.generation and generation["generation"] == self.generation["generation"]:
+                return set()
+            old_hashes = self.generation["certificates"] if self.generation else {}
+            filenames = generation["certificates"].keys()
+            changed_filenames = [
+                f for f, h in generation["certificates"].items()
+                if f not in known_filenames or old_hashes.get(f) != h
+            ]
+        else:
+            filenames = certificate_storage.listdir("")[1]
+            changed_filenames = [f for f in filenames if f not in known_filenames]
+
+        changed = set()
+        for filename in set(known_filenames.keys()) - set(filenames):
+            changed.add(known_filenames[filename])
+            del self.certificates[known_filenames[filename]]
+
+        for filename in changed_filenames:
+            if certificate := RawCertificate.load(certificate_storage, filename):
+                ca_reference = certificate.ca_reference.to_bytes()
+                self.certificates[ca_reference] = certificate
+                changed.add(ca_reference)
+
+        self.generation = generation
+        return changed
 
     def find_certificate(self, ca_reference: CAReference) -> typing.Optional[RawCertificate]:
-        for certificate in self.certificates:
-            if certificate.ca_reference.name == ca_reference.name and \
-                    certificate.ca_reference.service_indicator == ca_reference.service_indicator and \
-                    certificate.ca_reference.algorithm_reference == ca_reference.algorithm_reference and \
-                    certificate.ca_reference.year == ca_reference.year:
-                return certificate
-        return None
+        return self.certificates.get(ca_reference.to_bytes())
 
 
 @dataclasses.dataclass
@@ -115,16 +225,13 @@ class Certificate:
 
     @classmethod
     def parse(cls, raw_cert: RawCertificate):
-        try:
-            elms = ber_tlv.tlv.Tlv.Parser.parse(raw_cert.data, True, [], False, 0)
-        except Exception as e:
-            raise util.VDVException("Failed to parse certificate") from e
+        reader = tlv.Reader(raw_cert.data)
 
         certificate = None
 
-        for tag, data in elms:
+        for tag, offset, length in reader:
             if tag == util.TAG_CERTIFICATE:
-                certificate = data
+                certificate = reader.children(offset, length)
             else:
                 raise util.VDVException(f"Unknown tag: {hex(tag)}; likely not a certificate")
 
@@ -134,18 +241,18 @@ class Certificate:
         return cls.parse_tags(certificate)
 
     @classmethod
-    def parse_tags(cls, certificate: typing.List[typing.Tuple[int, typing.Any]]):
+    def parse_tags(cls, certificate: tlv.Reader):
         certificate_content = None
         certificate_signature = None
         certificate_signature_remainder = None
 
-        for tag, data in certificate:
+        for tag, offset, length in certificate:
             if tag == util.TAG_CERTIFICATE_CONTENT:
-                certificate_content = data
+                certificate_content = certificate.value(offset, length)
             elif tag == util.TAG_CERTIFICATE_SIGNATURE:
-                certificate_signature = data
+                certificate_signature = certificate.value(offset, length)
             elif tag == util.TAG_CERTIFICATE_SIGNATURE_REMAINDER:
-                certificate_signature_remainder = data
+                certificate_signature_remainder = certificate.value(offset, length)
             else:
                 raise util.VDVException(f"Unknown tag: {hex(tag)}")
 
@@ -172,9 +279,7 @@ class Certificate:
         assert self.content is not None
         assert isinstance(ca.public_key, RSAPublicKey)
 
-        h = int.from_bytes(self.signature, 'big')
-        m = pow(h, ca.public_key.exponent, ca.public_key.modulus)
-        data = m.to_bytes(ca.public_key.modulus_len, 'big')
+        data = rsa.public_operation(self.signature, ca.public_key)
 
         if data[0:2] != b'\x00\x01':
             raise util.VDVException("Invalid message padding - signature verification failed")
@@ -183,37 +288,95 @@ class Certificate:
             offset += 1
         if data[offset] != 0:
             raise util.VDVException("Invalid message padding - signature verification failed")
-        data = data[offset + 1:]
 
-        data = ber_tlv.tlv.Tlv.Parser.parse(data, True, [], False, 0)
-        if len(data) != 1:
+        reader = tlv.Reader(data, offset + 1)
+        elements = list(reader)
+        if len(elements) != 1:
             raise util.VDVException("Invalid message structure - signature verification failed")
-        if data[0][0] != util.TAG_SEQUENCE:
+        if elements[0][0] != util.TAG_SEQUENCE:
             raise util.VDVException("Invalid message structure - signature verification failed")
-        algorithm, signature = data[0][1][0], data[0][1][1]
+
+        elements = list(reader.children(elements[0][1], elements[0][2]))
+        if len(elements) != 2:
+            raise util.VDVException("Invalid message structure - signature verification failed")
+        algorithm, signature = elements
 
         if algorithm[0] != util.TAG_SEQUENCE:
             raise util.VDVException("Invalid message structure - signature verification failed")
-        if algorithm[1][0][0] != util.TAG_OID:
+        algorithm = list(reader.children(algorithm[1], algorithm[2]))
+        if not algorithm or algorithm[0][0] != util.TAG_OID:
             raise util.VDVException("Invalid message structure - signature verification failed")
 
-        signature_oid = decode_oid(algorithm[1][0][1])
+        signature_oid = decode_oid(reader.value(algorithm[0][1], algorithm[0][2]))
         if signature_oid != SHA1:
             raise util.VDVException("Invalid signature algorithm - signature verification failed")
 
-        if len(algorithm[1]) != 2:
+        if len(algorithm) != 2:
             raise util.VDVException("Invalid message structure - signature verification failed")
-        if algorithm[1][1][0] != util.TAG_NULL:
+        if algorithm[1][0] != util.TAG_NULL:
             raise util.VDVException("Invalid message structure - signature verification failed")
 
         if signature[0] != util.TAG_OCTET_STRING:
             raise util.VDVException("Invalid message structure - signature verification failed")
-        signature = signature[1]
+        signature = reader.value(signature[1], signature[2])
 
         if signature != hashlib.sha1(self.content).digest():
             raise util.VDVException("Invalid signature - signature verification failed")
 
 
+class CertificateCache:
+    entries: "collections.OrderedDict[bytes, CertificateData]"
+    max_size: int
+    hits: int
+    misses: int
+
+    def __init__(self, max_size: int):
+        # Shared by the decode worker's threads, an eviction between a lookup and move_to_end raises a KeyError
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(certificate: Certificate, ca_reference: CAReference) -> bytes:
+        hd = Crypto.Hash.TupleHash128.new(digest_bytes=16)
+        hd.update(certificate.signature)
+        hd.update(certificate.signature_residual or b"")
+        hd.update(certificate.content or b"")
+        hd.update(ca_reference.to_bytes())
+        return hd.digest()
+
+    def get(self, key: bytes) -> typing.Optional["CertificateData"]:
+        with self.lock:
+            if certificate_data := self.entries.get(key):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return certificate_data
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, certificate_data: "CertificateData"):
+        with self.lock:
+            self.entries[key] = certificate_data
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def info(self) -> dict:
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.entries),
+                "max_size": self.max_size,
+            }
+
+
 @dataclasses.dataclass
 class CertificateHolderAuthorization:
     name: str
@@ -0,0 +1,83 @@
+import abc
+import time
+import typing
+from django.conf import settings
+
+from . import pki
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+class Backend(abc.ABC):
+    name: str
+
+    @abc.abstractmethod
+    def pow(self, value: int, exponent: int, modulus: int) -> int:
+        pass
+
+    def public_operation(self, data: bytes, public_key: "pki.RSAPublicKey") -> bytes:
+        h = int.from_bytes(data, 'big')
+        m = self.pow(h, public_key.exponent, public_key.modulus)
+        return m.to_bytes(public_key.modulus_len, 'big')
+
+
+class PythonBackend(Backend):
+    name = "python"
+
+    def pow(self, value: int, exponent: int, modulus: int) -> int:
+        return pow(value, exponent, modulus)
+
+
+class GMPYBackend(Backend):
+    name = "gmpy2"
+
+    def pow(self, value: int, exponent: int, modulus: int) -> int:
+        return int(gmpy2.powmod(value, exponent, modulus))
+
+
+BACKENDS = {
+    PythonBackend.name: PythonBackend,
+    GMPYBackend.name: GMPYBackend,
+}
+BACKEND = None
+
+
+def available_backends() -> typing.List[Backend]:
+    backends = [PythonBackend()]
+    if gmpy2:
+        backends.append(GMPYBackend())
+    return backends
+
+
+def benchmark(backend: Backend, rounds: int = 50) -> float:
+    modulus = (1 << 1983) | 0x3b9ac9ff
+    value = (1 << 1982) | 0x2540be3ff
+    start = time.perf_counter()
+    for _ in range(rounds):
+        backend.pow(value, 65537, modulus)
+    return time.perf_counter() - start
+
+
+def get_backend() -> Backend:
+    global BACKEND
+
+    if BACKEND:
+        return BACKEND
+
+    if settings.VDV_RSA_BACKEND == "auto":
+        BACKEND = min(available_backends(), key=benchmark)
+    elif settings.VDV_RSA_BACKEND == GMPYBackend.name and not gmpy2:
+        raise RuntimeError("The gmpy2 RSA backend was selected but gmpy2 is not installed")
+    elif backend := BACKENDS.get(settings.VDV_RSA_BACKEND):
+        BACKEND = backend()
+    else:
+        raise RuntimeError(f"Unknown RSA backend: {settings.VDV_RSA_BACKEND}")
+
+    return BACKEND
+
+
+def public_operation(data: bytes, public_key: "pki.RSAPublicKey") -> bytes:
+    return get_backend().public_operation(data, public_key)
@@ -1,9 +1,9 @@
 import dataclasses
 import enum
+import functools
 import typing
-import ber_tlv.tlv
 import re
-from . import util, org_id
+from . import util, org_id, tlv
 
 NAME_TYPE_1_RE = re.compile(r"^(?P<start>\w*)(?P<len>\d+)(?P<end>\w*)$")
 
@@ -16,20 +16,13 @@ class VDVTicket:
     product_org_id: int
     validity_start: util.DateTime
     validity_end: util.DateTime
-    kvp_org_id: int
-    terminal_type: int
-    terminal_number: int
-    terminal_owner_id: int
-    transaction_time: util.DateTime
-    location_type: int
-    location_number: int
-    location_org_id: int
-    sam_sequence_number_1: int
-    sam_sequence_number_2: int
-    sam_version: int
-    sam_id: int
-    product_data: typing.List
-    product_transaction_data: typing.List
+    data: bytes = dataclasses.field(repr=False)
+    product_data_offset: int = dataclasses.field(repr=False)
+    product_data_length: int = dataclasses.field(repr=False)
+    common_transaction_data_offset: int = dataclasses.field(repr=False)
+    product_transaction_data_offset: int = dataclasses.field(repr=False)
+    product_transaction_data_length: int = dataclasses.field(repr=False)
+    ticket_issue_data_offset: int = dataclasses.field(repr=False)
 
     def __str__(self):
         out = "VDVTicket:\n" \
@@ -78,38 +71,34 @@ class VDVTicket:
         if len(data) < 111:
             raise util.VDVException("Invalid VDV ticket length")
 
-        header, data = data[0:18], data[18:]
+        reader = tlv.Reader(data, 18)
+        header = data[0:18]
 
-        try:
-            parser = ber_tlv.tlv.Tlv.Parser(data, [], 0)
-            product_data = parser.next()
-        except Exception as e:
-            raise util.VDVException("Invalid VDV ticket") from e
-
-        if product_data[0] != 0x85:
+        product_data = reader.next()
+        if not product_data or product_data[0] != util.TAG_TICKET_PRODUCT_DATA:
             raise util.VDVException("Not a VDV ticket")
 
-        product_data = ber_tlv.tlv.Tlv.parse(product_data[1], False, False)
-
-        offset_1 = parser.get_offset()
-        common_transaction_data, data = data[offset_1:offset_1+17], data[offset_1+17:]
+        offset_1 = reader.offset
+        reader.offset = offset_1 + 17
 
-        try:
-            parser = ber_tlv.tlv.Tlv.Parser(data, [], 0)
-            product_transaction_data = parser.next()
-        except Exception as e:
-            raise util.VDVException("Invalid VDV ticket") from e
-
-        if product_transaction_data[0] != 0x8A:
+        product_transaction_data = reader.next()
+        if not product_transaction_data or product_transaction_data[0] != util.TAG_TICKET_PRODUCT_TRANSACTION_DATA:
             raise util.VDVException("Not a VDV ticket")
 
-        product_transaction_data = ber_tlv.tlv.Tlv.parse(product_transaction_data[1], False, False)
-
-        offset_2 = parser.get_offset()
-        ticket_issue_data, data = data[offset_2:offset_2+12], data[offset_2+12:]
+        # Elements are only decoded when displayed, but a malformed one has to be rejected while parsing
+        for tag, offset, length in reader.children(product_data[1], product_data[2]):
+            if tag == 0xDB and (length < 5 or data[offset] not in GENDERS):
+                raise util.VDVException("Invalid passenger data element")
+            elif tag == 0xDC and length < 1:
+                raise util.VDVException("Invalid spacial validity element")
+        for _ in reader.children(product_transaction_data[1], product_transaction_data[2]):
+            pass
+
+        offset_2 = reader.offset
+        if offset_2 + 12 > len(data) - 5:
+            raise util.VDVException("Invalid VDV ticket length")
 
         trailer = data[-5:]
-
         if trailer[0:3] != b'VDV':
             raise util.VDVException("Not a VDV ticket")
 
@@ -123,22 +112,94 @@ class VDVTicket:
             product_org_id=int.from_bytes(header[8:10], 'big'),
             validity_start=util.DateTime.from_bytes(header[10:14]),
             validity_end=util.DateTime.from_bytes(header[14:18]),
-            kvp_org_id=int.from_bytes(common_transaction_data[0:2], 'big'),
-            terminal_type=common_transaction_data[2],
-            terminal_number=int.from_bytes(common_transaction_data[3:5], 'big'),
-            terminal_owner_id=int.from_bytes(common_transaction_data[5:7], 'big'),
-            transaction_time=util.DateTime.from_bytes(common_transaction_data[7:11]),
-            location_type=common_transaction_data[11],
-            location_number=int.from_bytes(common_transaction_data[12:15], 'big'),
-            location_org_id=int.from_bytes(common_transaction_data[15:17], 'big'),
-            sam_sequence_number_1=int.from_bytes(ticket_issue_data[0:4], 'big'),
-            sam_version=ticket_issue_data[4],
-            sam_sequence_number_2=int.from_bytes(ticket_issue_data[5:9], 'big'),
-            sam_id=int.from_bytes(ticket_issue_data[9:12], 'big'),
-            product_data=list(map(cls.parse_product_data_element, product_data)),
-            product_transaction_data=product_transaction_data
+            data=bytes(data),
+            product_data_offset=product_data[1],
+            product_data_length=product_data[2],
+            common_transaction_data_offset=offset_1,
+            product_transaction_data_offset=product_transaction_data[1],
+            product_transaction_data_length=product_transaction_data[2],
+            ticket_issue_data_offset=offset_2,
         )
 
+    def product_data_reader(self) -> tlv.Reader:
+        return tlv.Reader(self.data, self.product_data_offset, self.product_data_offset + self.product_data_length)
+
+    @functools.cached_property
+    def product_data(self) -> typing.List:
+        return list(map(self.parse_product_data_element, self.product_data_reader().elements()))
+
+    @functools.cached_property
+    def product_transaction_data(self) -> typing.List:
+        return tlv.Reader(
+            self.data, self.product_transaction_data_offset,
+            self.product_transaction_data_offset + self.product_transaction_data_length
+        ).elements()
+
+    @functools.cached_property
+    def passenger_data(self) -> typing.Optional["PassengerData"]:
+        if "product_data" in self.__dict__:
+            return next(filter(lambda d: isinstance(d, PassengerData), self.product_data), None)
+
+        reader = self.product_data_reader()
+        for tag, offset, length in reader:
+            if tag == 0xDB:
+                return PassengerData.parse(reader.value(offset, length))
+        return None
+
+    def common_transaction_data(self) -> bytes:
+        return self.data[self.common_transaction_data_offset:self.common_transaction_data_offset + 17]
+
+    def ticket_issue_data(self) -> bytes:
+        return self.data[self.ticket_issue_data_offset:self.ticket_issue_data_offset + 12]
+
+    @property
+    def kvp_org_id(self) -> int:
+        return int.from_bytes(self.common_transaction_data()[0:2], 'big')
+
+    @property
+    def terminal_type(self) -> int:
+        return self.common_transaction_data()[2]
+
+    @property
+    def terminal_number(self) -> int:
+        return int.from_bytes(self.common_transaction_data()[3:5], 'big')
+
+    @property
+    def terminal_owner_id(self) -> int:
+        return int.from_bytes(self.common_transaction_data()[5:7], 'big')
+
+    @functools.cached_property
+    def transaction_time(self) -> util.DateTime:
+        return util.DateTime.from_bytes(self.common_transaction_data()[7:11])
+
+    @property
+    def location_type(self) -> int:
+        return self.common_transaction_data()[11]
+
+    @property
+    def location_number(self) -> int:
+        return int.from_bytes(self.common_transaction_data()[12:15], 'big')
+
+    @property
+    def location_org_id(self) -> int:
+        return int.from_bytes(self.common_transaction_data()[15:17], 'big')
+
+    @property
+    def sam_sequence_number_1(self) -> int:
+        return int.from_bytes(self.ticket_issue_data()[0:4], 'big')
+
+    @property
+    def sam_version(self) -> int:
+        return self.ticket_issue_data()[4]
+
+    @property
+    def sam_sequence_number_2(self) -> int:
+        return int.from_bytes(self.ticket_issue_data()[5:9], 'big')
+
+    @property
+    def sam_id(self) -> int:
+        return int.from_bytes(self.ticket_issue_data()[9:12], 'big')
+
     @staticmethod
     def parse_product_data_element(elm):
         if elm[0] == 0xDB:
@@ -203,6 +264,8 @@ class Gender(enum.Enum):
     Female = 2
     Diverse = 3
 
+GENDERS = frozenset(gender.value for gender in Gender)
+
 @dataclasses.dataclass
 class PassengerData:
     TYPE = "passenger-data"
@@ -312,13 +375,13 @@ class UnknownElement:
 
 
 def map_org_id(code: int, opt=False):
-    org, is_test = org_id.get_org(code)
-    if org:
+    name, is_test = org_id.get_org(code)
+    if name:
         if is_test:
-            return f"{org['name']} (Test)"
+            return f"{name} (Test)"
         else:
-            return org['name']
+            return name
     if opt:
         return ""
     else:
-        return str(org_id)
\ No newline at end of file
+        return str(code)
\ No newline at end of file
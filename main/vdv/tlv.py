@@ -0,0 +1,77 @@
+import typing
+
+from . import util
+
+
+class Reader:
+    buffer: memoryview
+    offset: int
+    end: int
+
+    def __init__(self, data: typing.Union[bytes, memoryview], offset: int = 0, end: typing.Optional[int] = None):
+        self.buffer = data if isinstance(data, memoryview) else memoryview(data)
+        self.offset = offset
+        self.end = len(self.buffer) if end is None else end
+
+    def __iter__(self) -> "Reader":
+        return self
+
+    def __next__(self) -> typing.Tuple[int, int, int]:
+        element = self.next()
+        if element is None:
+            raise StopIteration
+        return element
+
+    def next(self) -> typing.Optional[typing.Tuple[int, int, int]]:
+        buffer = self.buffer
+        offset = self.offset
+        end = self.end
+
+        while offset < end and buffer[offset] == 0x00:
+            offset += 1
+        if offset >= end:
+            self.offset = offset
+            return None
+
+        tag = buffer[offset]
+        offset += 1
+        if tag & 0x1F == 0x1F:
+            tag_len = 1
+            while True:
+                if offset >= end:
+                    raise util.VDVException("Invalid BER-TLV, unexpected end of tag")
+                if tag_len >= 4:
+                    raise util.VDVException("Invalid BER-TLV, tag is too long")
+                tag = (tag << 8) | buffer[offset]
+                tag_len += 1
+                offset += 1
+                if not tag & 0x80:
+                    break
+
+        if offset >= end:
+            raise util.VDVException("Invalid BER-TLV, unexpected end of length")
+        length = buffer[offset]
+        offset += 1
+        if length & 0x80:
+            length_len = length & 0x7F
+            if length_len == 0 or length_len > 4:
+                raise util.VDVException("Invalid BER-TLV, unsupported length encoding")
+            if offset + length_len > end:
+                raise util.VDVException("Invalid BER-TLV, unexpected end of length")
+            length = int.from_bytes(buffer[offset:offset + length_len], 'big')
+            offset += length_len
+
+        if offset + length > end:
+            raise util.VDVException("Invalid BER-TLV, unexpected end of value")
+
+        self.offset = offset + length
+        return tag, offset, length
+
+    def value(self, offset: int, length: int) -> bytes:
+        return bytes(self.buffer[offset:offset + length])
+
+    def children(self, offset: int, length: int) -> "Reader":
+        return Reader(self.buffer, offset, offset + length)
+
+    def elements(self) -> typing.List[typing.Tuple[int, bytes]]:
+        return [(tag, self.value(offset, length)) for tag, offset, length in self]
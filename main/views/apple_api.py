@@ -7,7 +7,7 @@ from django.http import HttpResponse
 from django.conf import settings
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import condition
-from main import models, views
+from main import models, views, ticket
 
 logger = logging.Logger(__name__)
 
@@ -127,7 +127,11 @@ def registration(request, device_id, ticket_obj):
 @condition(last_modified_func=ticket_updated_date)
 @check_pass_auth
 def pass_document(_, ticket_obj):
-    return views.make_pkpass(ticket_obj)
+    try:
+        return views.make_pkpass(ticket_obj)
+    except ticket.TicketError as e:
+        logger.warning("Can't build pass for ticket %s: %s", ticket_obj.id, e.title)
+        return HttpResponse(status=500)
 
 
 @csrf_exempt
@@ -1,25 +1,35 @@
-import base64
 import json
-import typing
 import urllib.parse
 import pytz
-import dataclasses
 
 from django.shortcuts import render, redirect, get_object_or_404, reverse
 from django.http import HttpResponse
 from django.core.files.storage import storages
 from django.conf import settings
-from main import forms, models, ticket, pkpass, vdv, aztec, templatetags, apn
+from django.db import transaction
+from main import forms, models, ticket, pkpass, vdv, uic, templatetags, jobs
 
+MAX_PASS_LOCATIONS = 10
+NEARBY_STATION_RADIUS_KM = 1.0
+ROUTE_CORRIDOR_KM = 2.0
+MAX_IMAGE_SIZE = 2 * 1024 * 1024
+MAX_BATCH_IMAGES = 20
+
+
+def decoder_busy(request, template: str, context: dict):
+    context["error"] = {
+        "title": "We're busy right now",
+        "message": "Too many pictures are waiting to be read, please try again in a minute.",
+    }
+    response = render(request, template, context, status=503)
+    response["Retry-After"] = str(settings.AZTEC_RETRY_AFTER)
+    return response
 
-def to_dict_json(elements: typing.List[typing.Tuple[str, typing.Any]]) -> dict:
-    def encode_value(v):
-        if isinstance(v, bytes) or isinstance(v, bytearray):
-            return base64.b64encode(v).decode("ascii")
-        else:
-            return v
 
-    return {k: encode_value(v) for k, v in elements}
+def decoder_full() -> bool:
+    return models.DecodeJob.objects.filter(
+        state=models.DecodeJob.STATE_PENDING
+    ).count() >= settings.AZTEC_MAX_PENDING_JOBS
 
 
 def index(request):
@@ -38,69 +48,31 @@ def index(request):
             image_form = forms.TicketImageForm(request.POST, request.FILES)
             if image_form.is_valid():
                 image = image_form.cleaned_data["ticket"]
-                if image.size > 2 * 1024 * 1024:
+                if image.size > MAX_IMAGE_SIZE:
                     image_form.add_error("ticket", "The image must be less than 2MB")
+                elif decoder_full():
+                    return decoder_busy(request, "main/index.html", {
+                        "image_form": image_form,
+                    })
                 else:
-                    image_data = image.read()
-                    try:
-                        ticket_bytes = aztec.decode(image_data)
-                    except aztec.AztecError as e:
-                        image_form.add_error("ticket", str(e))
+                    job_obj = models.DecodeJob.objects.create(
+                        image=image.read(),
+                        account=request.user.account if request.user.is_authenticated else None,
+                    )
+                    return redirect('decode_job', pk=job_obj.id)
     else:
         image_form = forms.TicketImageForm()
 
     if ticket_bytes:
         try:
-            ticket_data = ticket.parse_ticket(ticket_bytes)
+            ticket_obj, ticket_created = jobs.save_ticket(
+                ticket_bytes, request.user.account if request.user.is_authenticated else None
+            )
         except ticket.TicketError as e:
-            error = {
-                "title": e.title,
-                "message": e.message,
-                "exception": e.exception,
-                "ticket_contents": ticket_bytes.hex()
-            }
+            error = jobs.ticket_error(e, ticket_bytes)
         else:
-            ticket_pk = ticket_data.pk()
-            defaults = {
-                "ticket_type": ticket_data.type(),
-            }
-            if request.user.is_authenticated:
-                defaults["account"] = request.user.account
-            ticket_obj, ticket_created = models.Ticket.objects.update_or_create(id=ticket_pk, defaults=defaults)
             request.session["ticket_updated"] = True
             request.session["ticket_created"] = ticket_created
-            if isinstance(ticket_data, ticket.VDVTicket):
-                models.VDVTicketInstance.objects.update_or_create(
-                    ticket_number=ticket_data.ticket.ticket_id,
-                    ticket_org_id=ticket_data.ticket.ticket_org_id,
-                    defaults={
-                        "ticket": ticket_obj,
-                        "validity_start": ticket_data.ticket.validity_start.as_datetime(),
-                        "validity_end": ticket_data.ticket.validity_end.as_datetime(),
-                        "barcode_data": ticket_bytes,
-                        "decoded_data": {
-                            "root_ca": dataclasses.asdict(ticket_data.root_ca, dict_factory=to_dict_json),
-                            "issuing_ca": dataclasses.asdict(ticket_data.issuing_ca, dict_factory=to_dict_json),
-                            "envelope_certificate": dataclasses.asdict(ticket_data.envelope_certificate,
-                                                                       dict_factory=to_dict_json),
-                            "ticket": base64.b64encode(ticket_data.raw_ticket).decode("ascii"),
-                        }
-                    }
-                )
-            elif isinstance(ticket_data, ticket.UICTicket):
-                models.UICTicketInstance.objects.update_or_create(
-                    reference=ticket_data.ticket_id(),
-                    distributor_rics=ticket_data.issuing_rics(),
-                    defaults={
-                        "ticket": ticket_obj,
-                        "issuing_time": ticket_data.issuing_time(),
-                        "barcode_data": ticket_bytes,
-                        "decoded_data": {
-                            "envelope": dataclasses.asdict(ticket_data.envelope, dict_factory=to_dict_json),
-                        }
-                    }
-                )
-            apn.notify_ticket(ticket_obj)
             return redirect('ticket', pk=ticket_obj.id)
 
     return render(request, "main/index.html", {
@@ -109,8 +81,80 @@ def index(request):
     })
 
 
+def batch(request):
+    if request.method == "POST":
+        batch_form = forms.TicketBatchForm(request.POST, request.FILES)
+        if batch_form.is_valid():
+            images = batch_form.cleaned_data["tickets"]
+            if len(images) > MAX_BATCH_IMAGES:
+                batch_form.add_error("tickets", f"Please upload at most {MAX_BATCH_IMAGES} images at a time")
+            elif any(image.size > MAX_IMAGE_SIZE for image in images):
+                batch_form.add_error("tickets", "Each image must be less than 2MB")
+            elif decoder_full():
+                return decoder_busy(request, "main/batch.html", {
+                    "batch_form": batch_form,
+                })
+            else:
+                with transaction.atomic():
+                    job_obj = models.DecodeJob.objects.create(
+                        account=request.user.account if request.user.is_authenticated else None,
+                        batch=True,
+                    )
+                    models.DecodeJobImage.objects.bulk_create([
+                        models.DecodeJobImage(job=job_obj, position=i, name=image.name[:255], image=image.read())
+                        for i, image in enumerate(images)
+                    ])
+                return redirect('decode_job', pk=job_obj.id)
+    else:
+        batch_form = forms.TicketBatchForm()
+
+    return render(request, "main/batch.html", {
+        "batch_form": batch_form,
+    })
+
+
+def decode_job(request, pk):
+    job_obj = get_object_or_404(models.DecodeJob, id=pk)
+
+    if job_obj.state == models.DecodeJob.STATE_DONE and job_obj.results is not None:
+        return render(request, "main/batch_results.html", {
+            "job": job_obj,
+        })
+    elif job_obj.state == models.DecodeJob.STATE_DONE and job_obj.ticket:
+        request.session["ticket_updated"] = True
+        request.session["ticket_created"] = job_obj.ticket_created
+        return redirect('ticket', pk=job_obj.ticket.id)
+    elif job_obj.state == models.DecodeJob.STATE_FAILED or job_obj.state == models.DecodeJob.STATE_DONE:
+        return render(request, "main/index.html", {
+            "image_form": forms.TicketImageForm(),
+            "error": job_obj.error,
+        })
+
+    return render(request, "main/decode_job.html", {
+        "job": job_obj,
+    })
+
+
+def ticket_flex_error(request, ticket_obj: models.Ticket):
+    for ticket_instance in ticket_obj.uic_instances.all():
+        ticket_data = ticket_instance.as_ticket()
+        if not ticket_data.flex:
+            continue
+        try:
+            ticket.decode_ticket_uic_flex(ticket_data.flex)
+        except ticket.TicketError as e:
+            return render(request, "main/index.html", {
+                "image_form": forms.TicketImageForm(),
+                "error": jobs.ticket_error(e, bytes(ticket_instance.barcode_data)),
+            })
+    return None
+
+
 def view_ticket(request, pk):
     ticket_obj = get_object_or_404(models.Ticket, id=pk)
+    if error := ticket_flex_error(request, ticket_obj):
+        return error
+
     ticket_id = ticket_obj.pk.upper()[0:8]
     return render(request, "main/ticket.html", {
         "ticket": ticket_obj,
@@ -133,7 +177,13 @@ def add_pkp_img(pkp, img_name: str, pass_path: str):
 
 def ticket_pkpass(request, pk):
     ticket_obj: models.Ticket = get_object_or_404(models.Ticket, id=pk)
-    return make_pkpass(ticket_obj)
+    try:
+        return make_pkpass(ticket_obj)
+    except ticket.TicketError as e:
+        return render(request, "main/index.html", {
+            "image_form": forms.TicketImageForm(),
+            "error": jobs.ticket_error(e, bytes(ticket_obj.uic_instances.first().barcode_data)),
+        })
 
 def make_pkpass(ticket_obj: models.Ticket):
     ticket_instance: models.UICTicketInstance = ticket_obj.uic_instances.first()
@@ -167,6 +217,7 @@ def make_pkpass(ticket_obj: models.Ticket):
 
     if ticket_instance:
         ticket_data: ticket.UICTicket = ticket_instance.as_ticket()
+        flex_data = ticket.decode_ticket_uic_flex(ticket_data.flex) if ticket_data.flex else None
         issued_at = ticket_data.issuing_time().astimezone(pytz.utc)
         issuing_rics = ticket_data.issuing_rics()
 
@@ -192,10 +243,10 @@ def make_pkpass(ticket_obj: models.Ticket):
             have_logo = True
 
         if ticket_data.flex:
-            pass_json["voided"] = not ticket_data.flex.data["issuingDetail"]["activated"]
+            pass_json["voided"] = not flex_data["issuingDetail"]["activated"]
 
-            if len(ticket_data.flex.data["transportDocument"]) >= 1:
-                document_type, document = ticket_data.flex.data["transportDocument"][0]["ticket"]
+            if len(flex_data["transportDocument"]) >= 1:
+                document_type, document = flex_data["transportDocument"][0]["ticket"]
                 if document_type == "openTicket":
                     validity_start = templatetags.rics.rics_valid_from(document, issued_at)
                     validity_end = templatetags.rics.rics_valid_until(document, issued_at)
@@ -310,6 +361,39 @@ def make_pkpass(ticket_obj: models.Ticket):
                                 }
                             })
 
+                        seen_stations = {station["uic"] for station in (from_station, to_station) if station}
+                        for station in (from_station, to_station):
+                            if not station or "latitude" not in station:
+                                continue
+                            for nearby_station in uic.stations.get_stations_near(
+                                    float(station["latitude"]), float(station["longitude"]),
+                                    NEARBY_STATION_RADIUS_KM, MAX_PASS_LOCATIONS
+                            ):
+                                if len(pass_json["locations"]) >= MAX_PASS_LOCATIONS:
+                                    break
+                                if nearby_station["uic"] in seen_stations:
+                                    continue
+                                seen_stations.add(nearby_station["uic"])
+                                pass_json["locations"].append({
+                                    "latitude": nearby_station["latitude"],
+                                    "longitude": nearby_station["longitude"],
+                                    "relevantText": nearby_station["name"]
+                                })
+
+                        free_slots = MAX_PASS_LOCATIONS - len(pass_json["locations"])
+                        if free_slots > 0 and from_station and to_station and \
+                                "latitude" in from_station and "latitude" in to_station:
+                            for route_station in uic.stations.get_stations_along_route(
+                                    float(from_station["latitude"]), float(from_station["longitude"]),
+                                    float(to_station["latitude"]), float(to_station["longitude"]),
+                                    ROUTE_CORRIDOR_KM, free_slots, seen_stations
+                            ):
+                                pass_json["locations"].append({
+                                    "latitude": route_station["latitude"],
+                                    "longitude": route_station["longitude"],
+                                    "relevantText": route_station["name"]
+                                })
+
                     if len(document.get("tariffs")) >= 1:
                         tariff = document["tariffs"][0]
                         if "tariffDesc" in tariff:
@@ -445,8 +529,8 @@ def make_pkpass(ticket_obj: models.Ticket):
                         "value": product_name
                     })
 
-            if len(ticket_data.flex.data.get("travelerDetail", {}).get("traveler", [])) >= 1:
-                passenger = ticket_data.flex.data["travelerDetail"]["traveler"][0]
+            if len(flex_data.get("travelerDetail", {}).get("traveler", [])) >= 1:
+                passenger = flex_data["travelerDetail"]["traveler"][0]
                 dob_year = passenger.get("yearOfBirth", 0)
                 dob_month = passenger.get("monthOfBirth", 0)
                 dob_day = passenger.get("dayOfBirthInMonth", 0)
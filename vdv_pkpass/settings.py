@@ -146,6 +146,20 @@ STORAGES = {
     },
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "aztec": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("AZTEC_CACHE_DIR", "/tmp/vdv-pkpass-aztec"),
+        "TIMEOUT": int(os.getenv("AZTEC_CACHE_TIMEOUT", "86400")),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("AZTEC_CACHE_MAX_ENTRIES", "10000")),
+        }
+    },
+}
+
 PKPASS_CERTIFICATE_LOCATION = os.getenv("PKPASS_CERTIFICATE_LOCATION")
 PKPASS_KEY_LOCATION = os.getenv("PKPASS_KEY_LOCATION")
 
@@ -163,6 +177,24 @@ PKPASS_CONF = {
 }
 
 AZTEC_JAR_PATH = BASE_DIR / "aztec-1.0.jar"
+AZTEC_MAX_IMAGE_SIZE = int(os.getenv("AZTEC_MAX_IMAGE_SIZE", "1600"))
+AZTEC_WORKERS = int(os.getenv("AZTEC_WORKERS", "1"))
+AZTEC_MAX_QUEUE = int(os.getenv("AZTEC_MAX_QUEUE", "8"))
+AZTEC_TIMEOUT = float(os.getenv("AZTEC_TIMEOUT", "30"))
+AZTEC_HEALTH_CHECK_INTERVAL = float(os.getenv("AZTEC_HEALTH_CHECK_INTERVAL", "60"))
+AZTEC_HEALTH_CHECK_TIMEOUT = float(os.getenv("AZTEC_HEALTH_CHECK_TIMEOUT", "5"))
+AZTEC_MAX_CONCURRENT = int(os.getenv("AZTEC_MAX_CONCURRENT", "2"))
+AZTEC_LOCK_DIR = os.getenv("AZTEC_LOCK_DIR", "/tmp/vdv-pkpass-aztec-locks")
+AZTEC_JAVA_MAX_HEAP = os.getenv("AZTEC_JAVA_MAX_HEAP", "256m")
+AZTEC_MAX_PENDING_JOBS = int(os.getenv("AZTEC_MAX_PENDING_JOBS", "50"))
+AZTEC_RETRY_AFTER = int(os.getenv("AZTEC_RETRY_AFTER", "30"))
+
+VDV_ENVELOPE_CERTIFICATE_CACHE_SIZE = int(os.getenv("VDV_ENVELOPE_CERTIFICATE_CACHE_SIZE", "4096"))
+VDV_RSA_BACKEND = os.getenv("VDV_RSA_BACKEND", "auto")
+UIC_ASN1_CACHE_DIR = os.getenv("UIC_ASN1_CACHE_DIR", "/tmp/vdv-pkpass-asn1")
+UIC_DATA_CACHE_DIR = os.getenv("UIC_DATA_CACHE_DIR", "/tmp/vdv-pkpass-uic-data")
+UIC_MAX_DECOMPRESSED_SIZE = int(os.getenv("UIC_MAX_DECOMPRESSED_SIZE", "1048576"))
+UIC_SIGNATURE_CACHE_SIZE = int(os.getenv("UIC_SIGNATURE_CACHE_SIZE", "4096"))
 
 LOGIN_URL = "magiclink:login"
 LOGIN_REDIRECT_URL = "account"
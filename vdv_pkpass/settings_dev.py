@@ -165,6 +165,24 @@ PKPASS_CONF = {
 }
 
 AZTEC_JAR_PATH = BASE_DIR / "aztec" / "target" / "aztec-1.0.jar"
+AZTEC_MAX_IMAGE_SIZE = 1600
+AZTEC_WORKERS = 2
+AZTEC_MAX_QUEUE = 8
+AZTEC_TIMEOUT = 30
+AZTEC_HEALTH_CHECK_INTERVAL = 60
+AZTEC_HEALTH_CHECK_TIMEOUT = 5
+AZTEC_MAX_CONCURRENT = 2
+AZTEC_LOCK_DIR = BASE_DIR / "aztec-locks"
+AZTEC_JAVA_MAX_HEAP = "256m"
+AZTEC_MAX_PENDING_JOBS = 50
+AZTEC_RETRY_AFTER = 30
+
+VDV_ENVELOPE_CERTIFICATE_CACHE_SIZE = 4096
+VDV_RSA_BACKEND = "auto"
+UIC_ASN1_CACHE_DIR = BASE_DIR / "asn1-cache"
+UIC_DATA_CACHE_DIR = BASE_DIR / "uic-data-cache"
+UIC_MAX_DECOMPRESSED_SIZE = 1048576
+UIC_SIGNATURE_CACHE_SIZE = 4096
 
 STORAGES = {
     "default": {
@@ -187,6 +205,20 @@ STORAGES = {
     },
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "aztec": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / "aztec-cache",
+        "TIMEOUT": 86400,
+        "OPTIONS": {
+            "MAX_ENTRIES": 10000,
+        }
+    },
+}
+
 LOGIN_URL = "magiclink:login"
 LOGIN_REDIRECT_URL = "account"
 LOGOUT_REDIRECT_URL = "index"